@@ -1,3 +1,4 @@
+import copy
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -62,6 +63,14 @@ class DebugMixin(ABC):
     def annotate_router_hint(self, router: Router):
         raise NotImplementedError()
 
+    @abstractmethod
+    def annotate_lasthops(self, routers=None, usehints=False, use_provider=False):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def graph_refinement(self, routers, interfaces, iterations=-1, vrfrouters=None, usehints=False, use_provider=False):
+        raise NotImplementedError()
+
     def test_last(self, nid, rupdates=None, iupdates=None, usehints=False):
         if rupdates is None:
             rupdates = Updates()
@@ -71,7 +80,7 @@ class DebugMixin(ABC):
             try:
                 r: Router = self.graph.routers[nid]
             except KeyError:
-                r: Router = self.graph.interfaces[nid].router
+                r: Router = self.graph.get_interface(nid).router
             if usehints:
                 asn, utype = self.annotate_router_hint(r)
                 if asn > 0:
@@ -87,7 +96,7 @@ class DebugMixin(ABC):
                 try:
                     r: Router = self.graph.routers[nid]
                 except KeyError:
-                    r: Router = self.graph.interfaces[nid].router
+                    r: Router = self.graph.get_interface(nid).router
             if usehints:
                 asn, utype = self.annotate_router_hint(r, **kwargs)
                 if asn > 0:
@@ -101,6 +110,26 @@ class DebugMixin(ABC):
 
     def test_interface(self, addr, rupdates=None, iupdates=None):
         with Debug(self, rupdates=rupdates, iupdates=iupdates):
-            i = self.graph.interfaces[addr]
+            i = self.graph.get_interface(addr)
             result = self.annotate_interface(i)
         print(result)
+
+    def rerun_subgraph(self, asns=None, prefixes=None, hops=1, iterations=-1, usehints=False, use_provider=False):
+        """
+        Rerun the annotation on the neighborhood of some ASes or prefixes, with the boundary annotations frozen from the
+        completed run on the full graph.
+        :return: the subgraph run, whose graph and updates contain copies of the original nodes
+        """
+        sub = self.graph.subgraph(asns=asns, prefixes=prefixes, hops=hops)
+        subrun = copy.copy(self)
+        subrun.graph = sub.graph
+        subrun.rupdates, subrun.iupdates = sub.freeze(self.rupdates, self.iupdates)
+        subrun.caches = Updates()
+        subrun.lasthops = [router for router in sub.routers if not router.succ]
+        subrun.routers_succ = [router for router in sub.routers if router.succ and not router.vrf]
+        # Like the command line run, VRF routers are not refined separately
+        subrun.routers_vrf = []
+        subrun.interfaces_pred = [interface for interface in sub.interfaces if interface.pred]
+        subrun.annotate_lasthops(usehints=usehints, use_provider=use_provider)
+        subrun.graph_refinement(subrun.routers_succ, subrun.interfaces_pred, iterations=iterations, usehints=usehints, use_provider=use_provider)
+        return subrun
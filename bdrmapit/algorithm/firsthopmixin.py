@@ -35,15 +35,26 @@ class FirstHopMixin:
             asn = min(rels, key=lambda x: (x != interface.asn, -self.bgp.conesize[x], x))
         return asn
 
-    def annotate_firsthops(self, firstcounters, filemap):
+    def annotate_firsthops(self, first, vps, filemap):
+        """
+        Annotate unannotated first hop interfaces using the ASes of the vantage points that saw them.
+        :param first: first hops keyed by (vantage point ID, addr)
+        :param vps: vantage point ID table from the parse results
+        :param filemap: vantage point filename to ASN
+        """
+        # Resolve each vantage point once, then first hops only need a list index
+        vpasns = [None] * len(vps)
+        for file, vid in vps.items():
+            vpasns[vid] = filemap.get(file)
         prevs = defaultdict(Counter)
-        pb = Progress(len(firstcounters), 'Creating previous ASNs', increment=100000, callback=lambda: '{:,d}'.format(len(prevs)))
-        for file, addr in pb.iterator(firstcounters):
-            if file in filemap:
-                prevs[addr][filemap[file]] += 1
+        pb = Progress(len(first), 'Creating previous ASNs', increment=100000, callback=lambda: '{:,d}'.format(len(prevs)))
+        for vid, addr in pb.iterator(first):
+            asn = vpasns[vid]
+            if asn is not None:
+                prevs[addr][asn] += 1
         pb = Progress(len(prevs), 'Annotating first hops', increment=100000, callback=lambda: '{:,d}'.format(len(prevs)))
         for addr, files in pb.iterator(prevs.items()):
-            interface = self.graph.interfaces[addr]
+            interface = self.graph.get_interface(addr)
             if addr in prevs and self.iupdates.asn(interface) == -1:
                 asn = self.annotate_firsthop(interface, prevs[addr])
                 self.caches.add_update_direct(interface, asn, self.as2org[asn], 3)
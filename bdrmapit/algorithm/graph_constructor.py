@@ -79,12 +79,7 @@ class GraphConstructor:
 
     @staticmethod
     def add_succ(router: Router, interface: Interface, succ: Union[Router, Interface]):
-        if succ in router.succ:
-            origins = router.origins[succ]
-            origins.add(interface.asn)
-        else:
-            router.succ.add(succ)
-            router.origins[succ] = {interface.asn}
+        router.add_succ(succ, interface.asn)
 
     @staticmethod
     def add_pred(interface: Interface, prouter: Router):
@@ -45,7 +45,7 @@ class LastHopsMixin(RegexMixin):
                             idests.discard(origin)
                             modified += 1
                 # Add all remaining destination ASes to the router destination AS set
-                router.dests.update(idests)
+                router.add_dests(idests)
 
     def annotate_lasthop_nodests(self, iasns):
         if debug.DEBUG: print('No dests')
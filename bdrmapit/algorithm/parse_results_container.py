@@ -86,13 +86,8 @@ class Container:
                 self.create_node(addr, router)
 
     @staticmethod
-    def add_succ(router: Router, interface: Interface, succ: Union[VRFEdge, Interface]):
-        if succ in router.succ:
-            origins = router.origins[succ]
-            origins.add(interface.asn)
-        else:
-            router.succ.add(succ)
-            router.origins[succ] = {interface.asn}
+    def add_succ(router: Router, interface: Interface, succ: Union[VRFEdge, Interface], count=0):
+        router.add_succ(succ, interface.asn, count)
 
     @staticmethod
     def add_pred(interface: Interface, prouter: Router):
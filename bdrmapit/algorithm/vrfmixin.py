@@ -45,6 +45,8 @@ class VRFMixin:
         sasn_origins = defaultdict(set)
         for edge in router.succ:
             origins = router.origins[edge]
+            # Shared edges stand in for every address-level edge counted in router.counts
+            weight = router.counts.get(edge, 1)
             if debug.DEBUG: print('Succ={}, ASN={}, VRF={}'.format(edge.node.name, self.rupdates[edge.node], edge.node.vrf))
             # succ_asn = self.vrf_heuristics(edge, origins, iasns)
             succ_asn = self.vrf_heuristics(edge, origins)
@@ -54,10 +56,10 @@ class VRFMixin:
                 vtype = VType.both
             if debug.DEBUG: print('Heuristic: {}'.format(succ_asn))
             if succ_asn > 0:
-                succs[succ_asn] += 1
+                succs[succ_asn] += weight
                 sasn_origins[succ_asn].update(origins)
                 if not edge.node.vrf:
-                    nonvrf[succ_asn] += 1
+                    nonvrf[succ_asn] += weight
         if debug.DEBUG:
             print('Succs: {}'.format(succs))
             print('VType: {}'.format(vtype))
@@ -102,7 +104,7 @@ class VRFMixin:
         return asn, utype
 
     def sort_vrf(self, router: Router):
-        nedges = len(router.succ)
+        nedges = sum(router.counts.get(edge, 1) for edge in router.succ)
         iasns = {interface.asn for interface in router.interfaces}
         iasn = min(iasns, key=lambda x: (self.bgp.conesize[x], -x))
         conesize = self.bgp.conesize[iasn]
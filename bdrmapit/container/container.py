@@ -1,17 +1,21 @@
+import heapq
 from collections import defaultdict
 from itertools import chain
+from multiprocessing.pool import Pool
 from sys import stderr
-from typing import Dict, Union
+from typing import Dict, Union, Optional
 
 from traceutils.file2.file2 import fopen
 from traceutils.progress.bar import Progress
 
+from bdrmapit.container.nodes_index import NodesIndex, is_index
+from bdrmapit.graph import construct
 from bdrmapit.graph.construct import Graph
-from bdrmapit.graph.node import Interface, Router
+from bdrmapit.graph.node import Interface, Router, pack_addr
 from scripts.traceparser import ParseResults
 from bdrmapit.vrf.vrfedge import VRFEdge
 
-import pandas as pd
+_container: Optional['Container'] = None
 
 def construct_graph(ip2as, as2org, filename, remove_edges=None):
     prep = Container.load(ip2as, as2org, filename)
@@ -23,8 +27,49 @@ def construct_graph(ip2as, as2org, filename, remove_edges=None):
                 del prep.parseres.multiadjs[x, y]
     return prep.construct(no_echos=True)
 
+def aggregate_edges(part):
+    """
+    Aggregate the edges of one partition of source routers in a worker process. Every address of a router is in the
+    same partition, so the routers with nexthop edges are known without the other partitions.
+    :param part: list of (order, addr, is nexthop edge source), nexthop sources first
+    :return: names of the routers with nexthop edges, and list of ((order, edge number), router name, successor key,
+    origin ASes, pred count, observations) sorted by the order each router-successor pair was first seen
+    """
+    container = _container
+    key = container.key
+    interfaces = container.interfaces
+    nexthop_routers = set()
+    edges = {}
+    for i, addr, nexthop in part:
+        interface = interfaces[key(addr)]
+        router = interface.router
+        if nexthop:
+            nexthop_routers.add(router.name)
+            succs = container.nexthops[addr]
+        elif router.name in nexthop_routers:
+            continue
+        else:
+            succs = container.multi[addr]
+        for j, (edge, count) in enumerate(succs.items()):
+            succ = interfaces[key(edge)]
+            if succ.router != router:
+                pair = (router.name, succ.key)
+                aggregate = edges.get(pair)
+                if aggregate is None:
+                    aggregate = edges[pair] = [(i, j), set(), 0, 0]
+                aggregate[1].add(interface.asn)
+                if nexthop:
+                    aggregate[2] += 1
+                aggregate[3] += count
+    aggregated = [(first, rname, skey, tuple(origins), predcount, count) for (rname, skey), (first, origins, predcount, count) in edges.items()]
+    aggregated.sort(key=lambda e: e[0])
+    return nexthop_routers, aggregated
+
 class Container:
-    def __init__(self, ip2as, as2org, parseres: ParseResults):
+    def __init__(self, ip2as, as2org, parseres: ParseResults, packed=False):
+        """
+        :param packed: store interface addresses packed, which is much smaller for IPv6 addresses
+        """
         self.ip2as = ip2as
         self.as2org = as2org
         self.parseres = parseres
@@ -36,35 +81,51 @@ class Container:
         self.dps = None
         self.firstaddrs = None
         self.echos = None
+        self.packed = packed
+        # Converts addresses to interface keys, str returns address strings unchanged
+        self.key = pack_addr if packed else str
 
     @classmethod
-    def load(cls, ip2as, as2org, *files):
+    def load(cls, ip2as, as2org, *files, packed=False):
         allresults = None
         for file in files:
-            results = ParseResults.load(file)
+            # Fields are only read and merged when construction first uses them
+            results = ParseResults.load(file, lazy=True)
             if allresults is None:
                 allresults = results
             else:
                 allresults.update(results)
-        return cls(ip2as, as2org, allresults)
+        return cls(ip2as, as2org, allresults, packed=packed)
 
     def alladdrs(self):
         return set(self.addrs) | set(self.parseres.echos)
 
     def filter_addrs(self, loop=True, no_echos=False):
+        nextadjs = self.parseres.nextadjs
+        multiadjs = self.parseres.multiadjs
+        loopadjs = self.parseres.loopadjs
         addrs = set()
         firstaddrs = {addr for _, addr in self.parseres.first}
-        adjs = self.parseres.nextadjs + self.parseres.multiadjs
-        pb = Progress(len(adjs), 'Filtering addrs', increment=1000000, callback=lambda: '{:,d}'.format(len(addrs)))
-        for (x, y), n in pb.iterator(adjs.items()):
-            if not loop or n > self.parseres.loopadjs.get((x, y), 0):
+        # Stream over both counters rather than building nextadjs + multiadjs
+        pb = Progress(len(nextadjs), 'Filtering addrs', increment=1000000, callback=lambda: '{:,d}'.format(len(addrs)))
+        for (x, y), n in pb.iterator(nextadjs.items()):
+            if not loop or n + multiadjs.get((x, y), 0) > loopadjs.get((x, y), 0):
+                addrs.add(x)
+                addrs.add(y)
+                firstaddrs.discard(y)
+        pb = Progress(len(multiadjs), 'Filtering multihop addrs', increment=1000000, callback=lambda: '{:,d}'.format(len(addrs)))
+        for (x, y), n in pb.iterator(multiadjs.items()):
+            # Adjacencies also in nextadjs were counted in the first pass
+            if (x, y) not in nextadjs and (not loop or n > loopadjs.get((x, y), 0)):
                 addrs.add(x)
                 addrs.add(y)
                 firstaddrs.discard(y)
-        self.addrs = addrs | firstaddrs
-        self.addrs |= {addr for addr, _ in self.parseres.dps}
+        addrs |= firstaddrs
+        del firstaddrs
+        addrs.update(addr for addr, _ in self.parseres.dps)
         if not no_echos:
-            self.addrs |= self.parseres.echos
+            addrs |= self.parseres.echos
+        self.addrs = addrs
         # self.firstaddrs = {(file, addr) for file, addr in self.parseres.first if addr in firstaddrs}
         Progress.message('Total addrs: {:,d}'.format(len(self.addrs)), file=stderr)
 
@@ -72,37 +133,53 @@ class Container:
         pass
 
     def create_edges(self, loop=True):
-        nexthops = defaultdict(set)
+        nexthops = defaultdict(dict)
         kept = 0
         pb = Progress(len(self.parseres.nextadjs), increment=200000, callback=lambda: '{:,d}'.format(kept))
         for (x, y), n in pb.iterator(self.parseres.nextadjs.items()):
             if x != y:
-                if not loop or n + self.parseres.multiadjs.get((x, y), 0) > self.parseres.loopadjs.get((x, y), 0):
+                m = self.parseres.multiadjs.get((x, y), 0)
+                if not loop or n + m > self.parseres.loopadjs.get((x, y), 0):
                     xasn = self.ip2as[x]
                     yasn = self.ip2as[y]
-                    if xasn == yasn or n > self.parseres.multiadjs.get((x, y), 0):
-                        nexthops[x].add(y)
+                    if xasn == yasn or n > m:
+                        nexthops[x][y] = n + m
                         kept += 1
         nkept = kept
         mkept = 0
-        multi = defaultdict(set)
+        multi = defaultdict(dict)
         pb = Progress(len(self.parseres.multiadjs), increment=200000, callback=lambda: 'N {:,d} M {:,d}'.format(nkept, mkept))
-        for (x, y), n in pb.iterator(self.parseres.multiadjs.items()):
+        for (x, y), m in pb.iterator(self.parseres.multiadjs.items()):
             if x != y:
-                if not loop or n + self.parseres.nextadjs.get((x, y), 0) > self.parseres.loopadjs.get((x, y), 0):
+                n = self.parseres.nextadjs.get((x, y), 0)
+                if not loop or n + m > self.parseres.loopadjs.get((x, y), 0):
                     xasn = self.ip2as[x]
                     yasn = self.ip2as[y]
                     if xasn > 0 and yasn > 0 and xasn == yasn:
-                        nexthops[x].add(y)
+                        nexthops[x][y] = n + m
                         nkept += 1
                     elif x not in nexthops:
-                        multi[x].add(y)
+                        multi[x][y] = n + m
                         mkept += 1
         nexthops.default_factory = None
         multi.default_factory = None
         self.nexthops = nexthops
         self.multi = multi
 
+    def classify(self, loop=True, no_echos=False):
+        """
+        Fused filter_addrs and create_edges. Makes one pass over each adjacency counter, selecting addresses and
+        classifying edges together, without building the combined adjacency counter.
+        :param loop: ignore adjacencies seen as often in loops as in traces
+        :param no_echos: ignore echo-only addresses
+        """
+        parseres = self.parseres
+        self.addrs, self.nexthops, self.multi = construct.classify(
+            parseres.nextadjs, parseres.multiadjs, parseres.loopadjs, parseres.first, parseres.dps, parseres.echos,
+            self.ip2as, loop=loop, no_echos=no_echos
+        )
+        Progress.message('Total addrs: {:,d}'.format(len(self.addrs)), file=stderr)
+
     def create_dps(self):
         dps = defaultdict(set)
         pb = Progress(len(self.parseres.dps), 'Creating dest pairs', increment=1000000)
@@ -118,30 +195,22 @@ class Container:
         :param addr: address of new interface node
         :param router: router node representing the interface's router
         """
-        asn = self.ip2as.asn(addr)
-        # Make sure address is not from private address space
-        if asn >= 0 or asn <= -100:
-            # Create interface
-            interface = Interface(addr, asn, self.as2org[asn])
-            self.interfaces[addr] = interface
-            interface.router = router
-            # Add interface to router
-            router.interfaces.append(interface)
-            self.routers[router.name] = router
-            # interface.echo = echo
-            # interface.cycle = cycle
+        construct.create_node(self.interfaces, self.routers, addr, router, self.ip2as, self.as2org, self.packed)
 
     def create_nodes(self, nodes_file, no_echos: bool = False, increment=100000):
         """
         Create router nodes based on alias resolution.
         :param no_echos: ignore echo-only addresses
-        :param nodes_file: filename containing alias resolution groupings in CAIDA format
+        :param nodes_file: filename containing alias resolution groupings in CAIDA format, or its binary index
         :param increment: increment for status
         """
         if not no_echos:
             taddrs = self.alladdrs()
         else:
             taddrs = self.addrs
+        if is_index(nodes_file):
+            self.create_nodes_index(nodes_file, taddrs, increment=increment)
+            return
         pb = Progress(message='Creating nodes', increment=increment, callback=lambda: 'Routers {:,d} Interfaces {:,d}'.format(len(self.routers), len(self.interfaces)))
         with fopen(nodes_file, 'rt') as f:
             for line in pb.iterator(f):
@@ -155,6 +224,23 @@ class Container:
                     for addr in naddrs:
                         self.create_node(addr, router)
 
+    def create_nodes_index(self, index_file, taddrs, increment=100000):
+        """
+        Create router nodes from a binary nodes index. Only the nodes containing addresses in taddrs are read, in the
+        same order as the nodes file.
+        :param index_file: index created by build_index
+        :param taddrs: addresses seen in the dataset
+        :param increment: increment for status
+        """
+        with NodesIndex(index_file) as index:
+            nodes = index.nodes(taddrs)
+            pb = Progress(len(nodes), 'Creating nodes', increment=increment, callback=lambda: 'Routers {:,d} Interfaces {:,d}'.format(len(self.routers), len(self.interfaces)))
+            for node in pb.iterator(nodes):
+                router = Router(index.name(node))
+                self.routers[router.name] = router
+                for addr in index.addrs(node):
+                    self.create_node(addr, router)
+
     def create_remaining(self, aliases: bool, no_echos: bool = False, increment=100000):
         """
         Create router nodes for any interfaces not seen in the alias resolution dataset, or when there is not alias resolution dataset.
@@ -162,64 +248,46 @@ class Container:
         :param increment: increment for status
         """
         if not no_echos:
-            taddrs = chain(self.addrs, self.parseres.echos)
-            num_addrs = len(self.addrs) + len(self.parseres.echos)
+            # Echo addresses are usually already in addrs, so only add the rest
+            echos = self.parseres.echos - self.addrs
+            taddrs = chain(self.addrs, echos)
+            num_addrs = len(self.addrs) + len(echos)
         else:
             taddrs = self.addrs
             num_addrs = len(self.addrs)
-        pb = Progress(num_addrs, 'Creating remaining routers and interfaces', increment=increment)
-        for addr in pb.iterator(taddrs):
-            if not aliases or addr not in self.interfaces:
-                router = Router(addr)
-                self.create_node(addr, router)
+        construct.create_remaining(self.interfaces, self.routers, taddrs, num_addrs, aliases, self.ip2as, self.as2org, self.packed, increment=increment)
 
     @staticmethod
-    def add_succ(router: Router, interface: Interface, succ: Union[VRFEdge, Interface]):
-        if succ in router.succ:
-            origins = router.origins[succ]
-            origins.add(interface.asn)
-        else:
-            router.succ.add(succ)
-            router.origins[succ] = {interface.asn}
+    def add_succ(router: Router, interface: Interface, succ: Union[VRFEdge, Interface], count=0):
+        router.add_succ(succ, interface.asn, count)
 
     @staticmethod
     def add_pred(interface: Interface, prouter: Router):
-        predcount = interface.pred.get(prouter, 0)
-        interface.pred[prouter] = predcount + 1
+        interface.add_pred(prouter)
 
-    def add_nexthop(self, increment=100000):
+    def add_nexthop(self, increment=100000, release=False):
         """
         Add nexthop edges.
         :param nexthop: nexthop edges
         :param increment: increment for status
+        :param release: discard the nexthop edges as they are added
         """
-        pb = Progress(len(self.nexthops), 'Adding nexthop edges', increment=increment)
-        for addr, edges in pb.iterator(self.nexthops.items()):
-            interface = self.interfaces[addr]
-            router = interface.router
-            router.nexthop = True
-            for edge in edges:
-                succ = self.interfaces[edge]
-                if succ.router != router:
-                    self.add_succ(router, interface, succ)
-                    self.add_pred(succ, router)
+        nexthops = self.nexthops
+        if release:
+            self.nexthops = None
+        construct.add_nexthop(self.interfaces, nexthops, self.packed, release=release, increment=increment)
 
-    def add_multi(self, increment=100000):
+    def add_multi(self, increment=100000, release=False):
         """
         Add multiple hop edges.
         :param multi: multiple hop edges
         :param increment: increment for status
+        :param release: discard the multihop edges as they are added
         """
-        pb = Progress(len(self.multi), 'Adding multihop edges', increment=increment)
-        for addr in pb.iterator(self.multi):
-            interface = self.interfaces[addr]
-            router = interface.router
-            if not router.nexthop:
-                edges = self.multi[addr]
-                for edge in edges:
-                    succ = self.interfaces[edge]
-                    if succ.router != router:
-                        self.add_succ(router, interface, succ)
+        multi = self.multi
+        if release:
+            self.multi = None
+        construct.add_multi(self.interfaces, multi, self.packed, release=release, increment=increment)
 
     def add_dests(self, increment=100000):
         """
@@ -227,18 +295,66 @@ class Container:
         :param dps: interface to destination mappings
         :param increment: increment for status
         """
+        key = self.key
         pb = Progress(len(self.dps), 'Adding destination ASes', increment=increment)
         for addr, dests in pb.iterator(self.dps.items()):
-            interface = self.interfaces.get(addr)
+            interface = self.interfaces.get(key(addr))
             if interface is not None:
                 interface.dests.update(dests)
 
+    def add_edges_parallel(self, poolsize, increment=100000):
+        """
+        Add nexthop and multihop edges using worker processes. Source addresses are partitioned by router, the workers
+        aggregate each router's edges, and the aggregates are applied here in the order they would have been added by
+        add_nexthop and add_multi, so the graph is identical.
+        :param poolsize: number of worker processes
+        :param increment: increment for status
+        """
+        global _container
+        key = self.key
+        interfaces = self.interfaces
+        parts = [[] for _ in range(poolsize)]
+        i = 0
+        for nexthop, adjs in [(True, self.nexthops), (False, self.multi)]:
+            for addr in adjs:
+                router = interfaces[key(addr)].router
+                parts[hash(router.name) % poolsize].append((i, addr, nexthop))
+                i += 1
+        # Workers inherit the container through fork
+        _container = self
+        try:
+            with Pool(poolsize) as pool:
+                results = pool.map(aggregate_edges, parts)
+        finally:
+            _container = None
+        del parts
+        self.nexthops = None
+        self.multi = None
+        routers = self.routers
+        for nexthop_routers, _ in results:
+            for name in nexthop_routers:
+                routers[name].nexthop = True
+        pb = Progress(sum(len(edges) for _, edges in results), 'Adding edges', increment=increment)
+        for _, rname, skey, origins, predcount, count in pb.iterator(heapq.merge(*[edges for _, edges in results])):
+            router = routers[rname]
+            succ = interfaces[skey]
+            router.add_origins(succ, origins, count)
+            if predcount:
+                succ.add_pred(router, count, predcount)
+
+    def add_dest_pairs(self, increment=1000000):
+        """
+        Add destination ASes directly from the parse results, without creating the intermediate dps mapping.
+        :param increment: increment for status
+        """
+        construct.add_dest_pairs(self.interfaces, self.parseres.dps, self.packed, increment=increment)
+
     def create_graph(self):
         """
         Create the graph based on the interfaces, routers, and edges.
         :return: the graph
         """
-        return Graph(interfaces=self.interfaces, routers=self.routers)
+        return Graph(interfaces=self.interfaces, routers=self.routers, packed=self.packed)
 
     def reset_hints(self):
         for interface in self.interfaces.values():
@@ -246,26 +362,26 @@ class Container:
             interface.router.hints = None
 
     def add_hints(self, hints: Dict[str, int]):
-        for addr, hint in hints.items():
-            if addr in self.interfaces:
-                interface = self.interfaces[addr]
-                interface.hint = hint
-                if not interface.router.hints:
-                    interface.router.hints = {hint}
-                else:
-                    interface.router.hints.add(hint)
+        construct.add_hints(self.interfaces, hints, self.packed)
 
     def add_hints_file(self, filename):
         print('Adding hints from {}'.format(filename))
-        df = pd.read_csv(filename, sep=r'\s+', index_col=0, names=['addr', 'tasn'])
-        hints = dict(df.tasn)
-        self.add_hints(hints)
+        with fopen(filename, 'rt') as f:
+            tokens = f.read().split()
+        if len(tokens) % 2:
+            raise ValueError('Hints file {} must have two columns, addr and ASN.'.format(filename))
+        # Later lines for the same address replace earlier ones
+        hints = dict(zip(tokens[::2], tokens[1::2]))
+        del tokens
+        key = self.key
+        interfaces = self.interfaces
+        self.add_hints({addr: int(tasn) for addr, tasn in hints.items() if key(addr) in interfaces})
 
     def reset(self):
         self.interfaces = {}
         self.routers = {}
 
-    def construct(self, nodes_file=None, loop=True, hints_file=None, no_echos=False):
+    def construct(self, nodes_file=None, loop=True, hints_file=None, no_echos=False, poolsize=1):
         """
         Construct the graph from scratch.
         :param addrs: addresses seen in the dataset
@@ -273,17 +389,19 @@ class Container:
         :param multi: multiple hop edges
         :param dps: interface to destination ASes
         :param nodes_file: alias resolution dataset
+        :param poolsize: add edges with this many worker processes
         :return: the graph
         """
-        self.filter_addrs(loop=loop, no_echos=no_echos)
-        self.create_edges(loop=loop)
-        self.create_dps()
+        self.classify(loop=loop, no_echos=no_echos)
         if nodes_file is not None:
             self.create_nodes(nodes_file=nodes_file, no_echos=no_echos)
         self.create_remaining(nodes_file is not None, no_echos=no_echos)
-        self.add_nexthop()
-        self.add_multi()
-        self.add_dests()
+        if poolsize > 1:
+            self.add_edges_parallel(poolsize)
+        else:
+            self.add_nexthop(release=True)
+            self.add_multi(release=True)
+        self.add_dest_pairs()
         if hints_file is not None:
             self.add_hints_file(hints_file)
         return self.create_graph()
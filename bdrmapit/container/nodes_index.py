@@ -0,0 +1,213 @@
+import mmap
+import socket
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+from traceutils.file2.file2 import fopen
+from traceutils.progress.bar import Progress
+
+MAGIC = b'BDRNODES'
+VERSION = 1
+HEADER = struct.Struct('<8sIxxxxQQQQQ')
+HEADER_SIZE = 56
+MASK64 = (1 << 64) - 1
+
+
+def is_index(filename):
+    """
+    Check whether a file is a binary nodes index rather than an ITDK nodes file.
+    """
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def canonical(addr: str):
+    """
+    Return the address in the form the index stores it.
+    """
+    if ':' in addr:
+        return socket.inet_ntop(socket.AF_INET6, socket.inet_pton(socket.AF_INET6, addr))
+    return socket.inet_ntoa(socket.inet_aton(addr))
+
+
+def build_index(nodes_file, output, increment=100000):
+    """
+    Convert an ITDK nodes file into a binary index. The index holds the IPv4 and IPv6 addresses sorted with the
+    position of their node, and for each node its name and the positions of its addresses in file order.
+    :param nodes_file: alias resolution groupings in CAIDA ITDK format
+    :param output: index filename
+    :param increment: increment for status
+    """
+    v4 = []
+    v6 = []
+    names = []
+    nodeaddrs = []
+    pb = Progress(message='Reading nodes', increment=increment, callback=lambda: 'Nodes {:,d} IPv4 {:,d} IPv6 {:,d}'.format(len(names), len(v4), len(v6)))
+    with fopen(nodes_file, 'rt') as f:
+        for line in pb.iterator(f):
+            if line[0] != '#':
+                _, nid, *naddrs = line.split()
+                node = len(names)
+                names.append(nid[:-1])
+                addrs = []
+                for addr in naddrs:
+                    if ':' in addr:
+                        addrs.append((True, len(v6)))
+                        v6.append((int.from_bytes(socket.inet_pton(socket.AF_INET6, addr), 'big'), node))
+                    else:
+                        addrs.append((False, len(v4)))
+                        v4.append((int.from_bytes(socket.inet_aton(addr), 'big'), node))
+                nodeaddrs.append(addrs)
+    # Sorting moves addresses, so remap each node's address references to the sorted positions
+    order4 = sorted(range(len(v4)), key=lambda i: v4[i][0])
+    order6 = sorted(range(len(v6)), key=lambda i: v6[i][0])
+    pos4 = array('Q', bytes(8 * len(v4)))
+    for pos, i in enumerate(order4):
+        pos4[i] = pos
+    pos6 = array('Q', bytes(8 * len(v6)))
+    for pos, i in enumerate(order6):
+        pos6[i] = pos
+    n4 = len(v4)
+    refs = array('Q')
+    refoffsets = array('Q', [0])
+    for addrs in nodeaddrs:
+        refs.extend(n4 + pos6[i] if ipv6 else pos4[i] for ipv6, i in addrs)
+        refoffsets.append(len(refs))
+    encoded = [name.encode() for name in names]
+    nameoffsets = array('Q', [0])
+    for name in encoded:
+        nameoffsets.append(nameoffsets[-1] + len(name))
+    blob = b''.join(encoded)
+    sections = [
+        array('I', [v4[i][0] for i in order4]),
+        array('I', [v4[i][1] for i in order4]),
+        array('Q', [v6[i][0] >> 64 for i in order6]),
+        array('Q', [v6[i][0] & MASK64 for i in order6]),
+        array('I', [v6[i][1] for i in order6]),
+        refoffsets,
+        refs,
+        nameoffsets,
+    ]
+    with open(output, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, n4, len(v6), len(names), len(refs), len(blob)).ljust(HEADER_SIZE, b'\0'))
+        for section in sections:
+            section.tofile(f)
+            # Keep every section 8 byte aligned for the memoryview casts
+            f.write(bytes(-f.tell() % 8))
+        f.write(blob)
+
+
+class NodesIndex:
+    """
+    Memory-mapped binary nodes index created by build_index.
+    """
+
+    def __init__(self, filename):
+        self.file = open(filename, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self.mm)
+        magic, version, self.n4, self.n6, self.nnodes, nrefs, nblob = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError('{} is not a nodes index.'.format(filename))
+        if version != VERSION:
+            raise ValueError('Unsupported nodes index version {} in {}.'.format(version, filename))
+        offset = HEADER_SIZE
+        views = []
+        for fmt, size, n in [('I', 4, self.n4), ('I', 4, self.n4), ('Q', 8, self.n6), ('Q', 8, self.n6), ('I', 4, self.n6), ('Q', 8, self.nnodes + 1), ('Q', 8, nrefs), ('Q', 8, self.nnodes + 1)]:
+            views.append(buf[offset:offset + size * n].cast(fmt))
+            offset += size * n
+            offset += -offset % 8
+        self.v4addrs, self.v4nodes, self.v6hi, self.v6lo, self.v6nodes, self.refoffsets, self.refs, self.nameoffsets = views
+        self.blob = buf[offset:offset + nblob]
+        self.views = views + [self.blob, buf]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __len__(self):
+        return self.nnodes
+
+    def node(self, addr: str):
+        """
+        Return the node containing an address, or -1 if no node contains it.
+        """
+        try:
+            if ':' in addr:
+                value = int.from_bytes(socket.inet_pton(socket.AF_INET6, addr), 'big')
+            else:
+                value = int.from_bytes(socket.inet_aton(addr), 'big')
+                i = bisect_left(self.v4addrs, value)
+                return self.v4nodes[i] if i < self.n4 and self.v4addrs[i] == value else -1
+        except OSError:
+            return -1
+        ahi = value >> 64
+        alo = value & MASK64
+        lo = bisect_left(self.v6hi, ahi)
+        hi = bisect_right(self.v6hi, ahi, lo)
+        i = bisect_left(self.v6lo, alo, lo, hi)
+        return self.v6nodes[i] if i < hi and self.v6lo[i] == alo else -1
+
+    def nodes(self, addrs):
+        """
+        Return the sorted nodes containing any of the addresses.
+        """
+        found = set()
+        for addr in addrs:
+            node = self.node(addr)
+            if node >= 0:
+                found.add(node)
+        return sorted(found)
+
+    def name(self, node):
+        return bytes(self.blob[self.nameoffsets[node]:self.nameoffsets[node + 1]]).decode()
+
+    def addrs(self, node):
+        """
+        Return the addresses of a node in the order of the nodes file.
+        """
+        n4 = self.n4
+        addrs = []
+        for i in range(self.refoffsets[node], self.refoffsets[node + 1]):
+            ref = self.refs[i]
+            if ref < n4:
+                addrs.append(socket.inet_ntoa(self.v4addrs[ref].to_bytes(4, 'big')))
+            else:
+                ref -= n4
+                addrs.append(socket.inet_ntop(socket.AF_INET6, ((self.v6hi[ref] << 64) | self.v6lo[ref]).to_bytes(16, 'big')))
+        return addrs
+
+    def close(self):
+        for view in self.views:
+            view.release()
+        self.mm.close()
+        self.file.close()
+
+
+def verify_index(nodes_file, index_file, increment=100000):
+    """
+    Compare an index with the nodes file it was built from. Every node must have the same name and addresses, in file
+    order and compared in canonical form, and each address must look up its node.
+    :return: list of (node name, address) pairs that differ, with address None when the node itself differs
+    """
+    mismatches = []
+    with NodesIndex(index_file) as index, fopen(nodes_file, 'rt') as f:
+        node = 0
+        pb = Progress(message='Verifying nodes index', increment=increment, callback=lambda: 'Mismatches {:,d}'.format(len(mismatches)))
+        for line in pb.iterator(f):
+            if line[0] == '#':
+                continue
+            _, nid, *naddrs = line.split()
+            name = nid[:-1]
+            if node >= len(index) or index.name(node) != name or index.addrs(node) != [canonical(addr) for addr in naddrs]:
+                mismatches.append((name, None))
+            else:
+                mismatches.extend((name, addr) for addr in naddrs if index.node(addr) != node)
+            node += 1
+        if node != len(index):
+            mismatches.append((None, None))
+    return mismatches
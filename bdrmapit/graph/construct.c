@@ -0,0 +1,13430 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [],
+        "name": "bdrmapit.graph.construct",
+        "sources": [
+            "bdrmapit/graph/construct.pyx"
+        ]
+    },
+    "module_name": "bdrmapit.graph.construct"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__bdrmapit__graph__construct
+#define __PYX_HAVE_API__bdrmapit__graph__construct
+/* Early includes */
+#include <arpa/inet.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "bdrmapit/graph/construct.pyx",
+  "bdrmapit/graph/construct.pxd",
+  "stringsource",
+  "dicts.pxd",
+  "as2org.pxd",
+  "radix_prefix.pxd",
+  "radix_node.pxd",
+  "radix_tree.pxd",
+  "radix.pxd",
+  "ip2as.pxd",
+  "bdrmapit/graph/node.pxd",
+};
+
+/*--- Type declarations ---*/
+struct __pyx_obj_10traceutils_5utils_5dicts_CustomDict;
+struct __pyx_obj_10traceutils_5utils_5dicts_StrDict;
+struct __pyx_obj_10traceutils_5utils_5dicts_EmptyDict;
+struct __pyx_obj_10traceutils_5utils_5dicts_ZeroDict;
+struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org;
+struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix;
+struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode;
+struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASN;
+struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASNs;
+struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeData;
+struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree;
+struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeASN;
+struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeASNs;
+struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeData;
+struct __pyx_obj_10traceutils_5radix_5radix_Radix;
+struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS;
+struct __pyx_obj_8bdrmapit_5graph_4node_Origins;
+struct __pyx_obj_8bdrmapit_5graph_4node_Router;
+struct __pyx_obj_8bdrmapit_5graph_4node_Interface;
+struct __pyx_obj_8bdrmapit_5graph_9construct_Graph;
+struct __pyx_opt_args_10traceutils_5radix_12radix_prefix_from_network;
+struct __pyx_opt_args_10traceutils_5radix_12radix_prefix_from_packed;
+struct __pyx_ctuple_char__ptr__and_char__ptr;
+typedef struct __pyx_ctuple_char__ptr__and_char__ptr __pyx_ctuple_char__ptr__and_char__ptr;
+
+/* "traceutils/radix/radix_prefix.pxd":22
+ * cdef unsigned char find_family(bytes network);
+ * # cdef Network partition(bytes b);
+ * cdef RadixPrefix from_network(str s, char masklen=*);             # <<<<<<<<<<<<<<
+ * cdef RadixPrefix from_address(str s);
+ * cdef RadixPrefix from_packed(bytes addr, char masklen=*);
+ */
+struct __pyx_opt_args_10traceutils_5radix_12radix_prefix_from_network {
+  int __pyx_n;
+  char masklen;
+};
+
+/* "traceutils/radix/radix_prefix.pxd":24
+ * cdef RadixPrefix from_network(str s, char masklen=*);
+ * cdef RadixPrefix from_address(str s);
+ * cdef RadixPrefix from_packed(bytes addr, char masklen=*);             # <<<<<<<<<<<<<<
+ * cdef (char*, char*) partition(bytes b);
+ */
+struct __pyx_opt_args_10traceutils_5radix_12radix_prefix_from_packed {
+  int __pyx_n;
+  char masklen;
+};
+
+/* "traceutils/radix/radix_prefix.pxd":25
+ * cdef RadixPrefix from_address(str s);
+ * cdef RadixPrefix from_packed(bytes addr, char masklen=*);
+ * cdef (char*, char*) partition(bytes b);             # <<<<<<<<<<<<<<
+ */
+struct __pyx_ctuple_char__ptr__and_char__ptr {
+  char *f0;
+  char *f1;
+};
+struct __pyx_opt_args_10traceutils_5radix_10radix_tree_9RadixTree_create_node;
+struct __pyx_opt_args_10traceutils_5radix_10radix_tree_13RadixTreeData_add_data;
+
+/* "traceutils/radix/radix_tree.pxd":14
+ *     cdef long active_nodes
+ * 
+ *     cdef RadixNode create_node(self, RadixPrefix prefix=*, unsigned char prefix_size=*, RadixNode parent=*);             # <<<<<<<<<<<<<<
+ *     cdef RadixNode add(self, RadixPrefix prefix);
+ *     cdef void remove(self, RadixNode node) except *;
+ */
+struct __pyx_opt_args_10traceutils_5radix_10radix_tree_9RadixTree_create_node {
+  int __pyx_n;
+  struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *prefix;
+  unsigned char prefix_size;
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *parent;
+};
+
+/* "traceutils/radix/radix_tree.pxd":29
+ * 
+ * cdef class RadixTreeData(RadixTree):
+ *     cdef RadixNodeData add_data(self, RadixPrefix prefix, dict data=*)             # <<<<<<<<<<<<<<
+ */
+struct __pyx_opt_args_10traceutils_5radix_10radix_tree_13RadixTreeData_add_data {
+  int __pyx_n;
+  PyObject *data;
+};
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_add;
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_delete;
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_exact_prefix;
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_best_prefix;
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_worst_prefix;
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_covered_prefix;
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_covering_prefix;
+
+/* "traceutils/radix/radix.pxd":19
+ *     cdef list _search_covered(self, RadixPrefix prefix);
+ * 
+ *     cpdef RadixNode add(self, str network, short masklen=*);             # <<<<<<<<<<<<<<
+ *     cpdef RadixNode add_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef void delete(self, str network, short masklen=*) except *;
+ */
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_add {
+  int __pyx_n;
+  short masklen;
+};
+
+/* "traceutils/radix/radix.pxd":21
+ *     cpdef RadixNode add(self, str network, short masklen=*);
+ *     cpdef RadixNode add_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef void delete(self, str network, short masklen=*) except *;             # <<<<<<<<<<<<<<
+ *     cpdef void delete_packed(self, bytes packed, unsigned char masklen) except *;
+ *     cpdef RadixNode search_exact(self, str addr);
+ */
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_delete {
+  int __pyx_n;
+  short masklen;
+};
+
+/* "traceutils/radix/radix.pxd":24
+ *     cpdef void delete_packed(self, bytes packed, unsigned char masklen) except *;
+ *     cpdef RadixNode search_exact(self, str addr);
+ *     cpdef RadixNode search_exact_prefix(self, str network, short masklen=*);             # <<<<<<<<<<<<<<
+ *     cpdef RadixNode search_exact_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef RadixNode search_best(self, str addr);
+ */
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_exact_prefix {
+  int __pyx_n;
+  short masklen;
+};
+
+/* "traceutils/radix/radix.pxd":27
+ *     cpdef RadixNode search_exact_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef RadixNode search_best(self, str addr);
+ *     cpdef RadixNode search_best_prefix(self, str network, short masklen=*);             # <<<<<<<<<<<<<<
+ *     cpdef RadixNode search_best_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef RadixNode search_worst(self, str addr);
+ */
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_best_prefix {
+  int __pyx_n;
+  short masklen;
+};
+
+/* "traceutils/radix/radix.pxd":30
+ *     cpdef RadixNode search_best_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef RadixNode search_worst(self, str addr);
+ *     cpdef RadixNode search_worst_prefix(self, str network, short masklen=*);             # <<<<<<<<<<<<<<
+ *     cpdef RadixNode search_worst_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef list search_covered(self, str addr);
+ */
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_worst_prefix {
+  int __pyx_n;
+  short masklen;
+};
+
+/* "traceutils/radix/radix.pxd":33
+ *     cpdef RadixNode search_worst_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef list search_covered(self, str addr);
+ *     cpdef list search_covered_prefix(self, str network, short masklen=*);             # <<<<<<<<<<<<<<
+ *     cpdef list search_covered_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef list search_covering(self, str addr);
+ */
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_covered_prefix {
+  int __pyx_n;
+  short masklen;
+};
+
+/* "traceutils/radix/radix.pxd":36
+ *     cpdef list search_covered_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef list search_covering(self, str addr);
+ *     cpdef list search_covering_prefix(self, str network, short masklen=*);             # <<<<<<<<<<<<<<
+ *     cpdef list search_covering_packed(self, bytes packed, unsigned char masklen);
+ *     cpdef list nodes(self);
+ */
+struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_covering_prefix {
+  int __pyx_n;
+  short masklen;
+};
+struct __pyx_opt_args_10traceutils_5radix_5ip2as_5IP2AS_add_asn;
+
+/* "traceutils/radix/ip2as.pxd":10
+ * 
+ * cdef class IP2AS(Radix):
+ *     cpdef RadixNodeASN add_asn(self, str network, short masklen=*, long asn=*);             # <<<<<<<<<<<<<<
+ *     cpdef long asn(self, str asn);
+ *     cpdef long asn_packed(self, bytes packed);
+ */
+struct __pyx_opt_args_10traceutils_5radix_5ip2as_5IP2AS_add_asn {
+  int __pyx_n;
+  short masklen;
+  long asn;
+};
+struct __pyx_opt_args_8bdrmapit_5graph_4node_6Router_add_succ;
+struct __pyx_opt_args_8bdrmapit_5graph_4node_6Router_add_origins;
+struct __pyx_opt_args_8bdrmapit_5graph_4node_9Interface_add_pred;
+
+/* "bdrmapit/graph/node.pxd":27
+ *     cdef void _add_count(self, object succ, long count) except *;
+ *     cpdef void add_interface(self, Interface interface) except *;
+ *     cpdef void add_succ(self, object succ, long asn, long count=*) except *;             # <<<<<<<<<<<<<<
+ *     cpdef void add_origins(self, object succ, object asns, long count=*) except *;
+ *     cpdef void add_dests(self, object dests) except *;
+ */
+struct __pyx_opt_args_8bdrmapit_5graph_4node_6Router_add_succ {
+  int __pyx_n;
+  long count;
+};
+
+/* "bdrmapit/graph/node.pxd":28
+ *     cpdef void add_interface(self, Interface interface) except *;
+ *     cpdef void add_succ(self, object succ, long asn, long count=*) except *;
+ *     cpdef void add_origins(self, object succ, object asns, long count=*) except *;             # <<<<<<<<<<<<<<
+ *     cpdef void add_dests(self, object dests) except *;
+ *     cpdef void clear_edges(self);
+ */
+struct __pyx_opt_args_8bdrmapit_5graph_4node_6Router_add_origins {
+  int __pyx_n;
+  long count;
+};
+
+/* "bdrmapit/graph/node.pxd":50
+ *         public int hint
+ * 
+ *     cpdef void add_pred(self, Router router, long count=*, long edges=*) except *;             # <<<<<<<<<<<<<<
+ *     cpdef Interface copy(self);
+ * 
+ */
+struct __pyx_opt_args_8bdrmapit_5graph_4node_9Interface_add_pred {
+  int __pyx_n;
+  long count;
+  long edges;
+};
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_classify;
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_node;
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_remaining;
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_nexthop;
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_multi;
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_dest_pairs;
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_hints;
+
+/* "bdrmapit/graph/construct.pxd":14
+ *     cpdef bint has_interface(self, object addr);
+ * 
+ * cpdef tuple classify(object nextadjs, object multiadjs, object loopadjs, object first, object dps, object echos, IP2AS ip2as, bint loop=*, bint no_echos=*, int increment=*);             # <<<<<<<<<<<<<<
+ * cpdef Interface create_node(dict interfaces, dict routers, str addr, Router router, IP2AS ip2as, AS2Org as2org, bint packed=*);
+ * cpdef void create_remaining(dict interfaces, dict routers, object addrs, Py_ssize_t num_addrs, bint aliases, IP2AS ip2as, AS2Org as2org, bint packed=*, int increment=*) except *;
+ */
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_classify {
+  int __pyx_n;
+  int loop;
+  int no_echos;
+  int increment;
+};
+
+/* "bdrmapit/graph/construct.pxd":15
+ * 
+ * cpdef tuple classify(object nextadjs, object multiadjs, object loopadjs, object first, object dps, object echos, IP2AS ip2as, bint loop=*, bint no_echos=*, int increment=*);
+ * cpdef Interface create_node(dict interfaces, dict routers, str addr, Router router, IP2AS ip2as, AS2Org as2org, bint packed=*);             # <<<<<<<<<<<<<<
+ * cpdef void create_remaining(dict interfaces, dict routers, object addrs, Py_ssize_t num_addrs, bint aliases, IP2AS ip2as, AS2Org as2org, bint packed=*, int increment=*) except *;
+ * cpdef void add_nexthop(dict interfaces, dict nexthops, bint packed=*, bint release=*, int increment=*) except *;
+ */
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_node {
+  int __pyx_n;
+  int packed;
+};
+
+/* "bdrmapit/graph/construct.pxd":16
+ * cpdef tuple classify(object nextadjs, object multiadjs, object loopadjs, object first, object dps, object echos, IP2AS ip2as, bint loop=*, bint no_echos=*, int increment=*);
+ * cpdef Interface create_node(dict interfaces, dict routers, str addr, Router router, IP2AS ip2as, AS2Org as2org, bint packed=*);
+ * cpdef void create_remaining(dict interfaces, dict routers, object addrs, Py_ssize_t num_addrs, bint aliases, IP2AS ip2as, AS2Org as2org, bint packed=*, int increment=*) except *;             # <<<<<<<<<<<<<<
+ * cpdef void add_nexthop(dict interfaces, dict nexthops, bint packed=*, bint release=*, int increment=*) except *;
+ * cpdef void add_multi(dict interfaces, dict multi, bint packed=*, bint release=*, int increment=*) except *;
+ */
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_remaining {
+  int __pyx_n;
+  int packed;
+  int increment;
+};
+
+/* "bdrmapit/graph/construct.pxd":17
+ * cpdef Interface create_node(dict interfaces, dict routers, str addr, Router router, IP2AS ip2as, AS2Org as2org, bint packed=*);
+ * cpdef void create_remaining(dict interfaces, dict routers, object addrs, Py_ssize_t num_addrs, bint aliases, IP2AS ip2as, AS2Org as2org, bint packed=*, int increment=*) except *;
+ * cpdef void add_nexthop(dict interfaces, dict nexthops, bint packed=*, bint release=*, int increment=*) except *;             # <<<<<<<<<<<<<<
+ * cpdef void add_multi(dict interfaces, dict multi, bint packed=*, bint release=*, int increment=*) except *;
+ * cpdef void add_dest_pairs(dict interfaces, set dps, bint packed=*, int increment=*) except *;
+ */
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_nexthop {
+  int __pyx_n;
+  int packed;
+  int release;
+  int increment;
+};
+
+/* "bdrmapit/graph/construct.pxd":18
+ * cpdef void create_remaining(dict interfaces, dict routers, object addrs, Py_ssize_t num_addrs, bint aliases, IP2AS ip2as, AS2Org as2org, bint packed=*, int increment=*) except *;
+ * cpdef void add_nexthop(dict interfaces, dict nexthops, bint packed=*, bint release=*, int increment=*) except *;
+ * cpdef void add_multi(dict interfaces, dict multi, bint packed=*, bint release=*, int increment=*) except *;             # <<<<<<<<<<<<<<
+ * cpdef void add_dest_pairs(dict interfaces, set dps, bint packed=*, int increment=*) except *;
+ * cpdef void add_hints(dict interfaces, dict hints, bint packed=*) except *;
+ */
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_multi {
+  int __pyx_n;
+  int packed;
+  int release;
+  int increment;
+};
+
+/* "bdrmapit/graph/construct.pxd":19
+ * cpdef void add_nexthop(dict interfaces, dict nexthops, bint packed=*, bint release=*, int increment=*) except *;
+ * cpdef void add_multi(dict interfaces, dict multi, bint packed=*, bint release=*, int increment=*) except *;
+ * cpdef void add_dest_pairs(dict interfaces, set dps, bint packed=*, int increment=*) except *;             # <<<<<<<<<<<<<<
+ * cpdef void add_hints(dict interfaces, dict hints, bint packed=*) except *;
+ */
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_dest_pairs {
+  int __pyx_n;
+  int packed;
+  int increment;
+};
+
+/* "bdrmapit/graph/construct.pxd":20
+ * cpdef void add_multi(dict interfaces, dict multi, bint packed=*, bint release=*, int increment=*) except *;
+ * cpdef void add_dest_pairs(dict interfaces, set dps, bint packed=*, int increment=*) except *;
+ * cpdef void add_hints(dict interfaces, dict hints, bint packed=*) except *;             # <<<<<<<<<<<<<<
+ */
+struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_hints {
+  int __pyx_n;
+  int packed;
+};
+
+/* "traceutils/utils/dicts.pxd":1
+ * cdef class CustomDict(dict):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_10traceutils_5utils_5dicts_CustomDict {
+  PyDictObject __pyx_base;
+};
+
+
+/* "traceutils/utils/dicts.pxd":4
+ *     pass
+ * 
+ * cdef class StrDict(CustomDict):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_10traceutils_5utils_5dicts_StrDict {
+  struct __pyx_obj_10traceutils_5utils_5dicts_CustomDict __pyx_base;
+};
+
+
+/* "traceutils/utils/dicts.pxd":7
+ *     pass
+ * 
+ * cdef class EmptyDict(CustomDict):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_10traceutils_5utils_5dicts_EmptyDict {
+  struct __pyx_obj_10traceutils_5utils_5dicts_CustomDict __pyx_base;
+};
+
+
+/* "traceutils/utils/dicts.pxd":10
+ *     pass
+ * 
+ * cdef class ZeroDict(CustomDict):             # <<<<<<<<<<<<<<
+ *     pass
+ */
+struct __pyx_obj_10traceutils_5utils_5dicts_ZeroDict {
+  struct __pyx_obj_10traceutils_5utils_5dicts_CustomDict __pyx_base;
+};
+
+
+/* "traceutils/as2org/as2org.pxd":3
+ * from traceutils.utils.dicts cimport StrDict, EmptyDict
+ * 
+ * cdef class AS2Org:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         public StrDict orgs
+ */
+struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_10traceutils_6as2org_6as2org_AS2Org *__pyx_vtab;
+  struct __pyx_obj_10traceutils_5utils_5dicts_StrDict *orgs;
+  struct __pyx_obj_10traceutils_5utils_5dicts_StrDict *asn_names;
+  struct __pyx_obj_10traceutils_5utils_5dicts_StrDict *asn_org_names;
+  struct __pyx_obj_10traceutils_5utils_5dicts_EmptyDict *siblings;
+  PyObject *org_cc;
+};
+
+
+/* "traceutils/radix/radix_prefix.pxd":10
+ *         cdef int inet_pton(int, char*, void*)
+ * 
+ * cdef class RadixPrefix:             # <<<<<<<<<<<<<<
+ *     cdef readonly bytes addr
+ *     cdef readonly unsigned char bitlen
+ */
+struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_10traceutils_5radix_12radix_prefix_RadixPrefix *__pyx_vtab;
+  PyObject *addr;
+  unsigned char bitlen;
+  unsigned char family;
+};
+
+
+/* "traceutils/radix/radix_node.pxd":3
+ * from traceutils.radix.radix_prefix cimport RadixPrefix
+ * 
+ * cdef class RadixNode:             # <<<<<<<<<<<<<<
+ *     cdef public RadixPrefix prefix
+ *     cdef RadixNode parent, left, right
+ */
+struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode {
+  PyObject_HEAD
+  struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *prefix;
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *parent;
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *left;
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *right;
+  unsigned char bitlen;
+};
+
+
+/* "traceutils/radix/radix_node.pxd":8
+ *     cdef public unsigned char bitlen
+ * 
+ * cdef class RadixNodeASN(RadixNode):             # <<<<<<<<<<<<<<
+ *     cdef public int asn
+ * 
+ */
+struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASN {
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode __pyx_base;
+  int asn;
+};
+
+
+/* "traceutils/radix/radix_node.pxd":11
+ *     cdef public int asn
+ * 
+ * cdef class RadixNodeASNs(RadixNode):             # <<<<<<<<<<<<<<
+ *     cdef public list asns
+ * 
+ */
+struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASNs {
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode __pyx_base;
+  PyObject *asns;
+};
+
+
+/* "traceutils/radix/radix_node.pxd":14
+ *     cdef public list asns
+ * 
+ * cdef class RadixNodeData(RadixNode):             # <<<<<<<<<<<<<<
+ *     cdef public dict data
+ */
+struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeData {
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode __pyx_base;
+  PyObject *data;
+};
+
+
+/* "traceutils/radix/radix_tree.pxd":9
+ * # cdef bint prefix_match2(bytes left, bytes right, unsigned char bitlen);
+ * 
+ * cdef class RadixTree:             # <<<<<<<<<<<<<<
+ *     # cdef unsigned char maxbits
+ *     cdef RadixNode head
+ */
+struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTree *__pyx_vtab;
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *head;
+  long active_nodes;
+};
+
+
+/* "traceutils/radix/radix_tree.pxd":22
+ *     cdef list search_covered(self, RadixPrefix prefix);
+ * 
+ * cdef class RadixTreeASN(RadixTree):             # <<<<<<<<<<<<<<
+ *     cdef RadixNodeASN add_asn(self, RadixPrefix prefix, int asn);
+ * 
+ */
+struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeASN {
+  struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree __pyx_base;
+};
+
+
+/* "traceutils/radix/radix_tree.pxd":25
+ *     cdef RadixNodeASN add_asn(self, RadixPrefix prefix, int asn);
+ * 
+ * cdef class RadixTreeASNs(RadixTree):             # <<<<<<<<<<<<<<
+ *     cdef RadixNodeASNs add_asns(self, RadixPrefix prefix, list asns);
+ * 
+ */
+struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeASNs {
+  struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree __pyx_base;
+};
+
+
+/* "traceutils/radix/radix_tree.pxd":28
+ *     cdef RadixNodeASNs add_asns(self, RadixPrefix prefix, list asns);
+ * 
+ * cdef class RadixTreeData(RadixTree):             # <<<<<<<<<<<<<<
+ *     cdef RadixNodeData add_data(self, RadixPrefix prefix, dict data=*)
+ */
+struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeData {
+  struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree __pyx_base;
+};
+
+
+/* "traceutils/radix/radix.pxd":7
+ * cdef list _search_covering(RadixNode node);
+ * 
+ * cdef class Radix:             # <<<<<<<<<<<<<<
+ *     cdef RadixTree _tree4
+ *     cdef RadixTree _tree6
+ */
+struct __pyx_obj_10traceutils_5radix_5radix_Radix {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_10traceutils_5radix_5radix_Radix *__pyx_vtab;
+  struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree *_tree4;
+  struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree *_tree6;
+  long gen_id;
+};
+
+
+/* "traceutils/radix/ip2as.pxd":9
+ * 
+ * 
+ * cdef class IP2AS(Radix):             # <<<<<<<<<<<<<<
+ *     cpdef RadixNodeASN add_asn(self, str network, short masklen=*, long asn=*);
+ *     cpdef long asn(self, str asn);
+ */
+struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS {
+  struct __pyx_obj_10traceutils_5radix_5radix_Radix __pyx_base;
+};
+
+
+/* "bdrmapit/graph/node.pxd":1
+ * cdef class Origins:             # <<<<<<<<<<<<<<
+ *     cdef dict data
+ * 
+ */
+struct __pyx_obj_8bdrmapit_5graph_4node_Origins {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Origins *__pyx_vtab;
+  PyObject *data;
+};
+
+
+/* "bdrmapit/graph/node.pxd":11
+ * cdef class Interface
+ * 
+ * cdef class Router:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         readonly str name
+ */
+struct __pyx_obj_8bdrmapit_5graph_4node_Router {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Router *__pyx_vtab;
+  PyObject *name;
+  PyObject *interfaces;
+  int nexthop;
+  int vrf;
+  PyObject *_succ;
+  PyObject *_dests;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Origins *_origins;
+  PyObject *_counts;
+  int echo;
+  int cycle;
+  PyObject *hints;
+};
+
+
+/* "bdrmapit/graph/node.pxd":9
+ *     cpdef Origins copy(self);
+ * 
+ * cdef class Interface             # <<<<<<<<<<<<<<
+ * 
+ * cdef class Router:
+ */
+struct __pyx_obj_8bdrmapit_5graph_4node_Interface {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Interface *__pyx_vtab;
+  PyObject *key;
+  int asn;
+  PyObject *org;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Router *router;
+  PyObject *pred;
+  PyObject *_pred_counts;
+  PyObject *dests;
+  int vrf;
+  int echo;
+  int cycle;
+  int hint;
+};
+
+
+/* "bdrmapit/graph/construct.pxd":6
+ * from bdrmapit.graph.node cimport Interface, Router
+ * 
+ * cdef class Graph:             # <<<<<<<<<<<<<<
+ *     cdef readonly dict interfaces, routers
+ *     cdef readonly bint packed
+ */
+struct __pyx_obj_8bdrmapit_5graph_9construct_Graph {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_8bdrmapit_5graph_9construct_Graph *__pyx_vtab;
+  PyObject *interfaces;
+  PyObject *routers;
+  int packed;
+};
+
+
+
+/* "traceutils/as2org/as2org.pxd":3
+ * from traceutils.utils.dicts cimport StrDict, EmptyDict
+ * 
+ * cdef class AS2Org:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         public StrDict orgs
+ */
+
+struct __pyx_vtabstruct_10traceutils_6as2org_6as2org_AS2Org {
+  PyObject *(*name)(struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *, int, int __pyx_skip_dispatch);
+  PyObject *(*asn_name)(struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *, int, int __pyx_skip_dispatch);
+  PyObject *(*asn_cc)(struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *, int, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_10traceutils_6as2org_6as2org_AS2Org *__pyx_vtabptr_10traceutils_6as2org_6as2org_AS2Org;
+
+
+/* "traceutils/radix/radix_prefix.pxd":10
+ *         cdef int inet_pton(int, char*, void*)
+ * 
+ * cdef class RadixPrefix:             # <<<<<<<<<<<<<<
+ *     cdef readonly bytes addr
+ *     cdef readonly unsigned char bitlen
+ */
+
+struct __pyx_vtabstruct_10traceutils_5radix_12radix_prefix_RadixPrefix {
+  PyObject *(*network)(struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_10traceutils_5radix_12radix_prefix_RadixPrefix *__pyx_vtabptr_10traceutils_5radix_12radix_prefix_RadixPrefix;
+
+
+/* "traceutils/radix/radix_tree.pxd":9
+ * # cdef bint prefix_match2(bytes left, bytes right, unsigned char bitlen);
+ * 
+ * cdef class RadixTree:             # <<<<<<<<<<<<<<
+ *     # cdef unsigned char maxbits
+ *     cdef RadixNode head
+ */
+
+struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTree {
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*create_node)(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree *, struct __pyx_opt_args_10traceutils_5radix_10radix_tree_9RadixTree_create_node *__pyx_optional_args);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*add)(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *);
+  void (*remove)(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree *, struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_best)(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_exact)(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_worst)(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *);
+  PyObject *(*search_covered)(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *);
+};
+static struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTree *__pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTree;
+
+
+/* "traceutils/radix/radix_tree.pxd":22
+ *     cdef list search_covered(self, RadixPrefix prefix);
+ * 
+ * cdef class RadixTreeASN(RadixTree):             # <<<<<<<<<<<<<<
+ *     cdef RadixNodeASN add_asn(self, RadixPrefix prefix, int asn);
+ * 
+ */
+
+struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTreeASN {
+  struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTree __pyx_base;
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASN *(*add_asn)(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeASN *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *, int);
+};
+static struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTreeASN *__pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTreeASN;
+
+
+/* "traceutils/radix/radix_tree.pxd":25
+ *     cdef RadixNodeASN add_asn(self, RadixPrefix prefix, int asn);
+ * 
+ * cdef class RadixTreeASNs(RadixTree):             # <<<<<<<<<<<<<<
+ *     cdef RadixNodeASNs add_asns(self, RadixPrefix prefix, list asns);
+ * 
+ */
+
+struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTreeASNs {
+  struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTree __pyx_base;
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASNs *(*add_asns)(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeASNs *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *, PyObject *);
+};
+static struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTreeASNs *__pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTreeASNs;
+
+
+/* "traceutils/radix/radix_tree.pxd":28
+ *     cdef RadixNodeASNs add_asns(self, RadixPrefix prefix, list asns);
+ * 
+ * cdef class RadixTreeData(RadixTree):             # <<<<<<<<<<<<<<
+ *     cdef RadixNodeData add_data(self, RadixPrefix prefix, dict data=*)
+ */
+
+struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTreeData {
+  struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTree __pyx_base;
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeData *(*add_data)(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeData *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *, struct __pyx_opt_args_10traceutils_5radix_10radix_tree_13RadixTreeData_add_data *__pyx_optional_args);
+};
+static struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTreeData *__pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTreeData;
+
+
+/* "traceutils/radix/radix.pxd":7
+ * cdef list _search_covering(RadixNode node);
+ * 
+ * cdef class Radix:             # <<<<<<<<<<<<<<
+ *     cdef RadixTree _tree4
+ *     cdef RadixTree _tree6
+ */
+
+struct __pyx_vtabstruct_10traceutils_5radix_5radix_Radix {
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*_add)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *);
+  void (*_delete)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*_search_exact)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*_search_best)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*_search_worst)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *);
+  PyObject *(*_search_covered)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix *);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*add)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_add *__pyx_optional_args);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*add_packed)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, unsigned char, int __pyx_skip_dispatch);
+  void (*delete)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_delete *__pyx_optional_args);
+  void (*delete_packed)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, unsigned char, int __pyx_skip_dispatch);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_exact)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_exact_prefix)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_exact_prefix *__pyx_optional_args);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_exact_packed)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, unsigned char, int __pyx_skip_dispatch);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_best)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_best_prefix)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_best_prefix *__pyx_optional_args);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_best_packed)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, unsigned char, int __pyx_skip_dispatch);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_worst)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_worst_prefix)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_worst_prefix *__pyx_optional_args);
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode *(*search_worst_packed)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, unsigned char, int __pyx_skip_dispatch);
+  PyObject *(*search_covered)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*search_covered_prefix)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_covered_prefix *__pyx_optional_args);
+  PyObject *(*search_covered_packed)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, unsigned char, int __pyx_skip_dispatch);
+  PyObject *(*search_covering)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*search_covering_prefix)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_10traceutils_5radix_5radix_5Radix_search_covering_prefix *__pyx_optional_args);
+  PyObject *(*search_covering_packed)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, PyObject *, unsigned char, int __pyx_skip_dispatch);
+  PyObject *(*nodes)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, int __pyx_skip_dispatch);
+  PyObject *(*prefixes)(struct __pyx_obj_10traceutils_5radix_5radix_Radix *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_10traceutils_5radix_5radix_Radix *__pyx_vtabptr_10traceutils_5radix_5radix_Radix;
+
+
+/* "traceutils/radix/ip2as.pxd":9
+ * 
+ * 
+ * cdef class IP2AS(Radix):             # <<<<<<<<<<<<<<
+ *     cpdef RadixNodeASN add_asn(self, str network, short masklen=*, long asn=*);
+ *     cpdef long asn(self, str asn);
+ */
+
+struct __pyx_vtabstruct_10traceutils_5radix_5ip2as_IP2AS {
+  struct __pyx_vtabstruct_10traceutils_5radix_5radix_Radix __pyx_base;
+  struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASN *(*add_asn)(struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_10traceutils_5radix_5ip2as_5IP2AS_add_asn *__pyx_optional_args);
+  long (*asn)(struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *, PyObject *, int __pyx_skip_dispatch);
+  long (*asn_packed)(struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *, PyObject *, int __pyx_skip_dispatch);
+  void (*add_private)(struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_10traceutils_5radix_5ip2as_IP2AS *__pyx_vtabptr_10traceutils_5radix_5ip2as_IP2AS;
+
+
+/* "bdrmapit/graph/node.pxd":1
+ * cdef class Origins:             # <<<<<<<<<<<<<<
+ *     cdef dict data
+ * 
+ */
+
+struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Origins {
+  void (*add)(struct __pyx_obj_8bdrmapit_5graph_4node_Origins *, PyObject *, long, int __pyx_skip_dispatch);
+  void (*update)(struct __pyx_obj_8bdrmapit_5graph_4node_Origins *, PyObject *, PyObject *, int __pyx_skip_dispatch);
+  void (*clear)(struct __pyx_obj_8bdrmapit_5graph_4node_Origins *, int __pyx_skip_dispatch);
+  struct __pyx_obj_8bdrmapit_5graph_4node_Origins *(*copy)(struct __pyx_obj_8bdrmapit_5graph_4node_Origins *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Origins *__pyx_vtabptr_8bdrmapit_5graph_4node_Origins;
+
+
+/* "bdrmapit/graph/node.pxd":9
+ *     cpdef Origins copy(self);
+ * 
+ * cdef class Interface             # <<<<<<<<<<<<<<
+ * 
+ * cdef class Router:
+ */
+
+struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Interface {
+  void (*add_pred)(struct __pyx_obj_8bdrmapit_5graph_4node_Interface *, struct __pyx_obj_8bdrmapit_5graph_4node_Router *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_4node_9Interface_add_pred *__pyx_optional_args);
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *(*copy)(struct __pyx_obj_8bdrmapit_5graph_4node_Interface *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Interface *__pyx_vtabptr_8bdrmapit_5graph_4node_Interface;
+
+
+/* "bdrmapit/graph/node.pxd":11
+ * cdef class Interface
+ * 
+ * cdef class Router:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         readonly str name
+ */
+
+struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Router {
+  void (*_add_count)(struct __pyx_obj_8bdrmapit_5graph_4node_Router *, PyObject *, long);
+  void (*add_interface)(struct __pyx_obj_8bdrmapit_5graph_4node_Router *, struct __pyx_obj_8bdrmapit_5graph_4node_Interface *, int __pyx_skip_dispatch);
+  void (*add_succ)(struct __pyx_obj_8bdrmapit_5graph_4node_Router *, PyObject *, long, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_4node_6Router_add_succ *__pyx_optional_args);
+  void (*add_origins)(struct __pyx_obj_8bdrmapit_5graph_4node_Router *, PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_4node_6Router_add_origins *__pyx_optional_args);
+  void (*add_dests)(struct __pyx_obj_8bdrmapit_5graph_4node_Router *, PyObject *, int __pyx_skip_dispatch);
+  void (*clear_edges)(struct __pyx_obj_8bdrmapit_5graph_4node_Router *, int __pyx_skip_dispatch);
+  struct __pyx_obj_8bdrmapit_5graph_4node_Router *(*copy)(struct __pyx_obj_8bdrmapit_5graph_4node_Router *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Router *__pyx_vtabptr_8bdrmapit_5graph_4node_Router;
+
+
+/* "bdrmapit/graph/construct.pyx":8
+ * 
+ * 
+ * cdef class Graph:             # <<<<<<<<<<<<<<
+ *     def __init__(self, dict interfaces=None, dict routers=None, bint packed=False):
+ *         """
+ */
+
+struct __pyx_vtabstruct_8bdrmapit_5graph_9construct_Graph {
+  PyObject *(*_key)(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *, PyObject *);
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *(*get_interface)(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *, PyObject *, int __pyx_skip_dispatch);
+  int (*has_interface)(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *, PyObject *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_8bdrmapit_5graph_9construct_Graph *__pyx_vtabptr_8bdrmapit_5graph_9construct_Graph;
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* DictGetItem.proto */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
+#define __Pyx_PyObject_Dict_GetItem(obj, name)\
+    (likely(PyDict_CheckExact(obj)) ?\
+     __Pyx_PyDict_GetItem(obj, name) : PyObject_GetItem(obj, name))
+#else
+#define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
+#define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
+#endif
+
+/* PyDictContains.proto */
+static CYTHON_INLINE int __Pyx_PyDict_ContainsTF(PyObject* item, PyObject* dict, int eq) {
+    int result = PyDict_Contains(dict, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* dict_getitem_default.proto */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
+
+/* UnpackUnboundCMethod.proto */
+typedef struct {
+    PyObject *type;
+    PyObject **method_name;
+    PyCFunction func;
+    PyObject *method;
+    int flag;
+} __Pyx_CachedCFunction;
+
+/* CallUnboundCMethod1.proto */
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#else
+#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
+#endif
+
+/* CallUnboundCMethod2.proto */
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030600B1
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2);
+#else
+#define __Pyx_CallUnboundCMethod2(cfunc, self, arg1, arg2)  __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2)
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* pyfrozenset_new.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyFrozenSet_New(PyObject* it);
+
+/* py_set_discard.proto */
+static CYTHON_INLINE int __Pyx_PySet_Discard(PyObject *set, PyObject *key);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* py_dict_pop.proto */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_Pop(PyObject *d, PyObject *key, PyObject *default_value);
+
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
+/* PyObjectCallMethod0.proto */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* RaiseNoneIterError.proto */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
+/* UnpackTupleError.proto */
+static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index);
+
+/* UnpackTuple2.proto */
+#define __Pyx_unpack_tuple2(tuple, value1, value2, is_tuple, has_known_size, decref_tuple)\
+    (likely(is_tuple || PyTuple_Check(tuple)) ?\
+        (likely(has_known_size || PyTuple_GET_SIZE(tuple) == 2) ?\
+            __Pyx_unpack_tuple2_exact(tuple, value1, value2, decref_tuple) :\
+            (__Pyx_UnpackTupleError(tuple, 2), -1)) :\
+        __Pyx_unpack_tuple2_generic(tuple, value1, value2, has_known_size, decref_tuple))
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int decref_tuple);
+static int __Pyx_unpack_tuple2_generic(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int has_known_size, int decref_tuple);
+
+/* dict_iter.proto */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_is_dict);
+static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
+                                              PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* GetVTable.proto */
+static void* __Pyx_GetVtable(PyObject *dict);
+
+/* GetNameInClass.proto */
+#define __Pyx_GetNameInClass(var, nmspace, name)  (var) = __Pyx__GetNameInClass(nmspace, name)
+static PyObject *__Pyx__GetNameInClass(PyObject *nmspace, PyObject *name);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* FunctionExport.proto */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig);
+
+/* VoidPtrImport.proto */
+static int __Pyx_ImportVoidPtr_0_29_37(PyObject *module, const char *name, void **p, const char *sig);
+
+/* FunctionImport.proto */
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static PyObject *__pyx_f_8bdrmapit_5graph_9construct_5Graph__key(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_addr); /* proto*/
+static struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_f_8bdrmapit_5graph_9construct_5Graph_get_interface(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_addr, int __pyx_skip_dispatch); /* proto*/
+static int __pyx_f_8bdrmapit_5graph_9construct_5Graph_has_interface(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_addr, int __pyx_skip_dispatch); /* proto*/
+
+/* Module declarations from 'traceutils.utils.dicts' */
+static PyTypeObject *__pyx_ptype_10traceutils_5utils_5dicts_CustomDict = 0;
+static PyTypeObject *__pyx_ptype_10traceutils_5utils_5dicts_StrDict = 0;
+static PyTypeObject *__pyx_ptype_10traceutils_5utils_5dicts_EmptyDict = 0;
+static PyTypeObject *__pyx_ptype_10traceutils_5utils_5dicts_ZeroDict = 0;
+
+/* Module declarations from 'traceutils.as2org.as2org' */
+static PyTypeObject *__pyx_ptype_10traceutils_6as2org_6as2org_AS2Org = 0;
+
+/* Module declarations from 'traceutils.radix.radix_prefix' */
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_12radix_prefix_RadixPrefix = 0;
+
+/* Module declarations from 'traceutils.radix.radix_node' */
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_10radix_node_RadixNode = 0;
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_10radix_node_RadixNodeASN = 0;
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_10radix_node_RadixNodeASNs = 0;
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_10radix_node_RadixNodeData = 0;
+
+/* Module declarations from 'traceutils.radix.radix_tree' */
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTree = 0;
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeASN = 0;
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeASNs = 0;
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeData = 0;
+
+/* Module declarations from 'traceutils.radix.radix' */
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_5radix_Radix = 0;
+
+/* Module declarations from 'traceutils.radix.ip2as' */
+static PyTypeObject *__pyx_ptype_10traceutils_5radix_5ip2as_IP2AS = 0;
+static PyObject **__pyx_vp_10traceutils_5radix_5ip2as_PRIVATE4 = 0;
+#define __pyx_v_10traceutils_5radix_5ip2as_PRIVATE4 (*__pyx_vp_10traceutils_5radix_5ip2as_PRIVATE4)
+static PyObject **__pyx_vp_10traceutils_5radix_5ip2as_PRIVATE6 = 0;
+#define __pyx_v_10traceutils_5radix_5ip2as_PRIVATE6 (*__pyx_vp_10traceutils_5radix_5ip2as_PRIVATE6)
+static PyObject **__pyx_vp_10traceutils_5radix_5ip2as_MULTICAST4 = 0;
+#define __pyx_v_10traceutils_5radix_5ip2as_MULTICAST4 (*__pyx_vp_10traceutils_5radix_5ip2as_MULTICAST4)
+static PyObject **__pyx_vp_10traceutils_5radix_5ip2as_MULTICAST6 = 0;
+#define __pyx_v_10traceutils_5radix_5ip2as_MULTICAST6 (*__pyx_vp_10traceutils_5radix_5ip2as_MULTICAST6)
+
+/* Module declarations from 'bdrmapit.graph.node' */
+static PyTypeObject *__pyx_ptype_8bdrmapit_5graph_4node_Origins = 0;
+static PyTypeObject *__pyx_ptype_8bdrmapit_5graph_4node_Interface = 0;
+static PyTypeObject *__pyx_ptype_8bdrmapit_5graph_4node_Router = 0;
+static PyObject *(*__pyx_f_8bdrmapit_5graph_4node_pack_addr)(PyObject *, int __pyx_skip_dispatch); /*proto*/
+static PyObject *(*__pyx_f_8bdrmapit_5graph_4node_unpack_addr)(PyObject *, int __pyx_skip_dispatch); /*proto*/
+
+/* Module declarations from 'bdrmapit.graph.construct' */
+static PyTypeObject *__pyx_ptype_8bdrmapit_5graph_9construct_Graph = 0;
+static PyObject *__pyx_f_8bdrmapit_5graph_9construct_classify(PyObject *, PyObject *, PyObject *, PyObject *, PyObject *, PyObject *, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_classify *__pyx_optional_args); /*proto*/
+static struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_f_8bdrmapit_5graph_9construct_create_node(PyObject *, PyObject *, PyObject *, struct __pyx_obj_8bdrmapit_5graph_4node_Router *, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *, struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_node *__pyx_optional_args); /*proto*/
+static void __pyx_f_8bdrmapit_5graph_9construct_create_remaining(PyObject *, PyObject *, PyObject *, Py_ssize_t, int, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *, struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_remaining *__pyx_optional_args); /*proto*/
+static void __pyx_f_8bdrmapit_5graph_9construct_add_nexthop(PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_nexthop *__pyx_optional_args); /*proto*/
+static void __pyx_f_8bdrmapit_5graph_9construct_add_multi(PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_multi *__pyx_optional_args); /*proto*/
+static void __pyx_f_8bdrmapit_5graph_9construct_add_dest_pairs(PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_dest_pairs *__pyx_optional_args); /*proto*/
+static void __pyx_f_8bdrmapit_5graph_9construct_add_hints(PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_hints *__pyx_optional_args); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_8bdrmapit_5graph_9construct__key(PyObject *, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_8bdrmapit_5graph_9construct__add_edge(PyObject *, PyObject *, PyObject *, long); /*proto*/
+static PyObject *__pyx_f_8bdrmapit_5graph_9construct___pyx_unpickle_Graph__set_state(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *, PyObject *); /*proto*/
+#define __Pyx_MODULE_NAME "bdrmapit.graph.construct"
+extern int __pyx_module_is_main_bdrmapit__graph__construct;
+int __pyx_module_is_main_bdrmapit__graph__construct = 0;
+
+/* Implementation of 'bdrmapit.graph.construct' */
+static PyObject *__pyx_builtin_staticmethod;
+static PyObject *__pyx_builtin_range;
+static const char __pyx_k_dps[] = "dps";
+static const char __pyx_k_get[] = "get";
+static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_pop[] = "pop";
+static const char __pyx_k_addr[] = "addr";
+static const char __pyx_k_asns[] = "asns";
+static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_hops[] = "hops";
+static const char __pyx_k_load[] = "load";
+static const char __pyx_k_loop[] = "loop";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_Graph[] = "Graph";
+static const char __pyx_k_addrs[] = "addrs";
+static const char __pyx_k_echos[] = "echos";
+static const char __pyx_k_first[] = "first";
+static const char __pyx_k_hints[] = "hints";
+static const char __pyx_k_ip2as[] = "ip2as";
+static const char __pyx_k_items[] = "items";
+static const char __pyx_k_multi[] = "multi";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_as2org[] = "as2org";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_packed[] = "packed";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_router[] = "router";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_aliases[] = "aliases";
+static const char __pyx_k_release[] = "release";
+static const char __pyx_k_routers[] = "routers";
+static const char __pyx_k_Progress[] = "Progress";
+static const char __pyx_k_filename[] = "filename";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_iterator[] = "iterator";
+static const char __pyx_k_loopadjs[] = "loopadjs";
+static const char __pyx_k_nextadjs[] = "nextadjs";
+static const char __pyx_k_nexthops[] = "nexthops";
+static const char __pyx_k_no_echos[] = "no_echos";
+static const char __pyx_k_prefixes[] = "prefixes";
+static const char __pyx_k_pyx_type[] = "__pyx_type";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_increment[] = "increment";
+static const char __pyx_k_multiadjs[] = "multiadjs";
+static const char __pyx_k_num_addrs[] = "num_addrs";
+static const char __pyx_k_pyx_state[] = "__pyx_state";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_interfaces[] = "interfaces";
+static const char __pyx_k_load_graph[] = "load_graph";
+static const char __pyx_k_pyx_result[] = "__pyx_result";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_save_graph[] = "save_graph";
+static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
+static const char __pyx_k_staticmethod[] = "staticmethod";
+static const char __pyx_k_stringsource[] = "stringsource";
+static const char __pyx_k_get_interface[] = "get_interface";
+static const char __pyx_k_has_interface[] = "has_interface";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_extract_subgraph[] = "extract_subgraph";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_pyx_unpickle_Graph[] = "__pyx_unpickle_Graph";
+static const char __pyx_k_Adding_nexthop_edges[] = "Adding nexthop edges";
+static const char __pyx_k_Adding_multihop_edges[] = "Adding multihop edges";
+static const char __pyx_k_Adding_destination_ASes[] = "Adding destination ASes";
+static const char __pyx_k_bdrmapit_graph_subgraph[] = "bdrmapit.graph.subgraph";
+static const char __pyx_k_traceutils_progress_bar[] = "traceutils.progress.bar";
+static const char __pyx_k_bdrmapit_graph_construct[] = "bdrmapit.graph.construct";
+static const char __pyx_k_bdrmapit_graph_serialize[] = "bdrmapit.graph.serialize";
+static const char __pyx_k_bdrmapit_graph_construct_pyx[] = "bdrmapit/graph/construct.pyx";
+static const char __pyx_k_Selecting_remaining_addresses[] = "Selecting remaining addresses";
+static const char __pyx_k_Classifying_nexthop_adjacencies[] = "Classifying nexthop adjacencies";
+static const char __pyx_k_Classifying_multihop_adjacencies[] = "Classifying multihop adjacencies";
+static const char __pyx_k_Creating_remaining_routers_and_i[] = "Creating remaining routers and interfaces";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x228f3cb, 0x0814fa7, 0x28bead2) = (interfaces, packed, routers))";
+static PyObject *__pyx_kp_u_Adding_destination_ASes;
+static PyObject *__pyx_kp_u_Adding_multihop_edges;
+static PyObject *__pyx_kp_u_Adding_nexthop_edges;
+static PyObject *__pyx_kp_u_Classifying_multihop_adjacencies;
+static PyObject *__pyx_kp_u_Classifying_nexthop_adjacencies;
+static PyObject *__pyx_kp_u_Creating_remaining_routers_and_i;
+static PyObject *__pyx_n_s_Graph;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
+static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_n_s_Progress;
+static PyObject *__pyx_kp_u_Selecting_remaining_addresses;
+static PyObject *__pyx_n_s_addr;
+static PyObject *__pyx_n_s_addrs;
+static PyObject *__pyx_n_s_aliases;
+static PyObject *__pyx_n_s_as2org;
+static PyObject *__pyx_n_s_asns;
+static PyObject *__pyx_n_s_bdrmapit_graph_construct;
+static PyObject *__pyx_kp_s_bdrmapit_graph_construct_pyx;
+static PyObject *__pyx_n_s_bdrmapit_graph_serialize;
+static PyObject *__pyx_n_s_bdrmapit_graph_subgraph;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_dps;
+static PyObject *__pyx_n_s_echos;
+static PyObject *__pyx_n_s_extract_subgraph;
+static PyObject *__pyx_n_s_filename;
+static PyObject *__pyx_n_s_first;
+static PyObject *__pyx_n_s_get;
+static PyObject *__pyx_n_s_get_interface;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_has_interface;
+static PyObject *__pyx_n_s_hints;
+static PyObject *__pyx_n_s_hops;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_increment;
+static PyObject *__pyx_n_s_interfaces;
+static PyObject *__pyx_n_s_ip2as;
+static PyObject *__pyx_n_s_items;
+static PyObject *__pyx_n_s_iterator;
+static PyObject *__pyx_n_s_load;
+static PyObject *__pyx_n_s_load_graph;
+static PyObject *__pyx_n_s_loop;
+static PyObject *__pyx_n_s_loopadjs;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_multi;
+static PyObject *__pyx_n_s_multiadjs;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_new;
+static PyObject *__pyx_n_s_nextadjs;
+static PyObject *__pyx_n_s_nexthops;
+static PyObject *__pyx_n_s_no_echos;
+static PyObject *__pyx_n_s_num_addrs;
+static PyObject *__pyx_n_s_packed;
+static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_pop;
+static PyObject *__pyx_n_s_prefixes;
+static PyObject *__pyx_n_s_pyx_PickleError;
+static PyObject *__pyx_n_s_pyx_checksum;
+static PyObject *__pyx_n_s_pyx_result;
+static PyObject *__pyx_n_s_pyx_state;
+static PyObject *__pyx_n_s_pyx_type;
+static PyObject *__pyx_n_s_pyx_unpickle_Graph;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_release;
+static PyObject *__pyx_n_s_router;
+static PyObject *__pyx_n_s_routers;
+static PyObject *__pyx_n_s_save_graph;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_n_s_staticmethod;
+static PyObject *__pyx_kp_s_stringsource;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_traceutils_progress_bar;
+static PyObject *__pyx_n_s_update;
+static int __pyx_pf_8bdrmapit_5graph_9construct_5Graph___init__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_routers, int __pyx_v_packed); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_2get_interface(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_addr); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_4has_interface(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_addr); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_6save(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_filename); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_8load(PyObject *__pyx_v_filename); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_10subgraph(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_asns, PyObject *__pyx_v_prefixes, int __pyx_v_hops); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_10interfaces___get__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_7routers___get__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_6packed___get__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_12__reduce_cython__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_14__setstate_cython__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_classify(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_nextadjs, PyObject *__pyx_v_multiadjs, PyObject *__pyx_v_loopadjs, PyObject *__pyx_v_first, PyObject *__pyx_v_dps, PyObject *__pyx_v_echos, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as, int __pyx_v_loop, int __pyx_v_no_echos, int __pyx_v_increment); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_2create_node(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_routers, PyObject *__pyx_v_addr, struct __pyx_obj_8bdrmapit_5graph_4node_Router *__pyx_v_router, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as, struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *__pyx_v_as2org, int __pyx_v_packed); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_4create_remaining(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_routers, PyObject *__pyx_v_addrs, Py_ssize_t __pyx_v_num_addrs, int __pyx_v_aliases, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as, struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *__pyx_v_as2org, int __pyx_v_packed, int __pyx_v_increment); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_6add_nexthop(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_nexthops, int __pyx_v_packed, int __pyx_v_release, int __pyx_v_increment); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_8add_multi(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_multi, int __pyx_v_packed, int __pyx_v_release, int __pyx_v_increment); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_10add_dest_pairs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_dps, int __pyx_v_packed, int __pyx_v_increment); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_12add_hints(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_hints, int __pyx_v_packed); /* proto */
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_14__pyx_unpickle_Graph(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_8bdrmapit_5graph_9construct_Graph(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_get = {0, &__pyx_n_s_get, 0, 0, 0};
+static __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop = {0, &__pyx_n_s_pop, 0, 0, 0};
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_8474535;
+static PyObject *__pyx_int_36238283;
+static PyObject *__pyx_int_42724050;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_codeobj__3;
+static PyObject *__pyx_codeobj__5;
+/* Late includes */
+
+/* "bdrmapit/graph/construct.pyx":9
+ * 
+ * cdef class Graph:
+ *     def __init__(self, dict interfaces=None, dict routers=None, bint packed=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         :param packed: interfaces are keyed by packed addresses rather than address strings
+ */
+
+/* Python wrapper */
+static int __pyx_pw_8bdrmapit_5graph_9construct_5Graph_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_5Graph___init__[] = "\n        :param packed: interfaces are keyed by packed addresses rather than address strings\n        ";
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_8bdrmapit_5graph_9construct_5Graph___init__;
+#endif
+static int __pyx_pw_8bdrmapit_5graph_9construct_5Graph_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_interfaces = 0;
+  PyObject *__pyx_v_routers = 0;
+  int __pyx_v_packed;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_interfaces,&__pyx_n_s_routers,&__pyx_n_s_packed,0};
+    PyObject* values[3] = {0,0,0};
+    values[0] = ((PyObject*)Py_None);
+    values[1] = ((PyObject*)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_interfaces);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_routers);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_packed);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 9, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_interfaces = ((PyObject*)values[0]);
+    __pyx_v_routers = ((PyObject*)values[1]);
+    if (values[2]) {
+      __pyx_v_packed = __Pyx_PyObject_IsTrue(values[2]); if (unlikely((__pyx_v_packed == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 9, __pyx_L3_error)
+    } else {
+      __pyx_v_packed = ((int)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 9, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_interfaces), (&PyDict_Type), 1, "interfaces", 1))) __PYX_ERR(0, 9, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_routers), (&PyDict_Type), 1, "routers", 1))) __PYX_ERR(0, 9, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph___init__(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self), __pyx_v_interfaces, __pyx_v_routers, __pyx_v_packed);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_8bdrmapit_5graph_9construct_5Graph___init__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_routers, int __pyx_v_packed) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "bdrmapit/graph/construct.pyx":13
+ *         :param packed: interfaces are keyed by packed addresses rather than address strings
+ *         """
+ *         if interfaces is None:             # <<<<<<<<<<<<<<
+ *             self.interfaces = {}
+ *         else:
+ */
+  __pyx_t_1 = (__pyx_v_interfaces == ((PyObject*)Py_None));
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "bdrmapit/graph/construct.pyx":14
+ *         """
+ *         if interfaces is None:
+ *             self.interfaces = {}             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.interfaces = interfaces
+ */
+    __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __Pyx_GOTREF(__pyx_v_self->interfaces);
+    __Pyx_DECREF(__pyx_v_self->interfaces);
+    __pyx_v_self->interfaces = ((PyObject*)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":13
+ *         :param packed: interfaces are keyed by packed addresses rather than address strings
+ *         """
+ *         if interfaces is None:             # <<<<<<<<<<<<<<
+ *             self.interfaces = {}
+ *         else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "bdrmapit/graph/construct.pyx":16
+ *             self.interfaces = {}
+ *         else:
+ *             self.interfaces = interfaces             # <<<<<<<<<<<<<<
+ *         if routers is None:
+ *             self.routers = {}
+ */
+  /*else*/ {
+    __Pyx_INCREF(__pyx_v_interfaces);
+    __Pyx_GIVEREF(__pyx_v_interfaces);
+    __Pyx_GOTREF(__pyx_v_self->interfaces);
+    __Pyx_DECREF(__pyx_v_self->interfaces);
+    __pyx_v_self->interfaces = __pyx_v_interfaces;
+  }
+  __pyx_L3:;
+
+  /* "bdrmapit/graph/construct.pyx":17
+ *         else:
+ *             self.interfaces = interfaces
+ *         if routers is None:             # <<<<<<<<<<<<<<
+ *             self.routers = {}
+ *         else:
+ */
+  __pyx_t_2 = (__pyx_v_routers == ((PyObject*)Py_None));
+  __pyx_t_1 = (__pyx_t_2 != 0);
+  if (__pyx_t_1) {
+
+    /* "bdrmapit/graph/construct.pyx":18
+ *             self.interfaces = interfaces
+ *         if routers is None:
+ *             self.routers = {}             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.routers = routers
+ */
+    __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 18, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __Pyx_GOTREF(__pyx_v_self->routers);
+    __Pyx_DECREF(__pyx_v_self->routers);
+    __pyx_v_self->routers = ((PyObject*)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":17
+ *         else:
+ *             self.interfaces = interfaces
+ *         if routers is None:             # <<<<<<<<<<<<<<
+ *             self.routers = {}
+ *         else:
+ */
+    goto __pyx_L4;
+  }
+
+  /* "bdrmapit/graph/construct.pyx":20
+ *             self.routers = {}
+ *         else:
+ *             self.routers = routers             # <<<<<<<<<<<<<<
+ *         self.packed = packed
+ * 
+ */
+  /*else*/ {
+    __Pyx_INCREF(__pyx_v_routers);
+    __Pyx_GIVEREF(__pyx_v_routers);
+    __Pyx_GOTREF(__pyx_v_self->routers);
+    __Pyx_DECREF(__pyx_v_self->routers);
+    __pyx_v_self->routers = __pyx_v_routers;
+  }
+  __pyx_L4:;
+
+  /* "bdrmapit/graph/construct.pyx":21
+ *         else:
+ *             self.routers = routers
+ *         self.packed = packed             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _key(self, object addr):
+ */
+  __pyx_v_self->packed = __pyx_v_packed;
+
+  /* "bdrmapit/graph/construct.pyx":9
+ * 
+ * cdef class Graph:
+ *     def __init__(self, dict interfaces=None, dict routers=None, bint packed=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         :param packed: interfaces are keyed by packed addresses rather than address strings
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":23
+ *         self.packed = packed
+ * 
+ *     cdef object _key(self, object addr):             # <<<<<<<<<<<<<<
+ *         if self.packed:
+ *             if isinstance(addr, str):
+ */
+
+static PyObject *__pyx_f_8bdrmapit_5graph_9construct_5Graph__key(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_addr) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_key", 0);
+
+  /* "bdrmapit/graph/construct.pyx":24
+ * 
+ *     cdef object _key(self, object addr):
+ *         if self.packed:             # <<<<<<<<<<<<<<
+ *             if isinstance(addr, str):
+ *                 return pack_addr(addr)
+ */
+  __pyx_t_1 = (__pyx_v_self->packed != 0);
+  if (__pyx_t_1) {
+
+    /* "bdrmapit/graph/construct.pyx":25
+ *     cdef object _key(self, object addr):
+ *         if self.packed:
+ *             if isinstance(addr, str):             # <<<<<<<<<<<<<<
+ *                 return pack_addr(addr)
+ *         elif isinstance(addr, bytes):
+ */
+    __pyx_t_1 = PyUnicode_Check(__pyx_v_addr); 
+    __pyx_t_2 = (__pyx_t_1 != 0);
+    if (__pyx_t_2) {
+
+      /* "bdrmapit/graph/construct.pyx":26
+ *         if self.packed:
+ *             if isinstance(addr, str):
+ *                 return pack_addr(addr)             # <<<<<<<<<<<<<<
+ *         elif isinstance(addr, bytes):
+ *             return unpack_addr(addr)
+ */
+      __Pyx_XDECREF(__pyx_r);
+      if (!(likely(PyUnicode_CheckExact(__pyx_v_addr))||((__pyx_v_addr) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_addr)->tp_name), 0))) __PYX_ERR(0, 26, __pyx_L1_error)
+      __pyx_t_3 = __pyx_f_8bdrmapit_5graph_4node_pack_addr(((PyObject*)__pyx_v_addr), 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 26, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_r = __pyx_t_3;
+      __pyx_t_3 = 0;
+      goto __pyx_L0;
+
+      /* "bdrmapit/graph/construct.pyx":25
+ *     cdef object _key(self, object addr):
+ *         if self.packed:
+ *             if isinstance(addr, str):             # <<<<<<<<<<<<<<
+ *                 return pack_addr(addr)
+ *         elif isinstance(addr, bytes):
+ */
+    }
+
+    /* "bdrmapit/graph/construct.pyx":24
+ * 
+ *     cdef object _key(self, object addr):
+ *         if self.packed:             # <<<<<<<<<<<<<<
+ *             if isinstance(addr, str):
+ *                 return pack_addr(addr)
+ */
+    goto __pyx_L3;
+  }
+
+  /* "bdrmapit/graph/construct.pyx":27
+ *             if isinstance(addr, str):
+ *                 return pack_addr(addr)
+ *         elif isinstance(addr, bytes):             # <<<<<<<<<<<<<<
+ *             return unpack_addr(addr)
+ *         return addr
+ */
+  __pyx_t_2 = PyBytes_Check(__pyx_v_addr); 
+  __pyx_t_1 = (__pyx_t_2 != 0);
+  if (__pyx_t_1) {
+
+    /* "bdrmapit/graph/construct.pyx":28
+ *                 return pack_addr(addr)
+ *         elif isinstance(addr, bytes):
+ *             return unpack_addr(addr)             # <<<<<<<<<<<<<<
+ *         return addr
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    if (!(likely(PyBytes_CheckExact(__pyx_v_addr))||((__pyx_v_addr) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_v_addr)->tp_name), 0))) __PYX_ERR(0, 28, __pyx_L1_error)
+    __pyx_t_3 = __pyx_f_8bdrmapit_5graph_4node_unpack_addr(((PyObject*)__pyx_v_addr), 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 28, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "bdrmapit/graph/construct.pyx":27
+ *             if isinstance(addr, str):
+ *                 return pack_addr(addr)
+ *         elif isinstance(addr, bytes):             # <<<<<<<<<<<<<<
+ *             return unpack_addr(addr)
+ *         return addr
+ */
+  }
+  __pyx_L3:;
+
+  /* "bdrmapit/graph/construct.pyx":29
+ *         elif isinstance(addr, bytes):
+ *             return unpack_addr(addr)
+ *         return addr             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef Interface get_interface(self, object addr):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_addr);
+  __pyx_r = __pyx_v_addr;
+  goto __pyx_L0;
+
+  /* "bdrmapit/graph/construct.pyx":23
+ *         self.packed = packed
+ * 
+ *     cdef object _key(self, object addr):             # <<<<<<<<<<<<<<
+ *         if self.packed:
+ *             if isinstance(addr, str):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph._key", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":31
+ *         return addr
+ * 
+ *     cpdef Interface get_interface(self, object addr):             # <<<<<<<<<<<<<<
+ *         """
+ *         Look up an interface by address string or packed address.
+ */
+
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_3get_interface(PyObject *__pyx_v_self, PyObject *__pyx_v_addr); /*proto*/
+static struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_f_8bdrmapit_5graph_9construct_5Graph_get_interface(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_addr, int __pyx_skip_dispatch) {
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_interface", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_interface); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_8bdrmapit_5graph_9construct_5Graph_3get_interface)) {
+        __Pyx_XDECREF(((PyObject *)__pyx_r));
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_addr) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_addr);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 31, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_8bdrmapit_5graph_4node_Interface))))) __PYX_ERR(0, 31, __pyx_L1_error)
+        __pyx_r = ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)__pyx_t_2);
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "bdrmapit/graph/construct.pyx":35
+ *         Look up an interface by address string or packed address.
+ *         """
+ *         return self.interfaces[self._key(addr)]             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint has_interface(self, object addr):
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  if (unlikely(__pyx_v_self->interfaces == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 35, __pyx_L1_error)
+  }
+  __pyx_t_1 = ((struct __pyx_vtabstruct_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self->__pyx_vtab)->_key(__pyx_v_self, __pyx_v_addr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v_self->interfaces, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_8bdrmapit_5graph_4node_Interface))))) __PYX_ERR(0, 35, __pyx_L1_error)
+  __pyx_r = ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "bdrmapit/graph/construct.pyx":31
+ *         return addr
+ * 
+ *     cpdef Interface get_interface(self, object addr):             # <<<<<<<<<<<<<<
+ *         """
+ *         Look up an interface by address string or packed address.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.get_interface", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_3get_interface(PyObject *__pyx_v_self, PyObject *__pyx_v_addr); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_5Graph_2get_interface[] = "Graph.get_interface(self, addr) -> Interface\n\n        Look up an interface by address string or packed address.\n        ";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_3get_interface(PyObject *__pyx_v_self, PyObject *__pyx_v_addr) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_interface (wrapper)", 0);
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph_2get_interface(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self), ((PyObject *)__pyx_v_addr));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_2get_interface(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_addr) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_interface", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((PyObject *)__pyx_f_8bdrmapit_5graph_9construct_5Graph_get_interface(__pyx_v_self, __pyx_v_addr, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.get_interface", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":37
+ *         return self.interfaces[self._key(addr)]
+ * 
+ *     cpdef bint has_interface(self, object addr):             # <<<<<<<<<<<<<<
+ *         return self._key(addr) in self.interfaces
+ * 
+ */
+
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_5has_interface(PyObject *__pyx_v_self, PyObject *__pyx_v_addr); /*proto*/
+static int __pyx_f_8bdrmapit_5graph_9construct_5Graph_has_interface(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_addr, int __pyx_skip_dispatch) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("has_interface", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_has_interface); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_8bdrmapit_5graph_9construct_5Graph_5has_interface)) {
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_addr) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_addr);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 37, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_5;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "bdrmapit/graph/construct.pyx":38
+ * 
+ *     cpdef bint has_interface(self, object addr):
+ *         return self._key(addr) in self.interfaces             # <<<<<<<<<<<<<<
+ * 
+ *     def save(self, filename):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self->__pyx_vtab)->_key(__pyx_v_self, __pyx_v_addr); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (unlikely(__pyx_v_self->interfaces == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 38, __pyx_L1_error)
+  }
+  __pyx_t_5 = (__Pyx_PyDict_ContainsTF(__pyx_t_1, __pyx_v_self->interfaces, Py_EQ)); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_5;
+  goto __pyx_L0;
+
+  /* "bdrmapit/graph/construct.pyx":37
+ *         return self.interfaces[self._key(addr)]
+ * 
+ *     cpdef bint has_interface(self, object addr):             # <<<<<<<<<<<<<<
+ *         return self._key(addr) in self.interfaces
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_WriteUnraisable("bdrmapit.graph.construct.Graph.has_interface", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_5has_interface(PyObject *__pyx_v_self, PyObject *__pyx_v_addr); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_5Graph_4has_interface[] = "Graph.has_interface(self, addr) -> bool";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_5has_interface(PyObject *__pyx_v_self, PyObject *__pyx_v_addr) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("has_interface (wrapper)", 0);
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph_4has_interface(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self), ((PyObject *)__pyx_v_addr));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_4has_interface(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_addr) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("has_interface", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_8bdrmapit_5graph_9construct_5Graph_has_interface(__pyx_v_self, __pyx_v_addr, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.has_interface", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":40
+ *         return self._key(addr) in self.interfaces
+ * 
+ *     def save(self, filename):             # <<<<<<<<<<<<<<
+ *         """
+ *         Save the graph in the flat binary layout of bdrmapit.graph.serialize.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_7save(PyObject *__pyx_v_self, PyObject *__pyx_v_filename); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_5Graph_6save[] = "Graph.save(self, filename)\n\n        Save the graph in the flat binary layout of bdrmapit.graph.serialize.\n        ";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_7save(PyObject *__pyx_v_self, PyObject *__pyx_v_filename) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("save (wrapper)", 0);
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph_6save(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self), ((PyObject *)__pyx_v_filename));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_6save(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_filename) {
+  PyObject *__pyx_v_save_graph = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("save", 0);
+
+  /* "bdrmapit/graph/construct.pyx":44
+ *         Save the graph in the flat binary layout of bdrmapit.graph.serialize.
+ *         """
+ *         from bdrmapit.graph.serialize import save_graph             # <<<<<<<<<<<<<<
+ *         save_graph(self, filename)
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_save_graph);
+  __Pyx_GIVEREF(__pyx_n_s_save_graph);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_save_graph);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_bdrmapit_graph_serialize, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_save_graph); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_save_graph = __pyx_t_1;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":45
+ *         """
+ *         from bdrmapit.graph.serialize import save_graph
+ *         save_graph(self, filename)             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+  __Pyx_INCREF(__pyx_v_save_graph);
+  __pyx_t_1 = __pyx_v_save_graph; __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_1)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_3, ((PyObject *)__pyx_v_self), __pyx_v_filename};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 45, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_3, ((PyObject *)__pyx_v_self), __pyx_v_filename};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 45, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 45, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_3) {
+      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
+    }
+    __Pyx_INCREF(((PyObject *)__pyx_v_self));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, ((PyObject *)__pyx_v_self));
+    __Pyx_INCREF(__pyx_v_filename);
+    __Pyx_GIVEREF(__pyx_v_filename);
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, __pyx_v_filename);
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 45, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":40
+ *         return self._key(addr) in self.interfaces
+ * 
+ *     def save(self, filename):             # <<<<<<<<<<<<<<
+ *         """
+ *         Save the graph in the flat binary layout of bdrmapit.graph.serialize.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.save", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_save_graph);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":48
+ * 
+ *     @staticmethod
+ *     def load(filename):             # <<<<<<<<<<<<<<
+ *         """
+ *         Load a graph written by save.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_9load(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_5Graph_8load[] = "Graph.load(filename)\n\n        Load a graph written by save.\n        ";
+static PyMethodDef __pyx_mdef_8bdrmapit_5graph_9construct_5Graph_9load = {"load", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_5Graph_9load, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_5Graph_8load};
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_9load(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_filename = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("load (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_filename,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_filename)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "load") < 0)) __PYX_ERR(0, 48, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+    }
+    __pyx_v_filename = values[0];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("load", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 48, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.load", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph_8load(__pyx_v_filename);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_8load(PyObject *__pyx_v_filename) {
+  PyObject *__pyx_v_load_graph = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("load", 0);
+
+  /* "bdrmapit/graph/construct.pyx":52
+ *         Load a graph written by save.
+ *         """
+ *         from bdrmapit.graph.serialize import load_graph             # <<<<<<<<<<<<<<
+ *         return load_graph(filename)
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 52, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_load_graph);
+  __Pyx_GIVEREF(__pyx_n_s_load_graph);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_load_graph);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_bdrmapit_graph_serialize, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 52, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_load_graph); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 52, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_load_graph = __pyx_t_1;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":53
+ *         """
+ *         from bdrmapit.graph.serialize import load_graph
+ *         return load_graph(filename)             # <<<<<<<<<<<<<<
+ * 
+ *     def subgraph(self, asns=None, prefixes=None, int hops=1):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_load_graph);
+  __pyx_t_1 = __pyx_v_load_graph; __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_v_filename) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_filename);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "bdrmapit/graph/construct.pyx":48
+ * 
+ *     @staticmethod
+ *     def load(filename):             # <<<<<<<<<<<<<<
+ *         """
+ *         Load a graph written by save.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.load", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_load_graph);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":55
+ *         return load_graph(filename)
+ * 
+ *     def subgraph(self, asns=None, prefixes=None, int hops=1):             # <<<<<<<<<<<<<<
+ *         """
+ *         Copy the neighborhood of the routers with interfaces in the ASes or prefixes, see
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_11subgraph(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_5Graph_10subgraph[] = "Graph.subgraph(self, asns=None, prefixes=None, int hops=1)\n\n        Copy the neighborhood of the routers with interfaces in the ASes or prefixes, see\n        bdrmapit.graph.subgraph.extract_subgraph.\n        ";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_11subgraph(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_asns = 0;
+  PyObject *__pyx_v_prefixes = 0;
+  int __pyx_v_hops;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("subgraph (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_asns,&__pyx_n_s_prefixes,&__pyx_n_s_hops,0};
+    PyObject* values[3] = {0,0,0};
+    values[0] = ((PyObject *)Py_None);
+    values[1] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_asns);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_prefixes);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_hops);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "subgraph") < 0)) __PYX_ERR(0, 55, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_asns = values[0];
+    __pyx_v_prefixes = values[1];
+    if (values[2]) {
+      __pyx_v_hops = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_hops == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 55, __pyx_L3_error)
+    } else {
+      __pyx_v_hops = ((int)1);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("subgraph", 0, 0, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 55, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.subgraph", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph_10subgraph(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self), __pyx_v_asns, __pyx_v_prefixes, __pyx_v_hops);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_10subgraph(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v_asns, PyObject *__pyx_v_prefixes, int __pyx_v_hops) {
+  PyObject *__pyx_v_extract_subgraph = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("subgraph", 0);
+
+  /* "bdrmapit/graph/construct.pyx":60
+ *         bdrmapit.graph.subgraph.extract_subgraph.
+ *         """
+ *         from bdrmapit.graph.subgraph import extract_subgraph             # <<<<<<<<<<<<<<
+ *         return extract_subgraph(self, asns=asns, prefixes=prefixes, hops=hops)
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_extract_subgraph);
+  __Pyx_GIVEREF(__pyx_n_s_extract_subgraph);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_extract_subgraph);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_bdrmapit_graph_subgraph, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_extract_subgraph); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_extract_subgraph = __pyx_t_1;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":61
+ *         """
+ *         from bdrmapit.graph.subgraph import extract_subgraph
+ *         return extract_subgraph(self, asns=asns, prefixes=prefixes, hops=hops)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self));
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_asns, __pyx_v_asns) < 0) __PYX_ERR(0, 61, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_prefixes, __pyx_v_prefixes) < 0) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_hops); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_hops, __pyx_t_3) < 0) __PYX_ERR(0, 61, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_v_extract_subgraph, __pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "bdrmapit/graph/construct.pyx":55
+ *         return load_graph(filename)
+ * 
+ *     def subgraph(self, asns=None, prefixes=None, int hops=1):             # <<<<<<<<<<<<<<
+ *         """
+ *         Copy the neighborhood of the routers with interfaces in the ASes or prefixes, see
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.subgraph", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_extract_subgraph);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pxd":7
+ * 
+ * cdef class Graph:
+ *     cdef readonly dict interfaces, routers             # <<<<<<<<<<<<<<
+ *     cdef readonly bint packed
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_10interfaces_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_10interfaces_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph_10interfaces___get__(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_10interfaces___get__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->interfaces);
+  __pyx_r = __pyx_v_self->interfaces;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_7routers_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_7routers_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph_7routers___get__(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_7routers___get__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->routers);
+  __pyx_r = __pyx_v_self->routers;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pxd":8
+ * cdef class Graph:
+ *     cdef readonly dict interfaces, routers
+ *     cdef readonly bint packed             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object _key(self, object addr);
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_6packed_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_6packed_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph_6packed___get__(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_6packed___get__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->packed); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.packed.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_5Graph_12__reduce_cython__[] = "Graph.__reduce_cython__(self)";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph_12__reduce_cython__(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_12__reduce_cython__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.interfaces, self.packed, self.routers)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->packed); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_self->interfaces);
+  __Pyx_GIVEREF(__pyx_v_self->interfaces);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_self->interfaces);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->routers);
+  __Pyx_GIVEREF(__pyx_v_self->routers);
+  PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_self->routers);
+  __pyx_t_1 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.interfaces, self.packed, self.routers)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_2 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v__dict = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.interfaces, self.packed, self.routers)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_3 = (__pyx_v__dict != Py_None);
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v__dict);
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self.interfaces is not None or self.routers is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.interfaces, self.packed, self.routers)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self.interfaces is not None or self.routers is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_Graph, (type(self), 0x228f3cb, None), state
+ */
+  /*else*/ {
+    __pyx_t_3 = (__pyx_v_self->interfaces != ((PyObject*)Py_None));
+    __pyx_t_5 = (__pyx_t_3 != 0);
+    if (!__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_5 = (__pyx_v_self->routers != ((PyObject*)Py_None));
+    __pyx_t_3 = (__pyx_t_5 != 0);
+    __pyx_t_4 = __pyx_t_3;
+    __pyx_L4_bool_binop_done:;
+    __pyx_v_use_setstate = __pyx_t_4;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.interfaces is not None or self.routers is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_Graph, (type(self), 0x228f3cb, None), state
+ *     else:
+ */
+  __pyx_t_4 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self.interfaces is not None or self.routers is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_Graph, (type(self), 0x228f3cb, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_Graph, (type(self), 0x228f3cb, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_Graph); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_36238283);
+    __Pyx_GIVEREF(__pyx_int_36238283);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_36238283);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, Py_None);
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_2);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_v_state);
+    __pyx_t_1 = 0;
+    __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.interfaces is not None or self.routers is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_Graph, (type(self), 0x228f3cb, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_Graph, (type(self), 0x228f3cb, None), state
+ *     else:
+ *         return __pyx_unpickle_Graph, (type(self), 0x228f3cb, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_Graph__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_pyx_unpickle_Graph); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_36238283);
+    __Pyx_GIVEREF(__pyx_int_36238283);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_36238283);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_state);
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2);
+    __pyx_t_6 = 0;
+    __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_Graph, (type(self), 0x228f3cb, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_Graph__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_5Graph_14__setstate_cython__[] = "Graph.__setstate_cython__(self, __pyx_state)";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5Graph_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_5Graph_14__setstate_cython__(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_5Graph_14__setstate_cython__(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_Graph, (type(self), 0x228f3cb, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_Graph__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(2, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_8bdrmapit_5graph_9construct___pyx_unpickle_Graph__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_Graph, (type(self), 0x228f3cb, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_Graph__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.Graph.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":64
+ * 
+ * 
+ * cdef inline object _key(str addr, bint packed):             # <<<<<<<<<<<<<<
+ *     if packed:
+ *         return pack_addr(addr)
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_8bdrmapit_5graph_9construct__key(PyObject *__pyx_v_addr, int __pyx_v_packed) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_key", 0);
+
+  /* "bdrmapit/graph/construct.pyx":65
+ * 
+ * cdef inline object _key(str addr, bint packed):
+ *     if packed:             # <<<<<<<<<<<<<<
+ *         return pack_addr(addr)
+ *     return addr
+ */
+  __pyx_t_1 = (__pyx_v_packed != 0);
+  if (__pyx_t_1) {
+
+    /* "bdrmapit/graph/construct.pyx":66
+ * cdef inline object _key(str addr, bint packed):
+ *     if packed:
+ *         return pack_addr(addr)             # <<<<<<<<<<<<<<
+ *     return addr
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __pyx_f_8bdrmapit_5graph_4node_pack_addr(__pyx_v_addr, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 66, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "bdrmapit/graph/construct.pyx":65
+ * 
+ * cdef inline object _key(str addr, bint packed):
+ *     if packed:             # <<<<<<<<<<<<<<
+ *         return pack_addr(addr)
+ *     return addr
+ */
+  }
+
+  /* "bdrmapit/graph/construct.pyx":67
+ *     if packed:
+ *         return pack_addr(addr)
+ *     return addr             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_addr);
+  __pyx_r = __pyx_v_addr;
+  goto __pyx_L0;
+
+  /* "bdrmapit/graph/construct.pyx":64
+ * 
+ * 
+ * cdef inline object _key(str addr, bint packed):             # <<<<<<<<<<<<<<
+ *     if packed:
+ *         return pack_addr(addr)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bdrmapit.graph.construct._key", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":70
+ * 
+ * 
+ * cdef inline void _add_edge(dict edges, str x, str y, long count) except *:             # <<<<<<<<<<<<<<
+ *     cdef dict succs = edges.get(x)
+ *     if succs is None:
+ */
+
+static CYTHON_INLINE void __pyx_f_8bdrmapit_5graph_9construct__add_edge(PyObject *__pyx_v_edges, PyObject *__pyx_v_x, PyObject *__pyx_v_y, long __pyx_v_count) {
+  PyObject *__pyx_v_succs = 0;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_add_edge", 0);
+
+  /* "bdrmapit/graph/construct.pyx":71
+ * 
+ * cdef inline void _add_edge(dict edges, str x, str y, long count) except *:
+ *     cdef dict succs = edges.get(x)             # <<<<<<<<<<<<<<
+ *     if succs is None:
+ *         succs = {}
+ */
+  if (unlikely(__pyx_v_edges == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 71, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyDict_GetItemDefault(__pyx_v_edges, __pyx_v_x, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(PyDict_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 71, __pyx_L1_error)
+  __pyx_v_succs = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":72
+ * cdef inline void _add_edge(dict edges, str x, str y, long count) except *:
+ *     cdef dict succs = edges.get(x)
+ *     if succs is None:             # <<<<<<<<<<<<<<
+ *         succs = {}
+ *         edges[x] = succs
+ */
+  __pyx_t_2 = (__pyx_v_succs == ((PyObject*)Py_None));
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "bdrmapit/graph/construct.pyx":73
+ *     cdef dict succs = edges.get(x)
+ *     if succs is None:
+ *         succs = {}             # <<<<<<<<<<<<<<
+ *         edges[x] = succs
+ *     succs[y] = count
+ */
+    __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_succs, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":74
+ *     if succs is None:
+ *         succs = {}
+ *         edges[x] = succs             # <<<<<<<<<<<<<<
+ *     succs[y] = count
+ * 
+ */
+    if (unlikely(__pyx_v_edges == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 74, __pyx_L1_error)
+    }
+    if (unlikely(PyDict_SetItem(__pyx_v_edges, __pyx_v_x, __pyx_v_succs) < 0)) __PYX_ERR(0, 74, __pyx_L1_error)
+
+    /* "bdrmapit/graph/construct.pyx":72
+ * cdef inline void _add_edge(dict edges, str x, str y, long count) except *:
+ *     cdef dict succs = edges.get(x)
+ *     if succs is None:             # <<<<<<<<<<<<<<
+ *         succs = {}
+ *         edges[x] = succs
+ */
+  }
+
+  /* "bdrmapit/graph/construct.pyx":75
+ *         succs = {}
+ *         edges[x] = succs
+ *     succs[y] = count             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v_count); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (unlikely(__pyx_v_succs == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 75, __pyx_L1_error)
+  }
+  if (unlikely(PyDict_SetItem(__pyx_v_succs, __pyx_v_y, __pyx_t_1) < 0)) __PYX_ERR(0, 75, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":70
+ * 
+ * 
+ * cdef inline void _add_edge(dict edges, str x, str y, long count) except *:             # <<<<<<<<<<<<<<
+ *     cdef dict succs = edges.get(x)
+ *     if succs is None:
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bdrmapit.graph.construct._add_edge", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_succs);
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "bdrmapit/graph/construct.pyx":78
+ * 
+ * 
+ * cpdef tuple classify(object nextadjs, object multiadjs, object loopadjs, object first, object dps, object echos, IP2AS ip2as, bint loop=True, bint no_echos=False, int increment=1000000):             # <<<<<<<<<<<<<<
+ *     """
+ *     Select the graph addresses and classify the adjacencies as nexthop or multihop edges, in one pass over each
+ */
+
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_1classify(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_f_8bdrmapit_5graph_9construct_classify(PyObject *__pyx_v_nextadjs, PyObject *__pyx_v_multiadjs, PyObject *__pyx_v_loopadjs, PyObject *__pyx_v_first, PyObject *__pyx_v_dps, PyObject *__pyx_v_echos, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_classify *__pyx_optional_args) {
+  int __pyx_v_loop = ((int)1);
+  int __pyx_v_no_echos = ((int)0);
+  int __pyx_v_increment = ((int)0xF4240);
+  PyObject *__pyx_v_addrs = 0;
+  PyObject *__pyx_v_firstaddrs = 0;
+  PyObject *__pyx_v_nexthops = 0;
+  PyObject *__pyx_v_multi = 0;
+  PyObject *__pyx_v_pair = 0;
+  PyObject *__pyx_v_x = 0;
+  PyObject *__pyx_v_y = 0;
+  long __pyx_v_n;
+  long __pyx_v_m;
+  int __pyx_v_xasn;
+  int __pyx_v_yasn;
+  PyObject *__pyx_v_count = 0;
+  PyObject *__pyx_v_pb = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *(*__pyx_t_3)(PyObject *);
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *(*__pyx_t_9)(PyObject *);
+  long __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  long __pyx_t_15;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("classify", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_loop = __pyx_optional_args->loop;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_no_echos = __pyx_optional_args->no_echos;
+        if (__pyx_optional_args->__pyx_n > 2) {
+          __pyx_v_increment = __pyx_optional_args->increment;
+        }
+      }
+    }
+  }
+
+  /* "bdrmapit/graph/construct.pyx":90
+ *     adjacency counted in both nextadjs and multiadjs
+ *     """
+ *     cdef set addrs = set(), firstaddrs = set()             # <<<<<<<<<<<<<<
+ *     cdef dict nexthops = {}, multi = {}
+ *     cdef tuple pair
+ */
+  __pyx_t_1 = PySet_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_addrs = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PySet_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_firstaddrs = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":91
+ *     """
+ *     cdef set addrs = set(), firstaddrs = set()
+ *     cdef dict nexthops = {}, multi = {}             # <<<<<<<<<<<<<<
+ *     cdef tuple pair
+ *     cdef str x, y
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_nexthops = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_multi = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":98
+ *     cdef object count
+ * 
+ *     for pair in first:             # <<<<<<<<<<<<<<
+ *         firstaddrs.add(pair[1])
+ *     pb = Progress(len(nextadjs), 'Classifying nexthop adjacencies', increment=increment)
+ */
+  if (likely(PyList_CheckExact(__pyx_v_first)) || PyTuple_CheckExact(__pyx_v_first)) {
+    __pyx_t_1 = __pyx_v_first; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_first); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 98, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 98, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 98, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 98, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 98, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 98, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      }
+    } else {
+      __pyx_t_4 = __pyx_t_3(__pyx_t_1);
+      if (unlikely(!__pyx_t_4)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 98, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    if (!(likely(PyTuple_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(0, 98, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_pair, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":99
+ * 
+ *     for pair in first:
+ *         firstaddrs.add(pair[1])             # <<<<<<<<<<<<<<
+ *     pb = Progress(len(nextadjs), 'Classifying nexthop adjacencies', increment=increment)
+ *     for pair, count in pb.iterator(nextadjs.items()):
+ */
+    if (unlikely(__pyx_v_pair == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 99, __pyx_L1_error)
+    }
+    __pyx_t_4 = __Pyx_GetItemInt_Tuple(__pyx_v_pair, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 99, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PySet_Add(__pyx_v_firstaddrs, __pyx_t_4); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 99, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":98
+ *     cdef object count
+ * 
+ *     for pair in first:             # <<<<<<<<<<<<<<
+ *         firstaddrs.add(pair[1])
+ *     pb = Progress(len(nextadjs), 'Classifying nexthop adjacencies', increment=increment)
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":100
+ *     for pair in first:
+ *         firstaddrs.add(pair[1])
+ *     pb = Progress(len(nextadjs), 'Classifying nexthop adjacencies', increment=increment)             # <<<<<<<<<<<<<<
+ *     for pair, count in pb.iterator(nextadjs.items()):
+ *         x = pair[0]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Progress); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Length(__pyx_v_nextadjs); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_4 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+  __Pyx_INCREF(__pyx_kp_u_Classifying_nexthop_adjacencies);
+  __Pyx_GIVEREF(__pyx_kp_u_Classifying_nexthop_adjacencies);
+  PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_kp_u_Classifying_nexthop_adjacencies);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_increment); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_increment, __pyx_t_7) < 0) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_6, __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_pb = __pyx_t_7;
+  __pyx_t_7 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":101
+ *         firstaddrs.add(pair[1])
+ *     pb = Progress(len(nextadjs), 'Classifying nexthop adjacencies', increment=increment)
+ *     for pair, count in pb.iterator(nextadjs.items()):             # <<<<<<<<<<<<<<
+ *         x = pair[0]
+ *         y = pair[1]
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_pb, __pyx_n_s_iterator); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_nextadjs, __pyx_n_s_items); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_8 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_6 = (__pyx_t_8) ? __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_8) : __Pyx_PyObject_CallNoArg(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_7 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_1, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_7)) || PyTuple_CheckExact(__pyx_t_7)) {
+    __pyx_t_4 = __pyx_t_7; __Pyx_INCREF(__pyx_t_4); __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 101, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 101, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_4)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_7 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_7); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 101, __pyx_L1_error)
+        #else
+        __pyx_t_7 = PySequence_ITEM(__pyx_t_4, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 101, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_7); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 101, __pyx_L1_error)
+        #else
+        __pyx_t_7 = PySequence_ITEM(__pyx_t_4, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 101, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        #endif
+      }
+    } else {
+      __pyx_t_7 = __pyx_t_3(__pyx_t_4);
+      if (unlikely(!__pyx_t_7)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 101, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_7);
+    }
+    if ((likely(PyTuple_CheckExact(__pyx_t_7))) || (PyList_CheckExact(__pyx_t_7))) {
+      PyObject* sequence = __pyx_t_7;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 101, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_6 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_1 = PyTuple_GET_ITEM(sequence, 1); 
+      } else {
+        __pyx_t_6 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_1 = PyList_GET_ITEM(sequence, 1); 
+      }
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_1);
+      #else
+      __pyx_t_6 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 101, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_1 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 101, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      #endif
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_8 = PyObject_GetIter(__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 101, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_9 = Py_TYPE(__pyx_t_8)->tp_iternext;
+      index = 0; __pyx_t_6 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_6)) goto __pyx_L7_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_6);
+      index = 1; __pyx_t_1 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_1)) goto __pyx_L7_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_1);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_8), 2) < 0) __PYX_ERR(0, 101, __pyx_L1_error)
+      __pyx_t_9 = NULL;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      goto __pyx_L8_unpacking_done;
+      __pyx_L7_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_9 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 101, __pyx_L1_error)
+      __pyx_L8_unpacking_done:;
+    }
+    if (!(likely(PyTuple_CheckExact(__pyx_t_6))||((__pyx_t_6) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_6)->tp_name), 0))) __PYX_ERR(0, 101, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_pair, ((PyObject*)__pyx_t_6));
+    __pyx_t_6 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_count, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":102
+ *     pb = Progress(len(nextadjs), 'Classifying nexthop adjacencies', increment=increment)
+ *     for pair, count in pb.iterator(nextadjs.items()):
+ *         x = pair[0]             # <<<<<<<<<<<<<<
+ *         y = pair[1]
+ *         n = count
+ */
+    if (unlikely(__pyx_v_pair == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 102, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v_pair, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 102, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_7))||((__pyx_t_7) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_7)->tp_name), 0))) __PYX_ERR(0, 102, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_x, ((PyObject*)__pyx_t_7));
+    __pyx_t_7 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":103
+ *     for pair, count in pb.iterator(nextadjs.items()):
+ *         x = pair[0]
+ *         y = pair[1]             # <<<<<<<<<<<<<<
+ *         n = count
+ *         m = multiadjs.get(pair, 0)
+ */
+    if (unlikely(__pyx_v_pair == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 103, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v_pair, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_7))||((__pyx_t_7) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_7)->tp_name), 0))) __PYX_ERR(0, 103, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_y, ((PyObject*)__pyx_t_7));
+    __pyx_t_7 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":104
+ *         x = pair[0]
+ *         y = pair[1]
+ *         n = count             # <<<<<<<<<<<<<<
+ *         m = multiadjs.get(pair, 0)
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):
+ */
+    __pyx_t_10 = __Pyx_PyInt_As_long(__pyx_v_count); if (unlikely((__pyx_t_10 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L1_error)
+    __pyx_v_n = __pyx_t_10;
+
+    /* "bdrmapit/graph/construct.pyx":105
+ *         y = pair[1]
+ *         n = count
+ *         m = multiadjs.get(pair, 0)             # <<<<<<<<<<<<<<
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):
+ *             addrs.add(x)
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_multiadjs, __pyx_n_s_get); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = NULL;
+    __pyx_t_11 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+        __pyx_t_11 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_pair, __pyx_int_0};
+      __pyx_t_7 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_11, 2+__pyx_t_11); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_7);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_pair, __pyx_int_0};
+      __pyx_t_7 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_11, 2+__pyx_t_11); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_7);
+    } else
+    #endif
+    {
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_11); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      if (__pyx_t_6) {
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_pair);
+      __Pyx_GIVEREF(__pyx_v_pair);
+      PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_11, __pyx_v_pair);
+      __Pyx_INCREF(__pyx_int_0);
+      __Pyx_GIVEREF(__pyx_int_0);
+      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_11, __pyx_int_0);
+      __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_10 = __Pyx_PyInt_As_long(__pyx_t_7); if (unlikely((__pyx_t_10 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 105, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_v_m = __pyx_t_10;
+
+    /* "bdrmapit/graph/construct.pyx":106
+ *         n = count
+ *         m = multiadjs.get(pair, 0)
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):             # <<<<<<<<<<<<<<
+ *             addrs.add(x)
+ *             addrs.add(y)
+ */
+    __pyx_t_13 = ((!(__pyx_v_loop != 0)) != 0);
+    if (!__pyx_t_13) {
+    } else {
+      __pyx_t_12 = __pyx_t_13;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_loopadjs, __pyx_n_s_get); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_8 = NULL;
+    __pyx_t_11 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+        __pyx_t_11 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_pair, __pyx_int_0};
+      __pyx_t_7 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_11, 2+__pyx_t_11); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_7);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_pair, __pyx_int_0};
+      __pyx_t_7 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_11, 2+__pyx_t_11); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_7);
+    } else
+    #endif
+    {
+      __pyx_t_6 = PyTuple_New(2+__pyx_t_11); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      if (__pyx_t_8) {
+        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_8); __pyx_t_8 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_pair);
+      __Pyx_GIVEREF(__pyx_v_pair);
+      PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_11, __pyx_v_pair);
+      __Pyx_INCREF(__pyx_int_0);
+      __Pyx_GIVEREF(__pyx_int_0);
+      PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_11, __pyx_int_0);
+      __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_6, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_10 = __Pyx_PyInt_As_long(__pyx_t_7); if (unlikely((__pyx_t_10 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 106, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_13 = (((__pyx_v_n + __pyx_v_m) > ((long)__pyx_t_10)) != 0);
+    __pyx_t_12 = __pyx_t_13;
+    __pyx_L10_bool_binop_done:;
+    if (__pyx_t_12) {
+
+      /* "bdrmapit/graph/construct.pyx":107
+ *         m = multiadjs.get(pair, 0)
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):
+ *             addrs.add(x)             # <<<<<<<<<<<<<<
+ *             addrs.add(y)
+ *             firstaddrs.discard(y)
+ */
+      __pyx_t_5 = PySet_Add(__pyx_v_addrs, __pyx_v_x); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 107, __pyx_L1_error)
+
+      /* "bdrmapit/graph/construct.pyx":108
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):
+ *             addrs.add(x)
+ *             addrs.add(y)             # <<<<<<<<<<<<<<
+ *             firstaddrs.discard(y)
+ *             if x != y and (n > m or ip2as.asn(x) == ip2as.asn(y)):
+ */
+      __pyx_t_5 = PySet_Add(__pyx_v_addrs, __pyx_v_y); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 108, __pyx_L1_error)
+
+      /* "bdrmapit/graph/construct.pyx":109
+ *             addrs.add(x)
+ *             addrs.add(y)
+ *             firstaddrs.discard(y)             # <<<<<<<<<<<<<<
+ *             if x != y and (n > m or ip2as.asn(x) == ip2as.asn(y)):
+ *                 _add_edge(nexthops, x, y, n + m)
+ */
+      __pyx_t_5 = __Pyx_PySet_Discard(__pyx_v_firstaddrs, __pyx_v_y); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 109, __pyx_L1_error)
+
+      /* "bdrmapit/graph/construct.pyx":110
+ *             addrs.add(y)
+ *             firstaddrs.discard(y)
+ *             if x != y and (n > m or ip2as.asn(x) == ip2as.asn(y)):             # <<<<<<<<<<<<<<
+ *                 _add_edge(nexthops, x, y, n + m)
+ *     pb = Progress(len(multiadjs), 'Classifying multihop adjacencies', increment=increment)
+ */
+      __pyx_t_13 = (__Pyx_PyUnicode_Equals(__pyx_v_x, __pyx_v_y, Py_NE)); if (unlikely(__pyx_t_13 < 0)) __PYX_ERR(0, 110, __pyx_L1_error)
+      __pyx_t_14 = (__pyx_t_13 != 0);
+      if (__pyx_t_14) {
+      } else {
+        __pyx_t_12 = __pyx_t_14;
+        goto __pyx_L13_bool_binop_done;
+      }
+      __pyx_t_14 = ((__pyx_v_n > __pyx_v_m) != 0);
+      if (!__pyx_t_14) {
+      } else {
+        __pyx_t_12 = __pyx_t_14;
+        goto __pyx_L13_bool_binop_done;
+      }
+      __pyx_t_14 = ((((struct __pyx_vtabstruct_10traceutils_5radix_5ip2as_IP2AS *)__pyx_v_ip2as->__pyx_base.__pyx_vtab)->asn(__pyx_v_ip2as, __pyx_v_x, 0) == ((struct __pyx_vtabstruct_10traceutils_5radix_5ip2as_IP2AS *)__pyx_v_ip2as->__pyx_base.__pyx_vtab)->asn(__pyx_v_ip2as, __pyx_v_y, 0)) != 0);
+      __pyx_t_12 = __pyx_t_14;
+      __pyx_L13_bool_binop_done:;
+      if (__pyx_t_12) {
+
+        /* "bdrmapit/graph/construct.pyx":111
+ *             firstaddrs.discard(y)
+ *             if x != y and (n > m or ip2as.asn(x) == ip2as.asn(y)):
+ *                 _add_edge(nexthops, x, y, n + m)             # <<<<<<<<<<<<<<
+ *     pb = Progress(len(multiadjs), 'Classifying multihop adjacencies', increment=increment)
+ *     for pair, count in pb.iterator(multiadjs.items()):
+ */
+        __pyx_f_8bdrmapit_5graph_9construct__add_edge(__pyx_v_nexthops, __pyx_v_x, __pyx_v_y, (__pyx_v_n + __pyx_v_m)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 111, __pyx_L1_error)
+
+        /* "bdrmapit/graph/construct.pyx":110
+ *             addrs.add(y)
+ *             firstaddrs.discard(y)
+ *             if x != y and (n > m or ip2as.asn(x) == ip2as.asn(y)):             # <<<<<<<<<<<<<<
+ *                 _add_edge(nexthops, x, y, n + m)
+ *     pb = Progress(len(multiadjs), 'Classifying multihop adjacencies', increment=increment)
+ */
+      }
+
+      /* "bdrmapit/graph/construct.pyx":106
+ *         n = count
+ *         m = multiadjs.get(pair, 0)
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):             # <<<<<<<<<<<<<<
+ *             addrs.add(x)
+ *             addrs.add(y)
+ */
+    }
+
+    /* "bdrmapit/graph/construct.pyx":101
+ *         firstaddrs.add(pair[1])
+ *     pb = Progress(len(nextadjs), 'Classifying nexthop adjacencies', increment=increment)
+ *     for pair, count in pb.iterator(nextadjs.items()):             # <<<<<<<<<<<<<<
+ *         x = pair[0]
+ *         y = pair[1]
+ */
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":112
+ *             if x != y and (n > m or ip2as.asn(x) == ip2as.asn(y)):
+ *                 _add_edge(nexthops, x, y, n + m)
+ *     pb = Progress(len(multiadjs), 'Classifying multihop adjacencies', increment=increment)             # <<<<<<<<<<<<<<
+ *     for pair, count in pb.iterator(multiadjs.items()):
+ *         x = pair[0]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_Progress); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = PyObject_Length(__pyx_v_multiadjs); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 112, __pyx_L1_error)
+  __pyx_t_7 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_7);
+  __Pyx_INCREF(__pyx_kp_u_Classifying_multihop_adjacencies);
+  __Pyx_GIVEREF(__pyx_kp_u_Classifying_multihop_adjacencies);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_kp_u_Classifying_multihop_adjacencies);
+  __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_increment); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_increment, __pyx_t_6) < 0) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_1, __pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF_SET(__pyx_v_pb, __pyx_t_6);
+  __pyx_t_6 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":113
+ *                 _add_edge(nexthops, x, y, n + m)
+ *     pb = Progress(len(multiadjs), 'Classifying multihop adjacencies', increment=increment)
+ *     for pair, count in pb.iterator(multiadjs.items()):             # <<<<<<<<<<<<<<
+ *         x = pair[0]
+ *         y = pair[1]
+ */
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_pb, __pyx_n_s_iterator); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_multiadjs, __pyx_n_s_items); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_8 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_8) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_8) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+    }
+  }
+  __pyx_t_6 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_4, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_6)) || PyTuple_CheckExact(__pyx_t_6)) {
+    __pyx_t_7 = __pyx_t_6; __Pyx_INCREF(__pyx_t_7); __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 113, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_3 = Py_TYPE(__pyx_t_7)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 113, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_7))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_7)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_6 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_2); __Pyx_INCREF(__pyx_t_6); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 113, __pyx_L1_error)
+        #else
+        __pyx_t_6 = PySequence_ITEM(__pyx_t_7, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 113, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_2); __Pyx_INCREF(__pyx_t_6); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 113, __pyx_L1_error)
+        #else
+        __pyx_t_6 = PySequence_ITEM(__pyx_t_7, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 113, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        #endif
+      }
+    } else {
+      __pyx_t_6 = __pyx_t_3(__pyx_t_7);
+      if (unlikely(!__pyx_t_6)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 113, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_6);
+    }
+    if ((likely(PyTuple_CheckExact(__pyx_t_6))) || (PyList_CheckExact(__pyx_t_6))) {
+      PyObject* sequence = __pyx_t_6;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 113, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_4 = PyTuple_GET_ITEM(sequence, 1); 
+      } else {
+        __pyx_t_1 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_4 = PyList_GET_ITEM(sequence, 1); 
+      }
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_4);
+      #else
+      __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 113, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      #endif
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_8 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 113, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_9 = Py_TYPE(__pyx_t_8)->tp_iternext;
+      index = 0; __pyx_t_1 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_1)) goto __pyx_L18_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_1);
+      index = 1; __pyx_t_4 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_4)) goto __pyx_L18_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_4);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_8), 2) < 0) __PYX_ERR(0, 113, __pyx_L1_error)
+      __pyx_t_9 = NULL;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      goto __pyx_L19_unpacking_done;
+      __pyx_L18_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_9 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 113, __pyx_L1_error)
+      __pyx_L19_unpacking_done:;
+    }
+    if (!(likely(PyTuple_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 113, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_pair, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_count, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":114
+ *     pb = Progress(len(multiadjs), 'Classifying multihop adjacencies', increment=increment)
+ *     for pair, count in pb.iterator(multiadjs.items()):
+ *         x = pair[0]             # <<<<<<<<<<<<<<
+ *         y = pair[1]
+ *         m = count
+ */
+    if (unlikely(__pyx_v_pair == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 114, __pyx_L1_error)
+    }
+    __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v_pair, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 114, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_6))||((__pyx_t_6) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_6)->tp_name), 0))) __PYX_ERR(0, 114, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_x, ((PyObject*)__pyx_t_6));
+    __pyx_t_6 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":115
+ *     for pair, count in pb.iterator(multiadjs.items()):
+ *         x = pair[0]
+ *         y = pair[1]             # <<<<<<<<<<<<<<
+ *         m = count
+ *         count = nextadjs.get(pair)
+ */
+    if (unlikely(__pyx_v_pair == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 115, __pyx_L1_error)
+    }
+    __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v_pair, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 115, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_6))||((__pyx_t_6) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_6)->tp_name), 0))) __PYX_ERR(0, 115, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_y, ((PyObject*)__pyx_t_6));
+    __pyx_t_6 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":116
+ *         x = pair[0]
+ *         y = pair[1]
+ *         m = count             # <<<<<<<<<<<<<<
+ *         count = nextadjs.get(pair)
+ *         n = 0 if count is None else count
+ */
+    __pyx_t_10 = __Pyx_PyInt_As_long(__pyx_v_count); if (unlikely((__pyx_t_10 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 116, __pyx_L1_error)
+    __pyx_v_m = __pyx_t_10;
+
+    /* "bdrmapit/graph/construct.pyx":117
+ *         y = pair[1]
+ *         m = count
+ *         count = nextadjs.get(pair)             # <<<<<<<<<<<<<<
+ *         n = 0 if count is None else count
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nextadjs, __pyx_n_s_get); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 117, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_1)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_1);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_1, __pyx_v_pair) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_pair);
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 117, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_count, __pyx_t_6);
+    __pyx_t_6 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":118
+ *         m = count
+ *         count = nextadjs.get(pair)
+ *         n = 0 if count is None else count             # <<<<<<<<<<<<<<
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):
+ *             # Addresses of adjacencies also in nextadjs were selected in the first pass
+ */
+    __pyx_t_12 = (__pyx_v_count == Py_None);
+    if ((__pyx_t_12 != 0)) {
+      __pyx_t_10 = 0;
+    } else {
+      __pyx_t_15 = __Pyx_PyInt_As_long(__pyx_v_count); if (unlikely((__pyx_t_15 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 118, __pyx_L1_error)
+      __pyx_t_10 = __pyx_t_15;
+    }
+    __pyx_v_n = __pyx_t_10;
+
+    /* "bdrmapit/graph/construct.pyx":119
+ *         count = nextadjs.get(pair)
+ *         n = 0 if count is None else count
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):             # <<<<<<<<<<<<<<
+ *             # Addresses of adjacencies also in nextadjs were selected in the first pass
+ *             if count is None:
+ */
+    __pyx_t_14 = ((!(__pyx_v_loop != 0)) != 0);
+    if (!__pyx_t_14) {
+    } else {
+      __pyx_t_12 = __pyx_t_14;
+      goto __pyx_L21_bool_binop_done;
+    }
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_loopadjs, __pyx_n_s_get); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = NULL;
+    __pyx_t_11 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_1)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_1);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_11 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_1, __pyx_v_pair, __pyx_int_0};
+      __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_11, 2+__pyx_t_11); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 119, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_6);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_1, __pyx_v_pair, __pyx_int_0};
+      __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_11, 2+__pyx_t_11); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 119, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_6);
+    } else
+    #endif
+    {
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_11); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 119, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      if (__pyx_t_1) {
+        __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_1); __pyx_t_1 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_pair);
+      __Pyx_GIVEREF(__pyx_v_pair);
+      PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_11, __pyx_v_pair);
+      __Pyx_INCREF(__pyx_int_0);
+      __Pyx_GIVEREF(__pyx_int_0);
+      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_11, __pyx_int_0);
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_8, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 119, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_10 = __Pyx_PyInt_As_long(__pyx_t_6); if (unlikely((__pyx_t_10 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_14 = (((__pyx_v_n + __pyx_v_m) > ((long)__pyx_t_10)) != 0);
+    __pyx_t_12 = __pyx_t_14;
+    __pyx_L21_bool_binop_done:;
+    if (__pyx_t_12) {
+
+      /* "bdrmapit/graph/construct.pyx":121
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):
+ *             # Addresses of adjacencies also in nextadjs were selected in the first pass
+ *             if count is None:             # <<<<<<<<<<<<<<
+ *                 addrs.add(x)
+ *                 addrs.add(y)
+ */
+      __pyx_t_12 = (__pyx_v_count == Py_None);
+      __pyx_t_14 = (__pyx_t_12 != 0);
+      if (__pyx_t_14) {
+
+        /* "bdrmapit/graph/construct.pyx":122
+ *             # Addresses of adjacencies also in nextadjs were selected in the first pass
+ *             if count is None:
+ *                 addrs.add(x)             # <<<<<<<<<<<<<<
+ *                 addrs.add(y)
+ *                 firstaddrs.discard(y)
+ */
+        __pyx_t_5 = PySet_Add(__pyx_v_addrs, __pyx_v_x); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 122, __pyx_L1_error)
+
+        /* "bdrmapit/graph/construct.pyx":123
+ *             if count is None:
+ *                 addrs.add(x)
+ *                 addrs.add(y)             # <<<<<<<<<<<<<<
+ *                 firstaddrs.discard(y)
+ *             if x != y:
+ */
+        __pyx_t_5 = PySet_Add(__pyx_v_addrs, __pyx_v_y); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 123, __pyx_L1_error)
+
+        /* "bdrmapit/graph/construct.pyx":124
+ *                 addrs.add(x)
+ *                 addrs.add(y)
+ *                 firstaddrs.discard(y)             # <<<<<<<<<<<<<<
+ *             if x != y:
+ *                 xasn = ip2as.asn(x)
+ */
+        __pyx_t_5 = __Pyx_PySet_Discard(__pyx_v_firstaddrs, __pyx_v_y); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 124, __pyx_L1_error)
+
+        /* "bdrmapit/graph/construct.pyx":121
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):
+ *             # Addresses of adjacencies also in nextadjs were selected in the first pass
+ *             if count is None:             # <<<<<<<<<<<<<<
+ *                 addrs.add(x)
+ *                 addrs.add(y)
+ */
+      }
+
+      /* "bdrmapit/graph/construct.pyx":125
+ *                 addrs.add(y)
+ *                 firstaddrs.discard(y)
+ *             if x != y:             # <<<<<<<<<<<<<<
+ *                 xasn = ip2as.asn(x)
+ *                 yasn = ip2as.asn(y)
+ */
+      __pyx_t_14 = (__Pyx_PyUnicode_Equals(__pyx_v_x, __pyx_v_y, Py_NE)); if (unlikely(__pyx_t_14 < 0)) __PYX_ERR(0, 125, __pyx_L1_error)
+      __pyx_t_12 = (__pyx_t_14 != 0);
+      if (__pyx_t_12) {
+
+        /* "bdrmapit/graph/construct.pyx":126
+ *                 firstaddrs.discard(y)
+ *             if x != y:
+ *                 xasn = ip2as.asn(x)             # <<<<<<<<<<<<<<
+ *                 yasn = ip2as.asn(y)
+ *                 if xasn > 0 and yasn > 0 and xasn == yasn:
+ */
+        __pyx_v_xasn = ((struct __pyx_vtabstruct_10traceutils_5radix_5ip2as_IP2AS *)__pyx_v_ip2as->__pyx_base.__pyx_vtab)->asn(__pyx_v_ip2as, __pyx_v_x, 0);
+
+        /* "bdrmapit/graph/construct.pyx":127
+ *             if x != y:
+ *                 xasn = ip2as.asn(x)
+ *                 yasn = ip2as.asn(y)             # <<<<<<<<<<<<<<
+ *                 if xasn > 0 and yasn > 0 and xasn == yasn:
+ *                     _add_edge(nexthops, x, y, n + m)
+ */
+        __pyx_v_yasn = ((struct __pyx_vtabstruct_10traceutils_5radix_5ip2as_IP2AS *)__pyx_v_ip2as->__pyx_base.__pyx_vtab)->asn(__pyx_v_ip2as, __pyx_v_y, 0);
+
+        /* "bdrmapit/graph/construct.pyx":128
+ *                 xasn = ip2as.asn(x)
+ *                 yasn = ip2as.asn(y)
+ *                 if xasn > 0 and yasn > 0 and xasn == yasn:             # <<<<<<<<<<<<<<
+ *                     _add_edge(nexthops, x, y, n + m)
+ *                 elif x not in nexthops:
+ */
+        __pyx_t_14 = ((__pyx_v_xasn > 0) != 0);
+        if (__pyx_t_14) {
+        } else {
+          __pyx_t_12 = __pyx_t_14;
+          goto __pyx_L26_bool_binop_done;
+        }
+        __pyx_t_14 = ((__pyx_v_yasn > 0) != 0);
+        if (__pyx_t_14) {
+        } else {
+          __pyx_t_12 = __pyx_t_14;
+          goto __pyx_L26_bool_binop_done;
+        }
+        __pyx_t_14 = ((__pyx_v_xasn == __pyx_v_yasn) != 0);
+        __pyx_t_12 = __pyx_t_14;
+        __pyx_L26_bool_binop_done:;
+        if (__pyx_t_12) {
+
+          /* "bdrmapit/graph/construct.pyx":129
+ *                 yasn = ip2as.asn(y)
+ *                 if xasn > 0 and yasn > 0 and xasn == yasn:
+ *                     _add_edge(nexthops, x, y, n + m)             # <<<<<<<<<<<<<<
+ *                 elif x not in nexthops:
+ *                     _add_edge(multi, x, y, n + m)
+ */
+          __pyx_f_8bdrmapit_5graph_9construct__add_edge(__pyx_v_nexthops, __pyx_v_x, __pyx_v_y, (__pyx_v_n + __pyx_v_m)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 129, __pyx_L1_error)
+
+          /* "bdrmapit/graph/construct.pyx":128
+ *                 xasn = ip2as.asn(x)
+ *                 yasn = ip2as.asn(y)
+ *                 if xasn > 0 and yasn > 0 and xasn == yasn:             # <<<<<<<<<<<<<<
+ *                     _add_edge(nexthops, x, y, n + m)
+ *                 elif x not in nexthops:
+ */
+          goto __pyx_L25;
+        }
+
+        /* "bdrmapit/graph/construct.pyx":130
+ *                 if xasn > 0 and yasn > 0 and xasn == yasn:
+ *                     _add_edge(nexthops, x, y, n + m)
+ *                 elif x not in nexthops:             # <<<<<<<<<<<<<<
+ *                     _add_edge(multi, x, y, n + m)
+ *     addrs |= firstaddrs
+ */
+        __pyx_t_12 = (__Pyx_PyDict_ContainsTF(__pyx_v_x, __pyx_v_nexthops, Py_NE)); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 130, __pyx_L1_error)
+        __pyx_t_14 = (__pyx_t_12 != 0);
+        if (__pyx_t_14) {
+
+          /* "bdrmapit/graph/construct.pyx":131
+ *                     _add_edge(nexthops, x, y, n + m)
+ *                 elif x not in nexthops:
+ *                     _add_edge(multi, x, y, n + m)             # <<<<<<<<<<<<<<
+ *     addrs |= firstaddrs
+ *     for pair in dps:
+ */
+          __pyx_f_8bdrmapit_5graph_9construct__add_edge(__pyx_v_multi, __pyx_v_x, __pyx_v_y, (__pyx_v_n + __pyx_v_m)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 131, __pyx_L1_error)
+
+          /* "bdrmapit/graph/construct.pyx":130
+ *                 if xasn > 0 and yasn > 0 and xasn == yasn:
+ *                     _add_edge(nexthops, x, y, n + m)
+ *                 elif x not in nexthops:             # <<<<<<<<<<<<<<
+ *                     _add_edge(multi, x, y, n + m)
+ *     addrs |= firstaddrs
+ */
+        }
+        __pyx_L25:;
+
+        /* "bdrmapit/graph/construct.pyx":125
+ *                 addrs.add(y)
+ *                 firstaddrs.discard(y)
+ *             if x != y:             # <<<<<<<<<<<<<<
+ *                 xasn = ip2as.asn(x)
+ *                 yasn = ip2as.asn(y)
+ */
+      }
+
+      /* "bdrmapit/graph/construct.pyx":119
+ *         count = nextadjs.get(pair)
+ *         n = 0 if count is None else count
+ *         if not loop or n + m > <long>loopadjs.get(pair, 0):             # <<<<<<<<<<<<<<
+ *             # Addresses of adjacencies also in nextadjs were selected in the first pass
+ *             if count is None:
+ */
+    }
+
+    /* "bdrmapit/graph/construct.pyx":113
+ *                 _add_edge(nexthops, x, y, n + m)
+ *     pb = Progress(len(multiadjs), 'Classifying multihop adjacencies', increment=increment)
+ *     for pair, count in pb.iterator(multiadjs.items()):             # <<<<<<<<<<<<<<
+ *         x = pair[0]
+ *         y = pair[1]
+ */
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":132
+ *                 elif x not in nexthops:
+ *                     _add_edge(multi, x, y, n + m)
+ *     addrs |= firstaddrs             # <<<<<<<<<<<<<<
+ *     for pair in dps:
+ *         addrs.add(pair[0])
+ */
+  __pyx_t_7 = PyNumber_InPlaceOr(__pyx_v_addrs, __pyx_v_firstaddrs); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 132, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF_SET(__pyx_v_addrs, ((PyObject*)__pyx_t_7));
+  __pyx_t_7 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":133
+ *                     _add_edge(multi, x, y, n + m)
+ *     addrs |= firstaddrs
+ *     for pair in dps:             # <<<<<<<<<<<<<<
+ *         addrs.add(pair[0])
+ *     if not no_echos:
+ */
+  if (likely(PyList_CheckExact(__pyx_v_dps)) || PyTuple_CheckExact(__pyx_v_dps)) {
+    __pyx_t_7 = __pyx_v_dps; __Pyx_INCREF(__pyx_t_7); __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_dps); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 133, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_3 = Py_TYPE(__pyx_t_7)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 133, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_7))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_7)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_6 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_2); __Pyx_INCREF(__pyx_t_6); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 133, __pyx_L1_error)
+        #else
+        __pyx_t_6 = PySequence_ITEM(__pyx_t_7, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 133, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_2); __Pyx_INCREF(__pyx_t_6); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 133, __pyx_L1_error)
+        #else
+        __pyx_t_6 = PySequence_ITEM(__pyx_t_7, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 133, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        #endif
+      }
+    } else {
+      __pyx_t_6 = __pyx_t_3(__pyx_t_7);
+      if (unlikely(!__pyx_t_6)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 133, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_6);
+    }
+    if (!(likely(PyTuple_CheckExact(__pyx_t_6))||((__pyx_t_6) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_6)->tp_name), 0))) __PYX_ERR(0, 133, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_pair, ((PyObject*)__pyx_t_6));
+    __pyx_t_6 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":134
+ *     addrs |= firstaddrs
+ *     for pair in dps:
+ *         addrs.add(pair[0])             # <<<<<<<<<<<<<<
+ *     if not no_echos:
+ *         addrs |= echos
+ */
+    if (unlikely(__pyx_v_pair == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 134, __pyx_L1_error)
+    }
+    __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v_pair, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_5 = PySet_Add(__pyx_v_addrs, __pyx_t_6); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 134, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":133
+ *                     _add_edge(multi, x, y, n + m)
+ *     addrs |= firstaddrs
+ *     for pair in dps:             # <<<<<<<<<<<<<<
+ *         addrs.add(pair[0])
+ *     if not no_echos:
+ */
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":135
+ *     for pair in dps:
+ *         addrs.add(pair[0])
+ *     if not no_echos:             # <<<<<<<<<<<<<<
+ *         addrs |= echos
+ *     return addrs, nexthops, multi
+ */
+  __pyx_t_14 = ((!(__pyx_v_no_echos != 0)) != 0);
+  if (__pyx_t_14) {
+
+    /* "bdrmapit/graph/construct.pyx":136
+ *         addrs.add(pair[0])
+ *     if not no_echos:
+ *         addrs |= echos             # <<<<<<<<<<<<<<
+ *     return addrs, nexthops, multi
+ * 
+ */
+    __pyx_t_7 = PyNumber_InPlaceOr(__pyx_v_addrs, __pyx_v_echos); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 136, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (!(likely(PySet_CheckExact(__pyx_t_7))||((__pyx_t_7) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "set", Py_TYPE(__pyx_t_7)->tp_name), 0))) __PYX_ERR(0, 136, __pyx_L1_error)
+    __Pyx_DECREF_SET(__pyx_v_addrs, ((PyObject*)__pyx_t_7));
+    __pyx_t_7 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":135
+ *     for pair in dps:
+ *         addrs.add(pair[0])
+ *     if not no_echos:             # <<<<<<<<<<<<<<
+ *         addrs |= echos
+ *     return addrs, nexthops, multi
+ */
+  }
+
+  /* "bdrmapit/graph/construct.pyx":137
+ *     if not no_echos:
+ *         addrs |= echos
+ *     return addrs, nexthops, multi             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_INCREF(__pyx_v_addrs);
+  __Pyx_GIVEREF(__pyx_v_addrs);
+  PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_addrs);
+  __Pyx_INCREF(__pyx_v_nexthops);
+  __Pyx_GIVEREF(__pyx_v_nexthops);
+  PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_v_nexthops);
+  __Pyx_INCREF(__pyx_v_multi);
+  __Pyx_GIVEREF(__pyx_v_multi);
+  PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_v_multi);
+  __pyx_r = ((PyObject*)__pyx_t_7);
+  __pyx_t_7 = 0;
+  goto __pyx_L0;
+
+  /* "bdrmapit/graph/construct.pyx":78
+ * 
+ * 
+ * cpdef tuple classify(object nextadjs, object multiadjs, object loopadjs, object first, object dps, object echos, IP2AS ip2as, bint loop=True, bint no_echos=False, int increment=1000000):             # <<<<<<<<<<<<<<
+ *     """
+ *     Select the graph addresses and classify the adjacencies as nexthop or multihop edges, in one pass over each
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.classify", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_addrs);
+  __Pyx_XDECREF(__pyx_v_firstaddrs);
+  __Pyx_XDECREF(__pyx_v_nexthops);
+  __Pyx_XDECREF(__pyx_v_multi);
+  __Pyx_XDECREF(__pyx_v_pair);
+  __Pyx_XDECREF(__pyx_v_x);
+  __Pyx_XDECREF(__pyx_v_y);
+  __Pyx_XDECREF(__pyx_v_count);
+  __Pyx_XDECREF(__pyx_v_pb);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_1classify(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_classify[] = "classify(nextadjs, multiadjs, loopadjs, first, dps, echos, IP2AS ip2as, bool loop=True, bool no_echos=False, int increment=1000000) -> tuple\n\n    Select the graph addresses and classify the adjacencies as nexthop or multihop edges, in one pass over each\n    adjacency counter.\n    :param nextadjs: adjacency counter, any mapping such as the ParseResults Counter\n    :param first: first hop counter keyed by (vantage point ID, addr)\n    :param dps: (addr, destination AS) pairs\n    :param loop: ignore adjacencies seen as often in loops as in traces\n    :param no_echos: ignore echo-only addresses\n    :return: addresses, nexthop edges, multihop edges, with edges as {x: {y: observations}} and observations of an\n    adjacency counted in both nextadjs and multiadjs\n    ";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_1classify(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_nextadjs = 0;
+  PyObject *__pyx_v_multiadjs = 0;
+  PyObject *__pyx_v_loopadjs = 0;
+  PyObject *__pyx_v_first = 0;
+  PyObject *__pyx_v_dps = 0;
+  PyObject *__pyx_v_echos = 0;
+  struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as = 0;
+  int __pyx_v_loop;
+  int __pyx_v_no_echos;
+  int __pyx_v_increment;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("classify (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_nextadjs,&__pyx_n_s_multiadjs,&__pyx_n_s_loopadjs,&__pyx_n_s_first,&__pyx_n_s_dps,&__pyx_n_s_echos,&__pyx_n_s_ip2as,&__pyx_n_s_loop,&__pyx_n_s_no_echos,&__pyx_n_s_increment,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_nextadjs)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_multiadjs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("classify", 0, 7, 10, 1); __PYX_ERR(0, 78, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_loopadjs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("classify", 0, 7, 10, 2); __PYX_ERR(0, 78, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_first)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("classify", 0, 7, 10, 3); __PYX_ERR(0, 78, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_dps)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("classify", 0, 7, 10, 4); __PYX_ERR(0, 78, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_echos)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("classify", 0, 7, 10, 5); __PYX_ERR(0, 78, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ip2as)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("classify", 0, 7, 10, 6); __PYX_ERR(0, 78, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_loop);
+          if (value) { values[7] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_no_echos);
+          if (value) { values[8] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_increment);
+          if (value) { values[9] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "classify") < 0)) __PYX_ERR(0, 78, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_nextadjs = values[0];
+    __pyx_v_multiadjs = values[1];
+    __pyx_v_loopadjs = values[2];
+    __pyx_v_first = values[3];
+    __pyx_v_dps = values[4];
+    __pyx_v_echos = values[5];
+    __pyx_v_ip2as = ((struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *)values[6]);
+    if (values[7]) {
+      __pyx_v_loop = __Pyx_PyObject_IsTrue(values[7]); if (unlikely((__pyx_v_loop == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 78, __pyx_L3_error)
+    } else {
+      __pyx_v_loop = ((int)1);
+    }
+    if (values[8]) {
+      __pyx_v_no_echos = __Pyx_PyObject_IsTrue(values[8]); if (unlikely((__pyx_v_no_echos == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 78, __pyx_L3_error)
+    } else {
+      __pyx_v_no_echos = ((int)0);
+    }
+    if (values[9]) {
+      __pyx_v_increment = __Pyx_PyInt_As_int(values[9]); if (unlikely((__pyx_v_increment == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 78, __pyx_L3_error)
+    } else {
+      __pyx_v_increment = ((int)0xF4240);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("classify", 0, 7, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 78, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.classify", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ip2as), __pyx_ptype_10traceutils_5radix_5ip2as_IP2AS, 1, "ip2as", 0))) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_classify(__pyx_self, __pyx_v_nextadjs, __pyx_v_multiadjs, __pyx_v_loopadjs, __pyx_v_first, __pyx_v_dps, __pyx_v_echos, __pyx_v_ip2as, __pyx_v_loop, __pyx_v_no_echos, __pyx_v_increment);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_classify(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_nextadjs, PyObject *__pyx_v_multiadjs, PyObject *__pyx_v_loopadjs, PyObject *__pyx_v_first, PyObject *__pyx_v_dps, PyObject *__pyx_v_echos, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as, int __pyx_v_loop, int __pyx_v_no_echos, int __pyx_v_increment) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_8bdrmapit_5graph_9construct_classify __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("classify", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 3;
+  __pyx_t_2.loop = __pyx_v_loop;
+  __pyx_t_2.no_echos = __pyx_v_no_echos;
+  __pyx_t_2.increment = __pyx_v_increment;
+  __pyx_t_1 = __pyx_f_8bdrmapit_5graph_9construct_classify(__pyx_v_nextadjs, __pyx_v_multiadjs, __pyx_v_loopadjs, __pyx_v_first, __pyx_v_dps, __pyx_v_echos, __pyx_v_ip2as, 0, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.classify", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":140
+ * 
+ * 
+ * cpdef Interface create_node(dict interfaces, dict routers, str addr, Router router, IP2AS ip2as, AS2Org as2org, bint packed=False):             # <<<<<<<<<<<<<<
+ *     """
+ *     Create new interface node and assign it to router.
+ */
+
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_3create_node(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_f_8bdrmapit_5graph_9construct_create_node(PyObject *__pyx_v_interfaces, PyObject *__pyx_v_routers, PyObject *__pyx_v_addr, struct __pyx_obj_8bdrmapit_5graph_4node_Router *__pyx_v_router, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as, struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *__pyx_v_as2org, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_node *__pyx_optional_args) {
+  int __pyx_v_packed = ((int)0);
+  int __pyx_v_asn;
+  PyObject *__pyx_v_key = 0;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_v_interface = 0;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("create_node", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_packed = __pyx_optional_args->packed;
+    }
+  }
+
+  /* "bdrmapit/graph/construct.pyx":145
+ *     :return: the interface, or None for private addresses
+ *     """
+ *     cdef int asn = ip2as.asn(addr)             # <<<<<<<<<<<<<<
+ *     cdef object key
+ *     cdef Interface interface
+ */
+  __pyx_v_asn = ((struct __pyx_vtabstruct_10traceutils_5radix_5ip2as_IP2AS *)__pyx_v_ip2as->__pyx_base.__pyx_vtab)->asn(__pyx_v_ip2as, __pyx_v_addr, 0);
+
+  /* "bdrmapit/graph/construct.pyx":149
+ *     cdef Interface interface
+ *     # Make sure address is not from private address space
+ *     if asn >= 0 or asn <= -100:             # <<<<<<<<<<<<<<
+ *         key = _key(addr, packed)
+ *         interface = Interface(key, asn, as2org[asn])
+ */
+  __pyx_t_2 = ((__pyx_v_asn >= 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_asn <= -100L) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "bdrmapit/graph/construct.pyx":150
+ *     # Make sure address is not from private address space
+ *     if asn >= 0 or asn <= -100:
+ *         key = _key(addr, packed)             # <<<<<<<<<<<<<<
+ *         interface = Interface(key, asn, as2org[asn])
+ *         interfaces[key] = interface
+ */
+    __pyx_t_3 = __pyx_f_8bdrmapit_5graph_9construct__key(__pyx_v_addr, __pyx_v_packed); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_v_key = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":151
+ *     if asn >= 0 or asn <= -100:
+ *         key = _key(addr, packed)
+ *         interface = Interface(key, asn, as2org[asn])             # <<<<<<<<<<<<<<
+ *         interfaces[key] = interface
+ *         router.add_interface(interface)
+ */
+    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_asn); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_GetItemInt(((PyObject *)__pyx_v_as2org), __pyx_v_asn, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_v_key);
+    __Pyx_GIVEREF(__pyx_v_key);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_key);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_t_4);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_8bdrmapit_5graph_4node_Interface), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_v_interface = ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)__pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":152
+ *         key = _key(addr, packed)
+ *         interface = Interface(key, asn, as2org[asn])
+ *         interfaces[key] = interface             # <<<<<<<<<<<<<<
+ *         router.add_interface(interface)
+ *         routers[router.name] = router
+ */
+    if (unlikely(__pyx_v_interfaces == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 152, __pyx_L1_error)
+    }
+    if (unlikely(PyDict_SetItem(__pyx_v_interfaces, __pyx_v_key, ((PyObject *)__pyx_v_interface)) < 0)) __PYX_ERR(0, 152, __pyx_L1_error)
+
+    /* "bdrmapit/graph/construct.pyx":153
+ *         interface = Interface(key, asn, as2org[asn])
+ *         interfaces[key] = interface
+ *         router.add_interface(interface)             # <<<<<<<<<<<<<<
+ *         routers[router.name] = router
+ *         return interface
+ */
+    ((struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Router *)__pyx_v_router->__pyx_vtab)->add_interface(__pyx_v_router, __pyx_v_interface, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 153, __pyx_L1_error)
+
+    /* "bdrmapit/graph/construct.pyx":154
+ *         interfaces[key] = interface
+ *         router.add_interface(interface)
+ *         routers[router.name] = router             # <<<<<<<<<<<<<<
+ *         return interface
+ *     return None
+ */
+    if (unlikely(__pyx_v_routers == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 154, __pyx_L1_error)
+    }
+    if (unlikely(PyDict_SetItem(__pyx_v_routers, __pyx_v_router->name, ((PyObject *)__pyx_v_router)) < 0)) __PYX_ERR(0, 154, __pyx_L1_error)
+
+    /* "bdrmapit/graph/construct.pyx":155
+ *         router.add_interface(interface)
+ *         routers[router.name] = router
+ *         return interface             # <<<<<<<<<<<<<<
+ *     return None
+ * 
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __Pyx_INCREF(((PyObject *)__pyx_v_interface));
+    __pyx_r = __pyx_v_interface;
+    goto __pyx_L0;
+
+    /* "bdrmapit/graph/construct.pyx":149
+ *     cdef Interface interface
+ *     # Make sure address is not from private address space
+ *     if asn >= 0 or asn <= -100:             # <<<<<<<<<<<<<<
+ *         key = _key(addr, packed)
+ *         interface = Interface(key, asn, as2org[asn])
+ */
+  }
+
+  /* "bdrmapit/graph/construct.pyx":156
+ *         routers[router.name] = router
+ *         return interface
+ *     return None             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __pyx_r = ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)Py_None); __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+
+  /* "bdrmapit/graph/construct.pyx":140
+ * 
+ * 
+ * cpdef Interface create_node(dict interfaces, dict routers, str addr, Router router, IP2AS ip2as, AS2Org as2org, bint packed=False):             # <<<<<<<<<<<<<<
+ *     """
+ *     Create new interface node and assign it to router.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.create_node", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XDECREF((PyObject *)__pyx_v_interface);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_3create_node(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_2create_node[] = "create_node(dict interfaces, dict routers, unicode addr, Router router, IP2AS ip2as, AS2Org as2org, bool packed=False) -> Interface\n\n    Create new interface node and assign it to router.\n    :return: the interface, or None for private addresses\n    ";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_3create_node(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_interfaces = 0;
+  PyObject *__pyx_v_routers = 0;
+  PyObject *__pyx_v_addr = 0;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Router *__pyx_v_router = 0;
+  struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as = 0;
+  struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *__pyx_v_as2org = 0;
+  int __pyx_v_packed;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("create_node (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_interfaces,&__pyx_n_s_routers,&__pyx_n_s_addr,&__pyx_n_s_router,&__pyx_n_s_ip2as,&__pyx_n_s_as2org,&__pyx_n_s_packed,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_interfaces)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_routers)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_node", 0, 6, 7, 1); __PYX_ERR(0, 140, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_addr)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_node", 0, 6, 7, 2); __PYX_ERR(0, 140, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_router)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_node", 0, 6, 7, 3); __PYX_ERR(0, 140, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ip2as)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_node", 0, 6, 7, 4); __PYX_ERR(0, 140, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_as2org)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_node", 0, 6, 7, 5); __PYX_ERR(0, 140, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_packed);
+          if (value) { values[6] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "create_node") < 0)) __PYX_ERR(0, 140, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_interfaces = ((PyObject*)values[0]);
+    __pyx_v_routers = ((PyObject*)values[1]);
+    __pyx_v_addr = ((PyObject*)values[2]);
+    __pyx_v_router = ((struct __pyx_obj_8bdrmapit_5graph_4node_Router *)values[3]);
+    __pyx_v_ip2as = ((struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *)values[4]);
+    __pyx_v_as2org = ((struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *)values[5]);
+    if (values[6]) {
+      __pyx_v_packed = __Pyx_PyObject_IsTrue(values[6]); if (unlikely((__pyx_v_packed == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+    } else {
+      __pyx_v_packed = ((int)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("create_node", 0, 6, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 140, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.create_node", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_interfaces), (&PyDict_Type), 1, "interfaces", 1))) __PYX_ERR(0, 140, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_routers), (&PyDict_Type), 1, "routers", 1))) __PYX_ERR(0, 140, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_addr), (&PyUnicode_Type), 1, "addr", 1))) __PYX_ERR(0, 140, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_router), __pyx_ptype_8bdrmapit_5graph_4node_Router, 1, "router", 0))) __PYX_ERR(0, 140, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ip2as), __pyx_ptype_10traceutils_5radix_5ip2as_IP2AS, 1, "ip2as", 0))) __PYX_ERR(0, 140, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_as2org), __pyx_ptype_10traceutils_6as2org_6as2org_AS2Org, 1, "as2org", 0))) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_2create_node(__pyx_self, __pyx_v_interfaces, __pyx_v_routers, __pyx_v_addr, __pyx_v_router, __pyx_v_ip2as, __pyx_v_as2org, __pyx_v_packed);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_2create_node(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_routers, PyObject *__pyx_v_addr, struct __pyx_obj_8bdrmapit_5graph_4node_Router *__pyx_v_router, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as, struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *__pyx_v_as2org, int __pyx_v_packed) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_node __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("create_node", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.packed = __pyx_v_packed;
+  __pyx_t_1 = ((PyObject *)__pyx_f_8bdrmapit_5graph_9construct_create_node(__pyx_v_interfaces, __pyx_v_routers, __pyx_v_addr, __pyx_v_router, __pyx_v_ip2as, __pyx_v_as2org, 0, &__pyx_t_2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.create_node", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":159
+ * 
+ * 
+ * cpdef void create_remaining(dict interfaces, dict routers, object addrs, Py_ssize_t num_addrs, bint aliases, IP2AS ip2as, AS2Org as2org, bint packed=False, int increment=100000) except *:             # <<<<<<<<<<<<<<
+ *     """
+ *     Create a single interface router for each address not already assigned to a router. The remaining addresses are
+ */
+
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5create_remaining(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static void __pyx_f_8bdrmapit_5graph_9construct_create_remaining(PyObject *__pyx_v_interfaces, PyObject *__pyx_v_routers, PyObject *__pyx_v_addrs, Py_ssize_t __pyx_v_num_addrs, int __pyx_v_aliases, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as, struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *__pyx_v_as2org, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_remaining *__pyx_optional_args) {
+  int __pyx_v_packed = ((int)0);
+  int __pyx_v_increment = ((int)0x186A0);
+  PyObject *__pyx_v_addr = 0;
+  PyObject *__pyx_v_key = 0;
+  PyObject *__pyx_v_remaining = 0;
+  PyObject *__pyx_v_keys = 0;
+  PyObject *__pyx_v_orgs = 0;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_n;
+  int __pyx_v_asn;
+  PyObject *__pyx_v_org = 0;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Router *__pyx_v_router = 0;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_v_interface = 0;
+  PyObject *__pyx_v_pb = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("create_remaining", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_packed = __pyx_optional_args->packed;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_increment = __pyx_optional_args->increment;
+      }
+    }
+  }
+
+  /* "bdrmapit/graph/construct.pyx":170
+ *     cdef str addr
+ *     cdef object key
+ *     cdef list remaining = [], keys = []             # <<<<<<<<<<<<<<
+ *     cdef dict orgs = {}
+ *     cdef Py_ssize_t i, n
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_remaining = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_keys = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":171
+ *     cdef object key
+ *     cdef list remaining = [], keys = []
+ *     cdef dict orgs = {}             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i, n
+ *     cdef int asn
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 171, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_orgs = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":178
+ *     cdef Interface interface
+ * 
+ *     pb = Progress(num_addrs, 'Selecting remaining addresses', increment=increment)             # <<<<<<<<<<<<<<
+ *     for addr in pb.iterator(addrs):
+ *         key = _key(addr, packed)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Progress); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_num_addrs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+  __Pyx_INCREF(__pyx_kp_u_Selecting_remaining_addresses);
+  __Pyx_GIVEREF(__pyx_kp_u_Selecting_remaining_addresses);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_kp_u_Selecting_remaining_addresses);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_increment); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_increment, __pyx_t_4) < 0) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_pb = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":179
+ * 
+ *     pb = Progress(num_addrs, 'Selecting remaining addresses', increment=increment)
+ *     for addr in pb.iterator(addrs):             # <<<<<<<<<<<<<<
+ *         key = _key(addr, packed)
+ *         if not aliases or key not in interfaces:
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_pb, __pyx_n_s_iterator); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_addrs) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_addrs);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_4)) || PyTuple_CheckExact(__pyx_t_4)) {
+    __pyx_t_2 = __pyx_t_4; __Pyx_INCREF(__pyx_t_2); __pyx_t_5 = 0;
+    __pyx_t_6 = NULL;
+  } else {
+    __pyx_t_5 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_6 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 179, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_6)) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_5); __Pyx_INCREF(__pyx_t_4); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 179, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_2, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 179, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      } else {
+        if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_5); __Pyx_INCREF(__pyx_t_4); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 179, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_2, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 179, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      }
+    } else {
+      __pyx_t_4 = __pyx_t_6(__pyx_t_2);
+      if (unlikely(!__pyx_t_4)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 179, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_addr, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":180
+ *     pb = Progress(num_addrs, 'Selecting remaining addresses', increment=increment)
+ *     for addr in pb.iterator(addrs):
+ *         key = _key(addr, packed)             # <<<<<<<<<<<<<<
+ *         if not aliases or key not in interfaces:
+ *             remaining.append(addr)
+ */
+    __pyx_t_4 = __pyx_f_8bdrmapit_5graph_9construct__key(__pyx_v_addr, __pyx_v_packed); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 180, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":181
+ *     for addr in pb.iterator(addrs):
+ *         key = _key(addr, packed)
+ *         if not aliases or key not in interfaces:             # <<<<<<<<<<<<<<
+ *             remaining.append(addr)
+ *             keys.append(key)
+ */
+    __pyx_t_8 = ((!(__pyx_v_aliases != 0)) != 0);
+    if (!__pyx_t_8) {
+    } else {
+      __pyx_t_7 = __pyx_t_8;
+      goto __pyx_L6_bool_binop_done;
+    }
+    if (unlikely(__pyx_v_interfaces == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+      __PYX_ERR(0, 181, __pyx_L1_error)
+    }
+    __pyx_t_8 = (__Pyx_PyDict_ContainsTF(__pyx_v_key, __pyx_v_interfaces, Py_NE)); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __pyx_t_9 = (__pyx_t_8 != 0);
+    __pyx_t_7 = __pyx_t_9;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_7) {
+
+      /* "bdrmapit/graph/construct.pyx":182
+ *         key = _key(addr, packed)
+ *         if not aliases or key not in interfaces:
+ *             remaining.append(addr)             # <<<<<<<<<<<<<<
+ *             keys.append(key)
+ *     n = len(remaining)
+ */
+      __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_remaining, __pyx_v_addr); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 182, __pyx_L1_error)
+
+      /* "bdrmapit/graph/construct.pyx":183
+ *         if not aliases or key not in interfaces:
+ *             remaining.append(addr)
+ *             keys.append(key)             # <<<<<<<<<<<<<<
+ *     n = len(remaining)
+ *     pb = Progress(n, 'Creating remaining routers and interfaces', increment=increment)
+ */
+      __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_keys, __pyx_v_key); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 183, __pyx_L1_error)
+
+      /* "bdrmapit/graph/construct.pyx":181
+ *     for addr in pb.iterator(addrs):
+ *         key = _key(addr, packed)
+ *         if not aliases or key not in interfaces:             # <<<<<<<<<<<<<<
+ *             remaining.append(addr)
+ *             keys.append(key)
+ */
+    }
+
+    /* "bdrmapit/graph/construct.pyx":179
+ * 
+ *     pb = Progress(num_addrs, 'Selecting remaining addresses', increment=increment)
+ *     for addr in pb.iterator(addrs):             # <<<<<<<<<<<<<<
+ *         key = _key(addr, packed)
+ *         if not aliases or key not in interfaces:
+ */
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":184
+ *             remaining.append(addr)
+ *             keys.append(key)
+ *     n = len(remaining)             # <<<<<<<<<<<<<<
+ *     pb = Progress(n, 'Creating remaining routers and interfaces', increment=increment)
+ *     for i in pb.iterator(range(n)):
+ */
+  __pyx_t_5 = PyList_GET_SIZE(__pyx_v_remaining); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_5;
+
+  /* "bdrmapit/graph/construct.pyx":185
+ *             keys.append(key)
+ *     n = len(remaining)
+ *     pb = Progress(n, 'Creating remaining routers and interfaces', increment=increment)             # <<<<<<<<<<<<<<
+ *     for i in pb.iterator(range(n)):
+ *         addr = remaining[i]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Progress); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_n); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __Pyx_INCREF(__pyx_kp_u_Creating_remaining_routers_and_i);
+  __Pyx_GIVEREF(__pyx_kp_u_Creating_remaining_routers_and_i);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_kp_u_Creating_remaining_routers_and_i);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_increment); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_increment, __pyx_t_1) < 0) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF_SET(__pyx_v_pb, __pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":186
+ *     n = len(remaining)
+ *     pb = Progress(n, 'Creating remaining routers and interfaces', increment=increment)
+ *     for i in pb.iterator(range(n)):             # <<<<<<<<<<<<<<
+ *         addr = remaining[i]
+ *         key = keys[i]
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_pb, __pyx_n_s_iterator); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_3, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_4 = __pyx_t_1; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+    __pyx_t_6 = NULL;
+  } else {
+    __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 186, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 186, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_6)) {
+      if (likely(PyList_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 186, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      } else {
+        if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 186, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      }
+    } else {
+      __pyx_t_1 = __pyx_t_6(__pyx_t_4);
+      if (unlikely(!__pyx_t_1)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 186, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __pyx_t_11 = __Pyx_PyIndex_AsSsize_t(__pyx_t_1); if (unlikely((__pyx_t_11 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 186, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_i = __pyx_t_11;
+
+    /* "bdrmapit/graph/construct.pyx":187
+ *     pb = Progress(n, 'Creating remaining routers and interfaces', increment=increment)
+ *     for i in pb.iterator(range(n)):
+ *         addr = remaining[i]             # <<<<<<<<<<<<<<
+ *         key = keys[i]
+ *         asn = ip2as.asn(addr)
+ */
+    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_remaining, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 187, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_addr, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":188
+ *     for i in pb.iterator(range(n)):
+ *         addr = remaining[i]
+ *         key = keys[i]             # <<<<<<<<<<<<<<
+ *         asn = ip2as.asn(addr)
+ *         # Make sure address is not from private address space
+ */
+    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_keys, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 188, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":189
+ *         addr = remaining[i]
+ *         key = keys[i]
+ *         asn = ip2as.asn(addr)             # <<<<<<<<<<<<<<
+ *         # Make sure address is not from private address space
+ *         if asn >= 0 or asn <= -100:
+ */
+    __pyx_v_asn = ((struct __pyx_vtabstruct_10traceutils_5radix_5ip2as_IP2AS *)__pyx_v_ip2as->__pyx_base.__pyx_vtab)->asn(__pyx_v_ip2as, __pyx_v_addr, 0);
+
+    /* "bdrmapit/graph/construct.pyx":191
+ *         asn = ip2as.asn(addr)
+ *         # Make sure address is not from private address space
+ *         if asn >= 0 or asn <= -100:             # <<<<<<<<<<<<<<
+ *             if asn in orgs:
+ *                 org = orgs[asn]
+ */
+    __pyx_t_9 = ((__pyx_v_asn >= 0) != 0);
+    if (!__pyx_t_9) {
+    } else {
+      __pyx_t_7 = __pyx_t_9;
+      goto __pyx_L11_bool_binop_done;
+    }
+    __pyx_t_9 = ((__pyx_v_asn <= -100L) != 0);
+    __pyx_t_7 = __pyx_t_9;
+    __pyx_L11_bool_binop_done:;
+    if (__pyx_t_7) {
+
+      /* "bdrmapit/graph/construct.pyx":192
+ *         # Make sure address is not from private address space
+ *         if asn >= 0 or asn <= -100:
+ *             if asn in orgs:             # <<<<<<<<<<<<<<
+ *                 org = orgs[asn]
+ *             else:
+ */
+      __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_asn); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 192, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_7 = (__Pyx_PyDict_ContainsTF(__pyx_t_1, __pyx_v_orgs, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 192, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_9 = (__pyx_t_7 != 0);
+      if (__pyx_t_9) {
+
+        /* "bdrmapit/graph/construct.pyx":193
+ *         if asn >= 0 or asn <= -100:
+ *             if asn in orgs:
+ *                 org = orgs[asn]             # <<<<<<<<<<<<<<
+ *             else:
+ *                 org = orgs[asn] = as2org[asn]
+ */
+        __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_asn); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 193, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v_orgs, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 193, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        if (!(likely(PyUnicode_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_2)->tp_name), 0))) __PYX_ERR(0, 193, __pyx_L1_error)
+        __Pyx_XDECREF_SET(__pyx_v_org, ((PyObject*)__pyx_t_2));
+        __pyx_t_2 = 0;
+
+        /* "bdrmapit/graph/construct.pyx":192
+ *         # Make sure address is not from private address space
+ *         if asn >= 0 or asn <= -100:
+ *             if asn in orgs:             # <<<<<<<<<<<<<<
+ *                 org = orgs[asn]
+ *             else:
+ */
+        goto __pyx_L13;
+      }
+
+      /* "bdrmapit/graph/construct.pyx":195
+ *                 org = orgs[asn]
+ *             else:
+ *                 org = orgs[asn] = as2org[asn]             # <<<<<<<<<<<<<<
+ *             router = Router(addr)
+ *             interface = Interface(key, asn, org)
+ */
+      /*else*/ {
+        __pyx_t_2 = __Pyx_GetItemInt(((PyObject *)__pyx_v_as2org), __pyx_v_asn, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 195, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        if (!(likely(PyUnicode_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_2)->tp_name), 0))) __PYX_ERR(0, 195, __pyx_L1_error)
+        __Pyx_INCREF(__pyx_t_2);
+        __Pyx_XDECREF_SET(__pyx_v_org, ((PyObject*)__pyx_t_2));
+        __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_asn); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        if (unlikely(PyDict_SetItem(__pyx_v_orgs, __pyx_t_1, __pyx_t_2) < 0)) __PYX_ERR(0, 195, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      }
+      __pyx_L13:;
+
+      /* "bdrmapit/graph/construct.pyx":196
+ *             else:
+ *                 org = orgs[asn] = as2org[asn]
+ *             router = Router(addr)             # <<<<<<<<<<<<<<
+ *             interface = Interface(key, asn, org)
+ *             router.add_interface(interface)
+ */
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_8bdrmapit_5graph_4node_Router), __pyx_v_addr); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_v_router, ((struct __pyx_obj_8bdrmapit_5graph_4node_Router *)__pyx_t_2));
+      __pyx_t_2 = 0;
+
+      /* "bdrmapit/graph/construct.pyx":197
+ *                 org = orgs[asn] = as2org[asn]
+ *             router = Router(addr)
+ *             interface = Interface(key, asn, org)             # <<<<<<<<<<<<<<
+ *             router.add_interface(interface)
+ *             interfaces[key] = interface
+ */
+      __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_asn); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 197, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 197, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_v_key);
+      __Pyx_GIVEREF(__pyx_v_key);
+      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_key);
+      __Pyx_GIVEREF(__pyx_t_2);
+      PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2);
+      __Pyx_INCREF(__pyx_v_org);
+      __Pyx_GIVEREF(__pyx_v_org);
+      PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_org);
+      __pyx_t_2 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_8bdrmapit_5graph_4node_Interface), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 197, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_interface, ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)__pyx_t_2));
+      __pyx_t_2 = 0;
+
+      /* "bdrmapit/graph/construct.pyx":198
+ *             router = Router(addr)
+ *             interface = Interface(key, asn, org)
+ *             router.add_interface(interface)             # <<<<<<<<<<<<<<
+ *             interfaces[key] = interface
+ *             routers[addr] = router
+ */
+      ((struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Router *)__pyx_v_router->__pyx_vtab)->add_interface(__pyx_v_router, __pyx_v_interface, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 198, __pyx_L1_error)
+
+      /* "bdrmapit/graph/construct.pyx":199
+ *             interface = Interface(key, asn, org)
+ *             router.add_interface(interface)
+ *             interfaces[key] = interface             # <<<<<<<<<<<<<<
+ *             routers[addr] = router
+ * 
+ */
+      if (unlikely(__pyx_v_interfaces == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 199, __pyx_L1_error)
+      }
+      if (unlikely(PyDict_SetItem(__pyx_v_interfaces, __pyx_v_key, ((PyObject *)__pyx_v_interface)) < 0)) __PYX_ERR(0, 199, __pyx_L1_error)
+
+      /* "bdrmapit/graph/construct.pyx":200
+ *             router.add_interface(interface)
+ *             interfaces[key] = interface
+ *             routers[addr] = router             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      if (unlikely(__pyx_v_routers == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 200, __pyx_L1_error)
+      }
+      if (unlikely(PyDict_SetItem(__pyx_v_routers, __pyx_v_addr, ((PyObject *)__pyx_v_router)) < 0)) __PYX_ERR(0, 200, __pyx_L1_error)
+
+      /* "bdrmapit/graph/construct.pyx":191
+ *         asn = ip2as.asn(addr)
+ *         # Make sure address is not from private address space
+ *         if asn >= 0 or asn <= -100:             # <<<<<<<<<<<<<<
+ *             if asn in orgs:
+ *                 org = orgs[asn]
+ */
+    }
+
+    /* "bdrmapit/graph/construct.pyx":186
+ *     n = len(remaining)
+ *     pb = Progress(n, 'Creating remaining routers and interfaces', increment=increment)
+ *     for i in pb.iterator(range(n)):             # <<<<<<<<<<<<<<
+ *         addr = remaining[i]
+ *         key = keys[i]
+ */
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":159
+ * 
+ * 
+ * cpdef void create_remaining(dict interfaces, dict routers, object addrs, Py_ssize_t num_addrs, bint aliases, IP2AS ip2as, AS2Org as2org, bint packed=False, int increment=100000) except *:             # <<<<<<<<<<<<<<
+ *     """
+ *     Create a single interface router for each address not already assigned to a router. The remaining addresses are
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.create_remaining", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_addr);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XDECREF(__pyx_v_remaining);
+  __Pyx_XDECREF(__pyx_v_keys);
+  __Pyx_XDECREF(__pyx_v_orgs);
+  __Pyx_XDECREF(__pyx_v_org);
+  __Pyx_XDECREF((PyObject *)__pyx_v_router);
+  __Pyx_XDECREF((PyObject *)__pyx_v_interface);
+  __Pyx_XDECREF(__pyx_v_pb);
+  __Pyx_RefNannyFinishContext();
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5create_remaining(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_4create_remaining[] = "create_remaining(dict interfaces, dict routers, addrs, Py_ssize_t num_addrs, bool aliases, IP2AS ip2as, AS2Org as2org, bool packed=False, int increment=100000) -> void\n\n    Create a single interface router for each address not already assigned to a router. The remaining addresses are\n    selected first, then their origin ASes are resolved and the routers and interfaces are created in one loop, with\n    one org lookup per AS.\n    :param addrs: iterable of distinct addresses\n    :param num_addrs: number of addresses, for status\n    :param aliases: alias resolution was used\n    ";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_5create_remaining(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_interfaces = 0;
+  PyObject *__pyx_v_routers = 0;
+  PyObject *__pyx_v_addrs = 0;
+  Py_ssize_t __pyx_v_num_addrs;
+  int __pyx_v_aliases;
+  struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as = 0;
+  struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *__pyx_v_as2org = 0;
+  int __pyx_v_packed;
+  int __pyx_v_increment;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("create_remaining (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_interfaces,&__pyx_n_s_routers,&__pyx_n_s_addrs,&__pyx_n_s_num_addrs,&__pyx_n_s_aliases,&__pyx_n_s_ip2as,&__pyx_n_s_as2org,&__pyx_n_s_packed,&__pyx_n_s_increment,0};
+    PyObject* values[9] = {0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_interfaces)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_routers)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_remaining", 0, 7, 9, 1); __PYX_ERR(0, 159, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_addrs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_remaining", 0, 7, 9, 2); __PYX_ERR(0, 159, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_addrs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_remaining", 0, 7, 9, 3); __PYX_ERR(0, 159, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_aliases)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_remaining", 0, 7, 9, 4); __PYX_ERR(0, 159, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ip2as)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_remaining", 0, 7, 9, 5); __PYX_ERR(0, 159, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_as2org)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("create_remaining", 0, 7, 9, 6); __PYX_ERR(0, 159, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_packed);
+          if (value) { values[7] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_increment);
+          if (value) { values[8] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "create_remaining") < 0)) __PYX_ERR(0, 159, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_interfaces = ((PyObject*)values[0]);
+    __pyx_v_routers = ((PyObject*)values[1]);
+    __pyx_v_addrs = values[2];
+    __pyx_v_num_addrs = __Pyx_PyIndex_AsSsize_t(values[3]); if (unlikely((__pyx_v_num_addrs == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
+    __pyx_v_aliases = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_aliases == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
+    __pyx_v_ip2as = ((struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *)values[5]);
+    __pyx_v_as2org = ((struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *)values[6]);
+    if (values[7]) {
+      __pyx_v_packed = __Pyx_PyObject_IsTrue(values[7]); if (unlikely((__pyx_v_packed == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
+    } else {
+      __pyx_v_packed = ((int)0);
+    }
+    if (values[8]) {
+      __pyx_v_increment = __Pyx_PyInt_As_int(values[8]); if (unlikely((__pyx_v_increment == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
+    } else {
+      __pyx_v_increment = ((int)0x186A0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("create_remaining", 0, 7, 9, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 159, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.create_remaining", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_interfaces), (&PyDict_Type), 1, "interfaces", 1))) __PYX_ERR(0, 159, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_routers), (&PyDict_Type), 1, "routers", 1))) __PYX_ERR(0, 159, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ip2as), __pyx_ptype_10traceutils_5radix_5ip2as_IP2AS, 1, "ip2as", 0))) __PYX_ERR(0, 159, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_as2org), __pyx_ptype_10traceutils_6as2org_6as2org_AS2Org, 1, "as2org", 0))) __PYX_ERR(0, 159, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_4create_remaining(__pyx_self, __pyx_v_interfaces, __pyx_v_routers, __pyx_v_addrs, __pyx_v_num_addrs, __pyx_v_aliases, __pyx_v_ip2as, __pyx_v_as2org, __pyx_v_packed, __pyx_v_increment);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_4create_remaining(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_routers, PyObject *__pyx_v_addrs, Py_ssize_t __pyx_v_num_addrs, int __pyx_v_aliases, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *__pyx_v_ip2as, struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *__pyx_v_as2org, int __pyx_v_packed, int __pyx_v_increment) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_remaining __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("create_remaining", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1.__pyx_n = 2;
+  __pyx_t_1.packed = __pyx_v_packed;
+  __pyx_t_1.increment = __pyx_v_increment;
+  __pyx_f_8bdrmapit_5graph_9construct_create_remaining(__pyx_v_interfaces, __pyx_v_routers, __pyx_v_addrs, __pyx_v_num_addrs, __pyx_v_aliases, __pyx_v_ip2as, __pyx_v_as2org, 0, &__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_void_to_None(NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 159, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.create_remaining", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":203
+ * 
+ * 
+ * cpdef void add_nexthop(dict interfaces, dict nexthops, bint packed=False, bint release=False, int increment=100000) except *:             # <<<<<<<<<<<<<<
+ *     """
+ *     Add nexthop edges, with origin ASes, predecessor counts, and observation counts.
+ */
+
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_7add_nexthop(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static void __pyx_f_8bdrmapit_5graph_9construct_add_nexthop(PyObject *__pyx_v_interfaces, PyObject *__pyx_v_nexthops, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_nexthop *__pyx_optional_args) {
+  int __pyx_v_packed = ((int)0);
+  int __pyx_v_release = ((int)0);
+  int __pyx_v_increment = ((int)0x186A0);
+  PyObject *__pyx_v_addr = 0;
+  PyObject *__pyx_v_edge = 0;
+  PyObject *__pyx_v_edges = 0;
+  long __pyx_v_count;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_v_interface = 0;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_v_succ = 0;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Router *__pyx_v_router = 0;
+  PyObject *__pyx_v_pb = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  long __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  struct __pyx_opt_args_8bdrmapit_5graph_4node_6Router_add_succ __pyx_t_14;
+  struct __pyx_opt_args_8bdrmapit_5graph_4node_9Interface_add_pred __pyx_t_15;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_nexthop", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_packed = __pyx_optional_args->packed;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_release = __pyx_optional_args->release;
+        if (__pyx_optional_args->__pyx_n > 2) {
+          __pyx_v_increment = __pyx_optional_args->increment;
+        }
+      }
+    }
+  }
+
+  /* "bdrmapit/graph/construct.pyx":215
+ *     cdef Router router
+ * 
+ *     pb = Progress(len(nexthops), 'Adding nexthop edges', increment=increment)             # <<<<<<<<<<<<<<
+ *     for addr in pb.iterator(list(nexthops) if release else nexthops):
+ *         edges = nexthops.pop(addr) if release else nexthops[addr]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Progress); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (unlikely(__pyx_v_nexthops == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 215, __pyx_L1_error)
+  }
+  __pyx_t_2 = PyDict_Size(__pyx_v_nexthops); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 215, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+  __Pyx_INCREF(__pyx_kp_u_Adding_nexthop_edges);
+  __Pyx_GIVEREF(__pyx_kp_u_Adding_nexthop_edges);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_kp_u_Adding_nexthop_edges);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_increment); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_increment, __pyx_t_5) < 0) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_pb = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":216
+ * 
+ *     pb = Progress(len(nexthops), 'Adding nexthop edges', increment=increment)
+ *     for addr in pb.iterator(list(nexthops) if release else nexthops):             # <<<<<<<<<<<<<<
+ *         edges = nexthops.pop(addr) if release else nexthops[addr]
+ *         interface = interfaces[_key(addr, packed)]
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_pb, __pyx_n_s_iterator); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if ((__pyx_v_release != 0)) {
+    __pyx_t_1 = PySequence_List(__pyx_v_nexthops); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = __pyx_t_1;
+    __pyx_t_1 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_nexthops);
+    __pyx_t_4 = __pyx_v_nexthops;
+  }
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_1, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
+    __pyx_t_3 = __pyx_t_5; __Pyx_INCREF(__pyx_t_3); __pyx_t_2 = 0;
+    __pyx_t_6 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 216, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 216, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_6)) {
+      if (likely(PyList_CheckExact(__pyx_t_3))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 216, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 216, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      }
+    } else {
+      __pyx_t_5 = __pyx_t_6(__pyx_t_3);
+      if (unlikely(!__pyx_t_5)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 216, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 216, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_addr, ((PyObject*)__pyx_t_5));
+    __pyx_t_5 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":217
+ *     pb = Progress(len(nexthops), 'Adding nexthop edges', increment=increment)
+ *     for addr in pb.iterator(list(nexthops) if release else nexthops):
+ *         edges = nexthops.pop(addr) if release else nexthops[addr]             # <<<<<<<<<<<<<<
+ *         interface = interfaces[_key(addr, packed)]
+ *         router = interface.router
+ */
+    if ((__pyx_v_release != 0)) {
+      if (unlikely(__pyx_v_nexthops == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "pop");
+        __PYX_ERR(0, 217, __pyx_L1_error)
+      }
+      __pyx_t_4 = __Pyx_PyDict_Pop(__pyx_v_nexthops, __pyx_v_addr, ((PyObject *)NULL)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 217, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (!(likely(PyDict_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(0, 217, __pyx_L1_error)
+      __pyx_t_5 = __pyx_t_4;
+      __pyx_t_4 = 0;
+    } else {
+      if (unlikely(__pyx_v_nexthops == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 217, __pyx_L1_error)
+      }
+      __pyx_t_4 = __Pyx_PyDict_GetItem(__pyx_v_nexthops, __pyx_v_addr); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 217, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (!(likely(PyDict_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(0, 217, __pyx_L1_error)
+      __pyx_t_5 = __pyx_t_4;
+      __pyx_t_4 = 0;
+    }
+    __Pyx_XDECREF_SET(__pyx_v_edges, ((PyObject*)__pyx_t_5));
+    __pyx_t_5 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":218
+ *     for addr in pb.iterator(list(nexthops) if release else nexthops):
+ *         edges = nexthops.pop(addr) if release else nexthops[addr]
+ *         interface = interfaces[_key(addr, packed)]             # <<<<<<<<<<<<<<
+ *         router = interface.router
+ *         router.nexthop = True
+ */
+    if (unlikely(__pyx_v_interfaces == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 218, __pyx_L1_error)
+    }
+    __pyx_t_5 = __pyx_f_8bdrmapit_5graph_9construct__key(__pyx_v_addr, __pyx_v_packed); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 218, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = __Pyx_PyDict_GetItem(__pyx_v_interfaces, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 218, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_8bdrmapit_5graph_4node_Interface))))) __PYX_ERR(0, 218, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_interface, ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":219
+ *         edges = nexthops.pop(addr) if release else nexthops[addr]
+ *         interface = interfaces[_key(addr, packed)]
+ *         router = interface.router             # <<<<<<<<<<<<<<
+ *         router.nexthop = True
+ *         for edge, count in edges.items():
+ */
+    __pyx_t_4 = ((PyObject *)__pyx_v_interface->router);
+    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_router, ((struct __pyx_obj_8bdrmapit_5graph_4node_Router *)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":220
+ *         interface = interfaces[_key(addr, packed)]
+ *         router = interface.router
+ *         router.nexthop = True             # <<<<<<<<<<<<<<
+ *         for edge, count in edges.items():
+ *             succ = interfaces[_key(edge, packed)]
+ */
+    __pyx_v_router->nexthop = 1;
+
+    /* "bdrmapit/graph/construct.pyx":221
+ *         router = interface.router
+ *         router.nexthop = True
+ *         for edge, count in edges.items():             # <<<<<<<<<<<<<<
+ *             succ = interfaces[_key(edge, packed)]
+ *             if succ.router is not router:
+ */
+    __pyx_t_7 = 0;
+    if (unlikely(__pyx_v_edges == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+      __PYX_ERR(0, 221, __pyx_L1_error)
+    }
+    __pyx_t_5 = __Pyx_dict_iterator(__pyx_v_edges, 1, __pyx_n_s_items, (&__pyx_t_8), (&__pyx_t_9)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 221, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4);
+    __pyx_t_4 = __pyx_t_5;
+    __pyx_t_5 = 0;
+    while (1) {
+      __pyx_t_10 = __Pyx_dict_iter_next(__pyx_t_4, __pyx_t_8, &__pyx_t_7, &__pyx_t_5, &__pyx_t_1, NULL, __pyx_t_9);
+      if (unlikely(__pyx_t_10 == 0)) break;
+      if (unlikely(__pyx_t_10 == -1)) __PYX_ERR(0, 221, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!(likely(PyUnicode_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 221, __pyx_L1_error)
+      __pyx_t_11 = __Pyx_PyInt_As_long(__pyx_t_1); if (unlikely((__pyx_t_11 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 221, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_edge, ((PyObject*)__pyx_t_5));
+      __pyx_t_5 = 0;
+      __pyx_v_count = __pyx_t_11;
+
+      /* "bdrmapit/graph/construct.pyx":222
+ *         router.nexthop = True
+ *         for edge, count in edges.items():
+ *             succ = interfaces[_key(edge, packed)]             # <<<<<<<<<<<<<<
+ *             if succ.router is not router:
+ *                 router.add_succ(succ, interface.asn, count)
+ */
+      if (unlikely(__pyx_v_interfaces == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 222, __pyx_L1_error)
+      }
+      __pyx_t_1 = __pyx_f_8bdrmapit_5graph_9construct__key(__pyx_v_edge, __pyx_v_packed); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_5 = __Pyx_PyDict_GetItem(__pyx_v_interfaces, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_8bdrmapit_5graph_4node_Interface))))) __PYX_ERR(0, 222, __pyx_L1_error)
+      __Pyx_XDECREF_SET(__pyx_v_succ, ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)__pyx_t_5));
+      __pyx_t_5 = 0;
+
+      /* "bdrmapit/graph/construct.pyx":223
+ *         for edge, count in edges.items():
+ *             succ = interfaces[_key(edge, packed)]
+ *             if succ.router is not router:             # <<<<<<<<<<<<<<
+ *                 router.add_succ(succ, interface.asn, count)
+ *                 succ.add_pred(router, count)
+ */
+      __pyx_t_12 = (__pyx_v_succ->router != __pyx_v_router);
+      __pyx_t_13 = (__pyx_t_12 != 0);
+      if (__pyx_t_13) {
+
+        /* "bdrmapit/graph/construct.pyx":224
+ *             succ = interfaces[_key(edge, packed)]
+ *             if succ.router is not router:
+ *                 router.add_succ(succ, interface.asn, count)             # <<<<<<<<<<<<<<
+ *                 succ.add_pred(router, count)
+ * 
+ */
+        __pyx_t_14.__pyx_n = 1;
+        __pyx_t_14.count = __pyx_v_count;
+        ((struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Router *)__pyx_v_router->__pyx_vtab)->add_succ(__pyx_v_router, ((PyObject *)__pyx_v_succ), __pyx_v_interface->asn, 0, &__pyx_t_14); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 224, __pyx_L1_error)
+
+        /* "bdrmapit/graph/construct.pyx":225
+ *             if succ.router is not router:
+ *                 router.add_succ(succ, interface.asn, count)
+ *                 succ.add_pred(router, count)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+        __pyx_t_15.__pyx_n = 1;
+        __pyx_t_15.count = __pyx_v_count;
+        ((struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Interface *)__pyx_v_succ->__pyx_vtab)->add_pred(__pyx_v_succ, __pyx_v_router, 0, &__pyx_t_15); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 225, __pyx_L1_error)
+
+        /* "bdrmapit/graph/construct.pyx":223
+ *         for edge, count in edges.items():
+ *             succ = interfaces[_key(edge, packed)]
+ *             if succ.router is not router:             # <<<<<<<<<<<<<<
+ *                 router.add_succ(succ, interface.asn, count)
+ *                 succ.add_pred(router, count)
+ */
+      }
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":216
+ * 
+ *     pb = Progress(len(nexthops), 'Adding nexthop edges', increment=increment)
+ *     for addr in pb.iterator(list(nexthops) if release else nexthops):             # <<<<<<<<<<<<<<
+ *         edges = nexthops.pop(addr) if release else nexthops[addr]
+ *         interface = interfaces[_key(addr, packed)]
+ */
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":203
+ * 
+ * 
+ * cpdef void add_nexthop(dict interfaces, dict nexthops, bint packed=False, bint release=False, int increment=100000) except *:             # <<<<<<<<<<<<<<
+ *     """
+ *     Add nexthop edges, with origin ASes, predecessor counts, and observation counts.
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_nexthop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_addr);
+  __Pyx_XDECREF(__pyx_v_edge);
+  __Pyx_XDECREF(__pyx_v_edges);
+  __Pyx_XDECREF((PyObject *)__pyx_v_interface);
+  __Pyx_XDECREF((PyObject *)__pyx_v_succ);
+  __Pyx_XDECREF((PyObject *)__pyx_v_router);
+  __Pyx_XDECREF(__pyx_v_pb);
+  __Pyx_RefNannyFinishContext();
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_7add_nexthop(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_6add_nexthop[] = "add_nexthop(dict interfaces, dict nexthops, bool packed=False, bool release=False, int increment=100000) -> void\n\n    Add nexthop edges, with origin ASes, predecessor counts, and observation counts.\n    :param nexthops: {addr: {successor addr: observations}}\n    :param release: empty nexthops as the edges are added\n    ";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_7add_nexthop(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_interfaces = 0;
+  PyObject *__pyx_v_nexthops = 0;
+  int __pyx_v_packed;
+  int __pyx_v_release;
+  int __pyx_v_increment;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("add_nexthop (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_interfaces,&__pyx_n_s_nexthops,&__pyx_n_s_packed,&__pyx_n_s_release,&__pyx_n_s_increment,0};
+    PyObject* values[5] = {0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_interfaces)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_nexthops)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("add_nexthop", 0, 2, 5, 1); __PYX_ERR(0, 203, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_packed);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_release);
+          if (value) { values[3] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_increment);
+          if (value) { values[4] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "add_nexthop") < 0)) __PYX_ERR(0, 203, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_interfaces = ((PyObject*)values[0]);
+    __pyx_v_nexthops = ((PyObject*)values[1]);
+    if (values[2]) {
+      __pyx_v_packed = __Pyx_PyObject_IsTrue(values[2]); if (unlikely((__pyx_v_packed == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 203, __pyx_L3_error)
+    } else {
+      __pyx_v_packed = ((int)0);
+    }
+    if (values[3]) {
+      __pyx_v_release = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_release == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 203, __pyx_L3_error)
+    } else {
+      __pyx_v_release = ((int)0);
+    }
+    if (values[4]) {
+      __pyx_v_increment = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_increment == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 203, __pyx_L3_error)
+    } else {
+      __pyx_v_increment = ((int)0x186A0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("add_nexthop", 0, 2, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 203, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_nexthop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_interfaces), (&PyDict_Type), 1, "interfaces", 1))) __PYX_ERR(0, 203, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_nexthops), (&PyDict_Type), 1, "nexthops", 1))) __PYX_ERR(0, 203, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_6add_nexthop(__pyx_self, __pyx_v_interfaces, __pyx_v_nexthops, __pyx_v_packed, __pyx_v_release, __pyx_v_increment);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_6add_nexthop(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_nexthops, int __pyx_v_packed, int __pyx_v_release, int __pyx_v_increment) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_nexthop __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_nexthop", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1.__pyx_n = 3;
+  __pyx_t_1.packed = __pyx_v_packed;
+  __pyx_t_1.release = __pyx_v_release;
+  __pyx_t_1.increment = __pyx_v_increment;
+  __pyx_f_8bdrmapit_5graph_9construct_add_nexthop(__pyx_v_interfaces, __pyx_v_nexthops, 0, &__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 203, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_void_to_None(NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_nexthop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":228
+ * 
+ * 
+ * cpdef void add_multi(dict interfaces, dict multi, bint packed=False, bint release=False, int increment=100000) except *:             # <<<<<<<<<<<<<<
+ *     """
+ *     Add multihop edges for routers without nexthop edges.
+ */
+
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_9add_multi(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static void __pyx_f_8bdrmapit_5graph_9construct_add_multi(PyObject *__pyx_v_interfaces, PyObject *__pyx_v_multi, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_multi *__pyx_optional_args) {
+  int __pyx_v_packed = ((int)0);
+  int __pyx_v_release = ((int)0);
+  int __pyx_v_increment = ((int)0x186A0);
+  PyObject *__pyx_v_addr = 0;
+  PyObject *__pyx_v_edge = 0;
+  PyObject *__pyx_v_edges = 0;
+  long __pyx_v_count;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_v_interface = 0;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_v_succ = 0;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Router *__pyx_v_router = 0;
+  PyObject *__pyx_v_pb = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  int __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  long __pyx_t_12;
+  int __pyx_t_13;
+  struct __pyx_opt_args_8bdrmapit_5graph_4node_6Router_add_succ __pyx_t_14;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_multi", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_packed = __pyx_optional_args->packed;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_release = __pyx_optional_args->release;
+        if (__pyx_optional_args->__pyx_n > 2) {
+          __pyx_v_increment = __pyx_optional_args->increment;
+        }
+      }
+    }
+  }
+
+  /* "bdrmapit/graph/construct.pyx":240
+ *     cdef Router router
+ * 
+ *     pb = Progress(len(multi), 'Adding multihop edges', increment=increment)             # <<<<<<<<<<<<<<
+ *     for addr in pb.iterator(list(multi) if release else multi):
+ *         edges = multi.pop(addr) if release else multi[addr]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Progress); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (unlikely(__pyx_v_multi == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 240, __pyx_L1_error)
+  }
+  __pyx_t_2 = PyDict_Size(__pyx_v_multi); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 240, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+  __Pyx_INCREF(__pyx_kp_u_Adding_multihop_edges);
+  __Pyx_GIVEREF(__pyx_kp_u_Adding_multihop_edges);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_kp_u_Adding_multihop_edges);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_increment); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_increment, __pyx_t_5) < 0) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_pb = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":241
+ * 
+ *     pb = Progress(len(multi), 'Adding multihop edges', increment=increment)
+ *     for addr in pb.iterator(list(multi) if release else multi):             # <<<<<<<<<<<<<<
+ *         edges = multi.pop(addr) if release else multi[addr]
+ *         interface = interfaces[_key(addr, packed)]
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_pb, __pyx_n_s_iterator); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if ((__pyx_v_release != 0)) {
+    __pyx_t_1 = PySequence_List(__pyx_v_multi); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = __pyx_t_1;
+    __pyx_t_1 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_multi);
+    __pyx_t_4 = __pyx_v_multi;
+  }
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_1, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
+    __pyx_t_3 = __pyx_t_5; __Pyx_INCREF(__pyx_t_3); __pyx_t_2 = 0;
+    __pyx_t_6 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 241, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 241, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_6)) {
+      if (likely(PyList_CheckExact(__pyx_t_3))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 241, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 241, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 241, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 241, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      }
+    } else {
+      __pyx_t_5 = __pyx_t_6(__pyx_t_3);
+      if (unlikely(!__pyx_t_5)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 241, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 241, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_addr, ((PyObject*)__pyx_t_5));
+    __pyx_t_5 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":242
+ *     pb = Progress(len(multi), 'Adding multihop edges', increment=increment)
+ *     for addr in pb.iterator(list(multi) if release else multi):
+ *         edges = multi.pop(addr) if release else multi[addr]             # <<<<<<<<<<<<<<
+ *         interface = interfaces[_key(addr, packed)]
+ *         router = interface.router
+ */
+    if ((__pyx_v_release != 0)) {
+      if (unlikely(__pyx_v_multi == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "pop");
+        __PYX_ERR(0, 242, __pyx_L1_error)
+      }
+      __pyx_t_4 = __Pyx_PyDict_Pop(__pyx_v_multi, __pyx_v_addr, ((PyObject *)NULL)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 242, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (!(likely(PyDict_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(0, 242, __pyx_L1_error)
+      __pyx_t_5 = __pyx_t_4;
+      __pyx_t_4 = 0;
+    } else {
+      if (unlikely(__pyx_v_multi == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 242, __pyx_L1_error)
+      }
+      __pyx_t_4 = __Pyx_PyDict_GetItem(__pyx_v_multi, __pyx_v_addr); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 242, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (!(likely(PyDict_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(0, 242, __pyx_L1_error)
+      __pyx_t_5 = __pyx_t_4;
+      __pyx_t_4 = 0;
+    }
+    __Pyx_XDECREF_SET(__pyx_v_edges, ((PyObject*)__pyx_t_5));
+    __pyx_t_5 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":243
+ *     for addr in pb.iterator(list(multi) if release else multi):
+ *         edges = multi.pop(addr) if release else multi[addr]
+ *         interface = interfaces[_key(addr, packed)]             # <<<<<<<<<<<<<<
+ *         router = interface.router
+ *         if not router.nexthop:
+ */
+    if (unlikely(__pyx_v_interfaces == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 243, __pyx_L1_error)
+    }
+    __pyx_t_5 = __pyx_f_8bdrmapit_5graph_9construct__key(__pyx_v_addr, __pyx_v_packed); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 243, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = __Pyx_PyDict_GetItem(__pyx_v_interfaces, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 243, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_8bdrmapit_5graph_4node_Interface))))) __PYX_ERR(0, 243, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_interface, ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":244
+ *         edges = multi.pop(addr) if release else multi[addr]
+ *         interface = interfaces[_key(addr, packed)]
+ *         router = interface.router             # <<<<<<<<<<<<<<
+ *         if not router.nexthop:
+ *             for edge, count in edges.items():
+ */
+    __pyx_t_4 = ((PyObject *)__pyx_v_interface->router);
+    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_router, ((struct __pyx_obj_8bdrmapit_5graph_4node_Router *)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":245
+ *         interface = interfaces[_key(addr, packed)]
+ *         router = interface.router
+ *         if not router.nexthop:             # <<<<<<<<<<<<<<
+ *             for edge, count in edges.items():
+ *                 succ = interfaces[_key(edge, packed)]
+ */
+    __pyx_t_7 = ((!(__pyx_v_router->nexthop != 0)) != 0);
+    if (__pyx_t_7) {
+
+      /* "bdrmapit/graph/construct.pyx":246
+ *         router = interface.router
+ *         if not router.nexthop:
+ *             for edge, count in edges.items():             # <<<<<<<<<<<<<<
+ *                 succ = interfaces[_key(edge, packed)]
+ *                 if succ.router is not router:
+ */
+      __pyx_t_8 = 0;
+      if (unlikely(__pyx_v_edges == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+        __PYX_ERR(0, 246, __pyx_L1_error)
+      }
+      __pyx_t_5 = __Pyx_dict_iterator(__pyx_v_edges, 1, __pyx_n_s_items, (&__pyx_t_9), (&__pyx_t_10)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 246, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4);
+      __pyx_t_4 = __pyx_t_5;
+      __pyx_t_5 = 0;
+      while (1) {
+        __pyx_t_11 = __Pyx_dict_iter_next(__pyx_t_4, __pyx_t_9, &__pyx_t_8, &__pyx_t_5, &__pyx_t_1, NULL, __pyx_t_10);
+        if (unlikely(__pyx_t_11 == 0)) break;
+        if (unlikely(__pyx_t_11 == -1)) __PYX_ERR(0, 246, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_GOTREF(__pyx_t_1);
+        if (!(likely(PyUnicode_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 246, __pyx_L1_error)
+        __pyx_t_12 = __Pyx_PyInt_As_long(__pyx_t_1); if (unlikely((__pyx_t_12 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 246, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_edge, ((PyObject*)__pyx_t_5));
+        __pyx_t_5 = 0;
+        __pyx_v_count = __pyx_t_12;
+
+        /* "bdrmapit/graph/construct.pyx":247
+ *         if not router.nexthop:
+ *             for edge, count in edges.items():
+ *                 succ = interfaces[_key(edge, packed)]             # <<<<<<<<<<<<<<
+ *                 if succ.router is not router:
+ *                     router.add_succ(succ, interface.asn, count)
+ */
+        if (unlikely(__pyx_v_interfaces == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 247, __pyx_L1_error)
+        }
+        __pyx_t_1 = __pyx_f_8bdrmapit_5graph_9construct__key(__pyx_v_edge, __pyx_v_packed); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 247, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_5 = __Pyx_PyDict_GetItem(__pyx_v_interfaces, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 247, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_8bdrmapit_5graph_4node_Interface))))) __PYX_ERR(0, 247, __pyx_L1_error)
+        __Pyx_XDECREF_SET(__pyx_v_succ, ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)__pyx_t_5));
+        __pyx_t_5 = 0;
+
+        /* "bdrmapit/graph/construct.pyx":248
+ *             for edge, count in edges.items():
+ *                 succ = interfaces[_key(edge, packed)]
+ *                 if succ.router is not router:             # <<<<<<<<<<<<<<
+ *                     router.add_succ(succ, interface.asn, count)
+ * 
+ */
+        __pyx_t_7 = (__pyx_v_succ->router != __pyx_v_router);
+        __pyx_t_13 = (__pyx_t_7 != 0);
+        if (__pyx_t_13) {
+
+          /* "bdrmapit/graph/construct.pyx":249
+ *                 succ = interfaces[_key(edge, packed)]
+ *                 if succ.router is not router:
+ *                     router.add_succ(succ, interface.asn, count)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+          __pyx_t_14.__pyx_n = 1;
+          __pyx_t_14.count = __pyx_v_count;
+          ((struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Router *)__pyx_v_router->__pyx_vtab)->add_succ(__pyx_v_router, ((PyObject *)__pyx_v_succ), __pyx_v_interface->asn, 0, &__pyx_t_14); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 249, __pyx_L1_error)
+
+          /* "bdrmapit/graph/construct.pyx":248
+ *             for edge, count in edges.items():
+ *                 succ = interfaces[_key(edge, packed)]
+ *                 if succ.router is not router:             # <<<<<<<<<<<<<<
+ *                     router.add_succ(succ, interface.asn, count)
+ * 
+ */
+        }
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "bdrmapit/graph/construct.pyx":245
+ *         interface = interfaces[_key(addr, packed)]
+ *         router = interface.router
+ *         if not router.nexthop:             # <<<<<<<<<<<<<<
+ *             for edge, count in edges.items():
+ *                 succ = interfaces[_key(edge, packed)]
+ */
+    }
+
+    /* "bdrmapit/graph/construct.pyx":241
+ * 
+ *     pb = Progress(len(multi), 'Adding multihop edges', increment=increment)
+ *     for addr in pb.iterator(list(multi) if release else multi):             # <<<<<<<<<<<<<<
+ *         edges = multi.pop(addr) if release else multi[addr]
+ *         interface = interfaces[_key(addr, packed)]
+ */
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":228
+ * 
+ * 
+ * cpdef void add_multi(dict interfaces, dict multi, bint packed=False, bint release=False, int increment=100000) except *:             # <<<<<<<<<<<<<<
+ *     """
+ *     Add multihop edges for routers without nexthop edges.
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_multi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_addr);
+  __Pyx_XDECREF(__pyx_v_edge);
+  __Pyx_XDECREF(__pyx_v_edges);
+  __Pyx_XDECREF((PyObject *)__pyx_v_interface);
+  __Pyx_XDECREF((PyObject *)__pyx_v_succ);
+  __Pyx_XDECREF((PyObject *)__pyx_v_router);
+  __Pyx_XDECREF(__pyx_v_pb);
+  __Pyx_RefNannyFinishContext();
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_9add_multi(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_8add_multi[] = "add_multi(dict interfaces, dict multi, bool packed=False, bool release=False, int increment=100000) -> void\n\n    Add multihop edges for routers without nexthop edges.\n    :param multi: {addr: {successor addr: observations}}\n    :param release: empty multi as the edges are added\n    ";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_9add_multi(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_interfaces = 0;
+  PyObject *__pyx_v_multi = 0;
+  int __pyx_v_packed;
+  int __pyx_v_release;
+  int __pyx_v_increment;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("add_multi (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_interfaces,&__pyx_n_s_multi,&__pyx_n_s_packed,&__pyx_n_s_release,&__pyx_n_s_increment,0};
+    PyObject* values[5] = {0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_interfaces)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_multi)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("add_multi", 0, 2, 5, 1); __PYX_ERR(0, 228, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_packed);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_release);
+          if (value) { values[3] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_increment);
+          if (value) { values[4] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "add_multi") < 0)) __PYX_ERR(0, 228, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_interfaces = ((PyObject*)values[0]);
+    __pyx_v_multi = ((PyObject*)values[1]);
+    if (values[2]) {
+      __pyx_v_packed = __Pyx_PyObject_IsTrue(values[2]); if (unlikely((__pyx_v_packed == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 228, __pyx_L3_error)
+    } else {
+      __pyx_v_packed = ((int)0);
+    }
+    if (values[3]) {
+      __pyx_v_release = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_release == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 228, __pyx_L3_error)
+    } else {
+      __pyx_v_release = ((int)0);
+    }
+    if (values[4]) {
+      __pyx_v_increment = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_increment == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 228, __pyx_L3_error)
+    } else {
+      __pyx_v_increment = ((int)0x186A0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("add_multi", 0, 2, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 228, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_multi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_interfaces), (&PyDict_Type), 1, "interfaces", 1))) __PYX_ERR(0, 228, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_multi), (&PyDict_Type), 1, "multi", 1))) __PYX_ERR(0, 228, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_8add_multi(__pyx_self, __pyx_v_interfaces, __pyx_v_multi, __pyx_v_packed, __pyx_v_release, __pyx_v_increment);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_8add_multi(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_multi, int __pyx_v_packed, int __pyx_v_release, int __pyx_v_increment) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_multi __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_multi", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1.__pyx_n = 3;
+  __pyx_t_1.packed = __pyx_v_packed;
+  __pyx_t_1.release = __pyx_v_release;
+  __pyx_t_1.increment = __pyx_v_increment;
+  __pyx_f_8bdrmapit_5graph_9construct_add_multi(__pyx_v_interfaces, __pyx_v_multi, 0, &__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 228, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_void_to_None(NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_multi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":252
+ * 
+ * 
+ * cpdef void add_dest_pairs(dict interfaces, set dps, bint packed=False, int increment=1000000) except *:             # <<<<<<<<<<<<<<
+ *     """
+ *     Add the destination ASes of (addr, destination AS) pairs to the interfaces.
+ */
+
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_11add_dest_pairs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static void __pyx_f_8bdrmapit_5graph_9construct_add_dest_pairs(PyObject *__pyx_v_interfaces, PyObject *__pyx_v_dps, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_dest_pairs *__pyx_optional_args) {
+  int __pyx_v_packed = ((int)0);
+  int __pyx_v_increment = ((int)0xF4240);
+  PyObject *__pyx_v_pair = 0;
+  int __pyx_v_asn;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_v_interface = 0;
+  PyObject *__pyx_v_pb = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_dest_pairs", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_packed = __pyx_optional_args->packed;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_increment = __pyx_optional_args->increment;
+      }
+    }
+  }
+
+  /* "bdrmapit/graph/construct.pyx":260
+ *     cdef Interface interface
+ * 
+ *     pb = Progress(len(dps), 'Adding destination ASes', increment=increment)             # <<<<<<<<<<<<<<
+ *     for pair in pb.iterator(dps):
+ *         asn = pair[1]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Progress); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (unlikely(__pyx_v_dps == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 260, __pyx_L1_error)
+  }
+  __pyx_t_2 = PySet_GET_SIZE(__pyx_v_dps); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 260, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+  __Pyx_INCREF(__pyx_kp_u_Adding_destination_ASes);
+  __Pyx_GIVEREF(__pyx_kp_u_Adding_destination_ASes);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_kp_u_Adding_destination_ASes);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_increment); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_increment, __pyx_t_5) < 0) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_pb = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":261
+ * 
+ *     pb = Progress(len(dps), 'Adding destination ASes', increment=increment)
+ *     for pair in pb.iterator(dps):             # <<<<<<<<<<<<<<
+ *         asn = pair[1]
+ *         if asn > 0:
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_pb, __pyx_n_s_iterator); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_dps) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_dps);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
+    __pyx_t_3 = __pyx_t_5; __Pyx_INCREF(__pyx_t_3); __pyx_t_2 = 0;
+    __pyx_t_6 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 261, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_6)) {
+      if (likely(PyList_CheckExact(__pyx_t_3))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 261, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 261, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 261, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 261, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      }
+    } else {
+      __pyx_t_5 = __pyx_t_6(__pyx_t_3);
+      if (unlikely(!__pyx_t_5)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 261, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    if (!(likely(PyTuple_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 261, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_pair, ((PyObject*)__pyx_t_5));
+    __pyx_t_5 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":262
+ *     pb = Progress(len(dps), 'Adding destination ASes', increment=increment)
+ *     for pair in pb.iterator(dps):
+ *         asn = pair[1]             # <<<<<<<<<<<<<<
+ *         if asn > 0:
+ *             interface = interfaces.get(_key(pair[0], packed))
+ */
+    if (unlikely(__pyx_v_pair == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 262, __pyx_L1_error)
+    }
+    __pyx_t_5 = __Pyx_GetItemInt_Tuple(__pyx_v_pair, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 262, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_5); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 262, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_v_asn = __pyx_t_7;
+
+    /* "bdrmapit/graph/construct.pyx":263
+ *     for pair in pb.iterator(dps):
+ *         asn = pair[1]
+ *         if asn > 0:             # <<<<<<<<<<<<<<
+ *             interface = interfaces.get(_key(pair[0], packed))
+ *             if interface is not None:
+ */
+    __pyx_t_8 = ((__pyx_v_asn > 0) != 0);
+    if (__pyx_t_8) {
+
+      /* "bdrmapit/graph/construct.pyx":264
+ *         asn = pair[1]
+ *         if asn > 0:
+ *             interface = interfaces.get(_key(pair[0], packed))             # <<<<<<<<<<<<<<
+ *             if interface is not None:
+ *                 interface.dests.add(asn)
+ */
+      if (unlikely(__pyx_v_interfaces == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+        __PYX_ERR(0, 264, __pyx_L1_error)
+      }
+      if (unlikely(__pyx_v_pair == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 264, __pyx_L1_error)
+      }
+      __pyx_t_5 = __Pyx_GetItemInt_Tuple(__pyx_v_pair, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 264, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (!(likely(PyUnicode_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 264, __pyx_L1_error)
+      __pyx_t_4 = __pyx_f_8bdrmapit_5graph_9construct__key(((PyObject*)__pyx_t_5), __pyx_v_packed); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 264, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyDict_GetItemDefault(__pyx_v_interfaces, __pyx_t_4, Py_None); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 264, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_8bdrmapit_5graph_4node_Interface))))) __PYX_ERR(0, 264, __pyx_L1_error)
+      __Pyx_XDECREF_SET(__pyx_v_interface, ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)__pyx_t_5));
+      __pyx_t_5 = 0;
+
+      /* "bdrmapit/graph/construct.pyx":265
+ *         if asn > 0:
+ *             interface = interfaces.get(_key(pair[0], packed))
+ *             if interface is not None:             # <<<<<<<<<<<<<<
+ *                 interface.dests.add(asn)
+ * 
+ */
+      __pyx_t_8 = (((PyObject *)__pyx_v_interface) != Py_None);
+      __pyx_t_9 = (__pyx_t_8 != 0);
+      if (__pyx_t_9) {
+
+        /* "bdrmapit/graph/construct.pyx":266
+ *             interface = interfaces.get(_key(pair[0], packed))
+ *             if interface is not None:
+ *                 interface.dests.add(asn)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+        if (unlikely(__pyx_v_interface->dests == Py_None)) {
+          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "add");
+          __PYX_ERR(0, 266, __pyx_L1_error)
+        }
+        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_asn); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 266, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __pyx_t_10 = PySet_Add(__pyx_v_interface->dests, __pyx_t_5); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 266, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+        /* "bdrmapit/graph/construct.pyx":265
+ *         if asn > 0:
+ *             interface = interfaces.get(_key(pair[0], packed))
+ *             if interface is not None:             # <<<<<<<<<<<<<<
+ *                 interface.dests.add(asn)
+ * 
+ */
+      }
+
+      /* "bdrmapit/graph/construct.pyx":263
+ *     for pair in pb.iterator(dps):
+ *         asn = pair[1]
+ *         if asn > 0:             # <<<<<<<<<<<<<<
+ *             interface = interfaces.get(_key(pair[0], packed))
+ *             if interface is not None:
+ */
+    }
+
+    /* "bdrmapit/graph/construct.pyx":261
+ * 
+ *     pb = Progress(len(dps), 'Adding destination ASes', increment=increment)
+ *     for pair in pb.iterator(dps):             # <<<<<<<<<<<<<<
+ *         asn = pair[1]
+ *         if asn > 0:
+ */
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":252
+ * 
+ * 
+ * cpdef void add_dest_pairs(dict interfaces, set dps, bint packed=False, int increment=1000000) except *:             # <<<<<<<<<<<<<<
+ *     """
+ *     Add the destination ASes of (addr, destination AS) pairs to the interfaces.
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_dest_pairs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pair);
+  __Pyx_XDECREF((PyObject *)__pyx_v_interface);
+  __Pyx_XDECREF(__pyx_v_pb);
+  __Pyx_RefNannyFinishContext();
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_11add_dest_pairs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_10add_dest_pairs[] = "add_dest_pairs(dict interfaces, set dps, bool packed=False, int increment=1000000) -> void\n\n    Add the destination ASes of (addr, destination AS) pairs to the interfaces.\n    ";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_11add_dest_pairs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_interfaces = 0;
+  PyObject *__pyx_v_dps = 0;
+  int __pyx_v_packed;
+  int __pyx_v_increment;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("add_dest_pairs (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_interfaces,&__pyx_n_s_dps,&__pyx_n_s_packed,&__pyx_n_s_increment,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_interfaces)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_dps)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("add_dest_pairs", 0, 2, 4, 1); __PYX_ERR(0, 252, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_packed);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_increment);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "add_dest_pairs") < 0)) __PYX_ERR(0, 252, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_interfaces = ((PyObject*)values[0]);
+    __pyx_v_dps = ((PyObject*)values[1]);
+    if (values[2]) {
+      __pyx_v_packed = __Pyx_PyObject_IsTrue(values[2]); if (unlikely((__pyx_v_packed == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 252, __pyx_L3_error)
+    } else {
+      __pyx_v_packed = ((int)0);
+    }
+    if (values[3]) {
+      __pyx_v_increment = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_increment == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 252, __pyx_L3_error)
+    } else {
+      __pyx_v_increment = ((int)0xF4240);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("add_dest_pairs", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 252, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_dest_pairs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_interfaces), (&PyDict_Type), 1, "interfaces", 1))) __PYX_ERR(0, 252, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dps), (&PySet_Type), 1, "dps", 1))) __PYX_ERR(0, 252, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_10add_dest_pairs(__pyx_self, __pyx_v_interfaces, __pyx_v_dps, __pyx_v_packed, __pyx_v_increment);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_10add_dest_pairs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_dps, int __pyx_v_packed, int __pyx_v_increment) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_dest_pairs __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_dest_pairs", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1.__pyx_n = 2;
+  __pyx_t_1.packed = __pyx_v_packed;
+  __pyx_t_1.increment = __pyx_v_increment;
+  __pyx_f_8bdrmapit_5graph_9construct_add_dest_pairs(__pyx_v_interfaces, __pyx_v_dps, 0, &__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 252, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_void_to_None(NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 252, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_dest_pairs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bdrmapit/graph/construct.pyx":269
+ * 
+ * 
+ * cpdef void add_hints(dict interfaces, dict hints, bint packed=False) except *:             # <<<<<<<<<<<<<<
+ *     """
+ *     Set interface hints, and collect them in each router's hints.
+ */
+
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_13add_hints(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static void __pyx_f_8bdrmapit_5graph_9construct_add_hints(PyObject *__pyx_v_interfaces, PyObject *__pyx_v_hints, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_hints *__pyx_optional_args) {
+  int __pyx_v_packed = ((int)0);
+  PyObject *__pyx_v_addr = 0;
+  int __pyx_v_hint;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Interface *__pyx_v_interface = 0;
+  struct __pyx_obj_8bdrmapit_5graph_4node_Router *__pyx_v_router = 0;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_hints", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_packed = __pyx_optional_args->packed;
+    }
+  }
+
+  /* "bdrmapit/graph/construct.pyx":279
+ *     cdef Router router
+ * 
+ *     for addr, hint in hints.items():             # <<<<<<<<<<<<<<
+ *         interface = interfaces.get(_key(addr, packed))
+ *         if interface is not None:
+ */
+  __pyx_t_2 = 0;
+  if (unlikely(__pyx_v_hints == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+    __PYX_ERR(0, 279, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_dict_iterator(__pyx_v_hints, 1, __pyx_n_s_items, (&__pyx_t_3), (&__pyx_t_4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_t_5 = 0;
+  while (1) {
+    __pyx_t_7 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_3, &__pyx_t_2, &__pyx_t_5, &__pyx_t_6, NULL, __pyx_t_4);
+    if (unlikely(__pyx_t_7 == 0)) break;
+    if (unlikely(__pyx_t_7 == -1)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GOTREF(__pyx_t_6);
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 279, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_6); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_addr, ((PyObject*)__pyx_t_5));
+    __pyx_t_5 = 0;
+    __pyx_v_hint = __pyx_t_7;
+
+    /* "bdrmapit/graph/construct.pyx":280
+ * 
+ *     for addr, hint in hints.items():
+ *         interface = interfaces.get(_key(addr, packed))             # <<<<<<<<<<<<<<
+ *         if interface is not None:
+ *             interface.hint = hint
+ */
+    if (unlikely(__pyx_v_interfaces == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+      __PYX_ERR(0, 280, __pyx_L1_error)
+    }
+    __pyx_t_6 = __pyx_f_8bdrmapit_5graph_9construct__key(__pyx_v_addr, __pyx_v_packed); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 280, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_5 = __Pyx_PyDict_GetItemDefault(__pyx_v_interfaces, __pyx_t_6, Py_None); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 280, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_8bdrmapit_5graph_4node_Interface))))) __PYX_ERR(0, 280, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_interface, ((struct __pyx_obj_8bdrmapit_5graph_4node_Interface *)__pyx_t_5));
+    __pyx_t_5 = 0;
+
+    /* "bdrmapit/graph/construct.pyx":281
+ *     for addr, hint in hints.items():
+ *         interface = interfaces.get(_key(addr, packed))
+ *         if interface is not None:             # <<<<<<<<<<<<<<
+ *             interface.hint = hint
+ *             router = interface.router
+ */
+    __pyx_t_8 = (((PyObject *)__pyx_v_interface) != Py_None);
+    __pyx_t_9 = (__pyx_t_8 != 0);
+    if (__pyx_t_9) {
+
+      /* "bdrmapit/graph/construct.pyx":282
+ *         interface = interfaces.get(_key(addr, packed))
+ *         if interface is not None:
+ *             interface.hint = hint             # <<<<<<<<<<<<<<
+ *             router = interface.router
+ *             if not router.hints:
+ */
+      __pyx_v_interface->hint = __pyx_v_hint;
+
+      /* "bdrmapit/graph/construct.pyx":283
+ *         if interface is not None:
+ *             interface.hint = hint
+ *             router = interface.router             # <<<<<<<<<<<<<<
+ *             if not router.hints:
+ *                 router.hints = {hint}
+ */
+      __pyx_t_5 = ((PyObject *)__pyx_v_interface->router);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_XDECREF_SET(__pyx_v_router, ((struct __pyx_obj_8bdrmapit_5graph_4node_Router *)__pyx_t_5));
+      __pyx_t_5 = 0;
+
+      /* "bdrmapit/graph/construct.pyx":284
+ *             interface.hint = hint
+ *             router = interface.router
+ *             if not router.hints:             # <<<<<<<<<<<<<<
+ *                 router.hints = {hint}
+ *             else:
+ */
+      __pyx_t_9 = (__pyx_v_router->hints != Py_None)&&(PySet_GET_SIZE(__pyx_v_router->hints) != 0);
+      __pyx_t_8 = ((!__pyx_t_9) != 0);
+      if (__pyx_t_8) {
+
+        /* "bdrmapit/graph/construct.pyx":285
+ *             router = interface.router
+ *             if not router.hints:
+ *                 router.hints = {hint}             # <<<<<<<<<<<<<<
+ *             else:
+ *                 router.hints.add(hint)
+ */
+        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_hint); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 285, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __pyx_t_6 = PySet_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 285, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        if (PySet_Add(__pyx_t_6, __pyx_t_5) < 0) __PYX_ERR(0, 285, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_GIVEREF(__pyx_t_6);
+        __Pyx_GOTREF(__pyx_v_router->hints);
+        __Pyx_DECREF(__pyx_v_router->hints);
+        __pyx_v_router->hints = ((PyObject*)__pyx_t_6);
+        __pyx_t_6 = 0;
+
+        /* "bdrmapit/graph/construct.pyx":284
+ *             interface.hint = hint
+ *             router = interface.router
+ *             if not router.hints:             # <<<<<<<<<<<<<<
+ *                 router.hints = {hint}
+ *             else:
+ */
+        goto __pyx_L6;
+      }
+
+      /* "bdrmapit/graph/construct.pyx":287
+ *                 router.hints = {hint}
+ *             else:
+ *                 router.hints.add(hint)             # <<<<<<<<<<<<<<
+ */
+      /*else*/ {
+        if (unlikely(__pyx_v_router->hints == Py_None)) {
+          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "add");
+          __PYX_ERR(0, 287, __pyx_L1_error)
+        }
+        __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_hint); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 287, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_10 = PySet_Add(__pyx_v_router->hints, __pyx_t_6); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 287, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      }
+      __pyx_L6:;
+
+      /* "bdrmapit/graph/construct.pyx":281
+ *     for addr, hint in hints.items():
+ *         interface = interfaces.get(_key(addr, packed))
+ *         if interface is not None:             # <<<<<<<<<<<<<<
+ *             interface.hint = hint
+ *             router = interface.router
+ */
+    }
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":269
+ * 
+ * 
+ * cpdef void add_hints(dict interfaces, dict hints, bint packed=False) except *:             # <<<<<<<<<<<<<<
+ *     """
+ *     Set interface hints, and collect them in each router's hints.
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_hints", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_addr);
+  __Pyx_XDECREF((PyObject *)__pyx_v_interface);
+  __Pyx_XDECREF((PyObject *)__pyx_v_router);
+  __Pyx_RefNannyFinishContext();
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_13add_hints(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_12add_hints[] = "add_hints(dict interfaces, dict hints, bool packed=False) -> void\n\n    Set interface hints, and collect them in each router's hints.\n    :param hints: addr to hint AS\n    ";
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_13add_hints(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_interfaces = 0;
+  PyObject *__pyx_v_hints = 0;
+  int __pyx_v_packed;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("add_hints (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_interfaces,&__pyx_n_s_hints,&__pyx_n_s_packed,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_interfaces)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_hints)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("add_hints", 0, 2, 3, 1); __PYX_ERR(0, 269, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_packed);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "add_hints") < 0)) __PYX_ERR(0, 269, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_interfaces = ((PyObject*)values[0]);
+    __pyx_v_hints = ((PyObject*)values[1]);
+    if (values[2]) {
+      __pyx_v_packed = __Pyx_PyObject_IsTrue(values[2]); if (unlikely((__pyx_v_packed == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 269, __pyx_L3_error)
+    } else {
+      __pyx_v_packed = ((int)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("add_hints", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 269, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_hints", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_interfaces), (&PyDict_Type), 1, "interfaces", 1))) __PYX_ERR(0, 269, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_hints), (&PyDict_Type), 1, "hints", 1))) __PYX_ERR(0, 269, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_12add_hints(__pyx_self, __pyx_v_interfaces, __pyx_v_hints, __pyx_v_packed);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_12add_hints(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_interfaces, PyObject *__pyx_v_hints, int __pyx_v_packed) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_hints __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_hints", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1.__pyx_n = 1;
+  __pyx_t_1.packed = __pyx_v_packed;
+  __pyx_f_8bdrmapit_5graph_9construct_add_hints(__pyx_v_interfaces, __pyx_v_hints, 0, &__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 269, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_void_to_None(NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 269, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.add_hints", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_Graph(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_15__pyx_unpickle_Graph(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8bdrmapit_5graph_9construct_14__pyx_unpickle_Graph[] = "__pyx_unpickle_Graph(__pyx_type, long __pyx_checksum, __pyx_state)";
+static PyMethodDef __pyx_mdef_8bdrmapit_5graph_9construct_15__pyx_unpickle_Graph = {"__pyx_unpickle_Graph", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_15__pyx_unpickle_Graph, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_14__pyx_unpickle_Graph};
+static PyObject *__pyx_pw_8bdrmapit_5graph_9construct_15__pyx_unpickle_Graph(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_Graph (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_Graph", 1, 3, 3, 1); __PYX_ERR(2, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_Graph", 1, 3, 3, 2); __PYX_ERR(2, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_Graph") < 0)) __PYX_ERR(2, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(2, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_Graph", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(2, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bdrmapit.graph.construct.__pyx_unpickle_Graph", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_8bdrmapit_5graph_9construct_14__pyx_unpickle_Graph(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8bdrmapit_5graph_9construct_14__pyx_unpickle_Graph(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_Graph", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x228f3cb, 0x0814fa7, 0x28bead2):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x228f3cb, 0x0814fa7, 0x28bead2) = (interfaces, packed, routers))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple_, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x228f3cb, 0x0814fa7, 0x28bead2):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x228f3cb, 0x0814fa7, 0x28bead2) = (interfaces, packed, routers))" % __pyx_checksum)
+ *     __pyx_result = Graph.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(2, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0x228f3cb, 0x0814fa7, 0x28bead2):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x228f3cb, 0x0814fa7, 0x28bead2) = (interfaces, packed, routers))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = Graph.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(2, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(2, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x228f3cb, 0x0814fa7, 0x28bead2):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x228f3cb, 0x0814fa7, 0x28bead2) = (interfaces, packed, routers))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x228f3cb, 0x0814fa7, 0x28bead2) = (interfaces, packed, routers))" % __pyx_checksum)
+ *     __pyx_result = Graph.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_Graph__set_state(<Graph> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_8bdrmapit_5graph_9construct_Graph), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(2, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x228f3cb, 0x0814fa7, 0x28bead2) = (interfaces, packed, routers))" % __pyx_checksum)
+ *     __pyx_result = Graph.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_Graph__set_state(<Graph> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = Graph.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_Graph__set_state(<Graph> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Graph__set_state(Graph __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(2, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_8bdrmapit_5graph_9construct___pyx_unpickle_Graph__set_state(((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(2, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x228f3cb, 0x0814fa7, 0x28bead2) = (interfaces, packed, routers))" % __pyx_checksum)
+ *     __pyx_result = Graph.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_Graph__set_state(<Graph> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_Graph__set_state(<Graph> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_Graph__set_state(Graph __pyx_result, tuple __pyx_state):
+ *     __pyx_result.interfaces = __pyx_state[0]; __pyx_result.packed = __pyx_state[1]; __pyx_result.routers = __pyx_state[2]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_Graph(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.__pyx_unpickle_Graph", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_Graph__set_state(<Graph> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Graph__set_state(Graph __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.interfaces = __pyx_state[0]; __pyx_result.packed = __pyx_state[1]; __pyx_result.routers = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_8bdrmapit_5graph_9construct___pyx_unpickle_Graph__set_state(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_Graph__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Graph__set_state(Graph __pyx_result, tuple __pyx_state):
+ *     __pyx_result.interfaces = __pyx_state[0]; __pyx_result.packed = __pyx_state[1]; __pyx_result.routers = __pyx_state[2]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(2, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(PyDict_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(2, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->interfaces);
+  __Pyx_DECREF(__pyx_v___pyx_result->interfaces);
+  __pyx_v___pyx_result->interfaces = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(2, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(2, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->packed = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(2, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(PyDict_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(2, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->routers);
+  __Pyx_DECREF(__pyx_v___pyx_result->routers);
+  __pyx_v___pyx_result->routers = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_Graph__set_state(Graph __pyx_result, tuple __pyx_state):
+ *     __pyx_result.interfaces = __pyx_state[0]; __pyx_result.packed = __pyx_state[1]; __pyx_result.routers = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(2, 13, __pyx_L1_error)
+  }
+  __pyx_t_3 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(2, 13, __pyx_L1_error)
+  __pyx_t_4 = ((__pyx_t_3 > 3) != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_2 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 13, __pyx_L1_error)
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  __pyx_t_2 = __pyx_t_5;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.interfaces = __pyx_state[0]; __pyx_result.packed = __pyx_state[1]; __pyx_result.routers = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_update); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(2, 14, __pyx_L1_error)
+    }
+    __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_8, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_Graph__set_state(Graph __pyx_result, tuple __pyx_state):
+ *     __pyx_result.interfaces = __pyx_state[0]; __pyx_result.packed = __pyx_state[1]; __pyx_result.routers = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_Graph__set_state(<Graph> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Graph__set_state(Graph __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.interfaces = __pyx_state[0]; __pyx_result.packed = __pyx_state[1]; __pyx_result.routers = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("bdrmapit.graph.construct.__pyx_unpickle_Graph__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_8bdrmapit_5graph_9construct_Graph __pyx_vtable_8bdrmapit_5graph_9construct_Graph;
+
+static PyObject *__pyx_tp_new_8bdrmapit_5graph_9construct_Graph(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)o);
+  p->__pyx_vtab = __pyx_vtabptr_8bdrmapit_5graph_9construct_Graph;
+  p->interfaces = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->routers = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_8bdrmapit_5graph_9construct_Graph(PyObject *o) {
+  struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *p = (struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->interfaces);
+  Py_CLEAR(p->routers);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_8bdrmapit_5graph_9construct_Graph(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *p = (struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)o;
+  if (p->interfaces) {
+    e = (*v)(p->interfaces, a); if (e) return e;
+  }
+  if (p->routers) {
+    e = (*v)(p->routers, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_8bdrmapit_5graph_9construct_Graph(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *p = (struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *)o;
+  tmp = ((PyObject*)p->interfaces);
+  p->interfaces = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->routers);
+  p->routers = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_8bdrmapit_5graph_9construct_5Graph_interfaces(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_8bdrmapit_5graph_9construct_5Graph_10interfaces_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_8bdrmapit_5graph_9construct_5Graph_routers(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_8bdrmapit_5graph_9construct_5Graph_7routers_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_8bdrmapit_5graph_9construct_5Graph_packed(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_8bdrmapit_5graph_9construct_5Graph_6packed_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_8bdrmapit_5graph_9construct_Graph[] = {
+  {"get_interface", (PyCFunction)__pyx_pw_8bdrmapit_5graph_9construct_5Graph_3get_interface, METH_O, __pyx_doc_8bdrmapit_5graph_9construct_5Graph_2get_interface},
+  {"has_interface", (PyCFunction)__pyx_pw_8bdrmapit_5graph_9construct_5Graph_5has_interface, METH_O, __pyx_doc_8bdrmapit_5graph_9construct_5Graph_4has_interface},
+  {"save", (PyCFunction)__pyx_pw_8bdrmapit_5graph_9construct_5Graph_7save, METH_O, __pyx_doc_8bdrmapit_5graph_9construct_5Graph_6save},
+  {"load", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_5Graph_9load, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_5Graph_8load},
+  {"subgraph", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_5Graph_11subgraph, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_5Graph_10subgraph},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_8bdrmapit_5graph_9construct_5Graph_13__reduce_cython__, METH_NOARGS, __pyx_doc_8bdrmapit_5graph_9construct_5Graph_12__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_8bdrmapit_5graph_9construct_5Graph_15__setstate_cython__, METH_O, __pyx_doc_8bdrmapit_5graph_9construct_5Graph_14__setstate_cython__},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_8bdrmapit_5graph_9construct_Graph[] = {
+  {(char *)"interfaces", __pyx_getprop_8bdrmapit_5graph_9construct_5Graph_interfaces, 0, (char *)0, 0},
+  {(char *)"routers", __pyx_getprop_8bdrmapit_5graph_9construct_5Graph_routers, 0, (char *)0, 0},
+  {(char *)"packed", __pyx_getprop_8bdrmapit_5graph_9construct_5Graph_packed, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_8bdrmapit_5graph_9construct_Graph = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "bdrmapit.graph.construct.Graph", /*tp_name*/
+  sizeof(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_8bdrmapit_5graph_9construct_Graph, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "Graph(dict interfaces=None, dict routers=None, bool packed=False)", /*tp_doc*/
+  __pyx_tp_traverse_8bdrmapit_5graph_9construct_Graph, /*tp_traverse*/
+  __pyx_tp_clear_8bdrmapit_5graph_9construct_Graph, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_8bdrmapit_5graph_9construct_Graph, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_8bdrmapit_5graph_9construct_Graph, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_8bdrmapit_5graph_9construct_5Graph_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_8bdrmapit_5graph_9construct_Graph, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {"classify", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_1classify, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_classify},
+  {"create_node", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_3create_node, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_2create_node},
+  {"create_remaining", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_5create_remaining, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_4create_remaining},
+  {"add_nexthop", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_7add_nexthop, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_6add_nexthop},
+  {"add_multi", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_9add_multi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_8add_multi},
+  {"add_dest_pairs", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_11add_dest_pairs, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_10add_dest_pairs},
+  {"add_hints", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8bdrmapit_5graph_9construct_13add_hints, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8bdrmapit_5graph_9construct_12add_hints},
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_construct(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_construct},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "construct",
+    0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_u_Adding_destination_ASes, __pyx_k_Adding_destination_ASes, sizeof(__pyx_k_Adding_destination_ASes), 0, 1, 0, 0},
+  {&__pyx_kp_u_Adding_multihop_edges, __pyx_k_Adding_multihop_edges, sizeof(__pyx_k_Adding_multihop_edges), 0, 1, 0, 0},
+  {&__pyx_kp_u_Adding_nexthop_edges, __pyx_k_Adding_nexthop_edges, sizeof(__pyx_k_Adding_nexthop_edges), 0, 1, 0, 0},
+  {&__pyx_kp_u_Classifying_multihop_adjacencies, __pyx_k_Classifying_multihop_adjacencies, sizeof(__pyx_k_Classifying_multihop_adjacencies), 0, 1, 0, 0},
+  {&__pyx_kp_u_Classifying_nexthop_adjacencies, __pyx_k_Classifying_nexthop_adjacencies, sizeof(__pyx_k_Classifying_nexthop_adjacencies), 0, 1, 0, 0},
+  {&__pyx_kp_u_Creating_remaining_routers_and_i, __pyx_k_Creating_remaining_routers_and_i, sizeof(__pyx_k_Creating_remaining_routers_and_i), 0, 1, 0, 0},
+  {&__pyx_n_s_Graph, __pyx_k_Graph, sizeof(__pyx_k_Graph), 0, 0, 1, 1},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
+  {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_Progress, __pyx_k_Progress, sizeof(__pyx_k_Progress), 0, 0, 1, 1},
+  {&__pyx_kp_u_Selecting_remaining_addresses, __pyx_k_Selecting_remaining_addresses, sizeof(__pyx_k_Selecting_remaining_addresses), 0, 1, 0, 0},
+  {&__pyx_n_s_addr, __pyx_k_addr, sizeof(__pyx_k_addr), 0, 0, 1, 1},
+  {&__pyx_n_s_addrs, __pyx_k_addrs, sizeof(__pyx_k_addrs), 0, 0, 1, 1},
+  {&__pyx_n_s_aliases, __pyx_k_aliases, sizeof(__pyx_k_aliases), 0, 0, 1, 1},
+  {&__pyx_n_s_as2org, __pyx_k_as2org, sizeof(__pyx_k_as2org), 0, 0, 1, 1},
+  {&__pyx_n_s_asns, __pyx_k_asns, sizeof(__pyx_k_asns), 0, 0, 1, 1},
+  {&__pyx_n_s_bdrmapit_graph_construct, __pyx_k_bdrmapit_graph_construct, sizeof(__pyx_k_bdrmapit_graph_construct), 0, 0, 1, 1},
+  {&__pyx_kp_s_bdrmapit_graph_construct_pyx, __pyx_k_bdrmapit_graph_construct_pyx, sizeof(__pyx_k_bdrmapit_graph_construct_pyx), 0, 0, 1, 0},
+  {&__pyx_n_s_bdrmapit_graph_serialize, __pyx_k_bdrmapit_graph_serialize, sizeof(__pyx_k_bdrmapit_graph_serialize), 0, 0, 1, 1},
+  {&__pyx_n_s_bdrmapit_graph_subgraph, __pyx_k_bdrmapit_graph_subgraph, sizeof(__pyx_k_bdrmapit_graph_subgraph), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_dps, __pyx_k_dps, sizeof(__pyx_k_dps), 0, 0, 1, 1},
+  {&__pyx_n_s_echos, __pyx_k_echos, sizeof(__pyx_k_echos), 0, 0, 1, 1},
+  {&__pyx_n_s_extract_subgraph, __pyx_k_extract_subgraph, sizeof(__pyx_k_extract_subgraph), 0, 0, 1, 1},
+  {&__pyx_n_s_filename, __pyx_k_filename, sizeof(__pyx_k_filename), 0, 0, 1, 1},
+  {&__pyx_n_s_first, __pyx_k_first, sizeof(__pyx_k_first), 0, 0, 1, 1},
+  {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
+  {&__pyx_n_s_get_interface, __pyx_k_get_interface, sizeof(__pyx_k_get_interface), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_has_interface, __pyx_k_has_interface, sizeof(__pyx_k_has_interface), 0, 0, 1, 1},
+  {&__pyx_n_s_hints, __pyx_k_hints, sizeof(__pyx_k_hints), 0, 0, 1, 1},
+  {&__pyx_n_s_hops, __pyx_k_hops, sizeof(__pyx_k_hops), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_increment, __pyx_k_increment, sizeof(__pyx_k_increment), 0, 0, 1, 1},
+  {&__pyx_n_s_interfaces, __pyx_k_interfaces, sizeof(__pyx_k_interfaces), 0, 0, 1, 1},
+  {&__pyx_n_s_ip2as, __pyx_k_ip2as, sizeof(__pyx_k_ip2as), 0, 0, 1, 1},
+  {&__pyx_n_s_items, __pyx_k_items, sizeof(__pyx_k_items), 0, 0, 1, 1},
+  {&__pyx_n_s_iterator, __pyx_k_iterator, sizeof(__pyx_k_iterator), 0, 0, 1, 1},
+  {&__pyx_n_s_load, __pyx_k_load, sizeof(__pyx_k_load), 0, 0, 1, 1},
+  {&__pyx_n_s_load_graph, __pyx_k_load_graph, sizeof(__pyx_k_load_graph), 0, 0, 1, 1},
+  {&__pyx_n_s_loop, __pyx_k_loop, sizeof(__pyx_k_loop), 0, 0, 1, 1},
+  {&__pyx_n_s_loopadjs, __pyx_k_loopadjs, sizeof(__pyx_k_loopadjs), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_multi, __pyx_k_multi, sizeof(__pyx_k_multi), 0, 0, 1, 1},
+  {&__pyx_n_s_multiadjs, __pyx_k_multiadjs, sizeof(__pyx_k_multiadjs), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+  {&__pyx_n_s_nextadjs, __pyx_k_nextadjs, sizeof(__pyx_k_nextadjs), 0, 0, 1, 1},
+  {&__pyx_n_s_nexthops, __pyx_k_nexthops, sizeof(__pyx_k_nexthops), 0, 0, 1, 1},
+  {&__pyx_n_s_no_echos, __pyx_k_no_echos, sizeof(__pyx_k_no_echos), 0, 0, 1, 1},
+  {&__pyx_n_s_num_addrs, __pyx_k_num_addrs, sizeof(__pyx_k_num_addrs), 0, 0, 1, 1},
+  {&__pyx_n_s_packed, __pyx_k_packed, sizeof(__pyx_k_packed), 0, 0, 1, 1},
+  {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_pop, __pyx_k_pop, sizeof(__pyx_k_pop), 0, 0, 1, 1},
+  {&__pyx_n_s_prefixes, __pyx_k_prefixes, sizeof(__pyx_k_prefixes), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_Graph, __pyx_k_pyx_unpickle_Graph, sizeof(__pyx_k_pyx_unpickle_Graph), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_release, __pyx_k_release, sizeof(__pyx_k_release), 0, 0, 1, 1},
+  {&__pyx_n_s_router, __pyx_k_router, sizeof(__pyx_k_router), 0, 0, 1, 1},
+  {&__pyx_n_s_routers, __pyx_k_routers, sizeof(__pyx_k_routers), 0, 0, 1, 1},
+  {&__pyx_n_s_save_graph, __pyx_k_save_graph, sizeof(__pyx_k_save_graph), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_staticmethod, __pyx_k_staticmethod, sizeof(__pyx_k_staticmethod), 0, 0, 1, 1},
+  {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_traceutils_progress_bar, __pyx_k_traceutils_progress_bar, sizeof(__pyx_k_traceutils_progress_bar), 0, 0, 1, 1},
+  {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_staticmethod = __Pyx_GetBuiltinName(__pyx_n_s_staticmethod); if (!__pyx_builtin_staticmethod) __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 186, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x228f3cb, 0x0814fa7, 0x28bead2):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x228f3cb, 0x0814fa7, 0x28bead2) = (interfaces, packed, routers))" % __pyx_checksum)
+ */
+  __pyx_tuple_ = PyTuple_Pack(3, __pyx_int_36238283, __pyx_int_8474535, __pyx_int_42724050); if (unlikely(!__pyx_tuple_)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "bdrmapit/graph/construct.pyx":48
+ * 
+ *     @staticmethod
+ *     def load(filename):             # <<<<<<<<<<<<<<
+ *         """
+ *         Load a graph written by save.
+ */
+  __pyx_tuple__2 = PyTuple_Pack(2, __pyx_n_s_filename, __pyx_n_s_load_graph); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+  __pyx_codeobj__3 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__2, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_bdrmapit_graph_construct_pyx, __pyx_n_s_load, 48, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__3)) __PYX_ERR(0, 48, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_Graph(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__4 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_codeobj__5 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__4, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Graph, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__5)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  __pyx_umethod_PyDict_Type_get.type = (PyObject*)&PyDict_Type;
+  __pyx_umethod_PyDict_Type_pop.type = (PyObject*)&PyDict_Type;
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_8474535 = PyInt_FromLong(8474535L); if (unlikely(!__pyx_int_8474535)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_36238283 = PyInt_FromLong(36238283L); if (unlikely(!__pyx_int_36238283)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_42724050 = PyInt_FromLong(42724050L); if (unlikely(!__pyx_int_42724050)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  if (__Pyx_ExportFunction("classify", (void (*)(void))__pyx_f_8bdrmapit_5graph_9construct_classify, "PyObject *(PyObject *, PyObject *, PyObject *, PyObject *, PyObject *, PyObject *, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_classify *__pyx_optional_args)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("create_node", (void (*)(void))__pyx_f_8bdrmapit_5graph_9construct_create_node, "struct __pyx_obj_8bdrmapit_5graph_4node_Interface *(PyObject *, PyObject *, PyObject *, struct __pyx_obj_8bdrmapit_5graph_4node_Router *, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *, struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_node *__pyx_optional_args)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("create_remaining", (void (*)(void))__pyx_f_8bdrmapit_5graph_9construct_create_remaining, "void (PyObject *, PyObject *, PyObject *, Py_ssize_t, int, struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS *, struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_create_remaining *__pyx_optional_args)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("add_nexthop", (void (*)(void))__pyx_f_8bdrmapit_5graph_9construct_add_nexthop, "void (PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_nexthop *__pyx_optional_args)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("add_multi", (void (*)(void))__pyx_f_8bdrmapit_5graph_9construct_add_multi, "void (PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_multi *__pyx_optional_args)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("add_dest_pairs", (void (*)(void))__pyx_f_8bdrmapit_5graph_9construct_add_dest_pairs, "void (PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_dest_pairs *__pyx_optional_args)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("add_hints", (void (*)(void))__pyx_f_8bdrmapit_5graph_9construct_add_hints, "void (PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_8bdrmapit_5graph_9construct_add_hints *__pyx_optional_args)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_8bdrmapit_5graph_9construct_Graph = &__pyx_vtable_8bdrmapit_5graph_9construct_Graph;
+  __pyx_vtable_8bdrmapit_5graph_9construct_Graph._key = (PyObject *(*)(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *, PyObject *))__pyx_f_8bdrmapit_5graph_9construct_5Graph__key;
+  __pyx_vtable_8bdrmapit_5graph_9construct_Graph.get_interface = (struct __pyx_obj_8bdrmapit_5graph_4node_Interface *(*)(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *, PyObject *, int __pyx_skip_dispatch))__pyx_f_8bdrmapit_5graph_9construct_5Graph_get_interface;
+  __pyx_vtable_8bdrmapit_5graph_9construct_Graph.has_interface = (int (*)(struct __pyx_obj_8bdrmapit_5graph_9construct_Graph *, PyObject *, int __pyx_skip_dispatch))__pyx_f_8bdrmapit_5graph_9construct_5Graph_has_interface;
+  if (PyType_Ready(&__pyx_type_8bdrmapit_5graph_9construct_Graph) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_8bdrmapit_5graph_9construct_Graph.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_8bdrmapit_5graph_9construct_Graph.tp_dictoffset && __pyx_type_8bdrmapit_5graph_9construct_Graph.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_8bdrmapit_5graph_9construct_Graph.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_8bdrmapit_5graph_9construct_Graph, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 8, __pyx_L1_error)
+    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
+      __pyx_wrapperbase_8bdrmapit_5graph_9construct_5Graph___init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_8bdrmapit_5graph_9construct_5Graph___init__.doc = __pyx_doc_8bdrmapit_5graph_9construct_5Graph___init__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_8bdrmapit_5graph_9construct_5Graph___init__;
+    }
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_type_8bdrmapit_5graph_9construct_Graph.tp_dict, __pyx_vtabptr_8bdrmapit_5graph_9construct_Graph) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Graph, (PyObject *)&__pyx_type_8bdrmapit_5graph_9construct_Graph) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_8bdrmapit_5graph_9construct_Graph) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  __pyx_ptype_8bdrmapit_5graph_9construct_Graph = &__pyx_type_8bdrmapit_5graph_9construct_Graph;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("traceutils.utils.dicts"); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_10traceutils_5utils_5dicts_CustomDict = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.utils.dicts", "CustomDict", sizeof(struct __pyx_obj_10traceutils_5utils_5dicts_CustomDict), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5utils_5dicts_CustomDict),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5utils_5dicts_CustomDict) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_ptype_10traceutils_5utils_5dicts_StrDict = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.utils.dicts", "StrDict", sizeof(struct __pyx_obj_10traceutils_5utils_5dicts_StrDict), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5utils_5dicts_StrDict),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5utils_5dicts_StrDict) __PYX_ERR(3, 4, __pyx_L1_error)
+  __pyx_ptype_10traceutils_5utils_5dicts_EmptyDict = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.utils.dicts", "EmptyDict", sizeof(struct __pyx_obj_10traceutils_5utils_5dicts_EmptyDict), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5utils_5dicts_EmptyDict),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5utils_5dicts_EmptyDict) __PYX_ERR(3, 7, __pyx_L1_error)
+  __pyx_ptype_10traceutils_5utils_5dicts_ZeroDict = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.utils.dicts", "ZeroDict", sizeof(struct __pyx_obj_10traceutils_5utils_5dicts_ZeroDict), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5utils_5dicts_ZeroDict),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5utils_5dicts_ZeroDict) __PYX_ERR(3, 10, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("traceutils.as2org.as2org"); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_10traceutils_6as2org_6as2org_AS2Org = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.as2org.as2org", "AS2Org", sizeof(struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_6as2org_6as2org_AS2Org),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_6as2org_6as2org_AS2Org) __PYX_ERR(4, 3, __pyx_L1_error)
+  __pyx_vtabptr_10traceutils_6as2org_6as2org_AS2Org = (struct __pyx_vtabstruct_10traceutils_6as2org_6as2org_AS2Org*)__Pyx_GetVtable(__pyx_ptype_10traceutils_6as2org_6as2org_AS2Org->tp_dict); if (unlikely(!__pyx_vtabptr_10traceutils_6as2org_6as2org_AS2Org)) __PYX_ERR(4, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("traceutils.radix.radix_prefix"); if (unlikely(!__pyx_t_1)) __PYX_ERR(5, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_10traceutils_5radix_12radix_prefix_RadixPrefix = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.radix_prefix", "RadixPrefix", sizeof(struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_12radix_prefix_RadixPrefix),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_12radix_prefix_RadixPrefix) __PYX_ERR(5, 10, __pyx_L1_error)
+  __pyx_vtabptr_10traceutils_5radix_12radix_prefix_RadixPrefix = (struct __pyx_vtabstruct_10traceutils_5radix_12radix_prefix_RadixPrefix*)__Pyx_GetVtable(__pyx_ptype_10traceutils_5radix_12radix_prefix_RadixPrefix->tp_dict); if (unlikely(!__pyx_vtabptr_10traceutils_5radix_12radix_prefix_RadixPrefix)) __PYX_ERR(5, 10, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("traceutils.radix.radix_node"); if (unlikely(!__pyx_t_1)) __PYX_ERR(6, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_10traceutils_5radix_10radix_node_RadixNode = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.radix_node", "RadixNode", sizeof(struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNode),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_10radix_node_RadixNode) __PYX_ERR(6, 3, __pyx_L1_error)
+  __pyx_ptype_10traceutils_5radix_10radix_node_RadixNodeASN = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.radix_node", "RadixNodeASN", sizeof(struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASN), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASN),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_10radix_node_RadixNodeASN) __PYX_ERR(6, 8, __pyx_L1_error)
+  __pyx_ptype_10traceutils_5radix_10radix_node_RadixNodeASNs = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.radix_node", "RadixNodeASNs", sizeof(struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASNs), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeASNs),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_10radix_node_RadixNodeASNs) __PYX_ERR(6, 11, __pyx_L1_error)
+  __pyx_ptype_10traceutils_5radix_10radix_node_RadixNodeData = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.radix_node", "RadixNodeData", sizeof(struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeData), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_10radix_node_RadixNodeData),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_10radix_node_RadixNodeData) __PYX_ERR(6, 14, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("traceutils.radix.radix_tree"); if (unlikely(!__pyx_t_1)) __PYX_ERR(7, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_10traceutils_5radix_10radix_tree_RadixTree = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.radix_tree", "RadixTree", sizeof(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTree),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTree) __PYX_ERR(7, 9, __pyx_L1_error)
+  __pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTree = (struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTree*)__Pyx_GetVtable(__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTree->tp_dict); if (unlikely(!__pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTree)) __PYX_ERR(7, 9, __pyx_L1_error)
+  __pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeASN = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.radix_tree", "RadixTreeASN", sizeof(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeASN), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeASN),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeASN) __PYX_ERR(7, 22, __pyx_L1_error)
+  __pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTreeASN = (struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTreeASN*)__Pyx_GetVtable(__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeASN->tp_dict); if (unlikely(!__pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTreeASN)) __PYX_ERR(7, 22, __pyx_L1_error)
+  __pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeASNs = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.radix_tree", "RadixTreeASNs", sizeof(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeASNs), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeASNs),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeASNs) __PYX_ERR(7, 25, __pyx_L1_error)
+  __pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTreeASNs = (struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTreeASNs*)__Pyx_GetVtable(__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeASNs->tp_dict); if (unlikely(!__pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTreeASNs)) __PYX_ERR(7, 25, __pyx_L1_error)
+  __pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeData = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.radix_tree", "RadixTreeData", sizeof(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeData), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_10radix_tree_RadixTreeData),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeData) __PYX_ERR(7, 28, __pyx_L1_error)
+  __pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTreeData = (struct __pyx_vtabstruct_10traceutils_5radix_10radix_tree_RadixTreeData*)__Pyx_GetVtable(__pyx_ptype_10traceutils_5radix_10radix_tree_RadixTreeData->tp_dict); if (unlikely(!__pyx_vtabptr_10traceutils_5radix_10radix_tree_RadixTreeData)) __PYX_ERR(7, 28, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("traceutils.radix.radix"); if (unlikely(!__pyx_t_1)) __PYX_ERR(8, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_10traceutils_5radix_5radix_Radix = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.radix", "Radix", sizeof(struct __pyx_obj_10traceutils_5radix_5radix_Radix), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_5radix_Radix),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_5radix_Radix) __PYX_ERR(8, 7, __pyx_L1_error)
+  __pyx_vtabptr_10traceutils_5radix_5radix_Radix = (struct __pyx_vtabstruct_10traceutils_5radix_5radix_Radix*)__Pyx_GetVtable(__pyx_ptype_10traceutils_5radix_5radix_Radix->tp_dict); if (unlikely(!__pyx_vtabptr_10traceutils_5radix_5radix_Radix)) __PYX_ERR(8, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("traceutils.radix.ip2as"); if (unlikely(!__pyx_t_1)) __PYX_ERR(9, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_10traceutils_5radix_5ip2as_IP2AS = __Pyx_ImportType_0_29_37(__pyx_t_1, "traceutils.radix.ip2as", "IP2AS", sizeof(struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_10traceutils_5radix_5ip2as_IP2AS),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_10traceutils_5radix_5ip2as_IP2AS) __PYX_ERR(9, 9, __pyx_L1_error)
+  __pyx_vtabptr_10traceutils_5radix_5ip2as_IP2AS = (struct __pyx_vtabstruct_10traceutils_5radix_5ip2as_IP2AS*)__Pyx_GetVtable(__pyx_ptype_10traceutils_5radix_5ip2as_IP2AS->tp_dict); if (unlikely(!__pyx_vtabptr_10traceutils_5radix_5ip2as_IP2AS)) __PYX_ERR(9, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("bdrmapit.graph.node"); if (unlikely(!__pyx_t_1)) __PYX_ERR(10, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_8bdrmapit_5graph_4node_Origins = __Pyx_ImportType_0_29_37(__pyx_t_1, "bdrmapit.graph.node", "Origins", sizeof(struct __pyx_obj_8bdrmapit_5graph_4node_Origins), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_8bdrmapit_5graph_4node_Origins),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_8bdrmapit_5graph_4node_Origins) __PYX_ERR(10, 1, __pyx_L1_error)
+  __pyx_vtabptr_8bdrmapit_5graph_4node_Origins = (struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Origins*)__Pyx_GetVtable(__pyx_ptype_8bdrmapit_5graph_4node_Origins->tp_dict); if (unlikely(!__pyx_vtabptr_8bdrmapit_5graph_4node_Origins)) __PYX_ERR(10, 1, __pyx_L1_error)
+  __pyx_ptype_8bdrmapit_5graph_4node_Interface = __Pyx_ImportType_0_29_37(__pyx_t_1, "bdrmapit.graph.node", "Interface", sizeof(struct __pyx_obj_8bdrmapit_5graph_4node_Interface), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_8bdrmapit_5graph_4node_Interface),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_8bdrmapit_5graph_4node_Interface) __PYX_ERR(10, 9, __pyx_L1_error)
+  __pyx_vtabptr_8bdrmapit_5graph_4node_Interface = (struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Interface*)__Pyx_GetVtable(__pyx_ptype_8bdrmapit_5graph_4node_Interface->tp_dict); if (unlikely(!__pyx_vtabptr_8bdrmapit_5graph_4node_Interface)) __PYX_ERR(10, 9, __pyx_L1_error)
+  __pyx_ptype_8bdrmapit_5graph_4node_Router = __Pyx_ImportType_0_29_37(__pyx_t_1, "bdrmapit.graph.node", "Router", sizeof(struct __pyx_obj_8bdrmapit_5graph_4node_Router), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_8bdrmapit_5graph_4node_Router),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_8bdrmapit_5graph_4node_Router) __PYX_ERR(10, 11, __pyx_L1_error)
+  __pyx_vtabptr_8bdrmapit_5graph_4node_Router = (struct __pyx_vtabstruct_8bdrmapit_5graph_4node_Router*)__Pyx_GetVtable(__pyx_ptype_8bdrmapit_5graph_4node_Router->tp_dict); if (unlikely(!__pyx_vtabptr_8bdrmapit_5graph_4node_Router)) __PYX_ERR(10, 11, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("traceutils.radix.ip2as"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "PRIVATE4", (void **)&__pyx_vp_10traceutils_5radix_5ip2as_PRIVATE4, "PyObject *") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "PRIVATE6", (void **)&__pyx_vp_10traceutils_5radix_5ip2as_PRIVATE6, "PyObject *") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "MULTICAST4", (void **)&__pyx_vp_10traceutils_5radix_5ip2as_MULTICAST4, "PyObject *") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "MULTICAST6", (void **)&__pyx_vp_10traceutils_5radix_5ip2as_MULTICAST6, "PyObject *") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("bdrmapit.graph.node"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "pack_addr", (void (**)(void))&__pyx_f_8bdrmapit_5graph_4node_pack_addr, "PyObject *(PyObject *, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "unpack_addr", (void (**)(void))&__pyx_f_8bdrmapit_5graph_4node_unpack_addr, "PyObject *(PyObject *, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initconstruct(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initconstruct(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_construct(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_construct(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_construct(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'construct' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_construct(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("construct", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_bdrmapit__graph__construct) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "bdrmapit.graph.construct")) {
+      if (unlikely(PyDict_SetItemString(modules, "bdrmapit.graph.construct", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  if (unlikely(__Pyx_modinit_function_export_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_variable_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_function_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "bdrmapit/graph/construct.pyx":2
+ * from traceutils.as2org.as2org cimport AS2Org
+ * from traceutils.progress.bar import Progress             # <<<<<<<<<<<<<<
+ * from traceutils.radix.ip2as cimport IP2AS
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_Progress);
+  __Pyx_GIVEREF(__pyx_n_s_Progress);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_Progress);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_traceutils_progress_bar, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_Progress); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Progress, __pyx_t_1) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":48
+ * 
+ *     @staticmethod
+ *     def load(filename):             # <<<<<<<<<<<<<<
+ *         """
+ *         Load a graph written by save.
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_8bdrmapit_5graph_9construct_5Graph_9load, NULL, __pyx_n_s_bdrmapit_graph_construct); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_8bdrmapit_5graph_9construct_Graph->tp_dict, __pyx_n_s_load, __pyx_t_2) < 0) __PYX_ERR(0, 48, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_8bdrmapit_5graph_9construct_Graph);
+
+  /* "bdrmapit/graph/construct.pyx":47
+ *         save_graph(self, filename)
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def load(filename):
+ *         """
+ */
+  __Pyx_GetNameInClass(__pyx_t_2, (PyObject *)__pyx_ptype_8bdrmapit_5graph_9construct_Graph, __pyx_n_s_load); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_staticmethod, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_8bdrmapit_5graph_9construct_Graph->tp_dict, __pyx_n_s_load, __pyx_t_1) < 0) __PYX_ERR(0, 48, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  PyType_Modified(__pyx_ptype_8bdrmapit_5graph_9construct_Graph);
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_Graph(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8bdrmapit_5graph_9construct_15__pyx_unpickle_Graph, NULL, __pyx_n_s_bdrmapit_graph_construct); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Graph, __pyx_t_1) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bdrmapit/graph/construct.pyx":1
+ * from traceutils.as2org.as2org cimport AS2Org             # <<<<<<<<<<<<<<
+ * from traceutils.progress.bar import Progress
+ * from traceutils.radix.ip2as cimport IP2AS
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init bdrmapit.graph.construct", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init bdrmapit.graph.construct");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* DictGetItem */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
+    PyObject *value;
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (!PyErr_Occurred()) {
+            if (unlikely(PyTuple_Check(key))) {
+                PyObject* args = PyTuple_Pack(1, key);
+                if (likely(args)) {
+                    PyErr_SetObject(PyExc_KeyError, args);
+                    Py_DECREF(args);
+                }
+            } else {
+                PyErr_SetObject(PyExc_KeyError, key);
+            }
+        }
+        return NULL;
+    }
+    Py_INCREF(value);
+    return value;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* GetAttr3 */
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r = __Pyx_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+}
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* UnpackUnboundCMethod */
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
+    PyObject *method;
+    method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
+    if (unlikely(!method))
+        return -1;
+    target->method = method;
+#if CYTHON_COMPILING_IN_CPYTHON
+    #if PY_MAJOR_VERSION >= 3
+    if (likely(__Pyx_TypeCheck(method, &PyMethodDescr_Type)))
+    #endif
+    {
+        PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
+        target->func = descr->d_method->ml_meth;
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_STACKLESS);
+    }
+#endif
+    return 0;
+}
+
+/* CallUnboundCMethod1 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
+    if (likely(cfunc->func)) {
+        int flag = cfunc->flag;
+        if (flag == METH_O) {
+            return (*(cfunc->func))(self, arg);
+        } else if (PY_VERSION_HEX >= 0x030600B1 && flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+                return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, &arg, 1);
+            #else
+                return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+            #endif
+        } else if (PY_VERSION_HEX >= 0x030700A0 && flag == (METH_FASTCALL | METH_KEYWORDS)) {
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+        }
+    }
+    return __Pyx__CallUnboundCMethod1(cfunc, self, arg);
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 0, arg);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 1, arg);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(2, self, arg);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+#endif
+bad:
+    Py_XDECREF(args);
+    return result;
+}
+
+/* CallUnboundCMethod2 */
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030600B1
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2) {
+    if (likely(cfunc->func)) {
+        PyObject *args[2] = {arg1, arg2};
+        if (cfunc->flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+            return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, args, 2);
+            #else
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, 2, NULL);
+            #endif
+        }
+        #if PY_VERSION_HEX >= 0x030700A0
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, 2, NULL);
+        #endif
+    }
+    return __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2);
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 0, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 1, arg2);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(3);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 1, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 2, arg2);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(3, self, arg1, arg2);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+#endif
+bad:
+    Py_XDECREF(args);
+    return result;
+}
+
+/* dict_getitem_default */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value) {
+    PyObject* value;
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (unlikely(PyErr_Occurred()))
+            return NULL;
+        value = default_value;
+    }
+    Py_INCREF(value);
+    if ((1));
+#else
+    if (PyString_CheckExact(key) || PyUnicode_CheckExact(key) || PyInt_CheckExact(key)) {
+        value = PyDict_GetItem(d, key);
+        if (unlikely(!value)) {
+            value = default_value;
+        }
+        Py_INCREF(value);
+    }
+#endif
+    else {
+        if (default_value == Py_None)
+            value = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyDict_Type_get, d, key);
+        else
+            value = __Pyx_CallUnboundCMethod2(&__pyx_umethod_PyDict_Type_get, d, key, default_value);
+    }
+    return value;
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
+/* pyfrozenset_new */
+static CYTHON_INLINE PyObject* __Pyx_PyFrozenSet_New(PyObject* it) {
+    if (it) {
+        PyObject* result;
+#if CYTHON_COMPILING_IN_PYPY
+        PyObject* args;
+        args = PyTuple_Pack(1, it);
+        if (unlikely(!args))
+            return NULL;
+        result = PyObject_Call((PyObject*)&PyFrozenSet_Type, args, NULL);
+        Py_DECREF(args);
+        return result;
+#else
+        if (PyFrozenSet_CheckExact(it)) {
+            Py_INCREF(it);
+            return it;
+        }
+        result = PyFrozenSet_New(it);
+        if (unlikely(!result))
+            return NULL;
+        if ((PY_VERSION_HEX >= 0x031000A1) || likely(PySet_GET_SIZE(result)))
+            return result;
+        Py_DECREF(result);
+#endif
+    }
+#if CYTHON_USE_TYPE_SLOTS
+    return PyFrozenSet_Type.tp_new(&PyFrozenSet_Type, __pyx_empty_tuple, NULL);
+#else
+    return PyObject_Call((PyObject*)&PyFrozenSet_Type, __pyx_empty_tuple, NULL);
+#endif
+}
+
+/* py_set_discard_unhashable */
+static int __Pyx_PySet_DiscardUnhashable(PyObject *set, PyObject *key) {
+    PyObject *tmpkey;
+    int rv;
+    if (likely(!PySet_Check(key) || !PyErr_ExceptionMatches(PyExc_TypeError)))
+        return -1;
+    PyErr_Clear();
+    tmpkey = __Pyx_PyFrozenSet_New(key);
+    if (tmpkey == NULL)
+        return -1;
+    rv = PySet_Discard(set, tmpkey);
+    Py_DECREF(tmpkey);
+    return rv;
+}
+
+/* py_set_discard */
+static CYTHON_INLINE int __Pyx_PySet_Discard(PyObject *set, PyObject *key) {
+    int found = PySet_Discard(set, key);
+    if (unlikely(found < 0)) {
+        found = __Pyx_PySet_DiscardUnhashable(set, key);
+    }
+    return found;
+}
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* py_dict_pop */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_Pop(PyObject *d, PyObject *key, PyObject *default_value) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX > 0x030600B3
+    if ((1)) {
+        return _PyDict_Pop(d, key, default_value);
+    } else
+#endif
+    if (default_value) {
+        return __Pyx_CallUnboundCMethod2(&__pyx_umethod_PyDict_Type_pop, d, key, default_value);
+    } else {
+        return __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyDict_Type_pop, d, key);
+    }
+}
+
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod0 */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
+}
+
+/* RaiseNoneIterError */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+/* UnpackTupleError */
+static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
+    if (t == Py_None) {
+      __Pyx_RaiseNoneNotIterableError();
+    } else if (PyTuple_GET_SIZE(t) < index) {
+      __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(t));
+    } else {
+      __Pyx_RaiseTooManyValuesError(index);
+    }
+}
+
+/* UnpackTuple2 */
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+        PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2, int decref_tuple) {
+    PyObject *value1 = NULL, *value2 = NULL;
+#if CYTHON_COMPILING_IN_PYPY
+    value1 = PySequence_ITEM(tuple, 0);  if (unlikely(!value1)) goto bad;
+    value2 = PySequence_ITEM(tuple, 1);  if (unlikely(!value2)) goto bad;
+#else
+    value1 = PyTuple_GET_ITEM(tuple, 0);  Py_INCREF(value1);
+    value2 = PyTuple_GET_ITEM(tuple, 1);  Py_INCREF(value2);
+#endif
+    if (decref_tuple) {
+        Py_DECREF(tuple);
+    }
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+#if CYTHON_COMPILING_IN_PYPY
+bad:
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+#endif
+}
+static int __Pyx_unpack_tuple2_generic(PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2,
+                                       int has_known_size, int decref_tuple) {
+    Py_ssize_t index;
+    PyObject *value1 = NULL, *value2 = NULL, *iter = NULL;
+    iternextfunc iternext;
+    iter = PyObject_GetIter(tuple);
+    if (unlikely(!iter)) goto bad;
+    if (decref_tuple) { Py_DECREF(tuple); tuple = NULL; }
+    iternext = Py_TYPE(iter)->tp_iternext;
+    value1 = iternext(iter); if (unlikely(!value1)) { index = 0; goto unpacking_failed; }
+    value2 = iternext(iter); if (unlikely(!value2)) { index = 1; goto unpacking_failed; }
+    if (!has_known_size && unlikely(__Pyx_IternextUnpackEndCheck(iternext(iter), 2))) goto bad;
+    Py_DECREF(iter);
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+unpacking_failed:
+    if (!has_known_size && __Pyx_IterFinish() == 0)
+        __Pyx_RaiseNeedMoreValuesError(index);
+bad:
+    Py_XDECREF(iter);
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+}
+
+/* dict_iter */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* iterable, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_source_is_dict) {
+    is_dict = is_dict || likely(PyDict_CheckExact(iterable));
+    *p_source_is_dict = is_dict;
+    if (is_dict) {
+#if !CYTHON_COMPILING_IN_PYPY
+        *p_orig_length = PyDict_Size(iterable);
+        Py_INCREF(iterable);
+        return iterable;
+#elif PY_MAJOR_VERSION >= 3
+        static PyObject *py_items = NULL, *py_keys = NULL, *py_values = NULL;
+        PyObject **pp = NULL;
+        if (method_name) {
+            const char *name = PyUnicode_AsUTF8(method_name);
+            if (strcmp(name, "iteritems") == 0) pp = &py_items;
+            else if (strcmp(name, "iterkeys") == 0) pp = &py_keys;
+            else if (strcmp(name, "itervalues") == 0) pp = &py_values;
+            if (pp) {
+                if (!*pp) {
+                    *pp = PyUnicode_FromString(name + 4);
+                    if (!*pp)
+                        return NULL;
+                }
+                method_name = *pp;
+            }
+        }
+#endif
+    }
+    *p_orig_length = 0;
+    if (method_name) {
+        PyObject* iter;
+        iterable = __Pyx_PyObject_CallMethod0(iterable, method_name);
+        if (!iterable)
+            return NULL;
+#if !CYTHON_COMPILING_IN_PYPY
+        if (PyTuple_CheckExact(iterable) || PyList_CheckExact(iterable))
+            return iterable;
+#endif
+        iter = PyObject_GetIter(iterable);
+        Py_DECREF(iterable);
+        return iter;
+    }
+    return PyObject_GetIter(iterable);
+}
+static CYTHON_INLINE int __Pyx_dict_iter_next(
+        PyObject* iter_obj, CYTHON_NCP_UNUSED Py_ssize_t orig_length, CYTHON_NCP_UNUSED Py_ssize_t* ppos,
+        PyObject** pkey, PyObject** pvalue, PyObject** pitem, int source_is_dict) {
+    PyObject* next_item;
+#if !CYTHON_COMPILING_IN_PYPY
+    if (source_is_dict) {
+        PyObject *key, *value;
+        if (unlikely(orig_length != PyDict_Size(iter_obj))) {
+            PyErr_SetString(PyExc_RuntimeError, "dictionary changed size during iteration");
+            return -1;
+        }
+        if (unlikely(!PyDict_Next(iter_obj, ppos, &key, &value))) {
+            return 0;
+        }
+        if (pitem) {
+            PyObject* tuple = PyTuple_New(2);
+            if (unlikely(!tuple)) {
+                return -1;
+            }
+            Py_INCREF(key);
+            Py_INCREF(value);
+            PyTuple_SET_ITEM(tuple, 0, key);
+            PyTuple_SET_ITEM(tuple, 1, value);
+            *pitem = tuple;
+        } else {
+            if (pkey) {
+                Py_INCREF(key);
+                *pkey = key;
+            }
+            if (pvalue) {
+                Py_INCREF(value);
+                *pvalue = value;
+            }
+        }
+        return 1;
+    } else if (PyTuple_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyTuple_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyTuple_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else if (PyList_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyList_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyList_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else
+#endif
+    {
+        next_item = PyIter_Next(iter_obj);
+        if (unlikely(!next_item)) {
+            return __Pyx_IterFinish();
+        }
+    }
+    if (pitem) {
+        *pitem = next_item;
+    } else if (pkey && pvalue) {
+        if (__Pyx_unpack_tuple2(next_item, pkey, pvalue, source_is_dict, source_is_dict, 1))
+            return -1;
+    } else if (pkey) {
+        *pkey = next_item;
+    } else {
+        *pvalue = next_item;
+    }
+    return 1;
+}
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* HasAttr */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (unlikely(!r)) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* GetVTable */
+static void* __Pyx_GetVtable(PyObject *dict) {
+    void* ptr;
+    PyObject *ob = PyObject_GetItem(dict, __pyx_n_s_pyx_vtable);
+    if (!ob)
+        goto bad;
+#if PY_VERSION_HEX >= 0x02070000
+    ptr = PyCapsule_GetPointer(ob, 0);
+#else
+    ptr = PyCObject_AsVoidPtr(ob);
+#endif
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* GetNameInClass */
+static PyObject *__Pyx_GetGlobalNameAfterAttributeLookup(PyObject *name) {
+    PyObject *result;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    __Pyx_GetModuleGlobalNameUncached(result, name);
+    return result;
+}
+static PyObject *__Pyx__GetNameInClass(PyObject *nmspace, PyObject *name) {
+    PyObject *result;
+    result = __Pyx_PyObject_GetAttrStr(nmspace, name);
+    if (!result) {
+        result = __Pyx_GetGlobalNameAfterAttributeLookup(name);
+    }
+    return result;
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* FunctionExport */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(__pyx_m, (char *)"__pyx_capi__");
+    if (!d) {
+        PyErr_Clear();
+        d = PyDict_New();
+        if (!d)
+            goto bad;
+        Py_INCREF(d);
+        if (PyModule_AddObject(__pyx_m, (char *)"__pyx_capi__", d) < 0)
+            goto bad;
+    }
+    tmp.fp = f;
+#if PY_VERSION_HEX >= 0x02070000
+    cobj = PyCapsule_New(tmp.p, sig, 0);
+#else
+    cobj = PyCObject_FromVoidPtrAndDesc(tmp.p, (void *)sig, 0);
+#endif
+    if (!cobj)
+        goto bad;
+    if (PyDict_SetItemString(d, name, cobj) < 0)
+        goto bad;
+    Py_DECREF(cobj);
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(cobj);
+    Py_XDECREF(d);
+    return -1;
+}
+
+/* VoidPtrImport */
+#ifndef __PYX_HAVE_RT_ImportVoidPtr_0_29_37
+#define __PYX_HAVE_RT_ImportVoidPtr_0_29_37
+static int __Pyx_ImportVoidPtr_0_29_37(PyObject *module, const char *name, void **p, const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
+    if (!d)
+        goto bad;
+    cobj = PyDict_GetItemString(d, name);
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C variable %.200s",
+                PyModule_GetName(module), name);
+        goto bad;
+    }
+#if PY_VERSION_HEX >= 0x02070000
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C variable %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), name, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    *p = PyCapsule_GetPointer(cobj, sig);
+#else
+    {const char *desc, *s1, *s2;
+    desc = (const char *)PyCObject_GetDesc(cobj);
+    if (!desc)
+        goto bad;
+    s1 = desc; s2 = sig;
+    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
+    if (*s1 != *s2) {
+        PyErr_Format(PyExc_TypeError,
+            "C variable %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), name, sig, desc);
+        goto bad;
+    }
+    *p = PyCObject_AsVoidPtr(cobj);}
+#endif
+    if (!(*p))
+        goto bad;
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    return -1;
+}
+#endif
+
+/* FunctionImport */
+#ifndef __PYX_HAVE_RT_ImportFunction_0_29_37
+#define __PYX_HAVE_RT_ImportFunction_0_29_37
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
+    if (!d)
+        goto bad;
+    cobj = PyDict_GetItemString(d, funcname);
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C function %.200s",
+                PyModule_GetName(module), funcname);
+        goto bad;
+    }
+#if PY_VERSION_HEX >= 0x02070000
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C function %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), funcname, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    tmp.p = PyCapsule_GetPointer(cobj, sig);
+#else
+    {const char *desc, *s1, *s2;
+    desc = (const char *)PyCObject_GetDesc(cobj);
+    if (!desc)
+        goto bad;
+    s1 = desc; s2 = sig;
+    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
+    if (*s1 != *s2) {
+        PyErr_Format(PyExc_TypeError,
+            "C function %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), funcname, sig, desc);
+        goto bad;
+    }
+    tmp.p = PyCObject_AsVoidPtr(cobj);}
+#endif
+    *f = tmp.fp;
+    if (!(*f))
+        goto bad;
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    return -1;
+}
+#endif
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
@@ -1,7 +1,20 @@
 from traceutils.as2org.as2org cimport AS2Org
 from traceutils.radix.ip2as cimport IP2AS
 
+from bdrmapit.graph.node cimport Interface, Router
+
 cdef class Graph:
     cdef readonly dict interfaces, routers
+    cdef readonly bint packed
+
+    cdef object _key(self, object addr);
+    cpdef Interface get_interface(self, object addr);
+    cpdef bint has_interface(self, object addr);
 
-cpdef Graph construct_graph(list addrs, dict nexthop, dict multi, dict dps, list mpls, IP2AS ip2as, AS2Org as2org, str nodes_file=*, int increment=*);
+cpdef tuple classify(object nextadjs, object multiadjs, object loopadjs, object first, object dps, object echos, IP2AS ip2as, bint loop=*, bint no_echos=*, int increment=*);
+cpdef Interface create_node(dict interfaces, dict routers, str addr, Router router, IP2AS ip2as, AS2Org as2org, bint packed=*);
+cpdef void create_remaining(dict interfaces, dict routers, object addrs, Py_ssize_t num_addrs, bint aliases, IP2AS ip2as, AS2Org as2org, bint packed=*, int increment=*) except *;
+cpdef void add_nexthop(dict interfaces, dict nexthops, bint packed=*, bint release=*, int increment=*) except *;
+cpdef void add_multi(dict interfaces, dict multi, bint packed=*, bint release=*, int increment=*) except *;
+cpdef void add_dest_pairs(dict interfaces, set dps, bint packed=*, int increment=*) except *;
+cpdef void add_hints(dict interfaces, dict hints, bint packed=*) except *;
@@ -1,13 +1,15 @@
 from traceutils.as2org.as2org cimport AS2Org
-from traceutils.file2.file2 cimport File2
 from traceutils.progress.bar import Progress
 from traceutils.radix.ip2as cimport IP2AS
 
-from bdrmapit.graph.node cimport Interface, Router
+from bdrmapit.graph.node cimport Interface, Router, pack_addr, unpack_addr
 
 
 cdef class Graph:
-    def __init__(self, dict interfaces=None, dict routers=None):
+    def __init__(self, dict interfaces=None, dict routers=None, bint packed=False):
+        """
+        :param packed: interfaces are keyed by packed addresses rather than address strings
+        """
         if interfaces is None:
             self.interfaces = {}
         else:
@@ -16,137 +18,270 @@ cdef class Graph:
             self.routers = {}
         else:
             self.routers = routers
+        self.packed = packed
 
+    cdef object _key(self, object addr):
+        if self.packed:
+            if isinstance(addr, str):
+                return pack_addr(addr)
+        elif isinstance(addr, bytes):
+            return unpack_addr(addr)
+        return addr
 
-# @cython.nonecheck(False)
-# @cython.overflowcheck(False)
-cpdef Graph construct_graph(list addrs, dict nexthop, dict multi, dict dps, list mpls, IP2AS ip2as, AS2Org as2org, str nodes_file=None, int increment=100000):
-    cdef dict interfaces = {}, routers = {}
-    cdef str addr, edge, nid
-    cdef int asn, i, predcount
-    cdef Interface interface, succ
+    cpdef Interface get_interface(self, object addr):
+        """
+        Look up an interface by address string or packed address.
+        """
+        return self.interfaces[self._key(addr)]
+
+    cpdef bint has_interface(self, object addr):
+        return self._key(addr) in self.interfaces
+
+    def save(self, filename):
+        """
+        Save the graph in the flat binary layout of bdrmapit.graph.serialize.
+        """
+        from bdrmapit.graph.serialize import save_graph
+        save_graph(self, filename)
+
+    @staticmethod
+    def load(filename):
+        """
+        Load a graph written by save.
+        """
+        from bdrmapit.graph.serialize import load_graph
+        return load_graph(filename)
+
+    def subgraph(self, asns=None, prefixes=None, int hops=1):
+        """
+        Copy the neighborhood of the routers with interfaces in the ASes or prefixes, see
+        bdrmapit.graph.subgraph.extract_subgraph.
+        """
+        from bdrmapit.graph.subgraph import extract_subgraph
+        return extract_subgraph(self, asns=asns, prefixes=prefixes, hops=hops)
+
+
+cdef inline object _key(str addr, bint packed):
+    if packed:
+        return pack_addr(addr)
+    return addr
+
+
+cdef inline void _add_edge(dict edges, str x, str y, long count) except *:
+    cdef dict succs = edges.get(x)
+    if succs is None:
+        succs = {}
+        edges[x] = succs
+    succs[y] = count
+
+
+cpdef tuple classify(object nextadjs, object multiadjs, object loopadjs, object first, object dps, object echos, IP2AS ip2as, bint loop=True, bint no_echos=False, int increment=1000000):
+    """
+    Select the graph addresses and classify the adjacencies as nexthop or multihop edges, in one pass over each
+    adjacency counter.
+    :param nextadjs: adjacency counter, any mapping such as the ParseResults Counter
+    :param first: first hop counter keyed by (vantage point ID, addr)
+    :param dps: (addr, destination AS) pairs
+    :param loop: ignore adjacencies seen as often in loops as in traces
+    :param no_echos: ignore echo-only addresses
+    :return: addresses, nexthop edges, multihop edges, with edges as {x: {y: observations}} and observations of an
+    adjacency counted in both nextadjs and multiadjs
+    """
+    cdef set addrs = set(), firstaddrs = set()
+    cdef dict nexthops = {}, multi = {}
+    cdef tuple pair
+    cdef str x, y
+    cdef long n, m
+    cdef int xasn, yasn
+    cdef object count
+
+    for pair in first:
+        firstaddrs.add(pair[1])
+    pb = Progress(len(nextadjs), 'Classifying nexthop adjacencies', increment=increment)
+    for pair, count in pb.iterator(nextadjs.items()):
+        x = pair[0]
+        y = pair[1]
+        n = count
+        m = multiadjs.get(pair, 0)
+        if not loop or n + m > <long>loopadjs.get(pair, 0):
+            addrs.add(x)
+            addrs.add(y)
+            firstaddrs.discard(y)
+            if x != y and (n > m or ip2as.asn(x) == ip2as.asn(y)):
+                _add_edge(nexthops, x, y, n + m)
+    pb = Progress(len(multiadjs), 'Classifying multihop adjacencies', increment=increment)
+    for pair, count in pb.iterator(multiadjs.items()):
+        x = pair[0]
+        y = pair[1]
+        m = count
+        count = nextadjs.get(pair)
+        n = 0 if count is None else count
+        if not loop or n + m > <long>loopadjs.get(pair, 0):
+            # Addresses of adjacencies also in nextadjs were selected in the first pass
+            if count is None:
+                addrs.add(x)
+                addrs.add(y)
+                firstaddrs.discard(y)
+            if x != y:
+                xasn = ip2as.asn(x)
+                yasn = ip2as.asn(y)
+                if xasn > 0 and yasn > 0 and xasn == yasn:
+                    _add_edge(nexthops, x, y, n + m)
+                elif x not in nexthops:
+                    _add_edge(multi, x, y, n + m)
+    addrs |= firstaddrs
+    for pair in dps:
+        addrs.add(pair[0])
+    if not no_echos:
+        addrs |= echos
+    return addrs, nexthops, multi
+
+
+cpdef Interface create_node(dict interfaces, dict routers, str addr, Router router, IP2AS ip2as, AS2Org as2org, bint packed=False):
+    """
+    Create new interface node and assign it to router.
+    :return: the interface, or None for private addresses
+    """
+    cdef int asn = ip2as.asn(addr)
+    cdef object key
+    cdef Interface interface
+    # Make sure address is not from private address space
+    if asn >= 0 or asn <= -100:
+        key = _key(addr, packed)
+        interface = Interface(key, asn, as2org[asn])
+        interfaces[key] = interface
+        router.add_interface(interface)
+        routers[router.name] = router
+        return interface
+    return None
+
+
+cpdef void create_remaining(dict interfaces, dict routers, object addrs, Py_ssize_t num_addrs, bint aliases, IP2AS ip2as, AS2Org as2org, bint packed=False, int increment=100000) except *:
+    """
+    Create a single interface router for each address not already assigned to a router. The remaining addresses are
+    selected first, then their origin ASes are resolved and the routers and interfaces are created in one loop, with
+    one org lookup per AS.
+    :param addrs: iterable of distinct addresses
+    :param num_addrs: number of addresses, for status
+    :param aliases: alias resolution was used
+    """
+    cdef str addr
+    cdef object key
+    cdef list remaining = [], keys = []
+    cdef dict orgs = {}
+    cdef Py_ssize_t i, n
+    cdef int asn
+    cdef str org
     cdef Router router
-    cdef list edges, dests, naddrs
-    cdef set origins
-
-    interfaces = {}
-    routers = {}
-    if nodes_file is not None:
-        pb = Progress(message='Creating nodes', increment=increment)
-        with File2(nodes_file, 'rt') as f:
-            for line in pb.iterator(f):
-                if line[0] != '#':
-                    _, nid, *naddrs = line.split()
-                    nid = nid[:-1]
-                    router = Router(nid)
-                    routers[router.name] = router
-                    for addr in naddrs:
-                        asn = ip2as.asn(addr)
-                        if asn > 0 or asn <= -100:
-                            interface = Interface(addr, asn, as2org[asn])
-                            interfaces[addr] = interface
-                            interface.router = router
-                            router.interfaces.append(interface)
-                            interface.router = router
-                            router.interfaces.append(interface)
-                            routers[router.name] = router
-    pb = Progress(len(addrs), 'Creating remaining routers and interfaces', increment=increment)
+    cdef Interface interface
+
+    pb = Progress(num_addrs, 'Selecting remaining addresses', increment=increment)
     for addr in pb.iterator(addrs):
-        if nodes_file is None or addr not in interfaces:
-            asn = ip2as.asn(addr)
-            interface = Interface(addr, asn, as2org[asn])
-            interfaces[addr] = interface
-            router = Router(interface.addr)
-            interface.router = router
-            router.interfaces.append(interface)
-            routers[router.name] = router
-    pb = Progress(len(mpls), 'Noting MPLS interfaces', increment=increment)
-    for addr in pb.iterator(mpls):
-        interface = interfaces[addr]
-        interface.mpls = True
-    # for interface in interfaces.values():
-    #     if not interface.router:
-    #         router = Router(interface.addr)
-    #         interface.router = router
-    #         router.interfaces.append(interface)
-    #         routers[router.name] = router
-    pb = Progress(len(nexthop), 'Adding nexthop edges', increment=increment)
-    for addr, edges in pb.iterator(nexthop.items()):
-        interface = interfaces[addr]
+        key = _key(addr, packed)
+        if not aliases or key not in interfaces:
+            remaining.append(addr)
+            keys.append(key)
+    n = len(remaining)
+    pb = Progress(n, 'Creating remaining routers and interfaces', increment=increment)
+    for i in pb.iterator(range(n)):
+        addr = remaining[i]
+        key = keys[i]
+        asn = ip2as.asn(addr)
+        # Make sure address is not from private address space
+        if asn >= 0 or asn <= -100:
+            if asn in orgs:
+                org = orgs[asn]
+            else:
+                org = orgs[asn] = as2org[asn]
+            router = Router(addr)
+            interface = Interface(key, asn, org)
+            router.add_interface(interface)
+            interfaces[key] = interface
+            routers[addr] = router
+
+
+cpdef void add_nexthop(dict interfaces, dict nexthops, bint packed=False, bint release=False, int increment=100000) except *:
+    """
+    Add nexthop edges, with origin ASes, predecessor counts, and observation counts.
+    :param nexthops: {addr: {successor addr: observations}}
+    :param release: empty nexthops as the edges are added
+    """
+    cdef str addr, edge
+    cdef dict edges
+    cdef long count
+    cdef Interface interface, succ
+    cdef Router router
+
+    pb = Progress(len(nexthops), 'Adding nexthop edges', increment=increment)
+    for addr in pb.iterator(list(nexthops) if release else nexthops):
+        edges = nexthops.pop(addr) if release else nexthops[addr]
+        interface = interfaces[_key(addr, packed)]
         router = interface.router
         router.nexthop = True
-        for i in range(len(edges)):
-            edge = edges[i]
-            succ = interfaces[edge]
-            if succ in router.succ:
-                origins = router.origins[succ]
-                origins.add(interface.asn)
-            else:
-                router.succ.add(succ)
-                router.origins[succ] = {interface.asn}
-            predcount = succ.pred.get(router, 0)
-            succ.pred[router] = predcount + 1
+        for edge, count in edges.items():
+            succ = interfaces[_key(edge, packed)]
+            if succ.router is not router:
+                router.add_succ(succ, interface.asn, count)
+                succ.add_pred(router, count)
+
+
+cpdef void add_multi(dict interfaces, dict multi, bint packed=False, bint release=False, int increment=100000) except *:
+    """
+    Add multihop edges for routers without nexthop edges.
+    :param multi: {addr: {successor addr: observations}}
+    :param release: empty multi as the edges are added
+    """
+    cdef str addr, edge
+    cdef dict edges
+    cdef long count
+    cdef Interface interface, succ
+    cdef Router router
+
     pb = Progress(len(multi), 'Adding multihop edges', increment=increment)
-    for addr in pb.iterator(multi):
-        interface = interfaces[addr]
+    for addr in pb.iterator(list(multi) if release else multi):
+        edges = multi.pop(addr) if release else multi[addr]
+        interface = interfaces[_key(addr, packed)]
         router = interface.router
         if not router.nexthop:
-            edges = multi[addr]
-            for edge in edges:
-                succ = interfaces[edge]
-                if succ in router.succ:
-                    router.origins[succ].add(interface.asn)
-                else:
-                    router.succ.add(succ)
-                    router.origins[succ] = {interface.asn}
+            for edge, count in edges.items():
+                succ = interfaces[_key(edge, packed)]
+                if succ.router is not router:
+                    router.add_succ(succ, interface.asn, count)
+
+
+cpdef void add_dest_pairs(dict interfaces, set dps, bint packed=False, int increment=1000000) except *:
+    """
+    Add the destination ASes of (addr, destination AS) pairs to the interfaces.
+    """
+    cdef tuple pair
+    cdef int asn
+    cdef Interface interface
+
     pb = Progress(len(dps), 'Adding destination ASes', increment=increment)
-    for addr, dests in pb.iterator(dps.items()):
-        interface = interfaces[addr]
-        interface.dests.update(dests)
-    return Graph(interfaces=interfaces, routers=routers)
-
-    # for i in range(len(addrs)):
-    #     addr = addrs[i]
-    #     asn = ip2as.asn(addr)
-    #     interface = Interface(addr, asn, as2org[asn])
-    #     interfaces[addr] = interface
-    # for addr in mpls:
-    #     interface = interfaces[addr]
-    #     interface.mpls = True
-    # for interface in interfaces.values():
-    #     if not interface.router:
-    #         router = Router(interface.addr)
-    #         interface.router = router
-    #         router.interfaces.append(interface)
-    #         routers[router.name] = router
-    # for addr, edges in nexthop.items():
-    #     interface = interfaces[addr]
-    #     router = interface.router
-    #     router.nexthop = True
-    #     for i in range(len(edges)):
-    #         edge = edges[i]
-    #         succ = interfaces[edge]
-    #         if succ in router.succ:
-    #             origins = router.origins[succ]
-    #             origins.add(interface.asn)
-    #         else:
-    #             router.succ.add(succ)
-    #             router.origins[succ] = {interface.asn}
-    #         predcount = succ.pred.get(router, 0)
-    #         succ.pred[router] = predcount + 1
-    # for addr in multi:
-    #     interface = interfaces[addr]
-    #     router = interface.router
-    #     if not router.nexthop:
-    #         edges = multi[addr]
-    #         for edge in edges:
-    #             succ = interfaces[edge]
-    #             if succ in router.succ:
-    #                 router.origins[succ].add(interface.asn)
-    #             else:
-    #                 router.succ.add(succ)
-    #                 router.origins[succ] = {interface.asn}
-    # for addr, dests in dps.items():
-    #     interface = interfaces[addr]
-    #     interface.dests.update(dests)
-    # return Graph(interfaces=interfaces, routers=routers)
+    for pair in pb.iterator(dps):
+        asn = pair[1]
+        if asn > 0:
+            interface = interfaces.get(_key(pair[0], packed))
+            if interface is not None:
+                interface.dests.add(asn)
+
+
+cpdef void add_hints(dict interfaces, dict hints, bint packed=False) except *:
+    """
+    Set interface hints, and collect them in each router's hints.
+    :param hints: addr to hint AS
+    """
+    cdef str addr
+    cdef int hint
+    cdef Interface interface
+    cdef Router router
+
+    for addr, hint in hints.items():
+        interface = interfaces.get(_key(addr, packed))
+        if interface is not None:
+            interface.hint = hint
+            router = interface.router
+            if not router.hints:
+                router.hints = {hint}
+            else:
+                router.hints.add(hint)
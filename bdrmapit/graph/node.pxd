@@ -1,31 +1,53 @@
+cdef class Origins:
+    cdef dict data
+
+    cpdef void add(self, object succ, long asn) except *;
+    cpdef void update(self, object succ, object asns) except *;
+    cpdef void clear(self);
+    cpdef Origins copy(self);
+
+cdef class Interface
+
 cdef class Router:
     cdef:
         readonly str name
         readonly list interfaces
         public bint nexthop
         public bint vrf
-        readonly set succ
-        readonly set dests
-        readonly dict origins
+        set _succ
+        set _dests
+        Origins _origins
+        dict _counts
         public bint echo
         public bint cycle
         public set hints
 
+    cdef void _add_count(self, object succ, long count) except *;
+    cpdef void add_interface(self, Interface interface) except *;
+    cpdef void add_succ(self, object succ, long asn, long count=*) except *;
+    cpdef void add_origins(self, object succ, object asns, long count=*) except *;
+    cpdef void add_dests(self, object dests) except *;
+    cpdef void clear_edges(self);
     cpdef Router copy(self);
 
+cpdef bytes pack_addr(str addr);
+cpdef str unpack_addr(bytes packed);
+
 cdef class Interface:
     cdef:
-        readonly str addr
+        readonly object key
         readonly int asn
         readonly str org
         public Router router
         readonly dict pred
+        dict _pred_counts
         public set dests
         public bint vrf
         public bint echo
         public bint cycle
         public int hint
 
+    cpdef void add_pred(self, Router router, long count=*, long edges=*) except *;
     cpdef Interface copy(self);
 
 ctypedef fused Node:
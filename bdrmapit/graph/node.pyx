@@ -1,4 +1,105 @@
 # from collections import defaultdict
+from types import MappingProxyType
+from socket import inet_pton, inet_ntop, AF_INET, AF_INET6
+
+
+cpdef bytes pack_addr(str addr):
+    """
+    Pack an address into its 4 byte IPv4 or 16 byte IPv6 network representation.
+    """
+    if ':' in addr:
+        return inet_pton(AF_INET6, addr)
+    return inet_pton(AF_INET, addr)
+
+
+cpdef str unpack_addr(bytes packed):
+    """
+    Format a packed address as a string.
+    """
+    if len(packed) == 4:
+        return inet_ntop(AF_INET, packed)
+    return inet_ntop(AF_INET6, packed)
+
+
+cdef class Origins:
+    """
+    Origin ASes seen before each successor of a router. Nearly every successor has a single origin AS, so it is stored
+    as an int, and only promoted to a sorted tuple when a second AS is added. Lookups always return a tuple.
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    def __getitem__(self, succ):
+        value = self.data[succ]
+        if isinstance(value, tuple):
+            return value
+        return (value,)
+
+    def __setitem__(self, succ, asns):
+        self.data.pop(succ, None)
+        self.update(succ, asns)
+
+    def __delitem__(self, succ):
+        del self.data[succ]
+
+    def __contains__(self, succ):
+        return succ in self.data
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __repr__(self):
+        return 'Origins({})'.format({succ: self[succ] for succ in self.data})
+
+    def get(self, succ, default=None):
+        if succ in self.data:
+            return self[succ]
+        return default
+
+    def keys(self):
+        return self.data.keys()
+
+    def values(self):
+        for succ in self.data:
+            yield self[succ]
+
+    def items(self):
+        for succ in self.data:
+            yield succ, self[succ]
+
+    cpdef void add(self, object succ, long asn) except *:
+        cdef object value = self.data.get(succ)
+        if value is None:
+            self.data[succ] = asn
+        elif isinstance(value, tuple):
+            if asn not in value:
+                self.data[succ] = tuple(sorted(value + (asn,)))
+        elif value != asn:
+            self.data[succ] = (value, asn) if value < asn else (asn, value)
+
+    cpdef void update(self, object succ, object asns) except *:
+        cdef long asn
+        for asn in asns:
+            self.add(succ, asn)
+
+    cpdef void clear(self):
+        self.data.clear()
+
+    cpdef Origins copy(self):
+        cdef Origins origins = Origins()
+        origins.data.update(self.data)
+        return origins
+
+
+# Shared by every router without successors or destinations, and never modified
+EMPTY = frozenset()
+EMPTY_ORIGINS = Origins()
+EMPTY_COUNTS = MappingProxyType({})
+
 
 cdef class Router:
 
@@ -7,34 +108,133 @@ cdef class Router:
         self.interfaces = []
         self.nexthop = False
         self.vrf = False
-        self.succ = set()
-        self.dests = set()
-        self.origins = {}
+        # Edge and destination containers are only allocated when the first one is added, since most routers are
+        # single interface routers without successors
+        self._succ = None
+        self._dests = None
+        self._origins = None
+        self._counts = None
         # self.origins = defaultdict(set)
         self.hints = None
 
     def __repr__(self):
         return 'Router<{}>'.format(self.name)
 
+    @property
+    def succ(self):
+        """
+        Successor interfaces and VRF edges. Read-only, use add_succ and clear_edges to modify.
+        """
+        if self._succ is None:
+            return EMPTY
+        return self._succ
+
+    @property
+    def dests(self):
+        """
+        Destination ASes. Read-only, use add_dests to modify.
+        """
+        if self._dests is None:
+            return EMPTY
+        return self._dests
+
+    @property
+    def origins(self):
+        """
+        Origin ASes of each successor. Read-only, use add_succ, add_origins, and clear_edges to modify.
+        """
+        if self._origins is None:
+            return EMPTY_ORIGINS
+        return self._origins
+
+    @property
+    def counts(self):
+        """
+        Number of times each successor was observed, summed over the router's interfaces. For shared VRF edges, the
+        number of address-level edges each one stands for. Only successors added with counts are included.
+        """
+        if self._counts is None:
+            return EMPTY_COUNTS
+        return self._counts
+
+    cpdef void add_interface(self, Interface interface) except *:
+        interface.router = self
+        self.interfaces.append(interface)
+
+    cdef void _add_count(self, object succ, long count) except *:
+        if self._counts is None:
+            self._counts = {succ: count}
+        else:
+            self._counts[succ] = self._counts.get(succ, 0) + count
+
+    cpdef void add_succ(self, object succ, long asn, long count=0) except *:
+        """
+        Add a successor, seen after an interface with origin AS asn.
+        :param count: observations of the edge
+        """
+        if self._succ is None:
+            self._succ = set()
+            self._origins = Origins()
+        self._succ.add(succ)
+        self._origins.add(succ, asn)
+        if count:
+            self._add_count(succ, count)
+
+    cpdef void add_origins(self, object succ, object asns, long count=0) except *:
+        """
+        Add a successor with several origin ASes.
+        :param count: observations of the edge
+        """
+        if self._succ is None:
+            self._succ = set()
+            self._origins = Origins()
+        self._succ.add(succ)
+        self._origins.update(succ, asns)
+        if count:
+            self._add_count(succ, count)
+
+    cpdef void add_dests(self, object dests) except *:
+        if dests:
+            if self._dests is None:
+                self._dests = set(dests)
+            else:
+                self._dests.update(dests)
+
+    cpdef void clear_edges(self):
+        """
+        Remove all successors, with their origins and counts.
+        """
+        self._succ = None
+        self._origins = None
+        self._counts = None
+
     cpdef Router copy(self):
-        router = Router(self.name)
+        cdef Router router = Router(self.name)
         router.interfaces.extend(self.interfaces)
         router.nexthop = self.nexthop
         router.vrf = self.vrf
-        router.succ.update(self.succ)
-        router.dests.update(self.dests)
-        router.origins.update(self.origins)
+        if self._succ is not None:
+            router._succ = set(self._succ)
+            router._origins = self._origins.copy()
+        if self._counts is not None:
+            router._counts = dict(self._counts)
+        if self._dests is not None:
+            router._dests = set(self._dests)
         router.hints = self.hints
         return router
 
 cdef class Interface:
 
-    def __init__(self, str addr, int asn, str org):
-        self.addr = addr
+    def __init__(self, addr, int asn, str org):
+        """
+        :param addr: address string, or packed address when the graph stores packed addresses
+        """
+        self.key = addr
         self.asn = asn
         self.org = org
         self.router = None
         self.pred = {}
+        self._pred_counts = None
         self.dests = set()
         self.vrf = False
         # self.mpls = False
@@ -43,10 +243,49 @@ cdef class Interface:
     def __repr__(self):
         return 'Interface<{} {}>'.format(self.addr, self.asn)
 
+    @property
+    def addr(self):
+        """
+        Address string, formatted on access when the address is stored packed.
+        """
+        if isinstance(self.key, bytes):
+            return unpack_addr(self.key)
+        return self.key
+
+    @property
+    def packed(self):
+        if isinstance(self.key, bytes):
+            return self.key
+        return pack_addr(self.key)
+
+    @property
+    def pred_counts(self):
+        """
+        Number of times each predecessor router was observed before the interface.
+        """
+        if self._pred_counts is None:
+            return EMPTY_COUNTS
+        return self._pred_counts
+
+    cpdef void add_pred(self, Router router, long count=0, long edges=1) except *:
+        """
+        Count nexthop edges from router.
+        :param count: observations of the edges
+        :param edges: number of edges, one per router interface
+        """
+        self.pred[router] = self.pred.get(router, 0) + edges
+        if count:
+            if self._pred_counts is None:
+                self._pred_counts = {router: count}
+            else:
+                self._pred_counts[router] = self._pred_counts.get(router, 0) + count
+
     cpdef Interface copy(self):
-        iface = Interface(self.addr, self.asn, self.org)
+        cdef Interface iface = Interface(self.key, self.asn, self.org)
         iface.router = self.router
         iface.pred.update(self.pred)
+        if self._pred_counts is not None:
+            iface._pred_counts = dict(self._pred_counts)
         iface.dests.update(self.dests)
         iface.vrf = self.vrf
         iface.hint = self.hint
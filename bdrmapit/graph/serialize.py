@@ -0,0 +1,325 @@
+import mmap
+import struct
+from array import array
+from collections import Counter
+
+from traceutils.progress.bar import Progress
+
+from bdrmapit.graph.construct import Graph
+from bdrmapit.graph.node import Interface, Router
+from bdrmapit.vrf.vrfedge import VRFEdge, VType
+
+MAGIC = b'BDRGRAPH'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQ')
+SECTION = struct.Struct('<16s1sxxxxxxxQQ')
+
+# Graph flags
+PACKED = 1
+
+# Router flags
+R_NEXTHOP = 1
+R_VRF = 2
+R_ECHO = 4
+R_CYCLE = 8
+R_HINTS = 16
+
+# Interface flags
+I_VRF = 1
+I_ECHO = 2
+I_CYCLE = 4
+
+
+def is_graph(filename):
+    """
+    Check whether a file is a graph written by save_graph.
+    """
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class Columns:
+    """
+    Named typed arrays, with variable length rows stored as an offsets column and a values column.
+    """
+
+    def __init__(self):
+        self.columns = {}
+
+    def column(self, name, typecode):
+        col = self.columns.get(name)
+        if col is None:
+            col = self.columns[name] = array(typecode)
+        return col
+
+    def rows(self, name, typecode, rows):
+        offsets = self.column(name + '.off', 'Q')
+        values = self.column(name, typecode)
+        offsets.append(0)
+        for row in rows:
+            values.extend(row)
+            offsets.append(len(values))
+
+    def strings(self, name, strings):
+        offsets = self.column(name + '.off', 'Q')
+        blob = self.column(name, 'B')
+        offsets.append(0)
+        for s in strings:
+            blob.frombytes(s if isinstance(s, bytes) else s.encode())
+            offsets.append(len(blob))
+
+    def write(self, filename, flags):
+        names = list(self.columns)
+        offset = HEADER.size + SECTION.size * len(names)
+        table = []
+        for name in names:
+            col = self.columns[name]
+            offset += -offset % 8
+            table.append(SECTION.pack(name.encode(), col.typecode.encode(), offset, len(col)))
+            offset += col.itemsize * len(col)
+        with open(filename, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, flags, len(names)))
+            for entry in table:
+                f.write(entry)
+            for name in names:
+                f.write(bytes(-f.tell() % 8))
+                self.columns[name].tofile(f)
+
+
+def save_graph(graph: Graph, filename, increment=100000):
+    """
+    Write a graph as flat columns. Routers and interfaces are numbered by their position in the graph dictionaries,
+    and edges, preds, and memberships refer to those numbers.
+    """
+    routers = list(graph.routers.values())
+    interfaces = list(graph.interfaces.values())
+    rindex = {id(router): i for i, router in enumerate(routers)}
+    iindex = {id(interface): i for i, interface in enumerate(interfaces)}
+    vrfedges = []
+    vindex = {}
+    orgs = {}
+    cols = Columns()
+
+    cols.strings('i.key', [interface.key for interface in interfaces])
+    cols.column('i.asn', 'q').extend(interface.asn for interface in interfaces)
+    cols.column('i.org', 'I').extend(orgs.setdefault(interface.org, len(orgs)) for interface in interfaces)
+    cols.column('i.router', 'q').extend(rindex[id(interface.router)] if interface.router is not None else -1 for interface in interfaces)
+    cols.column('i.flags', 'B').extend(interface.vrf * I_VRF | interface.echo * I_ECHO | interface.cycle * I_CYCLE for interface in interfaces)
+    cols.column('i.hint', 'q').extend(interface.hint for interface in interfaces)
+    cols.rows('i.dests', 'q', (interface.dests for interface in interfaces))
+    cols.rows('i.pred', 'I', ([rindex[id(router)] for router in interface.pred] for interface in interfaces))
+    cols.column('i.predcount', 'Q').extend(n for interface in interfaces for n in interface.pred.values())
+    cols.column('i.predobs', 'Q').extend(interface.pred_counts.get(router, 0) for interface in interfaces for router in interface.pred)
+    cols.strings('orgs', [org if org is not None else '' for org in orgs])
+
+    cols.strings('r.name', [router.name for router in routers])
+    cols.column('r.flags', 'B').extend(
+        router.nexthop * R_NEXTHOP | router.vrf * R_VRF | router.echo * R_ECHO | router.cycle * R_CYCLE | (router.hints is not None) * R_HINTS
+        for router in routers
+    )
+    cols.rows('r.interfaces', 'I', ([iindex[id(interface)] for interface in router.interfaces] for router in routers))
+    cols.rows('r.dests', 'q', (router.dests for router in routers))
+    cols.rows('r.hints', 'q', (router.hints or () for router in routers))
+    succoffsets = cols.column('r.succ.off', 'Q')
+    succs = cols.column('r.succ', 'q')
+    # Observation counts, parallel to the successors
+    counts = cols.column('r.count', 'Q')
+    origins = cols.column('s.origins', 'q')
+    originoffsets = cols.column('s.origins.off', 'Q')
+    succoffsets.append(0)
+    originoffsets.append(0)
+    pb = Progress(len(routers), 'Writing router edges', increment=increment)
+    for router in pb.iterator(routers):
+        # Successors with origins first, in origins order, so reloading restores the same order
+        ordered = list(router.origins.keys())
+        ordered.extend(succ for succ in router.succ if succ not in router.origins)
+        for succ in ordered:
+            if isinstance(succ, VRFEdge):
+                vid = vindex.get(id(succ))
+                if vid is None:
+                    vid = vindex[id(succ)] = len(vrfedges)
+                    vrfedges.append(succ)
+                # VRF edges are stored as negative references
+                succs.append(-vid - 1)
+            else:
+                succs.append(iindex[id(succ)])
+            counts.append(router.counts.get(succ, 0))
+            origins.extend(router.origins.get(succ, ()))
+            originoffsets.append(len(origins))
+        succoffsets.append(len(succs))
+    cols.column('v.router', 'I').extend(rindex[id(edge.node)] for edge in vrfedges)
+    cols.column('v.vtype', 'B').extend(int(edge.vtype) for edge in vrfedges)
+    cols.write(filename, PACKED if graph.packed else 0)
+
+
+class GraphView:
+    """
+    Read-only memory-mapped view of a saved graph. Columns are exposed as memoryviews, without creating router or
+    interface objects.
+    """
+
+    def __init__(self, filename):
+        self.file = open(filename, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buf = memoryview(self.mm)
+        magic, version, self.flags, n = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC:
+            raise ValueError('{} is not a saved graph.'.format(filename))
+        if version != VERSION:
+            raise ValueError('Unsupported graph version {} in {}.'.format(version, filename))
+        self.columns = {}
+        for i in range(n):
+            name, typecode, offset, count = SECTION.unpack_from(self.buf, HEADER.size + i * SECTION.size)
+            typecode = typecode.decode()
+            size = array(typecode).itemsize
+            self.columns[name.rstrip(b'\0').decode()] = self.buf[offset:offset + size * count].cast(typecode)
+        self.packed = bool(self.flags & PACKED)
+        self.nrouters = len(self.columns['r.flags'])
+        self.ninterfaces = len(self.columns['i.flags'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def row(self, name, i):
+        offsets = self.columns[name + '.off']
+        return self.columns[name][offsets[i]:offsets[i + 1]]
+
+    def string(self, name, i):
+        return bytes(self.row(name, i))
+
+    def key(self, i):
+        key = self.string('i.key', i)
+        return key if self.packed else key.decode()
+
+    def org(self, i):
+        return self.string('orgs', self.columns['i.org'][i]).decode()
+
+    def router_name(self, r):
+        return self.string('r.name', r).decode()
+
+    def close(self):
+        for col in self.columns.values():
+            col.release()
+        self.columns = {}
+        self.buf.release()
+        self.mm.close()
+        self.file.close()
+
+
+def load_graph(filename, increment=100000):
+    """
+    Recreate a graph written by save_graph.
+    """
+    with GraphView(filename) as view:
+        routers = [Router(view.router_name(r)) for r in range(view.nrouters)]
+        orgs = {}
+        interfaces = []
+        iasn = view['i.asn']
+        iorg = view['i.org']
+        irouter = view['i.router']
+        iflags = view['i.flags']
+        ihint = view['i.hint']
+        pb = Progress(view.ninterfaces, 'Loading interfaces', increment=increment)
+        for i in pb.iterator(range(view.ninterfaces)):
+            org = orgs.get(iorg[i])
+            if org is None:
+                org = orgs[iorg[i]] = view.org(i) or None
+            interface = Interface(view.key(i), iasn[i], org)
+            if irouter[i] >= 0:
+                interface.router = routers[irouter[i]]
+            flags = iflags[i]
+            interface.vrf = bool(flags & I_VRF)
+            interface.echo = bool(flags & I_ECHO)
+            interface.cycle = bool(flags & I_CYCLE)
+            interface.hint = ihint[i]
+            interface.dests.update(view.row('i.dests', i))
+            interfaces.append(interface)
+        predoff = view['i.pred.off']
+        preds = view['i.pred']
+        predcounts = view['i.predcount']
+        # Graphs saved before observation counts were kept have no count columns
+        predobs = view.columns.get('i.predobs')
+        for i, interface in enumerate(interfaces):
+            for j in range(predoff[i], predoff[i + 1]):
+                interface.add_pred(routers[preds[j]], predobs[j] if predobs is not None else 0, predcounts[j])
+        vrfedges = [VRFEdge(routers[r], VType(vtype)) for r, vtype in zip(view['v.router'], view['v.vtype'])]
+        rflags = view['r.flags']
+        succoff = view['r.succ.off']
+        succs = view['r.succ']
+        originoff = view['s.origins.off']
+        origins = view['s.origins']
+        counts = view.columns.get('r.count')
+        pb = Progress(view.nrouters, 'Loading routers', increment=increment)
+        for r in pb.iterator(range(view.nrouters)):
+            router = routers[r]
+            flags = rflags[r]
+            router.nexthop = bool(flags & R_NEXTHOP)
+            router.vrf = bool(flags & R_VRF)
+            router.echo = bool(flags & R_ECHO)
+            router.cycle = bool(flags & R_CYCLE)
+            if flags & R_HINTS:
+                router.hints = set(view.row('r.hints', r))
+            router.interfaces.extend(interfaces[i] for i in view.row('r.interfaces', r))
+            router.add_dests(view.row('r.dests', r))
+            for j in range(succoff[r], succoff[r + 1]):
+                ref = succs[j]
+                succ = vrfedges[-ref - 1] if ref < 0 else interfaces[ref]
+                router.add_origins(succ, origins[originoff[j]:originoff[j + 1]], counts[j] if counts is not None else 0)
+        graph = Graph(
+            interfaces={interface.key: interface for interface in interfaces},
+            routers={router.name: router for router in routers},
+            packed=view.packed
+        )
+    return graph
+
+
+def _succ_value(succ):
+    if isinstance(succ, VRFEdge):
+        return 'vrf', succ.node.name, int(succ.vtype)
+    return 'interface', succ.key
+
+
+def describe(graph: Graph):
+    """
+    Describe the interfaces and routers of a graph by value, with nodes referenced by key and name, so graphs built
+    from different objects can be compared.
+    :return: tuple of dictionaries, interface key to its values and router name to its values
+    """
+    interfaces = {}
+    for key, interface in graph.interfaces.items():
+        interfaces[key] = (
+            interface.asn, interface.org, interface.router.name if interface.router is not None else None,
+            interface.vrf, interface.echo, interface.cycle, interface.hint, set(interface.dests),
+            {router.name: (n, interface.pred_counts.get(router, 0)) for router, n in interface.pred.items()}
+        )
+    routers = {}
+    for name, router in graph.routers.items():
+        routers[name] = (
+            router.nexthop, router.vrf, router.echo, router.cycle, router.hints,
+            [interface.key for interface in router.interfaces], set(router.dests),
+            Counter((_succ_value(succ), router.origins.get(succ, ()), router.counts.get(succ, 0)) for succ in router.succ)
+        )
+    return interfaces, routers
+
+
+def verify_graph(graph: Graph, filename):
+    """
+    Reload a saved graph and compare it with the graph that was saved.
+    :return: list of (kind, key) pairs that differ, where kind is graph, interface, or router
+    """
+    loaded = load_graph(filename)
+    mismatches = []
+    if loaded.packed != graph.packed:
+        mismatches.append(('graph', 'packed'))
+    for kind, expected, actual in zip(['interface', 'router'], describe(graph), describe(loaded)):
+        for key in expected.keys() | actual.keys():
+            if expected.get(key) != actual.get(key):
+                mismatches.append((kind, key))
+    return mismatches
@@ -0,0 +1,166 @@
+from collections import deque
+from ipaddress import ip_network
+
+from bdrmapit.algorithm.updates_dict import Updates
+from bdrmapit.graph.construct import Graph
+from bdrmapit.graph.node import Interface, Router
+from bdrmapit.vrf.vrfedge import VRFEdge
+
+
+def _networks(prefixes):
+    """
+    Convert prefixes to (address length, shift, network value) for matching against packed addresses.
+    """
+    nets = []
+    for prefix in prefixes:
+        net = ip_network(prefix, strict=False)
+        shift = net.max_prefixlen - net.prefixlen
+        nets.append((net.max_prefixlen // 8, shift, int(net.network_address) >> shift))
+    return nets
+
+
+def _matches(packed, nets):
+    value = int.from_bytes(packed, 'big')
+    for size, shift, netvalue in nets:
+        if len(packed) == size and value >> shift == netvalue:
+            return True
+    return False
+
+
+def _neighbors(router: Router):
+    """
+    Routers adjacent to a router through its successors or the predecessors of its interfaces.
+    """
+    for succ in router.succ:
+        if isinstance(succ, VRFEdge):
+            yield succ.node
+        else:
+            yield succ.router
+    for interface in router.interfaces:
+        yield from interface.pred
+
+
+class Subgraph:
+    """
+    Self-contained copy of the routers within a number of hops of a set of seed routers. The routers one hop beyond
+    are copied as the boundary, without their own edges, so the core routers keep all of their successors and
+    predecessors. Boundary annotations are meant to be frozen from a run over the full graph.
+    """
+
+    def __init__(self, graph: Graph, core, boundary):
+        """
+        :param graph: full graph
+        :param core: original routers whose annotations will be recomputed
+        :param boundary: original routers adjacent to the core
+        """
+        self.original = {}
+        copies = {}
+        for router in core:
+            copies[router] = self._copy_router(router)
+        for router in boundary:
+            copies[router] = self._copy_router(router)
+        ifaces = {interface: copy for router, rcopy in copies.items() for interface, copy in zip(router.interfaces, rcopy.interfaces)}
+        for interface, copy in ifaces.items():
+            pred_counts = interface.pred_counts
+            for rpred, num in interface.pred.items():
+                pcopy = copies.get(rpred)
+                if pcopy is not None:
+                    copy.add_pred(pcopy, pred_counts.get(rpred, 0), num)
+        vrfedges = {}
+        for router in core:
+            rcopy = copies[router]
+            for succ in router.succ:
+                if isinstance(succ, VRFEdge):
+                    # Successors of a core router are always in the core or boundary
+                    scopy = vrfedges.get(succ)
+                    if scopy is None:
+                        scopy = vrfedges[succ] = VRFEdge(copies[succ.node], succ.vtype)
+                else:
+                    scopy = ifaces[succ]
+                rcopy.add_origins(scopy, router.origins.get(succ, ()), router.counts.get(succ, 0))
+        self.routers = [copies[router] for router in core]
+        self.boundary = [copies[router] for router in boundary]
+        self.graph = Graph(
+            interfaces={copy.key: copy for copy in ifaces.values()},
+            routers={copy.name: copy for copy in copies.values()},
+            packed=graph.packed
+        )
+
+    def _copy_router(self, router: Router):
+        copy = Router(router.name)
+        copy.nexthop = router.nexthop
+        copy.vrf = router.vrf
+        copy.echo = router.echo
+        copy.cycle = router.cycle
+        copy.hints = router.hints
+        copy.add_dests(router.dests)
+        self.original[copy] = router
+        for interface in router.interfaces:
+            icopy = Interface(interface.key, interface.asn, interface.org)
+            icopy.dests.update(interface.dests)
+            icopy.vrf = interface.vrf
+            icopy.echo = interface.echo
+            icopy.cycle = interface.cycle
+            icopy.hint = interface.hint
+            copy.add_interface(icopy)
+            self.original[icopy] = interface
+        return copy
+
+    @property
+    def interfaces(self):
+        """
+        Interfaces of the core routers.
+        """
+        return [interface for router in self.routers for interface in router.interfaces]
+
+    def freeze(self, rupdates: Updates, iupdates: Updates):
+        """
+        Create router and interface updates holding the full run annotations of the boundary routers and interfaces.
+        :param rupdates: router annotations from the full graph
+        :param iupdates: interface annotations from the full graph
+        :return: router updates, interface updates
+        """
+        frozen_rupdates = Updates(name=rupdates.name)
+        frozen_iupdates = Updates(name=iupdates.name)
+        for router in self.boundary:
+            update = rupdates[self.original[router]]
+            if update is not None:
+                frozen_rupdates.add_update_direct(router, update.asn, update.org, update.utype)
+            for interface in router.interfaces:
+                update = iupdates[self.original[interface]]
+                if update is not None:
+                    frozen_iupdates.add_update_direct(interface, update.asn, update.org, update.utype)
+        return frozen_rupdates, frozen_iupdates
+
+
+def extract_subgraph(graph: Graph, asns=None, prefixes=None, hops=1):
+    """
+    Extract the routers within a number of hops of the routers with interfaces in any of the ASes or prefixes.
+    :param graph: full graph, after router destinations were set
+    :param asns: interface origin ASes
+    :param prefixes: prefixes in address/length notation
+    :param hops: hops to traverse from the seed routers, through successors and predecessors
+    :return: Subgraph
+    """
+    asns = set(asns) if asns else set()
+    nets = _networks(prefixes) if prefixes else []
+    seeds = {}
+    for interface in graph.interfaces.values():
+        if interface.asn in asns or (nets and _matches(interface.packed, nets)):
+            router = interface.router
+            if router is not None:
+                seeds[router] = 0
+    distance = seeds
+    queue = deque(seeds)
+    boundary = {}
+    while queue:
+        router = queue.popleft()
+        d = distance[router]
+        for neighbor in _neighbors(router):
+            if neighbor not in distance:
+                if d < hops:
+                    distance[neighbor] = d + 1
+                    queue.append(neighbor)
+                else:
+                    boundary[neighbor] = None
+    return Subgraph(graph, list(distance), list(boundary))
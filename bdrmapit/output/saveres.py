@@ -165,7 +165,7 @@ class Save:
         loops = set()
         for addrs in parseres.loopadjs:
             for addr in addrs:
-                if addr not in self.bdrmapit.graph.interfaces:
+                if not self.bdrmapit.graph.has_interface(addr):
                     loops.add(addr)
                     asn = ip2as[addr]
                     org = self.bdrmapit.as2org[asn]
@@ -173,7 +173,7 @@ class Save:
                     values.append(row)
         echos = set()
         for addr in parseres.echos:
-            if addr not in loops and addr not in self.bdrmapit.graph.interfaces:
+            if addr not in loops and not self.bdrmapit.graph.has_interface(addr):
                 echos.add(addr)
                 asn = ip2as[addr]
                 org = self.bdrmapit.as2org[asn]
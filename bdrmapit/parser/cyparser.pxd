@@ -1,22 +1,2 @@
-from traceutils.radix.ip2as cimport IP2AS
-
-cpdef enum OutputType:
-    WARTS = 1
-    ATLAS = 2
-    ATLAS_ODD = 3
-
-
-cdef class TraceFile:
-    cdef public str filename
-    cdef public OutputType type
-
-
-cdef class ParseResults:
-    cdef readonly set addrs, adjs, dps, mpls, spoofing, echos, cycles
-
-    cpdef void update(self, ParseResults results) except *;
-
-
-cpdef ParseResults parse(TraceFile tfile);
-cdef dict listify(d);
-cpdef dict build_graph_json(ParseResults parseres, IP2AS ip2as);
\ No newline at end of file
+cdef void add_path(list hops, long dst_asn, set addrs, set dps, set spoofing, set echos, dict nextadjs, dict multiadjs, dict triplets, long count) except *;
+cpdef void parse_traces(object f, str filename, object ip2as, object public_ip4, object public_ip6, object results, bint dedup=*, bint triplets=*) except *;
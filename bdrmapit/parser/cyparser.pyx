@@ -1,170 +1,139 @@
-from collections import defaultdict
-from multiprocessing.pool import Pool
-
-from traceutils.progress.bar import Progress
-from traceutils.radix.ip2as cimport IP2AS
-from traceutils.scamper.atlas cimport AtlasReader
 from traceutils.scamper.hop import ICMPType
-from traceutils.scamper.hop cimport Reader, Trace, Hop
-from traceutils.scamper.warts cimport WartsReader
-from traceutils.scamper.pyatlas import AtlasReader as AtlasOddReader
-
-
-cdef IP2AS _ip2as
-
+from traceutils.radix.ip2as cimport IP2AS
+from traceutils.scamper.hop cimport Hop
 
-cdef class TraceFile:
-    def __init__(self, str filename, OutputType type):
-        self.filename = filename
-        self.type = type
 
-    def __repr__(self):
-        return self.filename
+cdef object ECHO_REPLY = ICMPType.echo_reply
+cdef object PORTPING = ICMPType.portping
+cdef object SPOOFING = ICMPType.spoofing
 
 
-cdef class ParseResults:
+cdef inline void increment(dict counter, tuple key, long count=1):
+    counter[key] = counter.get(key, 0) + count
 
-    def __init__(self):
-        self.addrs = set()
-        self.adjs = set()
-        self.dps = set()
-        self.mpls = set()
-        self.spoofing = set()
-        self.echos = set()
-        self.cycles = set()
-        self.loopadjs = set()
 
-    def __str__(self):
-        return 'Addrs {:,d} Adjs {:,d} DPs {:,d} MPLS {:,d} S {:,d} E {:,d} C {:,d}'.format(len(self.addrs), len(self.adjs), len(self.dps), len(self.mpls), len(self.spoofing), len(self.echos), len(self.cycles))
+cdef void add_path(list hops, long dst_asn, set addrs, set dps, set spoofing, set echos, dict nextadjs, dict multiadjs, dict triplets, long count) except *:
+    """
+    Add the addresses and adjacencies of one pruned hop sequence, count times.
+    :param triplets: hop triplet counter, or None when triplets are not collected
+    """
+    cdef Hop x, y, w
+    cdef object ytype
+    cdef Py_ssize_t i, last = len(hops) - 1
+    cdef int distance
 
-    cpdef void update(self, ParseResults results) except *:
-        self.addrs.update(results.addrs)
-        self.adjs.update(results.adjs)
-        self.dps.update(results.dps)
-        self.mpls.update(results.mpls)
-        self.spoofing.update(results.spoofing)
-        self.echos.update(results.echos)
-        self.cycles.update(results.cycles)
+    y = hops[last]
+    if y.type == ECHO_REPLY or y.type == PORTPING:
+        echos.add(y.addr)
+    for i in range(last + 1):
+        x = hops[i]
+        addrs.add(x.addr)
+        if x.type != ECHO_REPLY and x.type != PORTPING:
+            dps.add((x.addr, dst_asn))
+        if i == last:
+            break
+        y = hops[i + 1]
+        ytype = y.type
+        if ytype == ECHO_REPLY or ytype == PORTPING:
+            break
+        if ytype == SPOOFING and y.icmp_q_ttl > 1:
+            break
+        distance = y.probe_ttl - x.probe_ttl
+        if y.icmp_q_ttl == 0:
+            distance += 1
+        if distance > 1:
+            distance = 2
+        elif distance < 1:
+            distance = -1
+        if ytype == SPOOFING:
+            spoofing.add((x.addr, y.addr, distance))
+        else:
+            if distance == 1:
+                increment(nextadjs, (x.addr, y.addr), count)
+            else:
+                increment(multiadjs, (x.addr, y.addr), count)
+            if triplets is not None:
+                if i > 0:
+                    w = hops[i - 1]
+                    increment(triplets, (w.addr, x.addr, y.addr), count)
+                else:
+                    increment(triplets, (None, x.addr, y.addr), count)
 
 
-cpdef ParseResults parse(TraceFile tfile):
-    cdef ParseResults results = ParseResults()
+cpdef void parse_traces(object f, str filename, object ip2as, object public_ip4, object public_ip6, object results, bint dedup=False, bint triplets=False) except *:
+    """
+    Compiled parse kernel. Produces the same results as scripts.traceparser.parse_traces.
+    """
     cdef set addrs = results.addrs
-    cdef set adjs = results.adjs
     cdef set dps = results.dps
-    cdef set mpls = results.mpls
     cdef set spoofing = results.spoofing
     cdef set echos = results.echos
     cdef set cycles = results.cycles
-    cdef Reader f
-    cdef Trace trace
-    cdef list hops
-    cdef int dst_asn, i, distance
-    cdef Hop x, y
-    cdef str filename = tfile.filename
-    cdef OutputType output_type = tfile.type
-
-    if output_type == OutputType.WARTS:
-        f = WartsReader(filename, ping=False)
-    elif output_type == OutputType.ATLAS:
-        f = AtlasReader(filename)
-    elif output_type == OutputType.ATLAS_ODD:
-        f = AtlasOddReader(filename)
-    else:
-        raise Exception('Invalid output type: {}.'.format(output_type))
+    cdef dict loopadjs = {}, nextadjs = {}, multiadjs = {}, first = {}
+    cdef dict paths = {}, pathcounts = {}
+    cdef dict trips = {} if triplets else None
+    cdef list hops, loop
+    cdef Hop h, x, y
+    cdef str src
+    cdef object trace, lookup = ip2as.__getitem__
+    cdef tuple key
+    cdef Py_ssize_t i
+    cdef long dst_asn, vpid = results.vpid(filename)
+    # Trace.prune_private only accepts IP2AS, shared tables are pruned here
+    cdef bint native = isinstance(ip2as, IP2AS)
+
+    fiter = iter(f)
     try:
-        f.open()
-        for trace in f:
-            trace.prune_dups()
-            trace.prune_loops()
-            if trace.loop:
-                cycles.update(trace.loop)
-            hops = [h for h in trace.hops if _ip2as[h.addr] != -1]
-            dst_asn = _ip2as.asn(trace.dst)
-            for i in range(len(hops)):
-                x = hops[i]
-                addrs.add(x.addr)
-                if x.ismpls or (x.icmp_q_ttl > 1 and x.type == ICMPType.time_exceeded):
-                    mpls.add(x.addr)
-                if x.icmp_type != 0:
-                    dps.add((x.addr, dst_asn))
-                if i == len(hops) - 1:
-                    break
-                y = hops[i+1]
-                if y.type == ICMPType.echo_reply or y.type == ICMPType.portping:
-                    echos.add(y.addr)
-                    break
-                distance = y.probe_ttl - x.probe_ttl
-                if y.icmp_q_ttl == 0:
-                    distance += 1
-                if distance > 1:
-                    distance = 2
-                elif distance < 1:
-                    distance = -1
-                if y.type == ICMPType.spoofing:
-                    spoofing.add((x.addr, y.addr, distance))
+        while True:
+            try:
+                trace = next(fiter)
+                if native:
+                    trace.prune_private(ip2as)
                 else:
-                    adjs.add((x.addr, y.addr, distance))
+                    trace.hops = [h for h in trace.hops if lookup(h.addr) != -1]
+                trace.prune_dups()
+                trace.prune_loops(True)
+                loop = trace.loop
+                if loop:
+                    cycles.update(loop)
+                src = trace.src
+                hops = []
+                for h in trace.hops:
+                    if h.addr != src and h.addr != public_ip4 and h.addr != public_ip6 and lookup(h.addr) != -1:
+                        hops.append(h)
+                if not hops:
+                    continue
+                x = hops[0]
+                if x.probe_ttl == 1:
+                    increment(first, (vpid, x.addr))
+                dst_asn = ip2as.asn(trace.dst)
+                if dedup:
+                    key = (dst_asn, tuple([(h.addr, h.probe_ttl, h.icmp_q_ttl, h.type) for h in hops]))
+                    if key not in paths:
+                        paths[key] = hops
+                    increment(pathcounts, key)
+                else:
+                    add_path(hops, dst_asn, addrs, dps, spoofing, echos, nextadjs, multiadjs, trips, 1)
+                if loop:
+                    for i in range(len(loop) - 1):
+                        x = loop[i]
+                        y = loop[i + 1]
+                        increment(loopadjs, (x.addr, y.addr))
+            except UnicodeDecodeError:
+                print(filename, 'UnicodeDecodeError')
+                break
+            except EOFError:
+                print(filename, 'EOFError')
+                break
+            except StopIteration:
+                break
+        for key, count in pathcounts.items():
+            add_path(paths[key], key[0], addrs, dps, spoofing, echos, nextadjs, multiadjs, trips, count)
     finally:
-        f.close()
-    return results
-
-
-def parse_sequential(list files, IP2AS ip2as):
-    global _ip2as
-    cdef ParseResults results = ParseResults(), newresults
-    cdef TraceFile tfile
-    _ip2as = ip2as
-
-    pb = Progress(len(files), 'Parsing traceroute files', callback=lambda: str(results))
-    for tfile in pb.iterator(files):
-        newresults = parse(tfile)
-        results.update(newresults)
-    return results
-
-
-def parse_parallel(list files, IP2AS ip2as, poolsize):
-    global _ip2as
-    cdef ParseResults results = ParseResults(), newresults
-    cdef TraceFile tfile
-    _ip2as = ip2as
-
-    pb = Progress(len(files), 'Parsing traceroute files', callback=lambda: str(results))
-    with Pool(poolsize) as pool:
-        for newresults in pb.iterator(pool.imap_unordered(parse, files)):
-            results.update(newresults)
-    return results
-
-
-cdef dict listify(d):
-    cdef str k
-    cdef set v
-    return {k: list(v) for k, v in d.items()}
-
-
-cpdef dict build_graph_json(ParseResults parseres, IP2AS ip2as):
-    cdef dict results = {'addrs': list(parseres.addrs), 'mpls': list(parseres.mpls)}
-    cdef set remaining = set()
-    cdef str x, y
-    cdef int distance
-
-    nexthop = defaultdict(set)
-    multi = defaultdict(set)
-    for x, y, distance in parseres.adjs:
-        if distance == 1 or ip2as[x] == ip2as[y]:
-            nexthop[x].add(y)
-        elif distance > 0:
-            remaining.add((x, y))
-    for x, y in remaining:
-        if x not in nexthop:
-            multi[x].add(y)
-    results['nexthop'] = listify(nexthop)
-    results['multi'] = listify(multi)
-    results['spoofing'] = list(parseres.spoofing)
-    dests = defaultdict(set)
-    for addr, asn in parseres.dps:
-        dests[addr].add(asn)
-    results['dps'] = listify(dests)
-    results['echos'] = list(parseres.echos)
-    results['cycles'] = list(parseres.cycles)
-    return results
+        # Counter.update adds counts, and copies directly when the counter is empty
+        results.loopadjs.update(loopadjs)
+        results.nextadjs.update(nextadjs)
+        results.multiadjs.update(multiadjs)
+        results.first.update(first)
+        if trips:
+            results.triplets.update(trips)
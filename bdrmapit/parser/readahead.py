@@ -0,0 +1,179 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import subprocess
+import sys
+from queue import Queue, Full, Empty
+from threading import Thread, Event
+
+DECOMPRESSORS = {
+    '.gz': (['pigz', '-dc'], gzip.open),
+    '.bz2': (['pbzip2', '-dc'], bz2.open),
+    '.xz': (['xz', '-T0', '-dc'], lzma.open),
+}
+
+
+def compression(filename):
+    """
+    Return the compression suffix of a filename, or None if it is not compressed.
+    """
+    _, ext = os.path.splitext(filename)
+    return ext if ext in DECOMPRESSORS else None
+
+
+class ReadAhead:
+    """
+    Decompresses a file ahead of its reader. The decoded stream is exposed as a /dev/fd path that readers open like an
+    uncompressed file. A parallel decompressor (pigz, pbzip2, xz -T0) is used when installed, otherwise one thread
+    decompresses into a bounded queue of buffers and another writes them to a pipe, so decompression overlaps with
+    parsing.
+    """
+
+    def __init__(self, filename, external=True, chunksize=1 << 20, maxsize=16):
+        self.filename = filename
+        self.external = external
+        self.chunksize = chunksize
+        self.maxsize = maxsize
+        self.proc = None
+        self.rfd = None
+        self.wfd = None
+        self.queue = None
+        self.stop = Event()
+        self.threads = []
+        self.error = None
+        self.killed = False
+        self.returncode = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def _put(self, item):
+        while not self.stop.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _decompress(self, opener):
+        try:
+            with opener(self.filename, 'rb') as f:
+                while not self.stop.is_set():
+                    # read1 returns each decoded block, so little is lost when a later block is truncated
+                    buf = f.read1(self.chunksize)
+                    if not buf:
+                        break
+                    if not self._put(buf):
+                        return
+        except Exception as e:
+            # Truncated archives are common, pass along whatever was decoded before the error. The error is raised by
+            # FileSource at the end of the stream, or reported on close.
+            self.error = e
+        finally:
+            # Always end the stream, so the writer closes the pipe and the reader sees EOF
+            self._put(None)
+
+    def _write(self):
+        try:
+            while True:
+                try:
+                    buf = self.queue.get(timeout=0.1)
+                except Empty:
+                    if self.stop.is_set():
+                        break
+                    continue
+                if buf is None:
+                    break
+                view = memoryview(buf)
+                while view:
+                    written = os.write(self.wfd, view)
+                    view = view[written:]
+        except BrokenPipeError:
+            self.stop.set()
+        finally:
+            os.close(self.wfd)
+            self.wfd = None
+
+    def open(self):
+        """
+        Start decompressing.
+        :return: path of the decompressed stream
+        """
+        ext = compression(self.filename)
+        if ext is None:
+            return self.filename
+        cmd, opener = DECOMPRESSORS[ext]
+        if self.external and shutil.which(cmd[0]):
+            # The decompressor reports truncated or corrupt archives with its exit status
+            self.killed = False
+            self.returncode = None
+            self.proc = subprocess.Popen(cmd + [self.filename], stdout=subprocess.PIPE)
+            return '/dev/fd/{}'.format(self.proc.stdout.fileno())
+        self.rfd, self.wfd = os.pipe()
+        self.queue = Queue(self.maxsize)
+        self.stop.clear()
+        self.threads = [Thread(target=self._decompress, args=(opener,), daemon=True), Thread(target=self._write, daemon=True)]
+        for thread in self.threads:
+            thread.start()
+        return '/dev/fd/{}'.format(self.rfd)
+
+    def _drained(self):
+        """
+        Whether the external decompressor closed its output and the reader consumed all of it.
+        """
+        fd = self.proc.stdout.fileno()
+        os.set_blocking(fd, False)
+        try:
+            return os.read(fd, 1) == b''
+        except BlockingIOError:
+            return False
+
+    def _reap(self, timeout=None):
+        """
+        Wait for the external decompressor, and record a failed exit as the error. Exits caused by close are not errors.
+        """
+        returncode = self.proc.wait(timeout)
+        if self.returncode is None:
+            self.returncode = returncode
+            if returncode != 0 and not self.killed and self.error is None:
+                self.error = subprocess.CalledProcessError(returncode, self.proc.args)
+
+    def result(self, timeout=None):
+        """
+        Wait for decompression to finish once the stream has been read, and return its error, if any.
+        :param timeout: seconds to wait for an external decompressor, after which it is assumed not to have failed
+        """
+        if self.proc is not None:
+            try:
+                self._reap(timeout)
+            except subprocess.TimeoutExpired:
+                pass
+        return self.error
+
+    def close(self):
+        self.stop.set()
+        if self.proc is not None:
+            # Kill before closing the pipe, so a reader that stopped early does not cause a broken pipe error
+            if self.proc.poll() is None and not self._drained():
+                self.killed = True
+                self.proc.kill()
+            self.proc.stdout.close()
+            self._reap()
+            self.proc = None
+        if self.rfd is not None:
+            # Closing the read end unblocks a writer waiting on a full pipe
+            os.close(self.rfd)
+            self.rfd = None
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        if self.error is not None:
+            print(self.filename, '{}: {}'.format(type(self.error).__name__, self.error), file=sys.stderr)
+            self.error = None
@@ -0,0 +1,49 @@
+import pickle
+import struct
+
+MAGIC = b'BDRSECT1'
+FOOTER = struct.Struct('<Q')
+
+
+def write_sections(file, sections):
+    """
+    Write named objects as separately pickled sections, followed by an index of their offsets and lengths, so each one
+    can be read without deserializing the others.
+    :param file: output filename
+    :param sections: iterable of (name, object)
+    """
+    index = {}
+    with open(file, 'wb') as f:
+        f.write(MAGIC)
+        for name, value in sections:
+            offset = f.tell()
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            index[name] = (offset, f.tell() - offset)
+        offset = f.tell()
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.write(FOOTER.pack(offset))
+
+
+def read_index(file):
+    """
+    Read the section index of a file.
+    :return: dict of name to (offset, length), or None if the file is not sectioned
+    """
+    with open(file, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            return None
+        f.seek(-FOOTER.size, 2)
+        offset, = FOOTER.unpack(f.read(FOOTER.size))
+        f.seek(offset)
+        return pickle.load(f)
+
+
+def read_section(file, offset, length):
+    """
+    Deserialize a single section.
+    :param offset: offset from the section index
+    :param length: length from the section index
+    """
+    with open(file, 'rb') as f:
+        f.seek(offset)
+        return pickle.loads(f.read(length))
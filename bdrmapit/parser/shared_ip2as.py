@@ -0,0 +1,284 @@
+import socket
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from traceutils.file2.file2 import fopen
+from traceutils.radix.ip2as import IP2AS, create_private, create_table
+
+MAGIC = b'BDRIP2AS'
+VERSION = 1
+HEADER = struct.Struct('<8sIxxxxQQ')
+HEADER_SIZE = 32
+
+MAX4 = (1 << 32) - 1
+MAX6 = (1 << 128) - 1
+MASK64 = (1 << 64) - 1
+
+
+def addr_to_int(addr: str):
+    """
+    Convert an address string to its integer value.
+    :param addr: IPv4 or IPv6 address
+    :return: tuple of (is IPv6, integer value)
+    """
+    if ':' in addr:
+        return True, int.from_bytes(socket.inet_pton(socket.AF_INET6, addr), 'big')
+    return False, int.from_bytes(socket.inet_aton(addr), 'big')
+
+
+def prefix_range(prefix: str, length: int = None):
+    """
+    Convert a prefix to the first and last address it covers.
+    :param prefix: prefix address, optionally in address/length form
+    :param length: prefix length when not included in prefix
+    :return: tuple of (is IPv6, first address, last address)
+    """
+    if length is None:
+        prefix, length = prefix.split('/')
+    length = int(length)
+    ipv6, start = addr_to_int(prefix)
+    bits = 128 if ipv6 else 32
+    hostmask = (1 << (bits - length)) - 1
+    start &= ~hostmask
+    return ipv6, start, start | hostmask
+
+
+def parse_asn(asn: str):
+    """
+    Parse the origin AS field the way create_table does, with the leading integer of MOAS and AS-set origins, or 0 when
+    the field does not start with one.
+    """
+    end = 1 if asn[:1] in '+-' else 0
+    while end < len(asn) and asn[end].isdigit():
+        end += 1
+    try:
+        return int(asn[:end])
+    except ValueError:
+        return 0
+
+
+def flatten(prefixes, maxaddr):
+    """
+    Convert nested prefixes into disjoint intervals labeled by the most specific covering prefix. Addresses without a
+    covering prefix are labeled 0, the same value returned by IP2AS for unmapped addresses.
+    :param prefixes: list of (first address, last address, asn)
+    :param maxaddr: largest address in the address space
+    :return: sorted interval start addresses and their ASNs
+    """
+    starts = [0]
+    asns = [0]
+    stack = []
+
+    def mark(pos, asn):
+        if starts[-1] == pos:
+            asns[-1] = asn
+        else:
+            starts.append(pos)
+            asns.append(asn)
+
+    prefixes.sort(key=lambda p: (p[0], -p[1]))
+    for start, end, asn in prefixes:
+        while stack and stack[-1][0] < start:
+            pend, _ = stack.pop()
+            mark(pend + 1, stack[-1][1] if stack else 0)
+        mark(start, asn)
+        stack.append((end, asn))
+    while stack:
+        pend, _ = stack.pop()
+        if pend < maxaddr:
+            mark(pend + 1, stack[-1][1] if stack else 0)
+    fstarts = []
+    fasns = []
+    for start, asn in zip(starts, asns):
+        if not fasns or fasns[-1] != asn:
+            fstarts.append(start)
+            fasns.append(asn)
+    return fstarts, fasns
+
+
+def _attach(name):
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the segment with the resource tracker, which unlinks it when the
+        # worker exits. The creating process owns the segment, so undo the registration.
+        shm = SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class SharedIP2AS:
+    """
+    Read-only longest prefix match table stored as flat sorted arrays in shared memory. Worker processes attach to the
+    table by name instead of holding private copies of the radix tree. Supports the IP2AS lookup interface used by the
+    parsers, asn(addr) and ip2as[addr].
+    """
+
+    def __init__(self, shm: SharedMemory, owner=False):
+        self.shm = shm
+        self.owner = owner
+        buf = shm.buf
+        magic, version, n4, n6 = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError('Shared memory segment {} is not an ip2as table.'.format(shm.name))
+        if version != VERSION:
+            raise ValueError('Unsupported ip2as table version {} in shared memory segment {}.'.format(version, shm.name))
+        offset = HEADER_SIZE
+        self.v6hi = buf[offset:offset + 8 * n6].cast('Q')
+        offset += 8 * n6
+        self.v6lo = buf[offset:offset + 8 * n6].cast('Q')
+        offset += 8 * n6
+        self.v4asns = buf[offset:offset + 8 * n4].cast('q')
+        offset += 8 * n4
+        self.v6asns = buf[offset:offset + 8 * n6].cast('q')
+        offset += 8 * n6
+        self.v4starts = buf[offset:offset + 4 * n4].cast('I')
+
+    def __reduce__(self):
+        return attach, (self.name,)
+
+    def __len__(self):
+        return len(self.v4starts) + len(self.v6hi)
+
+    def __getitem__(self, addr):
+        return self.asn(addr)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @classmethod
+    def create(cls, filename=None, private=False):
+        """
+        Build the table and copy it into a new shared memory segment. With a filename and private False, the lookups
+        match create_table, and with private and no filename they match create_private.
+        :param filename: prefix-to-AS mappings, either prefix/length and AS, or CAIDA prefix2as format
+        :param private: map the private, reserved, and multicast prefixes of create_private to -1
+        :return: table owned by the calling process
+        """
+        prefixes4 = []
+        prefixes6 = []
+        if filename is not None:
+            with fopen(filename, 'rt') as f:
+                for line in f:
+                    if line[0] == '#':
+                        continue
+                    fields = line.split()
+                    if len(fields) == 3:
+                        ipv6, start, end = prefix_range(fields[0], fields[1])
+                    else:
+                        ipv6, start, end = prefix_range(fields[0])
+                    (prefixes6 if ipv6 else prefixes4).append((start, end, parse_asn(fields[-1])))
+        if private:
+            # Private prefixes come last so they override identical prefixes in the file
+            for prefix in create_private().prefixes():
+                ipv6, start, end = prefix_range(prefix)
+                (prefixes6 if ipv6 else prefixes4).append((start, end, -1))
+        starts4, asns4 = flatten(prefixes4, MAX4)
+        starts6, asns6 = flatten(prefixes6, MAX6)
+        n4 = len(starts4)
+        n6 = len(starts6)
+        size = HEADER_SIZE + 8 * n6 * 3 + 12 * n4
+        shm = SharedMemory(create=True, size=size)
+        buf = shm.buf
+        HEADER.pack_into(buf, 0, MAGIC, VERSION, n4, n6)
+        offset = HEADER_SIZE
+        for fmt, values in [('Q', [s >> 64 for s in starts6]), ('Q', [s & MASK64 for s in starts6]), ('q', asns4), ('q', asns6), ('I', starts4)]:
+            data = array(fmt, values).tobytes()
+            buf[offset:offset + len(data)] = data
+            offset += len(data)
+        return cls(shm, owner=True)
+
+    def asn(self, addr: str):
+        try:
+            if ':' in addr:
+                value = int.from_bytes(socket.inet_pton(socket.AF_INET6, addr), 'big')
+            else:
+                return self.v4asns[bisect_right(self.v4starts, int.from_bytes(socket.inet_aton(addr), 'big')) - 1]
+        except OSError:
+            return 0
+        ahi = value >> 64
+        alo = value & MASK64
+        i = bisect_right(self.v6hi, ahi)
+        j = bisect_left(self.v6hi, ahi, 0, i)
+        if j < i:
+            k = bisect_right(self.v6lo, alo, j, i)
+            if k > j:
+                return self.v6asns[k - 1]
+        return self.v6asns[j - 1]
+
+    def close(self):
+        for view in [self.v6hi, self.v6lo, self.v4asns, self.v6asns, self.v4starts]:
+            view.release()
+        self.shm.close()
+
+    def unlink(self):
+        """
+        Close the table and, if this process created it, remove the shared memory segment.
+        """
+        self.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def attach(name):
+    """
+    Attach to a table created by another process.
+    :param name: shared memory segment name
+    """
+    return SharedIP2AS(_attach(name))
+
+
+def int_to_addr(ipv6, value):
+    """
+    Convert an integer address value to its address string.
+    """
+    if ipv6:
+        return socket.inet_ntop(socket.AF_INET6, value.to_bytes(16, 'big'))
+    return socket.inet_ntoa(value.to_bytes(4, 'big'))
+
+
+def verify_table(table: SharedIP2AS, filename=None, private=False):
+    """
+    Reattach to a table by name and compare its lookups with the IP2AS radix table built from the same arguments, at the
+    first and last address of every prefix and the addresses just outside them.
+    :param filename: prefix-to-AS mappings passed to create
+    :param private: private passed to create
+    :return: list of (address, table ASN, IP2AS ASN) that differ
+    """
+    if filename is not None:
+        ip2as = create_table(filename)
+    else:
+        ip2as = IP2AS()
+    if private:
+        ip2as.add_private()
+    # Attach in this process, which owns the segment, so its resource tracker registration is kept
+    attached = SharedIP2AS(SharedMemory(name=table.name))
+    mismatches = []
+    try:
+        for prefix in ip2as.prefixes():
+            ipv6, start, end = prefix_range(prefix)
+            maxaddr = MAX6 if ipv6 else MAX4
+            for value in (start - 1, start, end, end + 1):
+                if 0 <= value <= maxaddr:
+                    addr = int_to_addr(ipv6, value)
+                    asn = attached.asn(addr)
+                    expected = ip2as.asn(addr)
+                    if asn != expected:
+                        mismatches.append((addr, asn, expected))
+    finally:
+        attached.close()
+    return mismatches
+
+
+def prune_private_hops(trace, ip2as):
+    """
+    Remove the hops with private addresses, like Trace.prune_private, which only accepts IP2AS tables.
+    """
+    if isinstance(ip2as, IP2AS):
+        trace.prune_private(ip2as)
+    else:
+        trace.hops = [h for h in trace.hops if ip2as.asn(h.addr) != -1]
@@ -0,0 +1,253 @@
+import os
+import time
+from enum import Enum
+from fnmatch import fnmatch
+from queue import Queue, Full
+from threading import Thread, Event
+from typing import Callable, Dict
+
+from traceutils.scamper.atlas import AtlasReader
+from traceutils.scamper.warts import WartsReader, WartsJsonReader
+
+from bdrmapit.parser.readahead import ReadAhead, compression
+
+
+class OutputType(Enum):
+    WARTS = 1
+    ATLAS = 2
+    ATLAS_ODD = 3
+    JSONWARTS = 4
+
+
+class TraceFile:
+    def __init__(self, filename, type):
+        self.filename = filename
+        self.type = type
+
+    def __repr__(self):
+        return self.filename
+
+
+STDIN = '-'
+
+
+def _atlas_odd_reader(filename):
+    from traceutils.scamper.pyatlas import AtlasReader as AtlasOddReader
+    return AtlasOddReader(filename)
+
+
+READERS: Dict[OutputType, Callable] = {
+    OutputType.WARTS: lambda filename: WartsReader(filename, ping=False),
+    OutputType.ATLAS: AtlasReader,
+    OutputType.ATLAS_ODD: _atlas_odd_reader,
+    OutputType.JSONWARTS: WartsJsonReader,
+}
+
+
+def register_reader(otype, factory: Callable):
+    """
+    Register the reader used for a trace output type.
+    :param otype: output type
+    :param factory: callable taking a filename and returning an unopened reader
+    """
+    READERS[otype] = factory
+
+
+class TraceSource:
+    """
+    Iterable of traces from a single vantage point. After open, filename, addr, and hostname describe the source.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.addr = None
+        self.hostname = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __iter__(self):
+        raise NotImplementedError()
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FileSource(TraceSource):
+    """
+    Traces read from a file by the reader registered for its output type.
+    """
+
+    def __init__(self, tfile: TraceFile, readahead=False):
+        super().__init__(tfile.filename)
+        self.type = tfile.type
+        self.reader = None
+        self.readahead = ReadAhead(tfile.filename) if readahead and compression(tfile.filename) else None
+
+    def __iter__(self):
+        if self.readahead is None:
+            return iter(self.reader)
+        return self._readahead_iter()
+
+    def _readahead_iter(self):
+        """
+        Raise a decompression error at the end of the decompressed stream, where the reader raises it without readahead.
+        """
+        try:
+            yield from self.reader
+        except Exception:
+            # A truncated stream can end in a partial record the reader cannot decode. A decompressor that is still
+            # running after a moment has not failed, so the reader's error is raised.
+            if self.readahead.result(timeout=1) is None:
+                raise
+        error = self.readahead.result()
+        if error is not None:
+            self.readahead.error = None
+            raise error
+
+    def path(self):
+        if self.filename == STDIN:
+            return '/dev/stdin'
+        if self.readahead is not None:
+            return self.readahead.open()
+        return self.filename
+
+    def open(self):
+        try:
+            factory = READERS[self.type]
+        except KeyError:
+            raise Exception('Invalid output type: {}.'.format(self.type))
+        self.reader = factory(self.path())
+        self.reader.open()
+        self.addr = self.reader.addr
+        self.hostname = self.reader.hostname
+
+    def close(self):
+        if self.reader is not None:
+            self.reader.close()
+        if self.readahead is not None:
+            self.readahead.close()
+
+
+class ThreadedSource(TraceSource):
+    """
+    Reads traces from another source in a background thread, handing them to the consumer in batches through a bounded
+    queue so decompression and decoding overlap with parsing. Exceptions raised by the reader are re-raised in the
+    consumer at the point in the stream where they occurred.
+    """
+
+    def __init__(self, source: TraceSource, maxsize=64, batchsize=256):
+        super().__init__(source.filename)
+        self.source = source
+        self.maxsize = maxsize
+        self.batchsize = batchsize
+        self.queue = None
+        self.stop = Event()
+        self.thread = None
+
+    def _put(self, item):
+        while not self.stop.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _produce(self):
+        batch = []
+        try:
+            for trace in self.source:
+                batch.append(trace)
+                if len(batch) >= self.batchsize:
+                    if not self._put(batch):
+                        return
+                    batch = []
+        except Exception as e:
+            if self._put(batch):
+                self._put(e)
+        else:
+            if self._put(batch):
+                self._put(None)
+
+    def __iter__(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield from item
+
+    def open(self):
+        self.source.open()
+        self.addr = self.source.addr
+        self.hostname = self.source.hostname
+        self.queue = Queue(self.maxsize)
+        self.stop.clear()
+        self.thread = Thread(target=self._produce, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.stop.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.source.close()
+
+
+def open_source(tfile: TraceFile, threaded=False, readahead=False) -> TraceSource:
+    """
+    Create and open the trace source for a file.
+    :param tfile: file and output type, filename - reads from stdin
+    :param threaded: read and decode traces in a background thread
+    :param readahead: decompress compressed files ahead of the reader in separate threads or processes
+    """
+    source = FileSource(tfile, readahead=readahead)
+    if threaded:
+        source = ThreadedSource(source)
+    source.open()
+    return source
+
+
+def watch_directory(directory, otype: OutputType, pattern='*', interval=5, idle=300):
+    """
+    Yield files as they appear in a directory that is being appended to. A file is yielded once its size stops
+    changing between polls.
+    :param directory: directory to watch
+    :param otype: output type of the files
+    :param pattern: glob pattern for filenames
+    :param interval: seconds between polls
+    :param idle: stop after this many seconds without a new file, or never when None
+    """
+    seen = set()
+    sizes = {}
+    last = time.time()
+    while True:
+        found = False
+        with os.scandir(directory) as it:
+            entries = sorted((entry for entry in it if entry.is_file() and fnmatch(entry.name, pattern)), key=lambda e: e.name)
+        for entry in entries:
+            if entry.path in seen:
+                continue
+            size = entry.stat().st_size
+            if sizes.get(entry.path) == size:
+                seen.add(entry.path)
+                del sizes[entry.path]
+                found = True
+                yield TraceFile(entry.path, otype)
+            else:
+                sizes[entry.path] = size
+        if found:
+            last = time.time()
+        elif idle is not None and not sizes and time.time() - last >= idle:
+            return
+        time.sleep(interval)
@@ -0,0 +1,115 @@
+import mmap
+import struct
+from array import array
+
+MAGIC = b'BDRTRIPS'
+VERSION = 1
+HEADER = struct.Struct('<8sIxxxxQQQ')
+# Address number for a missing first address
+NONE = 0xFFFFFFFF
+
+
+def is_triplets(filename):
+    """
+    Check whether a file is a binary triplets file written by write_triplets.
+    """
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_triplets(filename, triplets):
+    """
+    Write hop triplets as an address table followed by columns of address numbers and counts.
+    :param triplets: mapping of (w, x, y) to count, w is None when x is the first hop
+    """
+    index = {}
+    ws = array('I')
+    xs = array('I')
+    ys = array('I')
+    counts = array('Q')
+    for (w, x, y), n in triplets.items():
+        ws.append(NONE if w is None else index.setdefault(w, len(index)))
+        xs.append(index.setdefault(x, len(index)))
+        ys.append(index.setdefault(y, len(index)))
+        counts.append(n)
+    encoded = [addr.encode() for addr in index]
+    offsets = array('Q', [0])
+    for addr in encoded:
+        offsets.append(offsets[-1] + len(addr))
+    blob = b''.join(encoded)
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(encoded), len(counts), len(blob)))
+        for col in [offsets, counts, ws, xs, ys]:
+            col.tofile(f)
+            # Keep every column 8 byte aligned for the memoryview casts
+            f.write(bytes(-f.tell() % 8))
+        f.write(blob)
+
+
+class Triplets:
+    """
+    Memory-mapped binary triplets file.
+    """
+
+    def __init__(self, filename):
+        self.file = open(filename, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self.mm)
+        magic, version, naddrs, self.n, nblob = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError('{} is not a triplets file.'.format(filename))
+        if version != VERSION:
+            raise ValueError('Unsupported triplets version {} in {}.'.format(version, filename))
+        offset = HEADER.size
+        views = []
+        for fmt, size, n in [('Q', 8, naddrs + 1), ('Q', 8, self.n), ('I', 4, self.n), ('I', 4, self.n), ('I', 4, self.n)]:
+            views.append(buf[offset:offset + size * n].cast(fmt))
+            offset += size * n
+            offset += -offset % 8
+        offsets, self.counts, self.ws, self.xs, self.ys = views
+        blob = bytes(buf[offset:offset + nblob])
+        self.addrs = [blob[offsets[i]:offsets[i + 1]].decode() for i in range(naddrs)]
+        self.views = views + [buf]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __len__(self):
+        return self.n
+
+    def records(self, start=0, end=None):
+        """
+        Yield (w, x, y) for the triplets in [start, end), w is None when x was the first hop.
+        """
+        addrs = self.addrs
+        ws, xs, ys = self.ws, self.xs, self.ys
+        for i in range(start, self.n if end is None else end):
+            w = ws[i]
+            yield (addrs[w] if w != NONE else None), addrs[xs[i]], addrs[ys[i]]
+
+    def items(self):
+        """
+        Yield ((w, x, y), count) for every triplet.
+        """
+        return zip(self.records(), self.counts)
+
+    def close(self):
+        for view in self.views:
+            view.release()
+        self.mm.close()
+        self.file.close()
+
+
+def verify_triplets(filename, triplets):
+    """
+    Reload a triplets file and compare it with the triplets that were written.
+    :param triplets: mapping of (w, x, y) to count passed to write_triplets
+    :return: list of triplets whose counts differ, are missing, or were added
+    """
+    with Triplets(filename) as t:
+        loaded = dict(t.items())
+    return [key for key in loaded.keys() | triplets.keys() if loaded.get(key) != triplets.get(key)]
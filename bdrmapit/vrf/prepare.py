@@ -1,6 +1,9 @@
+import os
 import pickle
 from collections import defaultdict
-from typing import Dict, Optional
+from itertools import islice
+from multiprocessing.pool import Pool
+from typing import Dict, FrozenSet, Optional, Tuple
 
 from traceutils.as2org.as2org import AS2Org
 from traceutils.file2 import fopen
@@ -9,13 +12,115 @@ from traceutils.radix.ip2as import IP2AS
 from traceutils.utils.net import otherside
 
 from bdrmapit.container.container import Container
+from bdrmapit.graph.node import Interface, Router
+from bdrmapit.parser.readahead import compression
+from bdrmapit.parser.triplets import Triplets, is_triplets
 from scripts.traceparser import ParseResults
 from bdrmapit.vrf.vrfedge import VRFEdge, VType
 
+_vrfprep: Optional['VRFPrep'] = None
 
-class VRFPrep(Container):
-    def __init__(self, ip2as: IP2AS, as2org: AS2Org, parseres: ParseResults, vrfinfo=None):
-        super().__init__(ip2as, as2org, parseres)
+
+def find_marks(triplets, middle, last, ip2as, marks):
+    """
+    Add the marks for triplets to marks.
+    :param triplets: iterable of (w, x, y), w is empty or None when x is the first hop
+    :param marks: set of (a, b, c) marks, with c None when only the a-b edge is marked
+    """
+    for w, x, y in triplets:
+        if x in middle:
+            if not w:
+                if None in middle[x]:
+                    marks.add((x, y, None))
+            else:
+                if ip2as[w] in middle[x]:
+                    marks.add((w, x, y))
+        if y in last:
+            if not w:
+                if None not in last[y]:
+                    marks.add((x, y, None))
+            else:
+                if ip2as[x] not in last[y]:
+                    marks.add((x, y, None))
+
+
+def split_lines(lines):
+    for line in lines:
+        yield line.split()
+
+
+def scan_lines(lines):
+    """
+    Find the marks for a batch of "w x y" triplet lines in a worker process.
+    """
+    prep = _vrfprep
+    marks = set()
+    find_marks(split_lines(lines), prep.middle, prep.last, prep.ip2as, marks)
+    return marks
+
+
+def scan_records(args):
+    """
+    Find the marks for a range of records in a binary triplets file in a worker process.
+    :param args: filename, first record, end record
+    """
+    filename, start, end = args
+    prep = _vrfprep
+    marks = set()
+    with Triplets(filename) as triplets:
+        find_marks(triplets.records(start, end), prep.middle, prep.last, prep.ip2as, marks)
+    return marks
+
+
+def read_range(filename, start, end):
+    """
+    Yield the lines of an uncompressed file that start in the byte range [start, end).
+    """
+    with open(filename, 'rb') as f:
+        if start > 0:
+            # Skip the line that began in the previous range
+            f.seek(start - 1)
+            f.readline()
+        pos = f.tell()
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            yield line.decode()
+
+
+def scan_range(args):
+    """
+    Find the marks for the lines in a byte range of an uncompressed triplets file in a worker process.
+    :param args: filename, start offset, end offset
+    """
+    return scan_lines(read_range(*args))
+
+
+def batches(f, size):
+    while True:
+        batch = list(islice(f, size))
+        if not batch:
+            break
+        yield batch
+
+
+class VRFPrepMixin:
+    """
+    VRF preparation shared by the container variants. Subclasses provide the interfaces and routers, the add_succ and
+    add_pred edge methods, and the original nexthop and multi edges, either as {x: {y: observations}} or {x: [y]}.
+    """
+
+    interfaces: Dict[str, Interface]
+    routers: Dict[str, Router]
+
+    def init_vrfprep(self, ip2as: IP2AS, vrfinfo=None, nexthop=None, multi=None):
+        """
+        :param vrfinfo: dictionary with the middle and last forwarding addresses
+        :param nexthop: original nexthop edges
+        :param multi: original multihop edges
+        """
         if vrfinfo:
             self.middle = vrfinfo['middle']
             self.last = vrfinfo['last']
@@ -23,21 +128,21 @@ class VRFPrep(Container):
             self.middle = None
             self.last = None
         self.ip2as = ip2as
-        self.create_edges()
-        self.original_nexthop = dict(self.nexthops)
-        self.original_multi = dict(self.multi)
+        self.original_nexthop = nexthop
+        self.original_multi = multi
         self.bnext: Optional[Dict[str, Dict[str, VType]]] = None
         self.anext = None
         self.bmulti: Optional[Dict[str, Dict[str, VType]]] = None
         self.amulti = None
-        self.prune = None
+        self.prune: Optional[Dict[str, FrozenSet[str]]] = None
+        # One shared edge per (successor router, vtype, origin AS)
+        self.vrfedges: Dict[Tuple[Router, VType, int], VRFEdge] = {}
 
     def load_vrfinfo(self, filename):
         with open(filename, 'rb') as f:
             vrfinfo = pickle.load(f)
         self.middle = vrfinfo['middle']
         self.last = vrfinfo['last']
-        # self.middle = {x: asns for x, asns in self.middle.items() if asns != {self.ip2as[x]}}
 
     def merge_edgetypes(self, toforward, forwarding):
         bedges = defaultdict(dict)
@@ -54,20 +159,69 @@ class VRFPrep(Container):
         bedges.default_factory = None
         return bedges
 
-    def mark_vrfs(self, triplets):
+    def scan_triplets(self, triplets, poolsize=1, parts_per_worker=4, batchsize=1000000):
+        """
+        Find the distinct marks in a triplets file, either the binary file written by traceparser --triplets or a text
+        file of "w x y" lines. Workers scan record ranges of binary files, byte ranges of uncompressed text files, and
+        batches of lines read here for compressed text files.
+        :param triplets: triplets filename
+        :param poolsize: number of worker processes
+        :param parts_per_worker: ranges per worker, for load balancing
+        :param batchsize: lines per batch for compressed files
+        :return: set of (a, b, c) marks
+        """
+        global _vrfprep
+        marks = set()
+        binary = is_triplets(triplets)
+        if poolsize <= 1:
+            if binary:
+                with Triplets(triplets) as t:
+                    find_marks(t.records(), self.middle, self.last, self.ip2as, marks)
+            else:
+                with fopen(triplets) as f:
+                    find_marks(split_lines(f), self.middle, self.last, self.ip2as, marks)
+            return marks
+        # Workers inherit the middle and last addresses through fork
+        _vrfprep = self
+        try:
+            with Pool(poolsize) as pool:
+                if binary or compression(triplets) is None:
+                    if binary:
+                        with Triplets(triplets) as t:
+                            size = len(t)
+                        scan = scan_records
+                    else:
+                        size = os.path.getsize(triplets)
+                        scan = scan_range
+                    step = max(1, -(-size // (poolsize * parts_per_worker)))
+                    ranges = [(triplets, start, min(start + step, size)) for start in range(0, size, step)]
+                    pb = Progress(len(ranges), 'Scanning triplets', increment=1, callback=lambda: 'Marks {:,d}'.format(len(marks)))
+                    for part in pb.iterator(pool.imap_unordered(scan, ranges)):
+                        marks.update(part)
+                else:
+                    with fopen(triplets) as f:
+                        pb = Progress(message='Scanning triplets', increment=1, callback=lambda: 'Marks {:,d}'.format(len(marks)))
+                        for part in pb.iterator(pool.imap_unordered(scan_lines, batches(f, batchsize))):
+                            marks.update(part)
+        finally:
+            _vrfprep = None
+        return marks
+
+    def mark_vrfs(self, triplets, poolsize=1):
+        """
+        Mark the forwarding edges found in the triplets.
+        :param triplets: binary triplets file, file of "w x y" lines, or iterable of (w, x, y)
+        :param poolsize: number of worker processes scanning a triplets file
+        """
         toforward_next = defaultdict(set)
         forwarding_next = defaultdict(set)
-        self.bnext = defaultdict(dict)
         self.anext = defaultdict(set)
         toforward_multi = defaultdict(set)
         forwarding_multi = defaultdict(set)
-        self.bmulti = defaultdict(dict)
         self.amulti = defaultdict(set)
-        self.prune = defaultdict(set)
+        prune = defaultdict(set)
 
         def mark(a, b, c=None):
-            if a == '17.1.154.14' or b == '17.1.154.14':
-                print(a, b, c)
             if a in self.original_nexthop and b in self.original_nexthop[a]:
                 toforward = toforward_next
                 forwarding = forwarding_next
@@ -77,70 +231,76 @@ class VRFPrep(Container):
                 forwarding = forwarding_multi
                 aedges = self.amulti
             if a:
-                self.prune[a].add(b)
+                prune[a].add(b)
                 toforward[a].add(b)
                 forwarding[b].add(a)
             if c:
-                self.prune[b].add(c)
+                prune[b].add(c)
                 aedges[b].add(c)
                 aedges[c].add(b)
 
-        pb = Progress(message='Marking VRF edges', increment=500000, callback=lambda: '{:,d}'.format(len(self.prune)))
-        print(self.middle.get('2001:504:0:1::6939:1'))
-        with fopen(triplets) as f:
-            for line in pb.iterator(f):
-                w, x, y = line.split()
-                if x in self.middle:
-                    # if x == '2001:504:0:1::6939:1':
-                    #     print(w, x, y)
-                    if not w:
-                        if None in self.middle[x]:
-                            mark(x, y)
-                    else:
-                        if self.ip2as[w] in self.middle[x]:
-                            mark(w, x, y)
-                if y in self.last:
-                    if not w:
-                        if None not in self.last[y]:
-                            mark(x, y)
-                    else:
-                        pasns = self.last[y]
-                        if self.ip2as[x] not in pasns:
-                            mark(x, y)
+        if isinstance(triplets, str):
+            marks = self.scan_triplets(triplets, poolsize=poolsize)
+        else:
+            marks = set()
+            find_marks(triplets, self.middle, self.last, self.ip2as, marks)
+        pb = Progress(len(marks), 'Marking VRF edges', increment=500000, callback=lambda: '{:,d}'.format(len(prune)))
+        for a, b, c in pb.iterator(marks):
+            mark(a, b, c)
+        # Frozen copies are sized to their contents, unlike the grown sets
+        self.prune = {a: frozenset(bs) for a, bs in prune.items()}
         self.bnext = self.merge_edgetypes(toforward_next, forwarding_next)
         self.bmulti = self.merge_edgetypes(toforward_multi, forwarding_multi)
 
-    def remove_vrfs(self, edges, debug=None):
+    def remove_vrfs(self, edges):
+        """
+        Remove the pruned edges. Successors of addresses without pruned edges are kept as is rather than copied.
+        :param edges: {x: {y: observations}} or {x: [y]}
+        :return: remaining edges, in the same form
+        """
         nexthop = {}
-        removed = set()
-        pb = Progress(len(edges), 'Removing forwarding address edges', increment=500000, callback=lambda: 'K {:,d} R {:,d}'.format(len(nexthop), len(removed)))
+        removed = 0
+        pb = Progress(len(edges), 'Removing forwarding address edges', increment=500000, callback=lambda: 'K {:,d} R {:,d}'.format(len(nexthop), removed))
         for x, succ in pb.iterator(edges.items()):
-            if x == debug:
-                print(x, succ, self.prune.get(x))
-            if x in self.prune:
-                newsucc = succ - self.prune[x]
-                # newsucc = [y for y in succ if y not in self.prune[x]]
-                if newsucc:
-                    nexthop[x] = newsucc
-                else:
-                    removed.add(x)
-            else:
+            prune = self.prune.get(x)
+            if prune is None or prune.isdisjoint(succ):
                 nexthop[x] = succ
+                continue
+            if isinstance(succ, dict):
+                # Keep the observation counts of the remaining edges
+                newsucc = {y: n for y, n in succ.items() if y not in prune}
+            else:
+                newsucc = [y for y in succ if y not in prune]
+            if newsucc:
+                nexthop[x] = newsucc
+            else:
+                removed += 1
         return nexthop
 
-    def remove_nexthop(self, **kwargs):
-        self.nexthops = self.remove_vrfs(self.original_nexthop, **kwargs)
+    def remove_nexthop(self):
+        self.nexthops = self.remove_vrfs(self.original_nexthop)
 
     def remove_multi(self):
         self.multi = self.remove_vrfs(self.original_multi)
 
+    def vrfedge(self, srouter: Router, vtype: VType, asn: int):
+        """
+        Return the shared forwarding edge to a router, seen after an interface with origin AS asn. Keying on the origin
+        AS keeps each edge's origins identical to a per-address edge.
+        """
+        key = (srouter, vtype, asn)
+        edge = self.vrfedges.get(key)
+        if edge is None:
+            edge = self.vrfedges[key] = VRFEdge(srouter, vtype)
+        return edge
+
     def add_vrfedges(self, bedges: Dict[str, Dict[str, VType]], nexthop, skip_exists=True, increment=100000):
         etype = 'nexthop' if nexthop else 'multi'
         pb = Progress(len(bedges), 'Adding {} forwarding edges'.format(etype), increment=increment)
         for addr, succs in pb.iterator(bedges.items()):
-            if addr not in self.interfaces:
+            interface = self.interfaces.get(addr)
+            if interface is None:
                 continue
-            interface = self.interfaces[addr]
             router = interface.router
             if not nexthop and router.nexthop:
                 continue
@@ -149,11 +309,11 @@ class VRFPrep(Container):
             router.nexthop = nexthop
             router.vrf = True
             for succ, vtype in succs.items():
-                if succ not in self.interfaces:
+                sinterface = self.interfaces.get(succ)
+                if sinterface is None:
                     continue
-                srouter = self.interfaces[succ].router
-                edge = VRFEdge(srouter, vtype)
-                self.add_succ(router, interface, edge)
+                # Count each address-level edge so votes keep their per-address weight
+                self.add_succ(router, interface, self.vrfedge(sinterface.router, vtype, interface.asn), 1)
 
     def add_nexthop_forwarding(self, skip_exists=True, increment=100000):
         """
@@ -197,35 +357,29 @@ class VRFPrep(Container):
     def reset(self, keep_nodes=True):
         pb = Progress(len(self.routers), 'Resetting router edges', increment=1000000)
         for router in pb.iterator(self.routers.values()):
-            router.succ.clear()
-            router.origins.clear()
+            router.clear_edges()
         pb = Progress(len(self.interfaces), 'Resetting interface edges', increment=1000000)
         for interface in pb.iterator(self.interfaces.values()):
             interface.pred.clear()
+        self.vrfedges.clear()
+
+    def prepare_addrs(self):
+        """
+        Select the addresses and destination pairs before the nodes are created, if the container needs it.
+        """
+        pass
 
     def construct(self, nodes_file=None, skip_exists=True, skip_nodes=False, skip_dests=False, skip_graph=False):
         """
         Construct the graph from scratch.
-        :param skip_graph: 
-        :param skip_dests: 
-        :param skip_nodes: 
-        :param skip_exists: 
         :param nodes_file: alias resolution dataset
+        :param skip_exists: don't add vrf edges if normal edges exist
+        :param skip_nodes: keep the existing routers and interfaces
+        :param skip_dests: don't add the destination ASes
+        :param skip_graph: don't create the graph
         :return: the graph
         """
-
-        # self.filter_addrs()
-        # self.create_edges()
-        # self.create_dps()
-        # if nodes_file is not None:
-        #     self.create_nodes(nodes_file=nodes_file)
-        # self.create_remaining(nodes_file is not None)
-        # self.add_nexthop()
-        # self.add_multi()
-        # self.add_dests()
-        # return self.create_graph()
-        self.filter_addrs()
-        self.create_dps()
+        self.prepare_addrs()
         if not skip_nodes:
             if nodes_file is not None:
                 self.create_nodes(nodes_file=nodes_file)
@@ -239,3 +393,14 @@ class VRFPrep(Container):
             self.add_dests()
         if not skip_graph:
             return self.create_graph()
+
+
+class VRFPrep(VRFPrepMixin, Container):
+    def __init__(self, ip2as: IP2AS, as2org: AS2Org, parseres: ParseResults, vrfinfo=None):
+        super().__init__(ip2as, as2org, parseres)
+        self.create_edges()
+        self.init_vrfprep(ip2as, vrfinfo=vrfinfo, nexthop=dict(self.nexthops), multi=dict(self.multi))
+
+    def prepare_addrs(self):
+        self.filter_addrs()
+        self.create_dps()
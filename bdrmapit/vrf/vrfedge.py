@@ -8,10 +8,12 @@ class VType(IntEnum):
 
 
 class VRFEdge:
+    """
+    Forwarding edge to a router. VRFPrep shares one edge per (router, vtype, origin AS) across all predecessors, so
+    edges are immutable.
+    """
+    __slots__ = ('node', 'vtype')
+
     def __init__(self, node, vtype: VType):
         self.node = node
         self.vtype = vtype
-
-    def update(self, vtype: VType):
-        if vtype != self.vtype:
-            self.vtype = VType.both
@@ -13,6 +13,8 @@ from traceutils.radix.ip2as import create_table
 
 from bdrmapit.algorithm.algorithm import Bdrmapit
 from bdrmapit.container.container import Container
+from bdrmapit.graph.construct import Graph
+from bdrmapit.graph.serialize import is_graph, verify_graph
 from bdrmapit.output.saveres import Save, ITDK
 import scripts.traceparser as tp
 
@@ -24,6 +26,23 @@ class ExecTypes(Enum):
     bdrmapit_graph = 3
     bdrmapit_config = 4
 
+# Options applied while constructing the graph, as (dest, flag, default). A saved graph was built with its own.
+CONSTRUCT_OPTIONS = [
+    ('routers', '--routers', None),
+    ('as_hints', '--as-hints', None),
+    ('no_echos', '--no-echos', False),
+    ('packed_addrs', '--packed-addrs', False),
+    ('construct_poolsize', '--construct-poolsize', 1),
+    ('save_graph', '--save-graph', None),
+    ('verify_graph', '--verify-graph', False),
+]
+
+def construct_options(args):
+    """
+    Return the construction options set in args.
+    """
+    return [flag for dest, flag, default in CONSTRUCT_OPTIONS if getattr(args, dest, default) != default]
+
 def set_bdrmapit_parser(parser: ArgumentParser):
     group = parser.add_argument_group('CAIDA AS2Org')
     group.add_argument('-b', '--as2org', required=True, help='CAIDA AS2Org filename')
@@ -36,6 +55,10 @@ def set_bdrmapit_parser(parser: ArgumentParser):
     parser.add_argument('-I', '--max-iterations', default=5, type=int, help='Maximum number of iterations to run the graph refinement loop.')
     parser.add_argument('-H', '--as-hints', help='AS hints file.')
     parser.add_argument('--no-echos', action='store_true', help='Ignore echo-only addresses.')
+    parser.add_argument('--construct-poolsize', type=int, default=1, help='Number of processes used to add graph edges.')
+    parser.add_argument('--save-graph', help='Save the constructed graph to this file, which can be passed to graph -g to skip construction. The construction options are saved with it.')
+    parser.add_argument('--verify-graph', action='store_true', help='Reload the graph saved with --save-graph, and exit if it differs from the constructed graph.')
+    parser.add_argument('--packed-addrs', action='store_true', help='Store interface addresses packed to reduce graph memory, mostly for IPv6.')
     set_bdrmapit_parser_output(parser)
 
 def set_bdrmapit_parser_output(parser: ArgumentParser):
@@ -93,7 +116,7 @@ def main(args=None):
         bparser.set_defaults(etype=ExecTypes.bdrmapit_all)
 
         gparser = subs.add_parser('graph')
-        gparser.add_argument('-g', '--graph', required=True, help='Pickle file with graph.')
+        gparser.add_argument('-g', '--graph', required=True, help='Pickle file with parse results, or a graph saved with --save-graph. A saved graph already includes the aliases, hints, and other construction options it was saved with, so those options cannot be used with it.')
         gparser.add_argument('-i', '--ip2as', required=True, help='Filename of prefix-to-AS mappings in CAIDA prefix2as format.')
         set_bdrmapit_parser(gparser)
         gparser.set_defaults(etype=ExecTypes.bdrmapit_graph)
@@ -121,21 +144,41 @@ def main(args=None):
         tp.main(args=args)
         return
 
+    saved_graph = args.etype != ExecTypes.bdrmapit_all and is_graph(args.graph)
+    if saved_graph:
+        options = construct_options(args)
+        if options:
+            print('Cannot use {} with a saved graph, which already includes its construction options'.format(', '.join(options)), file=sys.stderr)
+            sys.exit(1)
+
     ip2as = create_table(args.ip2as)
     as2org = AS2Org(args.as2org, additional=args.as2org_extra)
+    prep = None
     if args.etype == ExecTypes.bdrmapit_all:
         args.output = None
         parseres = tp.main(args=args, ip2as=ip2as)
-        prep = Container(ip2as, as2org, parseres)
+        prep = Container(ip2as, as2org, parseres, packed=getattr(args, 'packed_addrs', False))
+    elif saved_graph:
+        graph = Graph.load(args.graph)
     else:
         sys.stdout.write('Unpickling graph.')
-        prep = Container.load(ip2as, as2org, args.graph)
+        prep = Container.load(ip2as, as2org, args.graph, packed=getattr(args, 'packed_addrs', False))
         sys.stdout.write(' Done.\n')
 
     bgp = BGP(args.rels, args.cone)
-    use_hints = args.as_hints is not None
 
-    graph = prep.construct(nodes_file=args.routers, hints_file=args.as_hints, no_echos=args.no_echos)
+    if prep is not None:
+        graph = prep.construct(nodes_file=args.routers, hints_file=args.as_hints, no_echos=args.no_echos, poolsize=getattr(args, 'construct_poolsize', 1))
+        if getattr(args, 'save_graph', None):
+            graph.save(args.save_graph)
+            if getattr(args, 'verify_graph', False):
+                tp.report_mismatches(args.save_graph, verify_graph(graph, args.save_graph))
+        use_hints = args.as_hints is not None
+        aliases = args.routers is not None
+    else:
+        # Recover the options the saved graph was built with
+        use_hints = any(router.hints is not None for router in graph.routers.values())
+        aliases = any(name[0] == 'N' for name in graph.routers)
 
     bdrmapit = Bdrmapit(graph, as2org, bgp, strict=False)
     if args.peeringdb:
@@ -150,7 +193,7 @@ def main(args=None):
         save.save_ixps()
         save.save_links()
     if args.itdk:
-        include_all = args.routers is None
+        include_all = not aliases
         save = ITDK(bdrmapit)
         save.write_nodes(args.itdk, include_all=include_all)
 
@@ -4,7 +4,7 @@ from argparse import ArgumentParser
 from collections import Counter, defaultdict
 from enum import Enum
 from multiprocessing.pool import Pool
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
 
 from traceutils.file2.file2 import File2, fopen
 from traceutils.progress.bar import Progress
@@ -15,9 +15,11 @@ from traceutils.scamper.warts import WartsReader, WartsJsonReader
 from traceutils.scamper.pyatlas import AtlasReader as AtlasOddReader
 from traceutils.utils.net import otherside, prefix_addrs
 
+from bdrmapit.parser.shared_ip2as import SharedIP2AS, prune_private_hops
+
 print('test')
 
-_ip2as: Optional[IP2AS] = None
+_ip2as: Optional[Union[IP2AS, SharedIP2AS]] = None
 _filemap4: Optional[Dict[str, str]] = None
 _filemap6: Optional[Dict[str, str]] = None
 _prune_loops = False
@@ -65,7 +67,7 @@ def parse(tfile: TraceFile):
                 break
             if _include_dsts:
                 addrs.add(trace.dst)
-            trace.prune_private(_ip2as)
+            prune_private_hops(trace, _ip2as)
             trace.prune_dups()
             if _prune_loops:
                 trace.prune_loops(True)
@@ -148,10 +150,23 @@ def parse_sequential(files):
         results.update(parse(tfile))
     return results
 
+def init_worker(ip2as, prune_loops, noechos, subnet, include_dsts, fours):
+    global _ip2as, _prune_loops, _noechos, _subnet, _include_dsts, _fours
+    _ip2as = ip2as
+    _prune_loops = prune_loops
+    _noechos = noechos
+    _subnet = subnet
+    _include_dsts = include_dsts
+    _fours = fours
+
 def parse_parallel(files, poolsize):
     results = set()
     pb = Progress(len(files), 'Parsing traceroute files', callback=lambda: '{:,d}'.format(len(results)))
-    with Pool(poolsize) as pool:
+    if isinstance(_ip2as, SharedIP2AS):
+        pool = Pool(poolsize, initializer=init_worker, initargs=(_ip2as, _prune_loops, _noechos, _subnet, _include_dsts, _fours))
+    else:
+        pool = Pool(poolsize)
+    with pool:
         for newresults in pb.iterator(pool.imap_unordered(parse, files)):
             results.update(newresults)
     return results
@@ -199,6 +214,7 @@ def main():
     group = parser.add_mutually_exclusive_group()
     group.add_argument('-s', '--subnet', action='store_true')
     group.add_argument('-4', '--fours', action='store_true')
+    parser.add_argument('-S', '--shared-ip2as', action='store_true', help='Share the private address table with parser processes through shared memory.')
     args = parser.parse_args()
     files = []
     if args.wfiles:
@@ -216,8 +232,12 @@ def main():
             files.extend(TraceFile(line.strip(), OutputType.JSONWARTS) for line in f if line[0] != '#')
     if args.jfilelist:
         files.extend(TraceFile(file, OutputType.JSONWARTS) for file in args.jfilelist)
-    ip2as = create_private()
-    run(files, ip2as, args.poolsize, args.output, prune_loops=args.prune_loops, noechos=args.noechos, subnet=args.subnet, include_dsts=args.include_dsts, fours=args.fours)
+    ip2as = SharedIP2AS.create(private=True) if args.shared_ip2as else create_private()
+    try:
+        run(files, ip2as, args.poolsize, args.output, prune_loops=args.prune_loops, noechos=args.noechos, subnet=args.subnet, include_dsts=args.include_dsts, fours=args.fours)
+    finally:
+        if args.shared_ip2as:
+            ip2as.unlink()
 
 if __name__ == '__main__':
     main()
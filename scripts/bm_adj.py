@@ -4,7 +4,7 @@ from argparse import ArgumentParser
 from collections import Counter, defaultdict
 from enum import Enum
 from multiprocessing.pool import Pool
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
 
 from file2 import fopen
 from pb_amarder.bar import Progress
@@ -14,9 +14,11 @@ from traceutils.scamper.hop import ICMPType, Hop
 from traceutils.scamper.warts import WartsReader, WartsJsonReader
 from traceutils.scamper.pyatlas import AtlasReader as AtlasOddReader
 
+from bdrmapit.parser.shared_ip2as import SharedIP2AS, prune_private_hops
+
 print('current')
 
-_ip2as: Optional[IP2AS] = None
+_ip2as: Optional[Union[IP2AS, SharedIP2AS]] = None
 _filemap4: Optional[Dict[str, str]] = None
 _filemap6: Optional[Dict[str, str]] = None
 _prune_private = True
@@ -51,7 +53,7 @@ def parse(tfile: TraceFile):
         f.open()
         for trace in f:
             if _prune_private:
-                trace.prune_private(_ip2as)
+                prune_private_hops(trace, _ip2as)
             trace.prune_dups()
             trace.prune_loops(True)
             # if trace.loop:
@@ -91,10 +93,19 @@ def parse_sequential(files):
         results.update(newresults)
     return results
 
+def init_worker(ip2as, prune_private):
+    global _ip2as, _prune_private
+    _ip2as = ip2as
+    _prune_private = prune_private
+
 def parse_parallel(files, poolsize):
     results = set()
     pb = Progress(len(files), 'Parsing traceroute files', callback=lambda: '{:,d}'.format(len(results)))
-    with Pool(poolsize) as pool:
+    if isinstance(_ip2as, SharedIP2AS):
+        pool = Pool(poolsize, initializer=init_worker, initargs=(_ip2as, _prune_private))
+    else:
+        pool = Pool(poolsize)
+    with pool:
         for newresults in pb.iterator(pool.imap_unordered(parse, files)):
             results.update(newresults)
     return results
@@ -148,6 +159,7 @@ def main():
     parser.add_argument('-o', '--output', required=True)
     parser.add_argument('-k', '--keep-private', action='store_true')
     parser.add_argument('-P', '--pickle', action='store_true')
+    parser.add_argument('-S', '--shared-ip2as', action='store_true', help='Share the private address table with parser processes through shared memory.')
     args = parser.parse_args()
     files = []
     if args.wfiles:
@@ -165,9 +177,13 @@ def main():
             files.extend(TraceFile(line.strip(), OutputType.JSONWARTS) for line in f if line[0] != '#')
     if args.jfilelist:
         files.extend(TraceFile(file, OutputType.JSONWARTS) for file in args.jfilelist)
-    ip2as = create_private()
+    ip2as = SharedIP2AS.create(private=True) if args.shared_ip2as else create_private()
     prune_private = not args.keep_private
-    run(files, ip2as, args.poolsize, args.output, prune_private=prune_private, serialize=args.pickle)
+    try:
+        run(files, ip2as, args.poolsize, args.output, prune_private=prune_private, serialize=args.pickle)
+    finally:
+        if args.shared_ip2as:
+            ip2as.unlink()
 
 if __name__ == '__main__':
     main()
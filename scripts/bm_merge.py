@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+import os
+import shutil
+import tempfile
+from argparse import ArgumentParser
+from multiprocessing.pool import Pool
+from sys import stderr
+
+from traceutils.file2.file2 import fopen
+from traceutils.progress.bar import Progress
+
+from bdrmapit.parser.sections import write_sections, read_index
+from scripts.traceparser import ParseResults
+
+# Rough ratio of in-memory container size to pickled section size
+EXPANSION = 5
+
+
+def merge_files(files, output):
+    """
+    Merge ParseResults files into one output file. Fields are merged and written one at a time, so only one field of
+    the inputs is in memory at once.
+    :param files: ParseResults files
+    :param output: output filename
+    """
+    results = ParseResults.load(files[0], lazy=True)
+    for file in files[1:]:
+        results.update(ParseResults.load(file, lazy=True))
+
+    def sections():
+        for k in ParseResults.FIELDS:
+            yield k, getattr(results, k)
+            # Release each merged field before the next is read
+            delattr(results, k)
+
+    write_sections(output, sections())
+    return output
+
+
+def merge_pair(args):
+    return merge_files(*args)
+
+
+def estimate(files):
+    """
+    Estimate the peak memory in bytes of merging files, from the largest combined field.
+    """
+    fields = {}
+    for file in files:
+        index = read_index(file)
+        if index is None:
+            # Older outputs are a single pickle that is loaded all at once
+            fields[file] = os.path.getsize(file)
+        else:
+            for k, (_, length) in index.items():
+                fields[k] = fields.get(k, 0) + length
+    return EXPANSION * max(fields.values(), default=0)
+
+
+def merge(files, output, poolsize=1, memory=None, tmpdir=None):
+    """
+    Pairwise tree merge of ParseResults files. Each round merges pairs of files in parallel, so the full set is merged
+    in log2(files) rounds.
+    :param files: ParseResults files
+    :param output: output filename
+    :param poolsize: maximum concurrent merges
+    :param memory: memory ceiling in bytes, limits the concurrent merges in a round by their estimated memory
+    :param tmpdir: directory for intermediate files
+    """
+    workdir = tempfile.mkdtemp(prefix='bm_merge.', dir=tmpdir)
+    intermediates = set()
+    try:
+        rnd = 0
+        while len(files) > 2:
+            pairs = [files[i:i + 2] for i in range(0, len(files) - 1, 2)]
+            outputs = [os.path.join(workdir, '{}.{}.results'.format(rnd, i)) for i in range(len(pairs))]
+            concurrency = min(poolsize, len(pairs))
+            if memory is not None:
+                peak = max(estimate(pair) for pair in pairs)
+                if peak > 0:
+                    concurrency = max(1, min(concurrency, memory // peak))
+            Progress.message('Round {}: {:,d} files, {:,d} concurrent merges'.format(rnd, len(files), concurrency), file=stderr)
+            pb = Progress(len(pairs), 'Merging')
+            if concurrency == 1:
+                merged = [merge_files(pair, out) for pair, out in pb.iterator(zip(pairs, outputs))]
+            else:
+                with Pool(concurrency) as pool:
+                    merged = list(pb.iterator(pool.imap_unordered(merge_pair, zip(pairs, outputs))))
+            for pair in pairs:
+                for file in pair:
+                    if file in intermediates:
+                        os.remove(file)
+                        intermediates.discard(file)
+            intermediates.update(merged)
+            if len(files) % 2:
+                merged.append(files[-1])
+            files = merged
+            rnd += 1
+        Progress.message('Writing {}'.format(output), file=stderr)
+        merge_files(files, output)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('-r', '--rfiles', help='File with list of newline-separated ParseResults filenames.')
+    parser.add_argument('-R', '--rfilelist', nargs='+', help='List of ParseResults filenames, space separated.')
+    parser.add_argument('-o', '--output', required=True, help='Filename for merged output file.')
+    parser.add_argument('-p', '--poolsize', type=int, default=1)
+    parser.add_argument('-m', '--memory', type=float, help='Memory ceiling in GB for concurrent merges.')
+    parser.add_argument('-t', '--tmpdir', help='Directory for intermediate files.')
+    args = parser.parse_args()
+    files = []
+    if args.rfiles:
+        with fopen(args.rfiles) as f:
+            files.extend(line.strip() for line in f if line[0] != '#' and line.strip())
+    if args.rfilelist:
+        files.extend(args.rfilelist)
+    if not files:
+        parser.error('No ParseResults files given.')
+    memory = int(args.memory * 1024 ** 3) if args.memory is not None else None
+    merge(files, args.output, poolsize=args.poolsize, memory=memory, tmpdir=args.tmpdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+import sys
+from argparse import ArgumentParser
+
+from bdrmapit.container.nodes_index import build_index, verify_index
+
+
+def main():
+    parser = ArgumentParser(description='Convert an ITDK nodes file into a binary index usable in place of the nodes file.')
+    parser.add_argument('-n', '--nodes', required=True, help='Alias resolution file in CAIDA ITDK format.')
+    parser.add_argument('-o', '--output', required=True, help='Filename for the nodes index.')
+    parser.add_argument('--verify', action='store_true', help='Reload the index and compare it with the nodes file.')
+    args = parser.parse_args()
+    build_index(args.nodes, args.output)
+    if args.verify:
+        mismatches = verify_index(args.nodes, args.output)
+        for name, addr in mismatches:
+            print(name, addr, file=sys.stderr)
+        if mismatches:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,40 +1,41 @@
 #!/usr/bin/env python
 import pickle
+import sys
 from argparse import ArgumentParser
 from collections import Counter, defaultdict
-from enum import Enum
+from itertools import chain
+from multiprocessing import Barrier, Queue
 from multiprocessing.pool import Pool
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
 
 from traceutils.file2.file2 import File2, fopen
 from traceutils.progress.bar import Progress
 from traceutils.radix.ip2as import IP2AS, create_table
-from traceutils.scamper.atlas import AtlasReader
 from traceutils.scamper.hop import ICMPType, Hop
-from traceutils.scamper.warts import WartsReader, WartsJsonReader
-# from traceutils.scamper.pyatlas import AtlasReader as AtlasOddReader
 
-_ip2as: Optional[IP2AS] = None
+from bdrmapit.parser.sections import write_sections, read_index, read_section
+from bdrmapit.parser.shared_ip2as import SharedIP2AS, prune_private_hops, verify_table
+from bdrmapit.parser.sources import OutputType, TraceFile, STDIN, open_source, watch_directory
+from bdrmapit.parser.triplets import write_triplets, verify_triplets
+
+_ip2as: Optional[Union[IP2AS, SharedIP2AS]] = None
 _filemap4: Optional[Dict[str, str]] = None
 _filemap6: Optional[Dict[str, str]] = None
-
-class OutputType(Enum):
-    WARTS = 1
-    ATLAS = 2
-    ATLAS_ODD = 3
-    JSONWARTS = 4
-
-class TraceFile:
-    def __init__(self, filename, type):
-        self.filename = filename
-        self.type = type
-
-    def __repr__(self):
-        return self.filename
+_kernel = None
+_threaded = False
+_readahead = False
+_dedup = False
+_triplets = False
+_accum: Optional['ParseResults'] = None
+_barrier = None
+_queues = None
 
 class ParseResults:
+    FIELDS = ('addrs', 'dps', 'spoofing', 'echos', 'cycles', 'loopadjs', 'nextadjs', 'multiadjs', 'vps', 'first', 'triplets')
 
     def __init__(self):
+        # Fields not yet deserialized, mapped to the file sections that will be merged to produce them
+        self._sections: Dict[str, List[tuple]] = {}
         self.addrs = set()
         self.dps = set()
         self.spoofing = set()
@@ -43,8 +44,29 @@ class ParseResults:
         self.loopadjs = Counter()
         self.nextadjs = Counter()
         self.multiadjs = Counter()
+        # Vantage point IDs, first hops are keyed by (vantage point ID, addr) rather than repeating the filename
+        self.vps: Dict[str, int] = {}
         self.first = Counter()
-        # self.triplets = Counter()
+        # Hop triplets (w, x, y) of each adjacency x-y, only collected on request, w is None when x is the first hop
+        self.triplets = Counter()
+
+    def __getattr__(self, name):
+        # Only called when the attribute is missing, which for fields means they are still on disk
+        sections = self.__dict__.get('_sections')
+        if not sections or name not in sections:
+            raise AttributeError(name)
+        value = None
+        for file, offset, length in sections.pop(name):
+            section = read_section(file, offset, length)
+            if value is None:
+                value = section
+            elif len(section) > len(value):
+                section.update(value)
+                value = section
+            else:
+                value.update(section)
+        setattr(self, name, value)
+        return value
 
     def __repr__(self):
         return 'Addrs {addrs:,d} N {nhop:,d} M {multi:,d} DPs {dests:,d} S {spoof:,d} E {echo:,d} C {cycle:,d} L {loop:,d} F {first:,d}'.format(
@@ -57,39 +79,208 @@ class ParseResults:
     def __str__(self):
         return self.__repr__()
 
+    def loaded(self, field):
+        return field in self.__dict__
+
+    def vpid(self, name):
+        """
+        Return the ID of a vantage point, adding it to the table when it is new.
+        :param name: trace filename
+        """
+        vps = self.vps
+        vid = vps.get(name)
+        if vid is None:
+            vid = vps[name] = len(vps)
+        return vid
+
+    def _convert_first(self):
+        # Older outputs key first hops by filename
+        first = Counter()
+        for (name, addr), n in self.first.items():
+            first[self.vpid(name), addr] += n
+        self.first = first
+
     def dump(self, file):
-        with open(file, 'wb') as f:
-            pickle.dump(vars(self), f)
+        write_sections(file, ((k, getattr(self, k)) for k in self.FIELDS))
 
     @classmethod
-    def load(cls, file):
-        with open(file, 'rb') as f:
-            d = pickle.load(f)
+    def load(cls, file, lazy=False):
+        """
+        Load results written by dump.
+        :param lazy: only deserialize each field when it is first accessed
+        """
         results = cls()
-        for k in d:
-            if hasattr(results, k):
-                getattr(results, k).update(d[k])
+        index = read_index(file)
+        if index is None:
+            # Older outputs pickle a dict of every field
+            with open(file, 'rb') as f:
+                d = pickle.load(f)
+            for k in d:
+                if k in cls.FIELDS:
+                    getattr(results, k).update(d[k])
+            if 'vps' not in d:
+                results._convert_first()
+            return results
+        for k in cls.FIELDS:
+            if k in index:
+                delattr(results, k)
+                offset, length = index[k]
+                results._sections[k] = [(file, offset, length)]
+        if 'vps' not in index:
+            results._convert_first()
+        if not lazy:
+            for k in cls.FIELDS:
+                getattr(results, k)
         return results
 
-    def update(self, results):
-        for k, v in vars(results).items():
-            getattr(self, k).update(v)
+    def update(self, results, consume=False):
+        """
+        Merge other results into these results. Fields that have not been loaded in either results are merged when
+        first accessed.
+        :param results: results to merge
+        :param consume: the other results are discarded afterward, so their containers can be reused
+        """
+        # Map the other vantage point IDs to IDs in this table
+        remap = {}
+        for name, vid in results.vps.items():
+            newid = self.vpid(name)
+            if newid != vid:
+                remap[vid] = newid
+        for k in self.FIELDS:
+            if k == 'vps':
+                continue
+            if k == 'first' and remap:
+                first = self.first
+                for (vid, addr), n in results.first.items():
+                    first[remap.get(vid, vid), addr] += n
+                continue
+            if not self.loaded(k) and not results.loaded(k):
+                self._sections[k].extend(results._sections[k])
+                continue
+            mine = getattr(self, k)
+            v = getattr(results, k)
+            if consume and len(v) > len(mine):
+                # Merge the smaller container into the larger one, Counter.update loops over every key it is given
+                v.update(mine)
+                setattr(self, k, v)
+            else:
+                mine.update(v)
+
+def add_path(hops: List[Hop], dst_asn, results: ParseResults, count=1, triplets=False):
+    """
+    Add the addresses and adjacencies of one pruned hop sequence.
+    :param hops: pruned and filtered hops
+    :param dst_asn: origin AS of the trace destination
+    :param count: number of traces that produced the same hops and destination AS
+    :param triplets: also count the hop triplet of each adjacency
+    """
+    lhop: Hop = hops[-1]
+    if lhop.type == ICMPType.echo_reply or lhop.type == ICMPType.portping:
+        results.echos.add(lhop.addr)
+    for i in range(len(hops)):
+        x: Hop = hops[i]
+        results.addrs.add(x.addr)
+        if x.type != ICMPType.echo_reply and x.type != ICMPType.portping:
+            results.dps.add((x.addr, dst_asn))
+        if i == len(hops) - 1:
+            break
+        y: Hop = hops[i+1]
+        if y.type == ICMPType.echo_reply or y.type == ICMPType.portping:
+            break
+        if y.type == ICMPType.spoofing and y.icmp_q_ttl > 1:
+            break
+        distance = y.probe_ttl - x.probe_ttl
+        if y.icmp_q_ttl == 0:
+            distance += 1
+        if distance > 1:
+            distance = 2
+        elif distance < 1:
+            distance = -1
+        if y.type == ICMPType.spoofing:
+            results.spoofing.add((x.addr, y.addr, distance))
+        else:
+            if distance == 1:
+                results.nextadjs[x.addr, y.addr] += count
+            else:
+                results.multiadjs[x.addr, y.addr] += count
+            if triplets:
+                results.triplets[hops[i - 1].addr if i > 0 else None, x.addr, y.addr] += count
+
+def parse_traces(f, filename, ip2as, public_ip4, public_ip6, results: ParseResults, dedup=False, triplets=False):
+    """
+    Pure Python parse kernel. Adds every trace from an opened reader to the results.
+    :param dedup: traces from different vantage points often share the same pruned hops toward a destination AS, so
+    only add each distinct path once, with its adjacency counts multiplied by the number of traces that produced it
+    :param triplets: also count hop triplets
+    """
+    paths: Dict[tuple, List[Hop]] = {}
+    pathcounts = Counter()
+    vpid = results.vpid(filename)
+    fiter = iter(f)
+    while True:
+        try:
+            trace = next(fiter)
+            prune_private_hops(trace, ip2as)
+            trace.prune_dups()
+            trace.prune_loops(True)
+            if trace.loop:
+                results.cycles.update(trace.loop)
+            hops: List[Hop] = [h for h in trace.hops if ip2as[h.addr] != -1 and h.addr != trace.src and h.addr != public_ip4 and h.addr != public_ip6]
+            if not hops: continue
+            fhop: Hop = hops[0]
+            if fhop.probe_ttl == 1:
+                results.first[vpid, fhop.addr] += 1
+            dst_asn = ip2as.asn(trace.dst)
+            if dedup:
+                key = (dst_asn, tuple([(h.addr, h.probe_ttl, h.icmp_q_ttl, h.type) for h in hops]))
+                if key not in paths:
+                    paths[key] = hops
+                pathcounts[key] += 1
+            else:
+                add_path(hops, dst_asn, results, triplets=triplets)
+            if trace.loop:
+                for x, y in zip(trace.loop, trace.loop[1:]):
+                    results.loopadjs[x.addr, y.addr] += 1
+        except UnicodeDecodeError:
+            print(filename, 'UnicodeDecodeError')
+            break
+        except EOFError:
+            print(filename, 'EOFError')
+            break
+        except StopIteration:
+            break
+    for key, count in pathcounts.items():
+        add_path(paths[key], key[0], results, count, triplets=triplets)
 
-def parse(tfile: TraceFile):
+def select_kernel(kernel='auto'):
+    """
+    Select the parse kernel used by parse.
+    :param kernel: python, cython, or auto to use the compiled kernel when it was built
+    """
+    global _kernel
+    if kernel == 'python':
+        _kernel = parse_traces
+    else:
+        try:
+            from bdrmapit.parser.cyparser import parse_traces as cyparse_traces
+            _kernel = cyparse_traces
+        except ImportError:
+            if kernel == 'cython':
+                raise
+            _kernel = parse_traces
+    return _kernel
+
+def kernel_name():
+    return 'python' if _kernel is parse_traces else 'cython'
+
+def parse(tfile: TraceFile, kernel=None, results: ParseResults = None):
     # public_ip4 = _filemap4.get(tfile.filename)
     # public_ip6 = _filemap6.get(tfile.filename)
-    results: ParseResults = ParseResults()
-    if tfile.type == OutputType.WARTS:
-        f = WartsReader(tfile.filename, ping=False)
-    elif tfile.type == OutputType.ATLAS:
-        f = AtlasReader(tfile.filename)
-    elif tfile.type == OutputType.ATLAS_ODD:
-        f = AtlasOddReader(tfile.filename)
-    elif tfile.type == OutputType.JSONWARTS:
-        f = WartsJsonReader(tfile.filename)
-    else:
-        raise Exception('Invalid output type: {}.'.format(tfile.type))
-    f.open()
+    if kernel is None:
+        kernel = _kernel
+    if results is None:
+        results = ParseResults()
+    f = open_source(tfile, threaded=_threaded, readahead=_readahead)
     if f.addr:
         public_ip4 = f.addr
         public_ip6 = f.addr
@@ -97,92 +288,164 @@ def parse(tfile: TraceFile):
         public_ip4 = _filemap4[f.hostname] if f.hostname in _filemap4 else _filemap4.get(tfile.filename)
         public_ip6 = _filemap6[f.hostname] if f.hostname in _filemap6 else _filemap6.get(tfile.filename)
     try:
-        fiter = iter(f)
-        while True:
-            try:
-                trace = next(fiter)
-                trace.prune_private(_ip2as)
-                trace.prune_dups()
-                trace.prune_loops(True)
-                if trace.loop:
-                    results.cycles.update(trace.loop)
-                hops: List[Hop] = [h for h in trace.hops if _ip2as[h.addr] != -1 and h.addr != trace.src and h.addr != public_ip4 and h.addr != public_ip6]
-                if not hops: continue
-                fhop: Hop = hops[0]
-                if fhop.probe_ttl == 1:
-                    results.first[tfile.filename, fhop.addr] += 1
-                lhop: Hop = hops[-1]
-                if lhop.type == ICMPType.echo_reply or lhop.type == ICMPType.portping:
-                    results.echos.add(lhop.addr)
-                dst_asn = _ip2as.asn(trace.dst)
-                for i in range(len(hops)):
-                    x: Hop = hops[i]
-                    results.addrs.add(x.addr)
-                    if x.type != ICMPType.echo_reply and x.type != ICMPType.portping:
-                        results.dps.add((x.addr, dst_asn))
-                    if i == len(hops) - 1:
-                        break
-                    y: Hop = hops[i+1]
-                    if y.type == ICMPType.echo_reply or y.type == ICMPType.portping:
-                        break
-                    if y.type == ICMPType.spoofing and y.icmp_q_ttl > 1:
-                        break
-                    distance = y.probe_ttl - x.probe_ttl
-                    if y.icmp_q_ttl == 0:
-                        distance += 1
-                    if distance > 1:
-                        distance = 2
-                    elif distance < 1:
-                        distance = -1
-                    if y.type == ICMPType.spoofing:
-                        results.spoofing.add((x.addr, y.addr, distance))
-                    else:
-                        if distance == 1:
-                            results.nextadjs[x.addr, y.addr] += 1
-                        else:
-                            results.multiadjs[x.addr, y.addr] += 1
-                if trace.loop:
-                    for x, y in zip(trace.loop, trace.loop[1:]):
-                        results.loopadjs[x.addr, y.addr] += 1
-            except UnicodeDecodeError:
-                print(tfile.filename, 'UnicodeDecodeError')
-                break
-            except EOFError:
-                print(tfile.filename, 'EOFError')
-                break
-            except StopIteration:
-                break
+        kernel(f, tfile.filename, _ip2as, public_ip4, public_ip6, results, _dedup, _triplets)
     finally:
         f.close()
     return results
 
+def check_parity(files):
+    """
+    Parse each file with the Python and compiled kernels and report any results that differ.
+    :param files: trace files to compare
+    :return: list of (file, field) pairs that differ
+    """
+    cykernel = select_kernel('cython')
+    select_kernel('python')
+    mismatches = []
+    pb = Progress(len(files), 'Comparing parse kernels', callback=lambda: 'Mismatches {:,d}'.format(len(mismatches)))
+    for tfile in pb.iterator(files):
+        pyresults = parse(tfile, kernel=parse_traces)
+        cyresults = parse(tfile, kernel=cykernel)
+        for k in ParseResults.FIELDS:
+            pyfield = getattr(pyresults, k)
+            cyfield = getattr(cyresults, k)
+            if k == 'cycles':
+                # Hops compare by identity, so compare what identifies them
+                pyfield = {(h.addr, h.probe_ttl) for h in pyfield}
+                cyfield = {(h.addr, h.probe_ttl) for h in cyfield}
+            if pyfield != cyfield:
+                mismatches.append((tfile.filename, k))
+                print(tfile.filename, k, file=sys.stderr)
+    return mismatches
+
+def report_mismatches(name, mismatches):
+    """
+    Print the differences found by a verification to stderr, and exit when there are any.
+    """
+    for mismatch in mismatches:
+        print(name, *mismatch, file=sys.stderr)
+    if mismatches:
+        sys.exit(1)
+
+def progress(files, callback):
+    if isinstance(files, list):
+        return Progress(len(files), 'Parsing traceroute files', callback=callback)
+    return Progress(message='Parsing traceroute files', increment=1, callback=callback)
+
 def parse_sequential(files):
     results = ParseResults()
 
-    pb = Progress(len(files), 'Parsing traceroute files', callback=lambda: str(results))
+    pb = progress(files, lambda: str(results))
     for tfile in pb.iterator(files):
-        newresults = parse(tfile)
-        results.update(newresults)
+        parse(tfile, results=results)
+    return results
+
+def init_worker(ip2as, filemap4, filemap6, kernel, threaded=False, readahead=False, dedup=False, barrier=None, queues=None, triplets=False):
+    global _ip2as, _filemap4, _filemap6, _threaded, _readahead, _dedup, _triplets, _accum, _barrier, _queues
+    _ip2as = ip2as
+    _filemap4 = filemap4
+    _filemap6 = filemap6
+    _threaded = threaded
+    _readahead = readahead
+    _dedup = dedup
+    _triplets = triplets
+    _accum = ParseResults()
+    _barrier = barrier
+    _queues = queues
+    select_kernel(kernel)
+
+def parse_accumulate(tfile: TraceFile):
+    """
+    Parse a file into this worker's accumulated results, so results are pre-reduced before leaving the worker.
+    """
+    parse(tfile, results=_accum)
+
+def reduce_worker(_):
+    """
+    Tree reduction of the accumulated results across workers. Each worker runs exactly one reduce task, since the
+    barrier holds every task until all workers have one, and the barrier assigns each a unique rank. In each round,
+    workers merge in the results of the worker step ranks above them, so merging proceeds in log2(workers) rounds
+    without passing through the parent.
+    :return: the fully reduced results from rank 0, None from the other workers
+    """
+    global _accum
+    rank = _barrier.wait()
+    results = _accum
+    _accum = ParseResults()
+    n = len(_queues)
+    step = 1
+    while step < n:
+        if rank % (2 * step) == step:
+            _queues[rank - step].put(results)
+            return None
+        if rank + step < n:
+            results.update(_queues[rank].get(), consume=True)
+        step *= 2
     return results
 
-def parse_parallel(files, poolsize):
+def parse_parallel(files, poolsize, tree=True):
+    """
+    Parse files with a pool of worker processes.
+    :param tree: workers accumulate their own results and reduce them among themselves, otherwise each file's results
+    are sent to and merged by this process
+    """
     results = ParseResults()
 
-    pb = Progress(len(files), 'Parsing traceroute files', callback=lambda: str(results))
-    with Pool(poolsize) as pool:
-        for newresults in pb.iterator(pool.imap_unordered(parse, files)):
-            results.update(newresults)
+    if isinstance(files, list):
+        # Pool workers close stdin, so streams are parsed in this process
+        streams = [tfile for tfile in files if tfile.filename == STDIN]
+        if streams:
+            results = parse_sequential(streams)
+            files = [tfile for tfile in files if tfile.filename != STDIN]
+    barrier = Barrier(poolsize) if tree else None
+    queues = [Queue() for _ in range(poolsize)] if tree else None
+    # A shared table pickles by name, so workers attach to it rather than copying the prefix table
+    initargs = (_ip2as, _filemap4, _filemap6, kernel_name(), _threaded, _readahead, _dedup, barrier, queues, _triplets)
+    with Pool(poolsize, initializer=init_worker, initargs=initargs) as pool:
+        if tree:
+            pb = progress(files, None)
+            for _ in pb.iterator(pool.imap_unordered(parse_accumulate, files)):
+                pass
+            for newresults in pool.imap_unordered(reduce_worker, range(poolsize)):
+                if newresults is not None:
+                    results.update(newresults, consume=True)
+        else:
+            pb = progress(files, lambda: str(results))
+            for newresults in pb.iterator(pool.imap_unordered(parse, files)):
+                results.update(newresults, consume=True)
     return results
 
-def run(files, ip2as: IP2AS, poolsize, output=None, filemap4=None, filemap6=None):
-    global _ip2as, _filemap4, _filemap6
+def run(files, ip2as: IP2AS, poolsize, output=None, filemap4=None, filemap6=None, kernel='auto', threaded=False, readahead=False, merge='tree', dedup=False, triplets=None, verify=False):
+    """
+    Parse traceroute files.
+    :param files: list of trace files, or an iterable yielding them as they become available
+    :param threaded: read and decode traces in background threads
+    :param readahead: decompress compressed files ahead of the readers
+    :param merge: tree reduces results among the workers, parent merges each file's results in this process
+    :param dedup: add each distinct path in a file once, weighted by the number of traces that produced it
+    :param triplets: filename for the binary hop triplets used for VRF detection, triplets are not collected otherwise
+    :param verify: reload the triplets file and exit if it differs from the triplets written
+    """
+    global _ip2as, _filemap4, _filemap6, _threaded, _readahead, _dedup, _triplets
     _ip2as = ip2as
     _filemap4 = filemap4 if filemap4 is not None else {}
     _filemap6 = filemap6 if filemap6 is not None else {}
+    _threaded = threaded
+    _readahead = readahead
+    _dedup = dedup
+    _triplets = triplets is not None
+    select_kernel(kernel)
 
-    poolsize = min(len(files), poolsize)
+    if isinstance(files, list):
+        poolsize = min(len(files), poolsize)
     print(poolsize)
-    results = parse_parallel(files, poolsize) if poolsize != 1 else parse_sequential(files)
+    results = parse_parallel(files, poolsize, tree=merge == 'tree') if poolsize != 1 else parse_sequential(files)
+    if triplets is not None:
+        write_triplets(triplets, results.triplets)
+        if verify:
+            report_mismatches(triplets, verify_triplets(triplets, results.triplets))
+        # The triplets file holds them, so they are not repeated in the results output
+        results.triplets = Counter()
     if output:
         results.dump(output)
     return results
@@ -211,6 +474,20 @@ def set_parser(parser: ArgumentParser, group=None, output=True):
     parser.add_argument('-p', '--poolsize', type=int, default=1)
     parser.add_argument('-m', '--filemap4', help='Mapping from filename to public IPv4 address (tab separated).')
     parser.add_argument('-M', '--filemap6', help='Mapping from filename to public IPv4 address (tab separated).')
+    parser.add_argument('--shared-ip2as', action='store_true', help='Share a flat prefix-to-AS table with parser processes through shared memory.')
+    parser.add_argument('--kernel', choices=['auto', 'python', 'cython'], default='auto', help='Parse kernel, auto uses the compiled kernel when available.')
+    parser.add_argument('--check-parity', action='store_true', help='Compare the Python and compiled parse kernels on the input files instead of parsing.')
+    parser.add_argument('--stdin', choices=['warts', 'atlas', 'jsonwarts'], help='Also parse traces of this type streamed on stdin.')
+    parser.add_argument('--watch', help='Parse files as they are added to this directory.')
+    parser.add_argument('--watch-type', choices=['warts', 'atlas', 'jsonwarts'], default='warts', help='Output type of files in the watched directory.')
+    parser.add_argument('--watch-pattern', default='*', help='Glob pattern for files in the watched directory.')
+    parser.add_argument('--watch-idle', type=float, default=300, help='Stop watching after this many seconds without a new file.')
+    parser.add_argument('--threaded-readers', action='store_true', help='Read and decode traces in background threads.')
+    parser.add_argument('--readahead', action='store_true', help='Decompress compressed files ahead of the readers, using pigz, pbzip2, or xz when installed.')
+    parser.add_argument('--dedup', action='store_true', help='Count repeated hop sequences toward the same destination AS once per file, weighted by repetitions.')
+    parser.add_argument('--merge', choices=['tree', 'parent'], default='tree', help='Merge results with a tree reduction among the parser processes, or one file at a time in the parent.')
+    parser.add_argument('--triplets', help='Also write the hop triplets of each adjacency, with counts, to this binary file for VRF detection.')
+    parser.add_argument('--verify', action='store_true', help='Reload the triplets file and the shared prefix-to-AS table after creating them, and exit if either differs.')
     if output:
         parser.add_argument('-o', '--output', required=True, help='Filename for pickle output file.')
 
@@ -235,11 +512,38 @@ def main(args=None, ip2as=None):
             files.extend(TraceFile(line.strip(), OutputType.JSONWARTS) for line in f if line[0] != '#')
     if args.jfilelist:
         files.extend(TraceFile(file, OutputType.JSONWARTS) for file in args.jfilelist)
+    if getattr(args, 'stdin', None):
+        files.append(TraceFile(STDIN, OutputType[args.stdin.upper()]))
+    if getattr(args, 'watch', None):
+        if any(tfile.filename == STDIN for tfile in files):
+            raise Exception('Cannot parse stdin while watching a directory.')
+        watched = watch_directory(args.watch, OutputType[args.watch_type.upper()], pattern=args.watch_pattern, idle=args.watch_idle)
+        files = chain(files, watched)
     filemap4 = read_filemap(args.filemap4) if args.filemap4 else {}
     filemap6 = read_filemap(args.filemap6) if args.filemap6 else {}
+    kernel = getattr(args, 'kernel', 'auto')
+    threaded = getattr(args, 'threaded_readers', False)
+    readahead = getattr(args, 'readahead', False)
+    merge = getattr(args, 'merge', 'tree')
+    dedup = getattr(args, 'dedup', False)
+    triplets = getattr(args, 'triplets', None)
+    verify = getattr(args, 'verify', False)
+    if getattr(args, 'check_parity', False):
+        if ip2as is None:
+            ip2as = create_table(args.ip2as)
+        init_worker(ip2as, filemap4, filemap6, 'python', dedup=dedup, triplets=triplets is not None)
+        return check_parity(list(files))
+    if getattr(args, 'shared_ip2as', False):
+        table = SharedIP2AS.create(args.ip2as)
+        try:
+            if verify:
+                report_mismatches(args.ip2as, verify_table(table, args.ip2as))
+            return run(files, table, args.poolsize, args.output, filemap4=filemap4, filemap6=filemap6, kernel=kernel, threaded=threaded, readahead=readahead, merge=merge, dedup=dedup, triplets=triplets, verify=verify)
+        finally:
+            table.unlink()
     if ip2as is None:
         ip2as = create_table(args.ip2as)
-    return run(files, ip2as, args.poolsize, args.output, filemap4=filemap4, filemap6=filemap6)
+    return run(files, ip2as, args.poolsize, args.output, filemap4=filemap4, filemap6=filemap6, kernel=kernel, threaded=threaded, readahead=readahead, merge=merge, dedup=dedup, triplets=triplets, verify=verify)
 
 if __name__ == '__main__':
     main()
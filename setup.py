@@ -15,6 +15,7 @@ extensions_names = {
     'bdrmapit.graph.node': ['bdrmapit/graph/node' + ext_pyx],
     'bdrmapit.graph.construct': ['bdrmapit/graph/construct' + ext_pyx],
     'bdrmapit.algorithm.updates_dict': ['bdrmapit/algorithm/updates_dict' + ext_pyx],
+    'bdrmapit.parser.cyparser': ['bdrmapit/parser/cyparser' + ext_pyx],
 }
 
 extensions = [Extension(k, v) for k, v in extensions_names.items()]
@@ -40,7 +41,9 @@ setup(
             'bdrmapit=scripts.bdrmapit:main',
             'traceparser=scripts.traceparser:main',
             'bm_addr=scripts.bm_addr:main',
-            'bm_adj=scripts.bm_adj:main'
+            'bm_adj=scripts.bm_adj:main',
+            'bm_merge=scripts.bm_merge:main',
+            'bm_nodes=scripts.bm_nodes:main'
         ],
     },
     zip_safe=False,